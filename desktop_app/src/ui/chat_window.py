@@ -1,6 +1,9 @@
+import json
 import traceback
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QUrl
+from PySide6.QtNetwork import QAbstractSocket, QNetworkRequest
+from PySide6.QtWebSockets import QWebSocket
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QListWidget,
                                QLineEdit, QPushButton, QTextEdit, QMessageBox,
                                QSplitter, QWidget, QComboBox)
@@ -13,6 +16,9 @@ class ChatDialog(QDialog):
         super().__init__(parent)
         self.api_client = api_client
         self.current_chat_id = None
+        self.messages = []  # Window of the current chat shown, oldest first
+        self.closing = False
+        self.socket = None
         self.all_users = []
         self.current_user = self.get_current_user()
         if self.current_user:
@@ -54,6 +60,11 @@ class ChatDialog(QDialog):
         right_widget = QWidget()
         right_layout = QVBoxLayout(right_widget)
 
+        self.load_older_button = QPushButton("Load earlier messages")
+        self.load_older_button.clicked.connect(self.load_older_messages)
+        self.load_older_button.hide()
+        right_layout.addWidget(self.load_older_button)
+
         self.chat_area = QTextEdit()
         self.chat_area.setReadOnly(True)
         right_layout.addWidget(self.chat_area)
@@ -71,9 +82,59 @@ class ChatDialog(QDialog):
         splitter.addWidget(right_widget)
         layout.addWidget(splitter)
 
-        self.refresh_timer = QTimer(self)
-        self.refresh_timer.timeout.connect(self.refresh_current_chat)
-        self.refresh_timer.start(5000)  # Refresh every 5 seconds
+        # New messages are pushed over a WebSocket; after a reconnect only the ones sent meanwhile are fetched
+        self.socket = QWebSocket()
+        self.socket.textMessageReceived.connect(self.on_chat_event)
+        self.socket.connected.connect(self.on_socket_connected)
+        self.socket.disconnected.connect(self.on_socket_disconnected)
+        self.reconnect_delay = 1000
+        self.connect_socket()
+
+    def connect_socket(self):
+        if self.closing:
+            return
+        if self.api_client.is_token_expired():
+            self.api_client.refresh_access_token()
+        base_url = self.api_client.base_url.replace("http", "ws", 1)
+        request = QNetworkRequest(QUrl(f"{base_url}/chat/ws"))
+        request.setRawHeader(b"Authorization", f"Bearer {self.api_client.access_token}".encode())
+        self.socket.open(request)
+
+    def on_socket_connected(self):
+        self.reconnect_delay = 1000
+        self.fetch_new_messages()
+
+    def on_socket_disconnected(self):
+        if not self.closing:
+            QTimer.singleShot(self.reconnect_delay, self.connect_socket)
+            self.reconnect_delay = min(self.reconnect_delay * 2, 30000)
+
+    def on_chat_event(self, text):
+        event = json.loads(text)
+        if event["type"] == "chat_message":
+            if event["chat_id"] == self.current_chat_id:
+                self.append_messages([event["message"]])
+                self.mark_current_chat_read()
+            else:
+                # The chat list only reads chat summaries, so refreshing its unread counts is cheap
+                self.load_chats()
+        elif event["type"] == "chat_deleted":
+            if event["chat_id"] == self.current_chat_id:
+                self.clear_current_chat()
+            self.load_chats()
+
+    def close_socket(self):
+        self.closing = True
+        if self.socket is not None:
+            self.socket.close()
+
+    def done(self, result):
+        self.close_socket()
+        super().done(result)
+
+    def closeEvent(self, event):
+        self.close_socket()
+        super().closeEvent(event)
 
     def get_current_user(self):
         try:
@@ -102,28 +163,78 @@ class ChatDialog(QDialog):
             self.chat_list.clear()
             for chat in chats:
                 other_user = chat["user1"] if chat["user2"]["id"] == self.current_user['id'] else chat["user2"]
-                self.chat_list.addItem(f"{other_user['username']} (ID: {chat['id']})")
+                unread = f" [{chat['unread_count']} new]" if chat.get("unread_count") else ""
+                self.chat_list.addItem(f"{other_user['username']}{unread} (ID: {chat['id']})")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load chats: {str(e)}")
 
     def load_chat(self, item):
         chat_id = int(item.text().split("ID: ")[-1].strip(")"))
+        self.clear_current_chat()
         self.current_chat_id = chat_id
-        self.refresh_current_chat()
+        response = self.get_messages({})
+        if response is not None:
+            self.messages = response.get("messages", [])
+            self.load_older_button.setVisible(response.get("has_more", False))
+            self.render_messages()
+            self.mark_current_chat_read()
+            item.setText(item.text().split(" [")[0] + f" (ID: {chat_id})")
 
-    def refresh_current_chat(self):
-        if self.current_chat_id:
-            try:
-                response = self.api_client.get(f"/chat/{self.current_chat_id}/messages")
-                messages = response.get("messages", [])
-                self.chat_area.clear()
-                for message in messages:
-                    sender = "You" if message["sender_id"] == self.current_user['id'] else "Other"
-                    self.chat_area.append(f"{sender}: {message['content']}")
-            except Exception as e:
-                error_msg = f"Failed to load messages: {str(e)}\n\n{traceback.format_exc()}"
-                print(error_msg)  # Log the error
-                QMessageBox.critical(self, "Error", error_msg)
+    def clear_current_chat(self):
+        self.current_chat_id = None
+        self.messages = []
+        self.chat_area.clear()
+        self.load_older_button.hide()
+
+    def get_messages(self, params):
+        try:
+            return self.api_client.get(f"/chat/{self.current_chat_id}/messages", params=params)
+        except Exception as e:
+            error_msg = f"Failed to load messages: {str(e)}\n\n{traceback.format_exc()}"
+            print(error_msg)  # Log the error
+            QMessageBox.critical(self, "Error", error_msg)
+            return None
+
+    def load_older_messages(self):
+        if self.current_chat_id and self.messages:
+            response = self.get_messages({"before_id": self.messages[0]["id"]})
+            if response is not None:
+                self.messages = response.get("messages", []) + self.messages
+                self.load_older_button.setVisible(response.get("has_more", False))
+                self.render_messages()
+
+    def fetch_new_messages(self):
+        """Messages of the current chat sent after the last one shown, e.g. while the socket was reconnecting."""
+        while self.current_chat_id:
+            response = self.get_messages({"after_id": self.messages[-1]["id"]} if self.messages else {})
+            if response is None:
+                return
+            self.append_messages(response.get("messages", []))
+            if not response.get("has_more", False):
+                return
+
+    def mark_current_chat_read(self):
+        try:
+            self.api_client.post(f"/chat/{self.current_chat_id}/read")
+        except Exception as e:
+            print(f"Error marking chat as read: {str(e)}")
+
+    def format_message(self, message):
+        sender = "You" if message["sender_id"] == self.current_user['id'] else "Other"
+        return f"{sender}: {message['content']}"
+
+    def render_messages(self):
+        self.chat_area.clear()
+        for message in self.messages:
+            self.chat_area.append(self.format_message(message))
+
+    def append_messages(self, messages):
+        for message in messages:
+            # A pushed message may also come with a fetch after a reconnect; ids only grow within a chat
+            if self.messages and message["id"] <= self.messages[-1]["id"]:
+                continue
+            self.messages.append(message)
+            self.chat_area.append(self.format_message(message))
 
     def send_message(self):
         if not self.current_chat_id:
@@ -134,7 +245,8 @@ class ChatDialog(QDialog):
             try:
                 self.api_client.post(f"/chat/{self.current_chat_id}/messages", json={"content": message})
                 self.message_input.clear()
-                self.refresh_current_chat()
+                if self.socket.state() != QAbstractSocket.SocketState.ConnectedState:
+                    self.fetch_new_messages()
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to send message: {str(e)}")
 
@@ -178,8 +290,7 @@ class ChatDialog(QDialog):
             try:
                 self.api_client.delete(f"/chat/{self.current_chat_id}")
                 self.load_chats()
-                self.chat_area.clear()
-                self.current_chat_id = None
+                self.clear_current_chat()
                 QMessageBox.information(self, "Success", "Chat deleted successfully.")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to delete chat: {str(e)}")
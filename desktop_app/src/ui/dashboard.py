@@ -51,13 +51,13 @@ class DashboardWidget(QWidget):
     def create_inventory_chart(self):
         inventory_data = self.inventory_api.get_inventory_summary()
         series = QPieSeries()
-        total_quantity = sum(inventory_data.category_quantities.values())
+        total_quantity = inventory_data.total_items
 
         for category, quantity in inventory_data.category_quantities.items():
             slice = series.append(category, quantity)
             slice.setLabelVisible(True)
 
-            percentage = (quantity / total_quantity) * 100
+            percentage = (quantity / total_quantity) * 100 if total_quantity else 0
             slice.setLabel(f"{category}: {quantity} ({percentage:.1f}%)")
 
         chart = QChart()
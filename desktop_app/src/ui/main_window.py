@@ -126,10 +126,14 @@ class MainWindow(QMainWindow):
 
         menu_bar.setCornerWidget(notification_button, Qt.TopRightCorner)
 
+        # The notification stream pushes every change of the unread count
+        self.notification_center.unread_count_changed.connect(
+            lambda unread: self.update_notification_icon(notification_button, unread))
         self.update_notification_icon(notification_button)
 
-    def update_notification_icon(self, button):
-        unread_notifications = len(self.notification_center.notifications_api.get_unread_notifications())
+    def update_notification_icon(self, button, unread_notifications=None):
+        if unread_notifications is None:
+            unread_notifications = self.notification_center.notifications_api.get_unread_count()
         if unread_notifications > 0:
             button.setIcon(QIcon(IconPath.BELL_UNREAD))
         else:
@@ -2,11 +2,11 @@ from datetime import datetime
 
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
-                               QHeaderView, QDialog, QLineEdit, QStackedWidget, QMessageBox)
+                               QHeaderView, QDialog, QLineEdit, QStackedWidget, QMessageBox, QLabel)
 
 from public_api.api import InventoryAPI, APIClient, LocationsAPI, ProductsAPI, UsersAPI
 from public_api.permissions import PermissionName
-from public_api.shared_schemas import InventoryWithDetails, Inventory
+from public_api.shared_schemas import InventoryWithDetails, Inventory, CountMode
 from src.ui.components import StyledButton
 from src.ui.components.icon_path import IconPath
 from src.ui.views.inventory.adjustment_dialog import AdjustmentDialog
@@ -16,6 +16,7 @@ from src.ui.views.inventory.inventory_planning import InventoryPlanningWidget
 
 class InventoryView(QWidget):
     inventory_updated = Signal()
+    PAGE_SIZE = 100
 
     def __init__(self, api_client: APIClient):
         super().__init__()
@@ -25,6 +26,7 @@ class InventoryView(QWidget):
         self.products_api = ProductsAPI(api_client)
         self.users_api = UsersAPI(api_client)
         self.permission_manager = self.users_api.get_current_user_permissions()
+        self.next_cursor: str | None = None
         self.init_ui()
 
     def init_ui(self):
@@ -57,8 +59,12 @@ class InventoryView(QWidget):
         self.table.setHorizontalHeaderLabels(["SKU", "Name", "Quantity", "Location", "Last Updated", "Actions"])
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.verticalScrollBar().valueChanged.connect(self.on_table_scrolled)
         main_layout.addWidget(self.table)
 
+        self.count_label = QLabel()
+        main_layout.addWidget(self.count_label)
+
         self.stacked_widget.addWidget(main_widget)
 
         # Inventory Planning Widget
@@ -79,13 +85,33 @@ class InventoryView(QWidget):
         self.refresh_inventory()
 
     def refresh_inventory(self):
-        inventory_data = self.inventory_api.get_inventory()
+        self.table.setRowCount(0)
+        self.next_cursor = ""
+        self.load_next_page()
+
+    def load_next_page(self):
+        if self.next_cursor is None:
+            return
+        # The first page counts exactly; following pages reuse that total from the server's count cache
+        count_mode = CountMode.EXACT if self.next_cursor == "" else CountMode.CACHED
+        inventory_data = self.inventory_api.get_inventory(limit=self.PAGE_SIZE, cursor=self.next_cursor,
+                                                          count_mode=count_mode)
+        self.next_cursor = inventory_data.next_cursor
         self.update_table(inventory_data.items)
+        self.count_label.setText(f"Showing {self.table.rowCount()} of {inventory_data.total} items")
+
+    def on_table_scrolled(self, value: int):
+        # Fetch the next page once the user scrolls near the end of what is loaded
+        if self.next_cursor and value >= self.table.verticalScrollBar().maximum() - 5:
+            self.load_next_page()
 
     def update_table(self, items: list[InventoryWithDetails]):
-        self.table.setRowCount(len(items))
+        first_row = self.table.rowCount()
+        self.table.setRowCount(first_row + len(items))
         self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
-        for row, item in enumerate(items):
+        can_write = self.permission_manager.has_write_permission(PermissionName.INVENTORY)
+        can_delete = self.permission_manager.has_delete_permission(PermissionName.INVENTORY)
+        for row, item in enumerate(items, start=first_row):
             self.table.setItem(row, 0, QTableWidgetItem(item.product.sku))
             self.table.setItem(row, 1, QTableWidgetItem(item.product.name))
             self.table.setItem(row, 2, QTableWidgetItem(str(item.quantity)))
@@ -99,7 +125,7 @@ class InventoryView(QWidget):
             actions_layout.setContentsMargins(0, 0, 0, 0)
             actions_layout.setSpacing(2)
 
-            if self.permission_manager.has_write_permission(PermissionName.INVENTORY):
+            if can_write:
                 edit_button = StyledButton("Edit", icon_path=IconPath.EDIT)
                 edit_button.clicked.connect(lambda _, i=item.id: self.edit_item(i))
                 actions_layout.addWidget(edit_button)
@@ -108,7 +134,7 @@ class InventoryView(QWidget):
                 adjust_button.clicked.connect(lambda _, i=item.id: self.adjust_item(i))
                 actions_layout.addWidget(adjust_button)
 
-            if self.permission_manager.has_delete_permission(PermissionName.INVENTORY):
+            if can_delete:
                 delete_button = StyledButton("Delete", icon_path=IconPath.DELETE)
                 delete_button.clicked.connect(lambda _, i=item.id: self.delete_item(i))
                 actions_layout.addWidget(delete_button)
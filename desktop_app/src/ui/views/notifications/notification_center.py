@@ -1,23 +1,72 @@
-from PySide6.QtCore import Qt, QTimer, QDateTime
+import json
+
+from PySide6.QtCore import Qt, QTimer, QDateTime, QUrl, Signal
 from PySide6.QtGui import QColor, QBrush
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest
 from PySide6.QtWidgets import (QVBoxLayout, QWidget, QTableWidget, QTableWidgetItem,
                                QPushButton, QHeaderView, QAbstractItemView)
 
 from public_api.api import APIClient, NotificationsAPI
+from public_api.shared_schemas import Notification
 
 
 class NotificationCenter(QWidget):
+    unread_count_changed = Signal(int)
+
     def __init__(self, api_client: APIClient):
         super().__init__()
         self.api_client = api_client
         self.notifications_api = NotificationsAPI(api_client)
         self.init_ui()
 
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.fetch_notifications)
-        self.update_timer.start(60000)  # Fetch notifications every minute
+        # New notifications and unread counts are pushed as server-sent events; the list is only reloaded after
+        # a reconnect, for whatever arrived in between
+        self.network = QNetworkAccessManager(self)
+        self.stream = None
+        self.stream_buffer = b""
+        self.reload_on_next_event = False
+        self.reconnect_delay = 1000
+        self.connect_stream()
         self.setMinimumSize(600, 400)
 
+    def connect_stream(self):
+        if self.api_client.is_token_expired():
+            self.api_client.refresh_access_token()
+        request = QNetworkRequest(QUrl(f"{self.api_client.base_url}/notifications/stream"))
+        request.setRawHeader(b"Authorization", f"Bearer {self.api_client.access_token}".encode())
+        request.setRawHeader(b"Accept", b"text/event-stream")
+        self.stream_buffer = b""
+        self.stream = self.network.get(request)
+        self.stream.readyRead.connect(self.read_stream)
+        self.stream.finished.connect(self.on_stream_finished)
+
+    def read_stream(self):
+        self.stream_buffer += self.stream.readAll().data()
+        while b"\n\n" in self.stream_buffer:
+            block, self.stream_buffer = self.stream_buffer.split(b"\n\n", 1)
+            data = [line[5:].strip() for line in block.decode().splitlines() if line.startswith("data:")]
+            if data:
+                self.handle_event(json.loads("\n".join(data)))
+
+    def handle_event(self, event):
+        self.reconnect_delay = 1000
+        if "unread_count" in event:
+            self.unread_count_changed.emit(event["unread_count"])
+        if self.reload_on_next_event or event["type"] == "resync":
+            self.reload_on_next_event = False
+            self.fetch_notifications()
+        elif event["type"] == "notification":
+            self.notification_table.insertRow(0)
+            self.set_notification_row(0, Notification.model_validate(event["notification"]))
+            self.notification_table.resizeRowsToContents()
+
+    def on_stream_finished(self):
+        self.stream.deleteLater()
+        self.stream = None
+        self.reload_on_next_event = True
+        QTimer.singleShot(self.reconnect_delay, self.connect_stream)
+        self.reconnect_delay = min(self.reconnect_delay * 2, 60000)
+
     def init_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -53,35 +102,37 @@ class NotificationCenter(QWidget):
         for notification in notifications:
             row_position = self.notification_table.rowCount()
             self.notification_table.insertRow(row_position)
+            self.set_notification_row(row_position, notification)
 
-            timestamp = QDateTime.fromSecsSinceEpoch(notification.timestamp).toString("yyyy-MM-dd")
-            date_item = QTableWidgetItem(timestamp)
-            date_item.setTextAlignment(Qt.AlignCenter)
+        self.notification_table.resizeRowsToContents()
 
-            description_item = QTableWidgetItem(notification.message)
-            description_item.setToolTip(notification.message)  # Show full message on hover
+    def set_notification_row(self, row_position, notification):
+        timestamp = QDateTime.fromSecsSinceEpoch(notification.timestamp).toString("yyyy-MM-dd")
+        date_item = QTableWidgetItem(timestamp)
+        date_item.setTextAlignment(Qt.AlignCenter)
 
-            if notification.is_read:
-                color = QColor(180, 180, 180)  # Lighter grey for read notifications
-            else:
-                color = QColor(0, 0, 0)  # Black for unread notifications
+        description_item = QTableWidgetItem(notification.message)
+        description_item.setToolTip(notification.message)  # Show full message on hover
 
-            date_item.setForeground(QBrush(color))
-            description_item.setForeground(QBrush(color))
+        if notification.is_read:
+            color = QColor(180, 180, 180)  # Lighter grey for read notifications
+        else:
+            color = QColor(0, 0, 0)  # Black for unread notifications
 
-            self.notification_table.setItem(row_position, 0, date_item)
-            self.notification_table.setItem(row_position, 1, description_item)
+        date_item.setForeground(QBrush(color))
+        description_item.setForeground(QBrush(color))
 
-            mark_as_read_button = QPushButton("Mark as Read")
-            mark_as_read_button.setStyleSheet("background-color: #28a745; color: white; padding: 5px;")
-            mark_as_read_button.clicked.connect(lambda _, nid=notification.id: self.mark_as_read(nid))
-            if notification.is_read:
-                mark_as_read_button.setEnabled(False)
-                mark_as_read_button.setStyleSheet("background-color: #a0a0a0; color: white; padding: 5px;")
+        self.notification_table.setItem(row_position, 0, date_item)
+        self.notification_table.setItem(row_position, 1, description_item)
 
-            self.notification_table.setCellWidget(row_position, 2, mark_as_read_button)
+        mark_as_read_button = QPushButton("Mark as Read")
+        mark_as_read_button.setStyleSheet("background-color: #28a745; color: white; padding: 5px;")
+        mark_as_read_button.clicked.connect(lambda _, nid=notification.id: self.mark_as_read(nid))
+        if notification.is_read:
+            mark_as_read_button.setEnabled(False)
+            mark_as_read_button.setStyleSheet("background-color: #a0a0a0; color: white; padding: 5px;")
 
-        self.notification_table.resizeRowsToContents()
+        self.notification_table.setCellWidget(row_position, 2, mark_as_read_button)
 
     def mark_as_read(self, notification_id):
         self.notifications_api.mark_as_read(notification_id)
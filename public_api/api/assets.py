@@ -1,8 +1,10 @@
+from typing import Iterator
+
 from public_api.shared_schemas import (
     AssetCreate, AssetUpdate, Asset, AssetWithMaintenance, AssetFilter,
     AssetMaintenanceCreate, AssetMaintenanceUpdate, AssetMaintenance,
     AssetMaintenanceFilter, AssetWithMaintenanceList, AssetTransfer,
-    Location
+    Location, CountMode
 )
 from .client import APIClient
 
@@ -16,13 +18,24 @@ class AssetsAPI:
         return Asset.model_validate(response)
 
     def get_assets(self, skip: int = 0, limit: int = 100,
-                   asset_filter: AssetFilter | None = None) -> AssetWithMaintenanceList:
+                   asset_filter: AssetFilter | None = None, cursor: str | None = None,
+                   count_mode: CountMode | None = None) -> AssetWithMaintenanceList:
         params = {"skip": skip, "limit": limit}
+        if cursor is not None:
+            params["cursor"] = cursor
+        if count_mode:
+            params["count_mode"] = count_mode.value
         if asset_filter:
             params.update(asset_filter.model_dump(mode="json", exclude_unset=True))
         response = self.client.get("/assets/", params=params)
         return AssetWithMaintenanceList.model_validate(response)
 
+    def iter_assets(self, asset_filter: AssetFilter | None = None,
+                    page_size: int = 100) -> Iterator[AssetWithMaintenance]:
+        params = asset_filter.model_dump(mode="json", exclude_unset=True) if asset_filter else None
+        for item in self.client.iterate("/assets/", params, page_size, items_key="assets"):
+            yield AssetWithMaintenance.model_validate(item)
+
     def get_asset(self, asset_id: int) -> AssetWithMaintenance:
         response = self.client.get(f"/assets/{asset_id}")
         return AssetWithMaintenance.model_validate(response)
@@ -54,6 +67,12 @@ class AssetsAPI:
         response = self.client.get("/assets/maintenance", params=params)
         return [AssetMaintenance.model_validate(item) for item in response]
 
+    def iter_asset_maintenances(self, maintenance_filter: AssetMaintenanceFilter | None = None,
+                                page_size: int = 100) -> Iterator[AssetMaintenance]:
+        params = maintenance_filter.model_dump(mode="json", exclude_unset=True) if maintenance_filter else None
+        for item in self.client.iterate("/assets/maintenance", params, page_size):
+            yield AssetMaintenance.model_validate(item)
+
     def get_asset_maintenance(self, maintenance_id: int) -> AssetMaintenance:
         response = self.client.get(f"/assets/maintenance/{maintenance_id}")
         return AssetMaintenance.model_validate(response)
@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from public_api.shared_schemas import (
     AuditLogCreate, AuditLog, AuditLogWithUser, AuditLogFilter,
     AuditSummary, AuditLogExport
@@ -21,6 +23,12 @@ class AuditAPI:
         response = self.client.get("/audit/logs", params=params)
         return [AuditLogWithUser.model_validate(item) for item in response]
 
+    def iter_audit_logs(self, filter_params: AuditLogFilter | None = None,
+                        page_size: int = 100) -> Iterator[AuditLogWithUser]:
+        params = filter_params.model_dump(mode="json", exclude_unset=True) if filter_params else None
+        for item in self.client.iterate("/audit/logs", params, page_size):
+            yield AuditLogWithUser.model_validate(item)
+
     def get_audit_log(self, log_id: int) -> AuditLogWithUser:
         response = self.client.get(f"/audit/logs/{log_id}")
         return AuditLogWithUser.model_validate(response)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterator, List
 
 from public_api.shared_schemas import CarrierCreate, CarrierUpdate, Carrier
 from .client import APIClient
@@ -16,6 +16,10 @@ class CarriersAPI:
         response = self.client.get("/carriers/", params={"skip": skip, "limit": limit})
         return [Carrier.model_validate(item) for item in response]
 
+    def iter_carriers(self, page_size: int = 100) -> Iterator[Carrier]:
+        for item in self.client.iterate("/carriers/", None, page_size):
+            yield Carrier.model_validate(item)
+
     def get_carrier(self, carrier_id: int) -> Carrier:
         response = self.client.get(f"/carriers/{carrier_id}")
         return Carrier.model_validate(response)
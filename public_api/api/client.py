@@ -1,11 +1,15 @@
 # public_api/api/client.py
 from datetime import datetime, timedelta
+from typing import Iterator
 
 import requests
 from requests import HTTPError
 
 from public_api.shared_schemas import Token
 
+# Response header carrying the cursor of the next page of a list endpoint requested with `cursor`
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 class APIClient:
     def __init__(self, base_url: str):
@@ -55,9 +59,11 @@ class APIClient:
                     return self.request_call(method, endpoint, **kwargs)
             raise
 
-    def request_call(self, method: str, endpoint: str, **kwargs):
+    def request_call(self, method: str, endpoint: str, raw_response: bool = False, **kwargs):
         response = self.session.request(method, f"{self.base_url}{endpoint}", **kwargs)
         response.raise_for_status()
+        if raw_response:
+            return response
         if response.status_code == 204:
             return None
         return response.json()
@@ -65,9 +71,25 @@ class APIClient:
     def get(self, endpoint: str, params: dict | None = None, headers: dict | None = None):
         return self.request("GET", endpoint, params=params, headers=headers)
 
+    def iterate(self, endpoint: str, params: dict | None = None, page_size: int = 100,
+                items_key: str | None = None) -> Iterator[dict]:
+        """
+        Yield every item of a list endpoint, page by page, following the server's cursor.
+        `items_key` names the list field for endpoints that wrap their items (e.g. "items" for InventoryList).
+        """
+        params = {**(params or {}), "limit": page_size, "cursor": ""}
+        while True:
+            response = self.request("GET", endpoint, params=params, raw_response=True)
+            body = response.json()
+            yield from body[items_key] if items_key else body
+            next_cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if not next_cursor:
+                return
+            params["cursor"] = next_cursor
+
     def post(self, endpoint: str, data: dict | None = None, json: dict | None = None, headers: dict | None = None,
-             params: dict | None = None):
-        return self.request("POST", endpoint, data=data, json=json, headers=headers, params=params)
+             params: dict | None = None, files: dict | None = None):
+        return self.request("POST", endpoint, data=data, json=json, headers=headers, params=params, files=files)
 
     def put(self, endpoint: str, data: dict | None = None, json: dict | None = None, headers: dict | None = None):
         return self.request("PUT", endpoint, data=data, json=json, headers=headers)
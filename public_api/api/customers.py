@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from public_api.shared_schemas import (
     CustomerCreate, CustomerUpdate, Customer, CustomerFilter, Order
 )
@@ -20,6 +22,11 @@ class CustomersAPI:
         response = self.client.get("/customers/", params=params)
         return [Customer.model_validate(item) for item in response]
 
+    def iter_customers(self, customer_filter: CustomerFilter | None = None, page_size: int = 100) -> Iterator[Customer]:
+        params = customer_filter.model_dump(mode="json", exclude_unset=True) if customer_filter else None
+        for item in self.client.iterate("/customers/", params, page_size):
+            yield Customer.model_validate(item)
+
     def get_customer(self, customer_id: int) -> Customer:
         response = self.client.get(f"/customers/{customer_id}")
         return Customer.model_validate(response)
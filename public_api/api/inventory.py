@@ -1,5 +1,8 @@
+import os
+from typing import Iterator
+
 from public_api.shared_schemas import (
-    InventoryCreate, InventoryUpdate, Inventory, InventoryList, InventoryFilter,
+    InventoryCreate, InventoryUpdate, Inventory, InventoryList, InventoryWithDetails, InventoryFilter, CountMode,
     InventoryTransfer, InventoryReport, ProductWithInventory, Product,
     LocationWithInventory, InventoryMovement, InventorySummary, StocktakeCreate,
     StocktakeResult, ABCAnalysisResult, InventoryLocationSuggestion,
@@ -17,13 +20,24 @@ class InventoryAPI:
         return Inventory.model_validate(response)
 
     def get_inventory(self, skip: int = 0, limit: int = 100,
-                      inventory_filter: InventoryFilter | None = None) -> InventoryList:
+                      inventory_filter: InventoryFilter | None = None, cursor: str | None = None,
+                      count_mode: CountMode | None = None) -> InventoryList:
         params = {"skip": skip, "limit": limit}
+        if cursor is not None:
+            params["cursor"] = cursor
+        if count_mode:
+            params["count_mode"] = count_mode.value
         if inventory_filter:
             params.update(inventory_filter.model_dump(mode="json", exclude_unset=True))
         response = self.client.get("/inventory", params=params)
         return InventoryList.model_validate(response)
 
+    def iter_inventory(self, inventory_filter: InventoryFilter | None = None,
+                       page_size: int = 100) -> Iterator[InventoryWithDetails]:
+        params = inventory_filter.model_dump(mode="json", exclude_unset=True) if inventory_filter else None
+        for item in self.client.iterate("/inventory", params, page_size, items_key="items"):
+            yield InventoryWithDetails.model_validate(item)
+
     def get_inventory_item(self, id: int) -> Inventory:
         response = self.client.get(f"/inventory/{id}")
         return Inventory.model_validate(response)
@@ -95,8 +109,9 @@ class InventoryAPI:
         response = self.client.get("/inventory/abc_analysis")
         return ABCAnalysisResult.model_validate(response)
 
-    def optimize_inventory_locations(self) -> list[InventoryLocationSuggestion]:
-        response = self.client.post("/inventory/optimize_locations")
+    def optimize_inventory_locations(self, max_moves: int | None = None) -> list[InventoryLocationSuggestion]:
+        params = {"max_moves": max_moves} if max_moves else None
+        response = self.client.post("/inventory/optimize_locations", params=params)
         return [InventoryLocationSuggestion.model_validate(item) for item in response]
 
     def get_expiring_soon_inventory(self, days: int = 30) -> list[ProductWithInventory]:
@@ -107,6 +122,13 @@ class InventoryAPI:
         response = self.client.post("/inventory/bulk_import", json=import_data.model_dump(mode="json"))
         return BulkImportResult.model_validate(response)
 
+    def bulk_import_inventory_file(self, file_path: str) -> BulkImportResult:
+        """Upload a CSV or NDJSON (.ndjson / .jsonl) import file; see `InventoryImportRow` for the columns."""
+        with open(file_path, "rb") as file:
+            response = self.client.post("/inventory/bulk_import/file",
+                                        files={"file": (os.path.basename(file_path), file)})
+        return BulkImportResult.model_validate(response)
+
     def get_storage_utilization(self) -> StorageUtilization:
         response = self.client.get("/inventory/storage_utilization")
         return StorageUtilization.model_validate(response)
@@ -115,8 +137,13 @@ class InventoryAPI:
         response = self.client.get(f"/inventory/forecast/{product_id}")
         return response
 
-    def get_reorder_suggestions(self) -> list[dict]:
-        response = self.client.get("/inventory/reorder_suggestions")
+    def refresh_inventory_forecasts(self, product_ids: list[int] | None = None, batch_size: int | None = None) -> dict:
+        params = {"batch_size": batch_size} if batch_size is not None else None
+        return self.client.post("/inventory/forecast/refresh", json=product_ids, params=params)
+
+    def get_reorder_suggestions(self, service_level: float | None = None) -> list[dict]:
+        params = {"service_level": service_level} if service_level is not None else None
+        response = self.client.get("/inventory/reorder_suggestions", params=params)
         return response
 
     def delete_inventory_item(self, inventory_item_id: int) -> None:
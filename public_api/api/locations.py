@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from public_api.shared_schemas.inventory import (
     LocationCreate, LocationUpdate, Location, LocationWithInventory, LocationFilter
 )
@@ -20,6 +22,12 @@ class LocationsAPI:
         response = self.client.get("/locations/", params=params)
         return [LocationWithInventory.model_validate(item) for item in response]
 
+    def iter_locations(self, location_filter: LocationFilter | None = None,
+                       page_size: int = 100) -> Iterator[LocationWithInventory]:
+        params = location_filter.model_dump(mode="json", exclude_unset=True) if location_filter else None
+        for item in self.client.iterate("/locations/", params, page_size):
+            yield LocationWithInventory.model_validate(item)
+
     def get_location(self, location_id: int) -> LocationWithInventory:
         response = self.client.get(f"/locations/{location_id}")
         return LocationWithInventory.model_validate(response)
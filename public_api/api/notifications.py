@@ -1,5 +1,6 @@
 # /public_api/api/notifications.py
-from typing import List
+import json
+from typing import Iterator, List
 
 from public_api.shared_schemas import Notification, NotificationCreate, NotificationUpdate
 from .client import APIClient
@@ -17,6 +18,24 @@ class NotificationsAPI:
         response = self.client.get("/notifications/unread", params={"skip": skip, "limit": limit})
         return [Notification.model_validate(item) for item in response]
 
+    def get_unread_count(self) -> int:
+        return self.client.get("/notifications/unread/count")
+
+    def stream_events(self) -> Iterator[dict]:
+        """
+        Block and yield the server-sent events of the notification stream as they arrive: {"type": "unread_count"},
+        {"type": "notification", "notification", "unread_count"} and {"type": "resync"} (reload, then reconnect).
+        """
+        response = self.client.request("GET", "/notifications/stream", raw_response=True, stream=True)
+        with response:
+            data = []
+            for line in response.iter_lines(decode_unicode=True):
+                if line.startswith("data:"):
+                    data.append(line[5:].strip())
+                elif not line and data:
+                    yield json.loads("\n".join(data))
+                    data = []
+
     def create_notification(self, notification: NotificationCreate) -> Notification:
         response = self.client.post("/notifications/", json=notification.model_dump())
         return Notification.model_validate(response)
@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from public_api.shared_schemas import (
     OrderCreate, OrderUpdate, Order, OrderWithDetails, OrderFilter,
     OrderSummary, ShippingInfo, OrderItemCreate, BulkOrderImportData,
@@ -22,6 +24,11 @@ class OrdersAPI:
         response = self.client.get("/orders/", params=params)
         return [OrderWithDetails.model_validate(item) for item in response]
 
+    def iter_orders(self, filter_params: OrderFilter | None = None, page_size: int = 100) -> Iterator[OrderWithDetails]:
+        params = filter_params.model_dump(mode="json", exclude_unset=True) if filter_params else None
+        for item in self.client.iterate("/orders/", params, page_size):
+            yield OrderWithDetails.model_validate(item)
+
     def get_order(self, order_id: int) -> OrderWithDetails:
         response = self.client.get(f"/orders/{order_id}")
         return OrderWithDetails.model_validate(response)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterator, List
 
 from public_api.shared_schemas import PermissionCreate, PermissionUpdate, Permission
 from .client import APIClient
@@ -16,6 +16,10 @@ class PermissionsAPI:
         response = self.client.get("/permissions/", params={"skip": skip, "limit": limit})
         return [Permission.model_validate(item) for item in response]
 
+    def iter_permissions(self, page_size: int = 100) -> Iterator[Permission]:
+        for item in self.client.iterate("/permissions/", None, page_size):
+            yield Permission.model_validate(item)
+
     def get_permission(self, permission_id: int) -> Permission:
         response = self.client.get(f"/permissions/{permission_id}")
         return Permission.model_validate(response)
@@ -1,6 +1,8 @@
+from typing import Iterator
+
 from public_api.shared_schemas import (
     PickListCreate, PickListUpdate, PickList, PickListFilter,
-    OptimizedPickingRoute, PickingPerformance
+    OptimizedPickingRoute, PickingPerformance, ReportBreakdown, WavePlanRequest, WavePlan
 )
 from .client import APIClient
 
@@ -21,6 +23,11 @@ class PickListsAPI:
         response = self.client.get("/pick_lists/", params=params)
         return [PickList.model_validate(item) for item in response]
 
+    def iter_pick_lists(self, filter_params: PickListFilter | None = None, page_size: int = 100) -> Iterator[PickList]:
+        params = filter_params.model_dump(mode="json", exclude_unset=True) if filter_params else None
+        for item in self.client.iterate("/pick_lists/", params, page_size):
+            yield PickList.model_validate(item)
+
     def get_pick_list(self, pick_list_id: int) -> PickList:
         response = self.client.get(f"/pick_lists/{pick_list_id}")
         return PickList.model_validate(response)
@@ -37,6 +44,10 @@ class PickListsAPI:
         response = self.client.get("/pick_lists/optimize_route", params={"pick_list_id": pick_list_id})
         return OptimizedPickingRoute.model_validate(response)
 
+    def plan_wave(self, request: WavePlanRequest) -> WavePlan:
+        response = self.client.post("/pick_lists/waves", json=request.model_dump(mode="json"))
+        return WavePlan.model_validate(response)
+
     def start_pick_list(self, pick_list_id: int) -> PickList:
         response = self.client.post(f"/pick_lists/{pick_list_id}/start")
         return PickList.model_validate(response)
@@ -45,10 +56,13 @@ class PickListsAPI:
         response = self.client.post(f"/pick_lists/{pick_list_id}/complete")
         return PickList.model_validate(response)
 
-    def get_picking_performance(self, start_date: int, end_date: int) -> PickingPerformance:
+    def get_picking_performance(self, start_date: int, end_date: int,
+                                breakdown: ReportBreakdown | None = None) -> PickingPerformance:
         params = {
             "start_date": start_date,
             "end_date": end_date
         }
+        if breakdown:
+            params["breakdown"] = breakdown.value
         response = self.client.get("/pick_lists/performance", params=params)
         return PickingPerformance.model_validate(response)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterator, List
 
 from public_api.shared_schemas import POItem, POItemUpdate
 from .client import APIClient
@@ -21,6 +21,10 @@ class POItemsAPI:
         response = self.client.get("/po_items", params={"skip": skip, "limit": limit})
         return [POItem.model_validate(item) for item in response]
 
+    def iter_po_items(self, page_size: int = 100) -> Iterator[POItem]:
+        for item in self.client.iterate("/po_items", None, page_size):
+            yield POItem.model_validate(item)
+
     def get_po_items_by_product(self, product_id: int, skip: int = 0, limit: int = 100) -> List[POItem]:
         response = self.client.get(f"/po_items/by_product/{product_id}", params={"skip": skip, "limit": limit})
         return [POItem.model_validate(item) for item in response]
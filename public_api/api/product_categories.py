@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterator, List
 
 from public_api.shared_schemas.inventory import ProductCategoryCreate, ProductCategoryUpdate, ProductCategory
 from .client import APIClient
@@ -16,6 +16,10 @@ class ProductCategoriesAPI:
         response = self.client.get("/product_categories/", params={"skip": skip, "limit": limit})
         return [ProductCategory.model_validate(item) for item in response]
 
+    def iter_categories(self, page_size: int = 100) -> Iterator[ProductCategory]:
+        for item in self.client.iterate("/product_categories/", None, page_size):
+            yield ProductCategory.model_validate(item)
+
     def get_category(self, category_id: int) -> ProductCategory:
         response = self.client.get(f"/product_categories/{category_id}")
         return ProductCategory.model_validate(response)
@@ -1,6 +1,8 @@
+from typing import Iterator
+
 from public_api.shared_schemas.inventory import (
     ProductCreate, ProductUpdate, Product, ProductWithCategoryAndInventory,
-    ProductFilter, BarcodeData
+    ProductFilter, BarcodeData, ProductLookup, ProductLookupRequest, ProductLookupResult
 )
 from .client import APIClient
 
@@ -21,6 +23,12 @@ class ProductsAPI:
         response = self.client.get("/products/", params=params)
         return [ProductWithCategoryAndInventory.model_validate(item) for item in response]
 
+    def iter_products(self, product_filter: ProductFilter | None = None,
+                      page_size: int = 100) -> Iterator[ProductWithCategoryAndInventory]:
+        params = product_filter.model_dump(mode="json", exclude_unset=True) if product_filter else None
+        for item in self.client.iterate("/products/", params, page_size):
+            yield ProductWithCategoryAndInventory.model_validate(item)
+
     def get_product(self, product_id: int) -> ProductWithCategoryAndInventory:
         response = self.client.get(f"/products/{product_id}")
         return ProductWithCategoryAndInventory.model_validate(response)
@@ -38,6 +46,15 @@ class ProductsAPI:
         response = self.client.post("/products/barcode", json=barcode_data.model_dump(mode="json"))
         return Product.model_validate(response)
 
+    def lookup_product(self, code: str) -> ProductLookup:
+        response = self.client.get("/products/lookup", params={"code": code})
+        return ProductLookup.model_validate(response)
+
+    def lookup_products(self, codes: list[str]) -> ProductLookupResult:
+        request = ProductLookupRequest(codes=codes)
+        response = self.client.post("/products/lookup", json=request.model_dump(mode="json"))
+        return ProductLookupResult.model_validate(response)
+
     def get_product_substitutes(self, product_id: int) -> list[Product]:
         response = self.client.get(f"/products/{product_id}/substitutes")
         return [Product.model_validate(item) for item in response]
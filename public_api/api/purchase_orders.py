@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from public_api.shared_schemas import (
     PurchaseOrderCreate, PurchaseOrderUpdate, PurchaseOrder,
     PurchaseOrderWithDetails, PurchaseOrderFilter, POItemReceive
@@ -21,6 +23,12 @@ class PurchaseOrdersAPI:
         response = self.client.get("/purchase_orders/", params=params)
         return [PurchaseOrderWithDetails.model_validate(item) for item in response]
 
+    def iter_purchase_orders(self, po_filter: PurchaseOrderFilter | None = None,
+                             page_size: int = 100) -> Iterator[PurchaseOrderWithDetails]:
+        params = po_filter.model_dump(mode="json", exclude_unset=True) if po_filter else None
+        for item in self.client.iterate("/purchase_orders/", params, page_size):
+            yield PurchaseOrderWithDetails.model_validate(item)
+
     def get_purchase_order(self, po_id: int) -> PurchaseOrderWithDetails:
         response = self.client.get(f"/purchase_orders/{po_id}")
         return PurchaseOrderWithDetails.model_validate(response)
@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from public_api.shared_schemas.quality import (
     QualityCheckCreate, QualityCheckUpdate, QualityCheckWithProduct, QualityCheckFilter,
     QualityMetrics, QualityStandardCreate, QualityStandardUpdate, QualityStandard,
@@ -23,6 +25,12 @@ class QualityAPI:
         response = self.client.get("/quality/checks", params=params)
         return [QualityCheckWithProduct.model_validate(item) for item in response]
 
+    def iter_quality_checks(self, filter_params: QualityCheckFilter | None = None,
+                            page_size: int = 100) -> Iterator[QualityCheckWithProduct]:
+        params = filter_params.model_dump(mode="json", exclude_unset=True) if filter_params else None
+        for item in self.client.iterate("/quality/checks", params, page_size):
+            yield QualityCheckWithProduct.model_validate(item)
+
     def get_quality_check(self, check_id: int) -> QualityCheckWithProduct:
         response = self.client.get(f"/quality/checks/{check_id}")
         return QualityCheckWithProduct.model_validate(response)
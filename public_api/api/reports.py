@@ -2,7 +2,8 @@ from typing import List
 
 from public_api.api import APIClient
 from public_api.shared_schemas import (
-    InventorySummaryReport, OrderSummaryReport, WarehousePerformanceReport, KPIDashboard, InventoryTrendItem
+    InventorySummaryReport, OrderSummaryReport, WarehousePerformanceReport, KPIDashboard, InventoryTrendItem,
+    ReportBreakdown
 )
 
 
@@ -19,8 +20,11 @@ class ReportsAPI:
         response = self.client.get("/reports/order_summary", params=params)
         return OrderSummaryReport.model_validate(response)
 
-    def get_warehouse_performance(self, start_date: int, end_date: int) -> WarehousePerformanceReport:
+    def get_warehouse_performance(self, start_date: int, end_date: int,
+                                  breakdown: ReportBreakdown | None = None) -> WarehousePerformanceReport:
         params = {"start_date": start_date, "end_date": end_date}
+        if breakdown:
+            params["breakdown"] = breakdown.value
         response = self.client.get("/reports/warehouse_performance", params=params)
         return WarehousePerformanceReport.model_validate(response)
 
@@ -15,7 +15,9 @@ class SearchAPI:
             in_stock: bool | None = None,
             min_quantity: int | None = None,
             sort_by: str | None = None,
-            sort_order: str | None = "asc"
+            sort_order: str | None = "asc",
+            skip: int = 0,
+            limit: int = 100
     ) -> list[Product]:
         params = {
             "q": q,
@@ -25,7 +27,9 @@ class SearchAPI:
             "in_stock": in_stock,
             "min_quantity": min_quantity,
             "sort_by": sort_by,
-            "sort_order": sort_order
+            "sort_order": sort_order,
+            "skip": skip,
+            "limit": limit
         }
         response = self.client.get("/search/products", params={k: v for k, v in params.items() if v is not None})
         return [Product.model_validate(item) for item in response]
@@ -40,7 +44,9 @@ class SearchAPI:
             end_date: int | None = None,
             customer_id: int | None = None,
             sort_by: str | None = None,
-            sort_order: str | None = "asc"
+            sort_order: str | None = "asc",
+            skip: int = 0,
+            limit: int = 100
     ) -> list[Order]:
         params = {
             "q": q,
@@ -51,7 +57,9 @@ class SearchAPI:
             "end_date": end_date,
             "customer_id": customer_id,
             "sort_by": sort_by,
-            "sort_order": sort_order
+            "sort_order": sort_order,
+            "skip": skip,
+            "limit": limit
         }
         response = self.client.get("/search/orders", params={k: v for k, v in params.items() if v is not None})
         return [Order.model_validate(item) for item in response]
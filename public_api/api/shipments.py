@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from public_api.shared_schemas import (
     Shipment, ShipmentCreate, ShipmentUpdate, ShipmentFilter,
     CarrierRate, ShippingLabel, ShipmentTracking, ShipmentWithDetails
@@ -17,6 +19,11 @@ class ShipmentsAPI:
         response = self.client.get("/shipments/", params=params)
         return [Shipment.model_validate(item) for item in response]
 
+    def iter_shipments(self, filter_params: ShipmentFilter | None = None, page_size: int = 100) -> Iterator[Shipment]:
+        params = filter_params.model_dump(mode="json", exclude_unset=True) if filter_params else None
+        for item in self.client.iterate("/shipments/", params, page_size):
+            yield Shipment.model_validate(item)
+
     def get_shipment(self, shipment_id: int) -> Shipment:
         response = self.client.get(f"/shipments/{shipment_id}")
         return Shipment.model_validate(response)
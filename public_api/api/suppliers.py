@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from public_api.shared_schemas import (
     Supplier, SupplierCreate, SupplierUpdate, SupplierFilter, PurchaseOrder
 )
@@ -16,6 +18,11 @@ class SuppliersAPI:
         response = self.client.get("/suppliers/", params=params)
         return [Supplier.model_validate(item) for item in response]
 
+    def iter_suppliers(self, filter_params: SupplierFilter | None = None, page_size: int = 100) -> Iterator[Supplier]:
+        params = filter_params.model_dump(mode="json", exclude_unset=True) if filter_params else None
+        for item in self.client.iterate("/suppliers/", params, page_size):
+            yield Supplier.model_validate(item)
+
     def get_supplier(self, supplier_id: int) -> Supplier:
         response = self.client.get(f"/suppliers/{supplier_id}")
         return Supplier.model_validate(response)
@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from public_api.shared_schemas import (
     Task, TaskCreate, TaskUpdate, TaskWithAssignee, TaskFilter, TaskStatistics,
     UserTaskSummary, TaskComment, TaskCommentCreate
@@ -22,6 +24,11 @@ class TasksAPI:
         response = self.client.get("/tasks/", params=params)
         return [TaskWithAssignee.model_validate(item) for item in response]
 
+    def iter_tasks(self, filter_params: TaskFilter | None = None, page_size: int = 100) -> Iterator[TaskWithAssignee]:
+        params = filter_params.model_dump(exclude_none=True) if filter_params else None
+        for item in self.client.iterate("/tasks/", params, page_size):
+            yield TaskWithAssignee.model_validate(item)
+
     def get_task_statistics(self) -> TaskStatistics:
         response = self.client.get("/tasks/statistics")
         return TaskStatistics.model_validate(response)
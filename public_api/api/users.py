@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from public_api.shared_schemas import (
     UserCreate, UserUpdate, UserSanitized, Token,
     Message, UserFilter, AllPermissions, AllRoles, UserWithPermissions,
@@ -88,6 +90,11 @@ class UsersAPI:
         response = self.client.get("/users/", params=params)
         return [UserSanitized.model_validate(item) for item in response]
 
+    def iter_users(self, filter_params: UserFilter | None = None, page_size: int = 100) -> Iterator[UserSanitized]:
+        params = filter_params.model_dump(exclude_unset=True) if filter_params else None
+        for item in self.client.iterate("/users/", params, page_size):
+            yield UserSanitized.model_validate(item)
+
     def create_user(self, user: UserCreate) -> UserSanitized:
         response = self.client.post("/users/", json=user.model_dump())
         return UserSanitized.model_validate(response)
@@ -1,35 +1,80 @@
-from typing import List
+from threading import Lock
+from typing import Callable, Hashable, List
 
 from public_api.permissions.permission_enums import PermissionType, PermissionName
 from public_api.shared_schemas import UserPermission
 
+# One bit per action; enum members and their raw values both map, so string callers keep working
+ACTION_BITS: dict = {}
+for _bit, _action in enumerate(PermissionType):
+    ACTION_BITS[_action] = ACTION_BITS[_action.value] = 1 << _bit
+READ_BIT, WRITE_BIT, EDIT_BIT, DELETE_BIT = (ACTION_BITS[action] for action in PermissionType)
+
+# In DB permission names are stored with " " (e.g. "User Management"), matching the enum values
+_NAMES_BY_VALUE = {name.value.upper(): name for name in PermissionName}
+
+
+def compile_permissions(permissions: List[UserPermission]) -> dict:
+    """Fold a list of permissions into {PermissionName (and its value): action bitmask}."""
+    masks = {}
+    for p in permissions:
+        name = _NAMES_BY_VALUE.get(p.name.replace("_", " ").upper())
+        if name is None:
+            continue
+        mask = ((READ_BIT if p.can_read else 0) | (WRITE_BIT if p.can_write else 0)
+                | (EDIT_BIT if p.can_edit else 0) | (DELETE_BIT if p.can_delete else 0))
+        masks[name] = masks[name.value] = mask
+    return masks
+
+
 class PermissionManager:
+    # role id -> (permissions version, manager); one entry per role, replaced when the version changes
+    _by_role: dict[Hashable, tuple[Hashable, "PermissionManager"]] = {}
+    _by_role_lock = Lock()
+
+    __slots__ = ("masks",)
+
     def __init__(self, permissions: List[UserPermission]):
-        # enum values are with "_", so we need to replace " " with "_"
-        # cause in DB we have " " instead of "_"
-        self.permissions = {PermissionName[p.name.replace(" ", "_").upper()]: p for p in permissions}
+        self.masks = compile_permissions(permissions)
+
+    @classmethod
+    def for_role(
+            cls,
+            role_id: Hashable,
+            version: Hashable,
+            permissions: List[UserPermission] | Callable[[], List[UserPermission]]
+    ) -> "PermissionManager":
+        """
+        Return the compiled manager for `role_id`, rebuilding it only when `version` differs from the memoized one.
+        `permissions` may be a callable so the list is only built on a rebuild.
+        """
+        entry = cls._by_role.get(role_id)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        manager = cls(permissions() if callable(permissions) else permissions)
+        with cls._by_role_lock:
+            cls._by_role[role_id] = (version, manager)
+        return manager
+
+    @classmethod
+    def forget_role(cls, role_id: Hashable | None = None) -> None:
+        with cls._by_role_lock:
+            if role_id is None:
+                cls._by_role.clear()
+            else:
+                cls._by_role.pop(role_id, None)
 
     def has_permission(self, tab: PermissionName, action: PermissionType) -> bool:
-        if tab in self.permissions:
-            permission = self.permissions[tab]
-            if action == PermissionType.READ and permission.can_read:
-                return True
-            if action == PermissionType.WRITE and permission.can_write:
-                return True
-            if action == PermissionType.EDIT and permission.can_edit:
-                return True
-            if action == PermissionType.DELETE and permission.can_delete:
-                return True
-        return False
+        return self.masks.get(tab, 0) & ACTION_BITS.get(action, 0) != 0
 
     def has_read_permission(self, permission: PermissionName) -> bool:
-        return self.has_permission(permission, PermissionType.READ)
+        return self.masks.get(permission, 0) & READ_BIT != 0
 
     def has_write_permission(self, permission: PermissionName) -> bool:
-        return self.has_permission(permission, PermissionType.WRITE)
+        return self.masks.get(permission, 0) & WRITE_BIT != 0
 
     def has_edit_permission(self, permission: PermissionName) -> bool:
-        return self.has_permission(permission, PermissionType.EDIT)
+        return self.masks.get(permission, 0) & EDIT_BIT != 0
 
     def has_delete_permission(self, permission: PermissionName) -> bool:
-        return self.has_permission(permission, PermissionType.DELETE)
+        return self.masks.get(permission, 0) & DELETE_BIT != 0
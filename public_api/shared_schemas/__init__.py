@@ -23,12 +23,13 @@ from .inventory import (
     ProductWithInventory, LocationWithInventory, ZoneWithLocations,
     ProductFilter, InventoryFilter, ZoneFilter,
     InventoryAdjustment, BarcodeData, InventoryTransfer,
+    ProductLocationStock, ProductLookup, ProductLookupRequest, ProductLookupResult,
     ProductWithCategoryAndInventory, InventoryReport,
     WarehouseLayout, InventoryMovement, StocktakeItem, StocktakeCreate,
-    StocktakeDiscrepancy, StocktakeResult, ABCCategory, ABCAnalysisResult,
-    InventoryLocationSuggestion, BulkImportData, BulkImportResult,
+    StocktakeDiscrepancy, StocktakeResult, ABCCategory, ABCAnalysisResult, ABCXYZCell, ABCClass, XYZClass,
+    InventoryLocationSuggestion, BulkImportData, InventoryImportRow, BulkImportResult,
     StorageUtilization, LocationBase, LocationCreate, LocationUpdate, Location,
-    LocationFilter, InventorySummary, InventoryList, InventoryWithDetails,
+    LocationFilter, InventorySummary, InventoryList, InventoryWithDetails, CountMode,
     InventoryTrendItem,
 )
 # Notification shared_schemas
@@ -61,7 +62,8 @@ from .quality import (QualityCheckBase, QualityCheckCreate,
 # Report shared_schemas
 from .reports import (
     InventoryItem, InventorySummaryReport,
-    OrderSummaryReport, WarehousePerformanceMetric, WarehousePerformanceReport,
+    OrderSummaryReport, WarehousePerformanceMetric, WarehousePerformanceReport, WarehousePerformancePeriod,
+    ReportBreakdown,
     KPIMetric, KPIDashboard
 )
 # Task shared_schemas
@@ -90,10 +92,10 @@ from .warehouse import (
     ShipmentBase, ShipmentCreate, ShipmentUpdate, Shipment,
     CarrierBase, CarrierCreate, CarrierUpdate, Carrier,
     PickListFilter, ReceiptFilter, ShipmentFilter, WarehouseStats, LocationInventory,
-    LocationInventoryUpdate, OptimizedPickingRoute, PickingPerformance,
+    LocationInventoryUpdate, OptimizedPickingRoute, PickingPerformance, PickingPerformanceGroup,
     ReceiptDiscrepancy, ShippingLabel, CarrierRate, ShipmentTracking,
     InventoryMovementCreate, InventoryAdjustmentCreate,
-    ShipmentWithDetails, ShipmentStatus
+    ShipmentWithDetails, ShipmentStatus, WavePlanRequest, PutWallSlot, WaveBatch, WavePlan
 )
 # Yard shared_schemas
 from .yard import (
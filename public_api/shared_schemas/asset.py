@@ -88,6 +88,7 @@ class AssetMaintenanceFilter(BaseModel):
 class AssetWithMaintenanceList(BaseModel):
     assets: list[AssetWithMaintenance]
     total: int
+    next_cursor: str | None = None
 
 
 class AssetTransfer(BaseModel):
@@ -24,6 +24,8 @@ class ChatResponse(BaseModel):
     user2: UserSanitized
     created_at: datetime
     last_message: MessageResponse | None = None
+    # Messages of the other participant the requesting user hasn't read yet
+    unread_count: int = 0
 
     class Config:
         from_attributes = True
@@ -32,4 +34,6 @@ class ChatListResponse(BaseModel):
     chats: List[ChatResponse]
 
 class ChatMessageListResponse(BaseModel):
-    messages: List[MessageResponse]
\ No newline at end of file
+    messages: List[MessageResponse]
+    # More messages lie beyond the window: older ones, or newer ones when it was requested with after_id
+    has_more: bool = False
\ No newline at end of file
@@ -1,5 +1,7 @@
 # /server/app/shared_schemas/inventory.py
 
+from enum import Enum
+
 from pydantic import BaseModel, constr, Field
 
 
@@ -24,6 +26,18 @@ class ProductCategory(ProductCategoryBase):
         from_attributes = True
 
 
+class ABCClass(str, Enum):
+    A = "A"  # the products making up the first 80% of the stock value
+    B = "B"  # the next 15%
+    C = "C"
+
+
+class XYZClass(str, Enum):
+    X = "X"  # steady weekly demand (coefficient of variation up to 0.5)
+    Y = "Y"  # variable demand (up to 1.0)
+    Z = "Z"  # erratic or no demand
+
+
 class ProductBase(BaseModel):
     sku: str
     name: str
@@ -54,6 +68,9 @@ class ProductUpdate(BaseModel):
 
 class Product(ProductBase):
     id: int
+    abc_class: ABCClass | None = None
+    xyz_class: XYZClass | None = None
+    classified_at: int | None = None
 
     class Config:
         from_attributes = True
@@ -157,6 +174,8 @@ class ProductFilter(BaseModel):
     category_id: int | None = None
     sku: str | None = None
     barcode: str | None = None
+    abc_class: ABCClass | None = None
+    xyz_class: XYZClass | None = None
 
 
 class LocationFilter(BaseModel):
@@ -176,6 +195,33 @@ class BarcodeData(BaseModel):
     barcode: constr(min_length=1, max_length=50)
 
 
+class ProductLocationStock(BaseModel):
+    location_id: int
+    location_name: str
+    quantity: int
+
+
+class ProductLookup(BaseModel):
+    code: str
+    product_id: int
+    sku: str
+    name: str
+    barcode: str | None = None
+    unit_of_measure: str | None = None
+    price: float
+    on_hand: int
+    stock: list[ProductLocationStock] = []
+
+
+class ProductLookupRequest(BaseModel):
+    codes: list[constr(min_length=1, max_length=50)] = Field(..., min_length=1, max_length=1000)
+
+
+class ProductLookupResult(BaseModel):
+    products: list[ProductLookup]
+    missing: list[str]
+
+
 class InventoryTransfer(BaseModel):
     from_location_id: int
     to_location_id: int
@@ -206,6 +252,9 @@ class InventoryMovement(BaseModel):
     reason: str
     timestamp: int
 
+    class Config:
+        from_attributes = True
+
 
 class InventoryAdjustment(BaseModel):
     product_id: int
@@ -246,8 +295,17 @@ class ABCCategory(BaseModel):
     item_percentage: float
 
 
+class ABCXYZCell(BaseModel):
+    abc_class: ABCClass
+    xyz_class: XYZClass
+    product_count: int
+    value_percentage: float
+
+
 class ABCAnalysisResult(BaseModel):
     categories: list[ABCCategory]
+    matrix: list[ABCXYZCell] = []
+    classified_at: int | None = None
 
 
 class InventoryLocationSuggestion(BaseModel):
@@ -255,16 +313,29 @@ class InventoryLocationSuggestion(BaseModel):
     current_location_id: int
     suggested_location_id: int
     reason: str
+    quantity: int = 0
+    travel_saving: float = 0.0  # round-trip walking distance saved over the velocity window, in layout units
 
 
 class BulkImportData(BaseModel):
     items: list[InventoryCreate]
 
 
+class InventoryImportRow(BaseModel):
+    # One line of an import file (CSV or NDJSON); the product is given by id or by SKU
+    product_id: int | None = None
+    sku: str | None = None
+    location_id: int
+    quantity: int
+    expiration_date: int | None = None
+
+
 class BulkImportResult(BaseModel):
     success_count: int
     failure_count: int
     errors: list[str]
+    elapsed_seconds: float = 0.0
+    rows_per_second: float = 0.0
 
 
 class StorageUtilization(BaseModel):
@@ -288,9 +359,16 @@ class InventoryWithDetails(Inventory):
     location: Location
 
 
+class CountMode(str, Enum):
+    EXACT = "exact"  # COUNT(*) with the request's filters
+    CACHED = "cached"  # exact count, reused for a short while per filter combination
+    ESTIMATE = "estimate"  # table statistics when unfiltered, otherwise as CACHED
+
+
 class InventoryList(BaseModel):
     items: list[InventoryWithDetails]
     total: int
+    next_cursor: str | None = None
 
 
 class InventoryFilter(BaseModel):
@@ -300,6 +378,8 @@ class InventoryFilter(BaseModel):
     name: str | None = None
     quantity_min: int | None = None
     quantity_max: int | None = None
+    abc_class: ABCClass | None = None
+    xyz_class: XYZClass | None = None
 
 
 class InventoryTrendItem(BaseModel):
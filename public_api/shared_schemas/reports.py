@@ -35,10 +35,21 @@ class WarehousePerformanceMetric(BaseModel):
     unit: str
 
 
+class ReportBreakdown(str, Enum):
+    DAY = 'day'
+    ZONE = 'zone'
+
+
+class WarehousePerformancePeriod(BaseModel):
+    day: int  # start of the day (UTC)
+    metrics: list[WarehousePerformanceMetric]
+
+
 class WarehousePerformanceReport(BaseModel):
     start_date: int
     end_date: int
     metrics: list[WarehousePerformanceMetric]
+    breakdown: list[WarehousePerformancePeriod] | None = None
 
 
 class TrendDirection(str, Enum):
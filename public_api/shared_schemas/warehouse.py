@@ -16,6 +16,8 @@ class PickListItemBase(BaseModel):
     location_id: int
     quantity: int
     picked_quantity: int = 0
+    order_id: int | None = None  # on batch pick lists, the order the units are for
+    put_wall_slot: int | None = None
 
 
 class PickListItemCreate(PickListItemBase):
@@ -38,7 +40,7 @@ class PickListItem(PickListItemBase):
 
 
 class PickListBase(BaseModel):
-    order_id: int
+    order_id: int | None = None  # None for a batch pick list of several orders
     status: str
 
 
@@ -54,6 +56,7 @@ class PickListUpdate(BaseModel):
 
 class PickList(PickListBase):
     pick_list_id: int
+    wave_id: int | None = None
     created_at: int
     completed_at: int | None = None
     items: list[PickListItem] = []
@@ -165,6 +168,7 @@ class Carrier(CarrierBase):
 class PickListFilter(BaseModel):
     status: str | None = None
     order_id: int | None = None
+    wave_id: int | None = None
     date_from: int | None = None
     date_to: int | None = None
 
@@ -209,12 +213,58 @@ class LocationInventoryUpdate(BaseModel):
 class OptimizedPickingRoute(BaseModel):
     pick_list_id: int
     optimized_route: list[PickListItem]
+    total_distance: float = 0.0  # metres walked from the depot through every pick and back
+    strategy: str | None = None  # routing heuristic the order came from, e.g. "largest_gap+2opt"
+
+
+class WavePlanRequest(BaseModel):
+    order_ids: list[int] | None = None  # None plans every open order not on a pick list yet
+    put_wall_slots: int | None = None  # orders per batch; defaults to settings.WAVE_PUT_WALL_SLOTS
+    max_lines_per_batch: int | None = None  # defaults to settings.WAVE_MAX_LINES_PER_BATCH
+    simulate: bool = False  # plan and estimate only, without allocating stock or creating pick lists
+
+
+class PutWallSlot(BaseModel):
+    slot: int
+    order_id: int
+
+
+class WaveBatch(BaseModel):
+    pick_list_id: int | None = None  # None in a simulation
+    zone_id: int | None
+    carrier_id: int | None
+    cutoff: int | None
+    slots: list[PutWallSlot]
+    lines: int
+    units: int
+    locations: int
+    travel_distance: float  # metres
+    estimated_seconds: float
+
+
+class WavePlan(BaseModel):
+    wave_ids: list[int] = []  # one wave per carrier and cutoff, empty in a simulation
+    simulated: bool
+    batches: list[WaveBatch]
+    orders_planned: int
+    unallocated_order_ids: list[int]  # orders that can't be filled from available stock
+    picks_per_hour: float  # order lines per picker hour, batch picked
+    single_order_picks_per_hour: float  # the same orders picked one pick list per order
+
+
+class PickingPerformanceGroup(BaseModel):
+    key: int | None  # start of the day (UTC) or zone id, None for locations outside any zone
+    pick_lists: int
+    average_picking_time: float
+    items_picked_per_hour: float
+    accuracy_rate: float
 
 
 class PickingPerformance(BaseModel):
     average_picking_time: float
     items_picked_per_hour: float
     accuracy_rate: float
+    breakdown: list[PickingPerformanceGroup] | None = None
 
 
 class QualityCheckCreate(BaseModel):
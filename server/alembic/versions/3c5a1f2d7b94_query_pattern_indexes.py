@@ -0,0 +1,77 @@
+"""query pattern indexes
+
+Revision ID: 3c5a1f2d7b94
+Revises: e07fc64f054b
+Create Date: 2026-10-17 10:12:31.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c5a1f2d7b94'
+down_revision: Union[str, None] = 'e07fc64f054b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns) of every index matching a hot filter + sort of the API
+INDEXES = [
+    ('ix_inventory_movements_product_id_timestamp', 'inventory_movements', ['product_id', 'timestamp']),
+    ('ix_orders_status_order_date', 'orders', ['status', 'order_date']),
+    ('ix_tasks_assigned_to_status_due_date', 'tasks', ['assigned_to', 'status', 'due_date']),
+    ('ix_audit_log_timestamp', 'audit_log', ['timestamp']),
+    ('ix_notifications_user_id_is_read', 'notifications', ['user_id', 'is_read']),
+    ('ix_dock_appointments_yard_location_id_appointment_time', 'dock_appointments',
+     ['yard_location_id', 'appointment_time']),
+    ('ix_messages_chat_id_created_at', 'messages', ['chat_id', 'created_at']),
+]
+
+
+def _existing(indexes: list) -> list:
+    # No migration creates notifications, chats or messages (Base.metadata.create_all does, with their indexes);
+    # on a database they are missing from, there is nothing to index
+    inspector = sa.inspect(op.get_bind())
+    return [index for index in indexes if inspector.has_table(index[1])]
+
+
+def upgrade() -> None:
+    # Stock of a product at a location must live in a single row before it can be made unique:
+    # fold duplicates into the oldest row. Derived tables keep the statements valid on MySQL too.
+    op.execute(sa.text(
+        "UPDATE inventory SET quantity = ("
+        " SELECT total FROM ("
+        "  SELECT product_id, location_id, SUM(quantity) AS total FROM inventory"
+        "  GROUP BY product_id, location_id"
+        " ) AS totals"
+        " WHERE totals.product_id = inventory.product_id AND totals.location_id = inventory.location_id"
+        ") WHERE id IN ("
+        " SELECT keep_id FROM ("
+        "  SELECT MIN(id) AS keep_id FROM inventory"
+        "  WHERE product_id IS NOT NULL AND location_id IS NOT NULL"
+        "  GROUP BY product_id, location_id HAVING COUNT(*) > 1"
+        " ) AS keepers"
+        ")"
+    ))
+    op.execute(sa.text(
+        "DELETE FROM inventory WHERE product_id IS NOT NULL AND location_id IS NOT NULL AND id NOT IN ("
+        " SELECT keep_id FROM ("
+        "  SELECT MIN(id) AS keep_id FROM inventory GROUP BY product_id, location_id"
+        " ) AS keepers"
+        ")"
+    ))
+    with op.batch_alter_table('inventory') as batch_op:
+        batch_op.create_unique_constraint('uq_inventory_product_location', ['product_id', 'location_id'])
+
+    for name, table, columns in _existing(INDEXES):
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(_existing(INDEXES)):
+        op.drop_index(name, table_name=table)
+
+    with op.batch_alter_table('inventory') as batch_op:
+        batch_op.drop_constraint('uq_inventory_product_location', type_='unique')
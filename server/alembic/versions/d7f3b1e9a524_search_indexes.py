@@ -0,0 +1,67 @@
+"""search indexes
+
+Revision ID: d7f3b1e9a524
+Revises: c4e8a2f6d913
+Create Date: 2026-10-17 19:10:52.803116
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7f3b1e9a524'
+down_revision: Union[str, None] = 'c4e8a2f6d913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, indexed columns) of every full-text index
+SEARCH_TABLES = [
+    ('products', ['name', 'sku', 'description']),
+    ('customers', ['name', 'email']),
+]
+PRODUCT_DOCUMENT = "coalesce(name, '') || ' ' || coalesce(sku, '') || ' ' || coalesce(description, '')"
+CUSTOMER_DOCUMENT = "coalesce(name, '') || ' ' || coalesce(email, '')"
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_orders_customer_id'), 'orders', ['customer_id'], unique=False)
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        # External-content FTS5 tables mirrored by triggers, then filled from the existing rows
+        for table, columns in SEARCH_TABLES:
+            names = ', '.join(columns)
+            new = ', '.join(f'new.{column}' for column in columns)
+            old = ', '.join(f'old.{column}' for column in columns)
+            remove = f"INSERT INTO {table}_fts({table}_fts, rowid, {names}) VALUES ('delete', old.id, {old});"
+            add = f"INSERT INTO {table}_fts(rowid, {names}) VALUES (new.id, {new});"
+            op.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts USING fts5({names}, content='{table}', "
+                       f"content_rowid='id', prefix='2 3', tokenize='unicode61 remove_diacritics 2')")
+            op.execute(f"CREATE TRIGGER {table}_fts_insert AFTER INSERT ON {table} BEGIN {add} END")
+            op.execute(f"CREATE TRIGGER {table}_fts_delete AFTER DELETE ON {table} BEGIN {remove} END")
+            op.execute(f"CREATE TRIGGER {table}_fts_update AFTER UPDATE OF {names} ON {table} BEGIN {remove} {add} END")
+            op.execute(f"INSERT INTO {table}_fts({table}_fts) VALUES ('rebuild')")
+    elif dialect == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(f"CREATE INDEX IF NOT EXISTS ix_products_search ON products USING gin "
+                   f"(to_tsvector('simple', {PRODUCT_DOCUMENT}))")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_products_sku_trgm ON products USING gin (sku gin_trgm_ops)")
+        op.execute(f"CREATE INDEX IF NOT EXISTS ix_customers_search ON customers USING gin "
+                   f"(to_tsvector('simple', {CUSTOMER_DOCUMENT}))")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_customers_email_trgm ON customers USING gin (email gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for table, _ in SEARCH_TABLES:
+            for trigger in ('insert', 'delete', 'update'):
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_fts_{trigger}")
+            op.execute(f"DROP TABLE IF EXISTS {table}_fts")
+    elif dialect == 'postgresql':
+        for index in ('ix_customers_email_trgm', 'ix_customers_search', 'ix_products_sku_trgm', 'ix_products_search'):
+            op.execute(f"DROP INDEX IF EXISTS {index}")
+
+    op.drop_index(op.f('ix_orders_customer_id'), table_name='orders')
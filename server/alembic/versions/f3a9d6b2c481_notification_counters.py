@@ -0,0 +1,47 @@
+"""notification counters
+
+Revision ID: f3a9d6b2c481
+Revises: e5b2c8d4f617
+Create Date: 2026-10-17 21:04:12.590318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9d6b2c481'
+down_revision: Union[str, None] = 'e5b2c8d4f617'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_notifications() -> bool:
+    # No migration creates notifications (Base.metadata.create_all does, already in its current form)
+    return sa.inspect(op.get_bind()).has_table('notifications')
+
+
+def upgrade() -> None:
+    has_notifications = _has_notifications()
+    if has_notifications:
+        # Unread is is_read = false from now on, which the (user_id, is_read) index can serve; NULL meant unread
+        op.execute("UPDATE notifications SET is_read = false WHERE is_read IS NULL")
+        with op.batch_alter_table('notifications') as batch_op:
+            batch_op.alter_column('is_read', existing_type=sa.Boolean(), nullable=False, server_default=sa.false())
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.add_column(sa.Column('unread_notification_count', sa.Integer(), nullable=False, server_default='0'))
+    if has_notifications:
+        op.execute(
+            "UPDATE users SET unread_notification_count = (SELECT count(*) FROM notifications "
+            "WHERE notifications.user_id = users.id AND notifications.is_read = false)"
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('unread_notification_count')
+    if _has_notifications():
+        with op.batch_alter_table('notifications') as batch_op:
+            batch_op.alter_column('is_read', existing_type=sa.Boolean(), nullable=True, server_default=None)
@@ -1,16 +1,21 @@
 # /server/app/api/deps.py
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Response, status
+from fastapi.requests import HTTPConnection
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from sqlalchemy.orm import Session
 
 from public_api.permissions import PermissionName, PermissionType, PermissionManager
 from app import crud, models
+from app.core.cache import principal_cache
 from app.core.config import settings
-from app.db.database import get_db
+from app.db.database import SessionLocal, get_db, get_async_db  # noqa: F401
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/login/access-token")
 
+# Set on list responses requested with `cursor` while more rows follow; pass it back as `cursor` for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 def decode_token(token: str) -> dict:
     try:
@@ -42,7 +47,12 @@ def get_current_user(
             detail="Could not validate credentials",
         )
 
-    user = crud.user.get(db, id=int(user_id))
+    # The JWT itself (signature, expiry) is verified above on every request; only the DB lookups are cached
+    principal = principal_cache.get(token)
+    if principal is not None and principal.user_id == int(user_id):
+        return crud.user.from_principal(db, principal)
+
+    user = crud.user.get_with_role(db, user_id=int(user_id))
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -50,6 +60,7 @@ def get_current_user(
     if token_obj is None or not token_obj.is_active:
         raise HTTPException(status_code=401, detail="Token is invalid or expired")
 
+    principal_cache.set(token, crud.user.to_principal(user))
     return user
 
 
@@ -61,6 +72,22 @@ def get_current_active_user(
     return current_user
 
 
+def bearer_token(connection: HTTPConnection) -> str:
+    scheme, _, token = connection.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return token
+
+
+def get_stream_user_id(token: str) -> int:
+    """
+    Id of the active user `token` authenticates, for long-lived connections (WebSockets, event streams): checked in
+    a session of its own, since a request-scoped one would stay checked out for as long as the connection lasts.
+    """
+    with SessionLocal() as db:
+        return get_current_active_user(get_current_user(db, token)).id
+
+
 def get_current_admin(
         current_user: models.User = Depends(get_current_user),
 ) -> models.User:
@@ -72,11 +99,14 @@ def get_current_admin(
 
 
 def get_permission_manager(
-        db: Session = Depends(get_db),
+        token: str = Depends(oauth2_scheme),
         current_user: models.User = Depends(get_current_active_user)
 ) -> PermissionManager:
-    permissions = crud.user.get_user_permissions(db, current_user.id)
-    return PermissionManager(permissions)
+    principal = principal_cache.get(token)
+    if principal is not None and principal.user_id == current_user.id:
+        return principal.permission_manager
+    # current_user already carries its role graph (eager-loaded or rebuilt from the cache), so no query here
+    return crud.user.get_permission_manager(current_user)
 
 
 def has_permission(name: PermissionName, action: PermissionType):
@@ -91,3 +121,9 @@ def has_permission(name: PermissionName, action: PermissionType):
         return True
 
     return permission_checker
+
+
+def set_next_cursor(response: Response, page: list) -> list:
+    if next_cursor := getattr(page, "next_cursor", None):
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return page
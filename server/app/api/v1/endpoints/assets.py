@@ -1,7 +1,7 @@
 # /server/app/api/v1/endpoints/assets.py
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models
@@ -24,15 +24,19 @@ def create_asset(
 
 @router.get("/", response_model=shared_schemas.AssetWithMaintenanceList)
 def read_assets(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
+        count_mode: shared_schemas.CountMode = shared_schemas.CountMode.EXACT,
         asset_filter: shared_schemas.AssetFilter = Depends(),
         current_user: models.User = Depends(deps.has_permission(PermissionName.ASSET, PermissionType.READ))
 ):
-    assets = crud.asset.get_multi_with_filter(db, skip=skip, limit=limit, filter_params=asset_filter)
-    total = len(assets)
-    return shared_schemas.AssetWithMaintenanceList(assets=assets, total=total)
+    assets = crud.asset.get_multi_with_filter(db, skip=skip, limit=limit, cursor=cursor, filter_params=asset_filter)
+    deps.set_next_cursor(response, assets)
+    total = crud.asset.count_with_filter(db, filter_params=asset_filter, mode=count_mode)
+    return shared_schemas.AssetWithMaintenanceList(assets=assets, total=total, next_cursor=assets.next_cursor)
 
 
 @router.get("/types", response_model=list[str])
@@ -63,13 +67,17 @@ def create_asset_maintenance(
 
 @router.get("/maintenance", response_model=list[shared_schemas.AssetMaintenance])
 def read_asset_maintenances(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         maintenance_filter: shared_schemas.AssetMaintenanceFilter = Depends(),
         current_user: models.User = Depends(deps.has_permission(PermissionName.ASSET_MAINTENANCE, PermissionType.READ))
 ):
-    return crud.asset_maintenance.get_multi_with_filter(db, skip=skip, limit=limit, filter_params=maintenance_filter)
+    page = crud.asset_maintenance.get_multi_with_filter(db, skip=skip, limit=limit, cursor=cursor,
+                                                        filter_params=maintenance_filter)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/maintenance/{maintenance_id}", response_model=shared_schemas.AssetMaintenance)
@@ -120,14 +128,18 @@ def read_maintenance_types(
 
 @router.get("/{asset_id}/maintenance_history", response_model=list[shared_schemas.AssetMaintenance])
 def read_asset_maintenance_history(
+        response: Response,
         asset_id: int,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         current_user: models.User = Depends(deps.has_permission(PermissionName.ASSET_MAINTENANCE, PermissionType.READ))
 ):
     filter_params = shared_schemas.AssetMaintenanceFilter(asset_id=asset_id)
-    return crud.asset_maintenance.get_multi_with_filter(db, skip=skip, limit=limit, filter_params=filter_params)
+    page = crud.asset_maintenance.get_multi_with_filter(db, skip=skip, limit=limit, cursor=cursor,
+                                                        filter_params=filter_params)
+    return deps.set_next_cursor(response, page)
 
 
 @router.post("/{asset_id}/schedule_maintenance", response_model=shared_schemas.AssetMaintenance)
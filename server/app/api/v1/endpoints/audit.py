@@ -1,7 +1,7 @@
 # /server/app/api/v1/endpoints/audit.py
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models
@@ -22,13 +22,16 @@ def create_audit_log(
 
 @router.get("/logs", response_model=list[shared_schemas.AuditLogWithUser])
 def read_audit_logs(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         filter_params: shared_schemas.AuditLogFilter = Depends(),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.audit_log.get_multi_with_filter(db, skip=skip, limit=limit, filter_params=filter_params)
+    page = crud.audit_log.get_multi_with_filter(db, skip=skip, limit=limit, cursor=cursor, filter_params=filter_params)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/logs/summary", response_model=shared_schemas.AuditSummary)
@@ -85,36 +88,45 @@ def read_audit_log(
 
 @router.get("/logs/user/{user_id}", response_model=list[shared_schemas.AuditLog])
 def get_user_audit_logs(
+        response: Response,
         user_id: int = Path(..., title="The ID of the user to get audit logs for"),
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
     filter_params = shared_schemas.AuditLogFilter(user_id=user_id)
-    return crud.audit_log.get_multi_with_filter(db, skip=skip, limit=limit, filter_params=filter_params)
+    page = crud.audit_log.get_multi_with_filter(db, skip=skip, limit=limit, cursor=cursor, filter_params=filter_params)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/logs/table/{table_name}", response_model=list[shared_schemas.AuditLog])
 def get_table_audit_logs(
+        response: Response,
         table_name: str = Path(..., title="The name of the table to get audit logs for"),
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
     filter_params = shared_schemas.AuditLogFilter(table_name=table_name)
-    return crud.audit_log.get_multi_with_filter(db, skip=skip, limit=limit, filter_params=filter_params)
+    page = crud.audit_log.get_multi_with_filter(db, skip=skip, limit=limit, cursor=cursor, filter_params=filter_params)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/logs/record/{table_name}/{record_id}", response_model=list[shared_schemas.AuditLog])
 def get_record_audit_logs(
+        response: Response,
         table_name: str = Path(..., title="The name of the table"),
         record_id: int = Path(..., title="The ID of the record to get audit logs for"),
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
     filter_params = shared_schemas.AuditLogFilter(table_name=table_name, record_id=record_id)
-    return crud.audit_log.get_multi_with_filter(db, skip=skip, limit=limit, filter_params=filter_params)
+    page = crud.audit_log.get_multi_with_filter(db, skip=skip, limit=limit, cursor=cursor, filter_params=filter_params)
+    return deps.set_next_cursor(response, page)
@@ -1,6 +1,6 @@
 # /server/app/api/v1/endpoints/carriers.py
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Body
+from fastapi import APIRouter, Depends, HTTPException, Path, Body, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models
@@ -22,12 +22,14 @@ def create_carrier(
 
 @router.get("/", response_model=list[Carrier])
 def read_carriers(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.carrier.get_multi(db, skip=skip, limit=limit)
+    return deps.set_next_cursor(response, crud.carrier.get_multi(db, skip=skip, limit=limit, cursor=cursor))
 
 
 @router.get("/{carrier_id}", response_model=shared_schemas.Carrier)
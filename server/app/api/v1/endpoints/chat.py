@@ -1,8 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, status
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.core.pubsub import broker, user_channel, LAGGED
 from app.crud import chat as chat_crud
+from app.models.chat import Chat
 from app.models.user import User
 from public_api.shared_schemas import ChatCreate, ChatResponse, ChatListResponse, MessageCreate, \
     ChatMessageListResponse, MessageResponse
@@ -10,6 +14,10 @@ from public_api.shared_schemas import ChatCreate, ChatResponse, ChatListResponse
 router = APIRouter()
 
 
+def _chat_response(chat: Chat, user_id: int) -> ChatResponse:
+    return ChatResponse.model_validate(chat).model_copy(update={"unread_count": chat.unread_count_for(user_id)})
+
+
 @router.post("/", response_model=ChatResponse)
 def create_chat(
         chat: ChatCreate,
@@ -19,7 +27,42 @@ def create_chat(
     if chat.user2_id == current_user.id:
         raise HTTPException(status_code=400, detail="Cannot create chat with yourself")
     db_chat = chat_crud.create_chat(db, current_user.id, chat.user2_id)
-    return ChatResponse.model_validate(db_chat)
+    return _chat_response(db_chat, current_user.id)
+
+
+@router.websocket("/ws")
+async def chat_events(websocket: WebSocket, token: str | None = None):
+    # Pushes {"type": "chat_message", "chat_id", "message"} and {"type": "chat_deleted", "chat_id"} for the
+    # user's chats. Clients fetch what they missed while disconnected with GET /{chat_id}/messages?after_id=
+    try:
+        user_id = await asyncio.to_thread(deps.get_stream_user_id, token or deps.bearer_token(websocket))
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    with broker.subscribe(user_channel(user_id)) as subscription:
+        await websocket.accept()
+        # Clients only listen; reading is how a disconnect is noticed while no events arrive
+        receiving = asyncio.create_task(_drain(websocket))
+        try:
+            while True:
+                next_event = asyncio.create_task(subscription.get())
+                await asyncio.wait({receiving, next_event}, return_when=asyncio.FIRST_COMPLETED)
+                if receiving.done():
+                    next_event.cancel()
+                    return
+                event = next_event.result()
+                if event is LAGGED:
+                    await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+                    return
+                await websocket.send_json(event)
+        finally:
+            receiving.cancel()
+
+
+async def _drain(websocket: WebSocket) -> None:
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
 
 
 @router.get("/{chat_id}", response_model=ChatResponse)
@@ -31,7 +74,7 @@ def get_chat(
     chat = chat_crud.get_chat(db, chat_id, current_user.id)
     if not chat:
         raise HTTPException(status_code=404, detail="Chat not found")
-    return ChatResponse.model_validate(chat)
+    return _chat_response(chat, current_user.id)
 
 
 @router.get("/", response_model=ChatListResponse)
@@ -40,7 +83,7 @@ def get_user_chats(
         current_user: User = Depends(deps.get_current_active_user)
 ):
     chats = chat_crud.get_user_chats(db, current_user.id)
-    return ChatListResponse(chats=[ChatResponse.model_validate(chat) for chat in chats])
+    return ChatListResponse(chats=[_chat_response(chat, current_user.id) for chat in chats])
 
 
 @router.delete("/{chat_id}")
@@ -54,7 +97,7 @@ def delete_chat(
     raise HTTPException(status_code=404, detail="Chat not found")
 
 
-@router.post("/{chat_id}/messages", response_model=ChatResponse)
+@router.post("/{chat_id}/messages", response_model=MessageResponse)
 def create_message(
         chat_id: int,
         message: MessageCreate,
@@ -64,15 +107,33 @@ def create_message(
     chat = chat_crud.get_chat(db, chat_id, current_user.id)
     if not chat:
         raise HTTPException(status_code=404, detail="Chat not found")
-    chat_crud.create_message(db, chat_id, current_user.id, message)
-    return ChatResponse.model_validate(chat)
+    return chat_crud.create_message(db, chat_id, current_user.id, message)
+
+
+@router.post("/{chat_id}/read", response_model=ChatResponse)
+def mark_chat_read(
+        chat_id: int,
+        db: Session = Depends(deps.get_db),
+        current_user: User = Depends(deps.get_current_active_user)
+):
+    chat = chat_crud.mark_read(db, chat_id, current_user.id)
+    if not chat:
+        raise HTTPException(status_code=404, detail="Chat not found")
+    return _chat_response(chat, current_user.id)
 
 
 @router.get("/{chat_id}/messages", response_model=ChatMessageListResponse)
 def get_chat_messages(
         chat_id: int,
+        before_id: int | None = None,
+        after_id: int | None = None,
+        since_id: int | None = Query(None, deprecated=True, description="Same as after_id"),
+        limit: int = Query(50, ge=1, le=200),
         db: Session = Depends(deps.get_db),
         current_user: User = Depends(deps.get_current_active_user)
 ):
-    messages = chat_crud.get_chat_messages(db, chat_id, current_user.id)
-    return ChatMessageListResponse(messages=[MessageResponse.model_validate(message) for message in messages])
+    messages, has_more = chat_crud.get_chat_messages(db, chat_id, current_user.id, before_id=before_id,
+                                                     after_id=after_id if after_id is not None else since_id,
+                                                     limit=limit)
+    return ChatMessageListResponse(messages=[MessageResponse.model_validate(message) for message in messages],
+                                   has_more=has_more)
@@ -1,6 +1,6 @@
 # /server/app/api/v1/endpoints/customers.py
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models
@@ -21,13 +21,16 @@ def create_customer(
 
 @router.get("/", response_model=list[shared_schemas.Customer])
 def read_customers(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         customer_filter: shared_schemas.CustomerFilter = Depends(),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.customer.get_multi_with_filter(db, skip=skip, limit=limit, filter_params=customer_filter)
+    page = crud.customer.get_multi_with_filter(db, skip=skip, limit=limit, cursor=cursor, filter_params=customer_filter)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/{customer_id}", response_model=shared_schemas.Customer)
@@ -69,11 +72,14 @@ def delete_customer(
 
 @router.get("/{customer_id}/orders", response_model=list[shared_schemas.Order])
 def read_customer_orders(
+        response: Response,
         customer_id: int,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
     filter_params = shared_schemas.OrderFilter(customer_id=customer_id)
-    return crud.order.get_multi_with_details(db, skip=skip, limit=limit, filter_params=filter_params)
+    page = crud.order.get_multi_with_details(db, skip=skip, limit=limit, cursor=cursor, filter_params=filter_params)
+    return deps.set_next_cursor(response, page)
@@ -0,0 +1,15 @@
+# /server/app/api/v1/endpoints/health.py
+
+from fastapi import APIRouter
+
+from app.db.database import engine, async_engine, get_pool_status
+
+router = APIRouter()
+
+
+@router.get("/db-pool", response_model=dict)
+def get_db_pool_status():
+    return {
+        "sync": get_pool_status(engine),
+        "async": get_pool_status(async_engine.sync_engine),
+    }
@@ -1,35 +1,48 @@
 # /server/app/api/v1/endpoints/inventory.py
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Query, Response, UploadFile
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import crud, models
 from app.api import deps
+from app.utils.inventory_import import detect_import_format, iter_import_rows
 from public_api import shared_schemas
 
 router = APIRouter()
 
 
 @router.post("/", response_model=shared_schemas.Inventory)
-def create_inventory(
+async def create_inventory(
         inventory: shared_schemas.InventoryCreate,
-        db: Session = Depends(deps.get_db),
+        db: AsyncSession = Depends(deps.get_async_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.inventory.create(db=db, obj_in=inventory)
+    try:
+        return await crud.inventory_async.create(db=db, obj_in=inventory)
+    except IntegrityError:
+        # (product_id, location_id) is unique: stock of a product at a location lives in a single row
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Inventory for this product already exists at this location")
 
 
 @router.get("/", response_model=shared_schemas.InventoryList)
 def read_inventory(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
+        count_mode: shared_schemas.CountMode = shared_schemas.CountMode.EXACT,
         inventory_filter: shared_schemas.InventoryFilter = Depends(),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    items = crud.inventory.get_multi_with_products(db, skip=skip, limit=limit, filter_params=inventory_filter)
-    total = len(items)
-    return shared_schemas.InventoryList(items=items, total=total)
+    items = crud.inventory.get_multi_with_products(db, skip=skip, limit=limit, cursor=cursor,
+                                                   filter_params=inventory_filter)
+    deps.set_next_cursor(response, items)
+    total = crud.inventory.count_with_filter(db, filter_params=inventory_filter, mode=count_mode)
+    return shared_schemas.InventoryList(items=items, total=total, next_cursor=items.next_cursor)
 
 
 @router.post("/transfer", response_model=shared_schemas.Inventory)
@@ -56,7 +69,8 @@ def perform_cycle_count(
         db: Session = Depends(deps.get_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.inventory.perform_cycle_count(db, location_id=location_id, counted_items=counted_items)
+    return crud.inventory.perform_cycle_count(db, location_id=location_id, counted_items=counted_items,
+                                              user_id=current_user.id)
 
 
 @router.get("/low_stock", response_model=list[shared_schemas.ProductWithInventory])
@@ -100,18 +114,23 @@ def batch_update_inventory(
         db: Session = Depends(deps.get_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.inventory.batch_update(db, updates=updates)
+    return crud.inventory.batch_update(db, updates=updates, user_id=current_user.id)
 
 
 @router.get("/movement_history/{product_id}", response_model=list[shared_schemas.InventoryMovement])
 def get_inventory_movement_history(
+        response: Response,
         product_id: int,
         start_date: int = Query(None),
         end_date: int = Query(None),
+        limit: int = Query(None),
+        cursor: str | None = None,
         db: Session = Depends(deps.get_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.inventory.get_movement_history(db, product_id=product_id, start_date=start_date, end_date=end_date)
+    movements = crud.inventory.get_movement_history(db, product_id=product_id, start_date=start_date,
+                                                    end_date=end_date, limit=limit, cursor=cursor)
+    return deps.set_next_cursor(response, movements)
 
 
 @router.get("/summary", response_model=shared_schemas.InventorySummary)
@@ -128,7 +147,7 @@ def perform_stocktake(
         db: Session = Depends(deps.get_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.inventory.perform_stocktake(db, stocktake=stocktake)
+    return crud.inventory.perform_stocktake(db, stocktake=stocktake, user_id=current_user.id)
 
 
 @router.get("/abc_analysis", response_model=shared_schemas.ABCAnalysisResult)
@@ -141,10 +160,11 @@ def perform_abc_analysis(
 
 @router.post("/optimize_locations", response_model=list[shared_schemas.InventoryLocationSuggestion])
 def optimize_inventory_locations(
+        max_moves: int | None = Query(None, ge=1),
         db: Session = Depends(deps.get_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.inventory.optimize_locations(db)
+    return crud.inventory.optimize_locations(db, max_moves=max_moves)
 
 
 @router.get("/expiring_soon", response_model=list[shared_schemas.ProductWithInventory])
@@ -165,6 +185,20 @@ def bulk_import_inventory(
     return crud.inventory.bulk_import(db, import_data=import_data)
 
 
+@router.post("/bulk_import/file", response_model=shared_schemas.BulkImportResult)
+def bulk_import_inventory_file(
+        file: UploadFile,
+        db: Session = Depends(deps.get_db),
+        current_user: models.User = Depends(deps.get_current_admin)
+):
+    # CSV with a header line (sku or product_id, location_id, quantity[, expiration_date]) or NDJSON,
+    # parsed and written chunk by chunk while the upload is read
+    import_format = detect_import_format(file.filename, file.content_type)
+    if import_format is None:
+        raise HTTPException(status_code=400, detail="Unsupported file format, expected CSV or NDJSON")
+    return crud.inventory.import_rows(db, rows=iter_import_rows(file.file, import_format))
+
+
 @router.get("/storage_utilization", response_model=shared_schemas.StorageUtilization)
 def get_storage_utilization(
         db: Session = Depends(deps.get_db),
@@ -179,7 +213,18 @@ def get_inventory_forecast(
         db: Session = Depends(deps.get_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.inventory.get_forecast_for_product_id(db, product_id=product_id)
+    return crud.forecast.get_forecast(db, product_id=product_id)
+
+
+@router.post("/forecast/refresh", response_model=dict, status_code=202)
+def refresh_inventory_forecasts(
+        background_tasks: BackgroundTasks,
+        product_ids: list[int] | None = Body(None),
+        batch_size: int | None = Query(None, gt=0),
+        current_user: models.User = Depends(deps.get_current_admin)
+):
+    background_tasks.add_task(crud.forecast.refresh_in_background, product_ids=product_ids, batch_size=batch_size)
+    return {"status": "scheduled"}
 
 
 @router.get("/trend", response_model=dict[str, list[shared_schemas.InventoryTrendItem]])
@@ -196,48 +241,49 @@ def get_inventory_trend(
 
 @router.get("/reorder_suggestions", response_model=list[dict])
 def get_reorder_suggestions(
+        service_level: float | None = Query(None, gt=0, lt=1),
         db: Session = Depends(deps.get_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.inventory.get_reorder_suggestions(db)
+    return crud.inventory.get_reorder_suggestions(db, service_level=service_level)
 
 
 @router.delete("/{id}", status_code=204)
-def delete_inventory_item(
+async def delete_inventory_item(
         id: int,
-        db: Session = Depends(deps.get_db),
+        db: AsyncSession = Depends(deps.get_async_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    inventory_item = crud.inventory.get(db, id=id)
+    inventory_item = await crud.inventory_async.get(db, id=id)
     if not inventory_item:
         raise HTTPException(status_code=404, detail="Inventory item not found")
 
-    crud.inventory.remove(db, id=id)
+    await crud.inventory_async.remove(db, id=id)
 
 
 @router.get("/{id}", response_model=shared_schemas.Inventory)
-def read_inventory_item(
+async def read_inventory_item(
         id: int,
-        db: Session = Depends(deps.get_db),
+        db: AsyncSession = Depends(deps.get_async_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    inventory = crud.inventory.get(db, id=id)
+    inventory = await crud.inventory_async.get(db, id=id)
     if inventory is None:
         raise HTTPException(status_code=404, detail="Inventory item not found")
     return inventory
 
 
 @router.put("/{id}", response_model=shared_schemas.Inventory)
-def update_inventory(
+async def update_inventory(
         id: int,
         inventory_in: shared_schemas.InventoryUpdate,
-        db: Session = Depends(deps.get_db),
+        db: AsyncSession = Depends(deps.get_async_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    inventory = crud.inventory.get(db, id=id)
+    inventory = await crud.inventory_async.get(db, id=id)
     if inventory is None:
         raise HTTPException(status_code=404, detail="Inventory item not found")
-    return crud.inventory.update(db, db_obj=inventory, obj_in=inventory_in)
+    return await crud.inventory_async.update(db, db_obj=inventory, obj_in=inventory_in)
 
 
 @router.post("/{id}/adjust", response_model=shared_schemas.Inventory)
@@ -1,6 +1,6 @@
 # /server/app/api/v1/endpoints/locations.py
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models
@@ -21,13 +21,17 @@ def create_location(
 
 @router.get("/", response_model=list[shared_schemas.LocationWithInventory])
 def read_locations(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         location_filter: shared_schemas.LocationFilter = Depends(),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.location.get_multi_with_inventory(db, skip=skip, limit=limit, filter_params=location_filter)
+    page = crud.location.get_multi_with_inventory(db, skip=skip, limit=limit, cursor=cursor,
+                                                  filter_params=location_filter)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/{location_id}", response_model=shared_schemas.LocationWithInventory)
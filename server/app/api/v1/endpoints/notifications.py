@@ -1,10 +1,16 @@
 # /server/app/api/v1/endpoints/notifications.py
+import asyncio
+import json
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app import crud, models
 from app.api import deps
+from app.core.config import settings
+from app.core.pubsub import broker, notification_channel, LAGGED
+from app.db.database import SessionLocal
 from public_api.shared_schemas import Notification, NotificationCreate, NotificationUpdate
 
 router = APIRouter()
@@ -47,6 +53,55 @@ def get_unread_notifications(
     return crud.notification.get_user_unread_notifications(db, current_user.id, skip, limit)
 
 
+@router.get("/unread/count", response_model=int)
+def get_unread_notification_count(
+        db: Session = Depends(deps.get_db),
+        current_user: models.User = Depends(deps.get_current_active_user)
+):
+    return crud.notification.get_unread_count(db, current_user.id)
+
+
+def _unread_count(user_id: int) -> int:
+    with SessionLocal() as db:
+        return crud.notification.get_unread_count(db, user_id)
+
+
+def _server_sent_event(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+@router.get("/stream")
+async def stream_notifications(request: Request, token: str | None = None):
+    # Server-sent events: "unread_count" on connecting and whenever the counter changes, "notification" with each
+    # new one (and the new count), and "resync" before closing on a client too slow to keep up, which should reload
+    # its list. Comment lines keep an idle stream alive.
+    user_id = await asyncio.to_thread(deps.get_stream_user_id, token or deps.bearer_token(request))
+    # Subscribed before reading the counter, so no change falls between the two
+    subscription = broker.subscribe(notification_channel(user_id))
+    try:
+        unread = await asyncio.to_thread(_unread_count, user_id)
+    except Exception:
+        subscription.close()
+        raise
+
+    async def events():
+        with subscription:
+            yield _server_sent_event({"type": "unread_count", "unread_count": unread})
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscription.get(), settings.NOTIFICATION_STREAM_KEEPALIVE_SECONDS)
+                except TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if event is LAGGED:
+                    yield _server_sent_event({"type": "resync"})
+                    return
+                yield _server_sent_event(event)
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
 @router.put("/{notification_id}/read", response_model=Notification)
 def mark_notification_as_read(
         notification_id: int,
@@ -2,10 +2,12 @@
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Body, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import crud, models
+from app.crud.order import ORDER_DETAIL_OPTIONS
 from app.api import deps
 from public_api import shared_schemas
 
@@ -13,23 +15,26 @@ router = APIRouter()
 
 
 @router.post("/", response_model=shared_schemas.Order)
-def create_order(
+async def create_order(
         order: shared_schemas.OrderCreate,
-        db: Session = Depends(deps.get_db),
+        db: AsyncSession = Depends(deps.get_async_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.order.create(db=db, obj_in=order)
+    return await crud.order_async.create(db=db, obj_in=order)
 
 
 @router.get("/", response_model=List[shared_schemas.OrderWithDetails])
 def read_orders(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         filter_params: shared_schemas.OrderFilter = Depends(),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.order.get_multi_with_details(db, skip=skip, limit=limit, filter_params=filter_params)
+    page = crud.order.get_multi_with_details(db, skip=skip, limit=limit, cursor=cursor, filter_params=filter_params)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/summary", response_model=shared_schemas.OrderSummary)
@@ -80,40 +85,40 @@ def update_order_items(
 
 
 @router.get("/{order_id}", response_model=shared_schemas.OrderWithDetails)
-def read_order(
+async def read_order(
         order_id: int,
-        db: Session = Depends(deps.get_db),
+        db: AsyncSession = Depends(deps.get_async_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    order = crud.order.get(db, id=order_id)
+    order = await crud.order_async.get(db, id=order_id, options=list(ORDER_DETAIL_OPTIONS))
     if order is None:
         raise HTTPException(status_code=404, detail="Order not found")
     return order
 
 
 @router.put("/{order_id}", response_model=shared_schemas.Order)
-def update_order(
+async def update_order(
         order_id: int,
         order_in: shared_schemas.OrderUpdate,
-        db: Session = Depends(deps.get_db),
+        db: AsyncSession = Depends(deps.get_async_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    order = crud.order.get(db, id=order_id)
+    order = await crud.order_async.get(db, id=order_id, options=list(ORDER_DETAIL_OPTIONS))
     if order is None:
         raise HTTPException(status_code=404, detail="Order not found")
-    return crud.order.update(db, db_obj=order, obj_in=order_in)
+    return await crud.order_async.update(db, db_obj=order, obj_in=order_in)
 
 
 @router.delete("/{order_id}", status_code=204)
-def delete_order(
+async def delete_order(
         order_id: int,
-        db: Session = Depends(deps.get_db),
+        db: AsyncSession = Depends(deps.get_async_db),
         current_user: models.User = Depends(deps.get_current_admin)
 ):
-    order = crud.order.get(db, id=order_id)
+    order = await crud.order_async.get(db, id=order_id)
     if order is None:
         raise HTTPException(status_code=404, detail="Order not found")
-    crud.order.remove(db, id=order_id)
+    await crud.order_async.remove(db, id=order_id)
 
 
 @router.post("/{order_id}/cancel", response_model=shared_schemas.Order)
@@ -1,6 +1,6 @@
 # /server/app/api/v1/endpoints/permissions.py
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models
@@ -21,12 +21,14 @@ def create_permission(
 
 @router.get("/", response_model=list[shared_schemas.Permission])
 def read_permissions(
+        response: Response,
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         db: Session = Depends(deps.get_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.permission.get_multi(db, skip=skip, limit=limit)
+    return deps.set_next_cursor(response, crud.permission.get_multi(db, skip=skip, limit=limit, cursor=cursor))
 
 
 @router.get("/{permission_id}", response_model=shared_schemas.Permission)
@@ -1,9 +1,11 @@
 # /server/app/api/v1/endpoints/pick_lists.py
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Body, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Path, Body, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
 from app import crud, models
+from app.models import PickList
 from app.api import deps
 from public_api import shared_schemas
 
@@ -21,13 +23,16 @@ def create_pick_list(
 
 @router.get("/", response_model=list[shared_schemas.PickList])
 def read_pick_lists(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         filter_params: shared_schemas.PickListFilter = Depends(),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.pick_list.get_multi_with_filter(db, skip=skip, limit=limit, filter_params=filter_params)
+    page = crud.pick_list.get_multi_with_filter(db, skip=skip, limit=limit, cursor=cursor, filter_params=filter_params)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/optimize_route", response_model=shared_schemas.OptimizedPickingRoute)
@@ -36,26 +41,39 @@ def optimize_picking_route(
         db: Session = Depends(deps.get_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.pick_list.optimize_route(db, pick_list_id=pick_list_id)
+    try:
+        return crud.pick_list.optimize_route(db, pick_list_id=pick_list_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
 
 @router.get("/performance", response_model=shared_schemas.PickingPerformance)
 def get_picking_performance(
         start_date: int = Query(...),
         end_date: int = Query(...),
+        breakdown: shared_schemas.ReportBreakdown | None = Query(None),
         db: Session = Depends(deps.get_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.pick_list.get_performance(db, start_date=start_date, end_date=end_date)
+    return crud.pick_list.get_performance(db, start_date=start_date, end_date=end_date, breakdown=breakdown)
+
+
+@router.post("/waves", response_model=shared_schemas.WavePlan)
+def plan_wave(
+        request: shared_schemas.WavePlanRequest,
+        db: Session = Depends(deps.get_db),
+        current_user: models.User = Depends(deps.get_current_active_user)
+):
+    return crud.wave.plan(db, request)
 
 
 @router.get("/{pick_list_id}", response_model=shared_schemas.PickList)
-def read_pick_list(
+async def read_pick_list(
         pick_list_id: int = Path(..., title="The ID of the pick list to get"),
-        db: Session = Depends(deps.get_db),
+        db: AsyncSession = Depends(deps.get_async_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    pick_list = crud.pick_list.get(db, id=pick_list_id)
+    pick_list = await crud.pick_list_async.get(db, id=pick_list_id, options=[selectinload(PickList.pick_list_items)])
     if pick_list is None:
         raise HTTPException(status_code=404, detail="Pick list not found")
     return pick_list
@@ -75,15 +93,15 @@ def update_pick_list(
 
 
 @router.delete("/{pick_list_id}", status_code=204)
-def delete_pick_list(
+async def delete_pick_list(
         pick_list_id: int = Path(..., title="The ID of the pick list to delete"),
-        db: Session = Depends(deps.get_db),
+        db: AsyncSession = Depends(deps.get_async_db),
         current_user: models.User = Depends(deps.get_current_admin)
 ):
-    pick_list = crud.pick_list.get(db, id=pick_list_id)
+    pick_list = await crud.pick_list_async.get(db, id=pick_list_id)
     if pick_list is None:
         raise HTTPException(status_code=404, detail="Pick list not found")
-    crud.pick_list.remove(db, id=pick_list_id)
+    await crud.pick_list_async.remove(db, id=pick_list_id)
 
 
 @router.post("/{pick_list_id}/start", response_model=shared_schemas.PickList)
@@ -1,6 +1,6 @@
 # /server/app/api/v1/endpoints/po_items.py
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Body
+from fastapi import APIRouter, Depends, HTTPException, Path, Body, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models
@@ -12,12 +12,14 @@ router = APIRouter()
 
 @router.get("/", response_model=list[shared_schemas.POItem])
 def read_po_items(
+        response: Response,
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         db: Session = Depends(deps.get_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.po_item.get_multi(db, skip=skip, limit=limit)
+    return deps.set_next_cursor(response, crud.po_item.get_multi(db, skip=skip, limit=limit, cursor=cursor))
 
 
 @router.get("/by_product/{product_id}", response_model=list[shared_schemas.POItem])
@@ -1,6 +1,6 @@
 # /server/app/api/v1/endpoints/product_categories.py
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models
@@ -21,12 +21,14 @@ def create_category(
 
 @router.get("/", response_model=list[shared_schemas.ProductCategory])
 def read_categories(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.product_category.get_multi(db, skip=skip, limit=limit)
+    return deps.set_next_cursor(response, crud.product_category.get_multi(db, skip=skip, limit=limit, cursor=cursor))
 
 
 @router.get("/{category_id}", response_model=shared_schemas.ProductCategory)
@@ -1,6 +1,6 @@
 # /server/app/api/v1/endpoints/products.py
 
-from fastapi import APIRouter, Depends, HTTPException, Body
+from fastapi import APIRouter, Depends, HTTPException, Body, Response, Query
 from sqlalchemy.orm import Session, joinedload
 
 from app import crud, models
@@ -22,13 +22,17 @@ def create_product(
 
 @router.get("/", response_model=list[shared_schemas.ProductWithCategoryAndInventory])
 def read_products(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         product_filter: shared_schemas.ProductFilter = Depends(),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.product.get_multi_with_category_and_inventory(db, skip=skip, limit=limit, filter_params=product_filter)
+    page = crud.product.get_multi_with_category_and_inventory(db, skip=skip, limit=limit, cursor=cursor,
+                                                              filter_params=product_filter)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/max_id", response_model=int)
@@ -39,18 +43,35 @@ def get_max_product_id(
     return crud.product.get_max_id(db)
 
 
+@router.get("/lookup", response_model=shared_schemas.ProductLookup)
+def lookup_product(
+        code: str = Query(..., min_length=1, max_length=50),
+        db: Session = Depends(deps.get_db),
+        current_user: models.User = Depends(deps.get_current_active_user)
+):
+    found = crud.product_lookup.lookup(db, code)
+    if found is None:
+        raise HTTPException(status_code=404, detail="Product not found")
+    return found
+
+
+@router.post("/lookup", response_model=shared_schemas.ProductLookupResult)
+def lookup_products(
+        request: shared_schemas.ProductLookupRequest,
+        db: Session = Depends(deps.get_db),
+        current_user: models.User = Depends(deps.get_current_active_user)
+):
+    return crud.product_lookup.lookup_many(db, request.codes)
+
+
 @router.post("/barcode", response_model=shared_schemas.Product)
 def get_product_by_barcode(
         barcode_data: shared_schemas.BarcodeData,
         db: Session = Depends(deps.get_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    options = [
-        joinedload(Product.category),
-        joinedload(Product.inventory_items)
-    ]
-
-    product = crud.product.get(db, barcode=barcode_data.barcode, options=options)
+    found = crud.product_lookup.lookup(db, barcode_data.barcode)
+    product = crud.product.get(db, id=found.product_id) if found else None
 
     if product:
         return product
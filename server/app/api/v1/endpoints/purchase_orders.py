@@ -1,6 +1,6 @@
 # /server/app/api/v1/endpoints/purchase_orders.py
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models
@@ -21,13 +21,17 @@ def create_purchase_order(
 
 @router.get("/", response_model=list[shared_schemas.PurchaseOrderWithDetails])
 def read_purchase_orders(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         po_filter: shared_schemas.PurchaseOrderFilter = Depends(),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.purchase_order.get_multi_with_products(db, skip=skip, limit=limit, filter_params=po_filter)
+    page = crud.purchase_order.get_multi_with_products(db, skip=skip, limit=limit, cursor=cursor,
+                                                       filter_params=po_filter)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/{po_id}", response_model=shared_schemas.PurchaseOrderWithDetails)
@@ -1,6 +1,6 @@
 # /server/app/api/v1/endpoints/quality.py
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models
@@ -21,13 +21,17 @@ def create_quality_check(
 
 @router.get("/checks", response_model=list[shared_schemas.QualityCheckWithProduct])
 def read_quality_checks(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         filter_params: shared_schemas.QualityCheckFilter = Depends(),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.quality_check.get_multi_with_filter(db, skip=skip, limit=limit, filter_params=filter_params)
+    page = crud.quality_check.get_multi_with_filter(db, skip=skip, limit=limit, cursor=cursor,
+                                                    filter_params=filter_params)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/checks/{check_id}", response_model=shared_schemas.QualityCheckWithProduct)
@@ -88,12 +92,14 @@ def create_quality_standard(
 
 @router.get("/standards", response_model=list[shared_schemas.QualityStandard])
 def read_quality_standards(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.quality_standard.get_multi(db, skip=skip, limit=limit)
+    return deps.set_next_cursor(response, crud.quality_standard.get_multi(db, skip=skip, limit=limit, cursor=cursor))
 
 
 @router.get("/standards/{standard_id}", response_model=shared_schemas.QualityStandard)
@@ -144,12 +150,14 @@ def create_quality_alert(
 
 @router.get("/alerts", response_model=list[shared_schemas.QualityAlert])
 def read_quality_alerts(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.quality_alert.get_multi(db, skip=skip, limit=limit)
+    return deps.set_next_cursor(response, crud.quality_alert.get_multi(db, skip=skip, limit=limit, cursor=cursor))
 
 
 @router.put("/alerts/{alert_id}/resolve", response_model=shared_schemas.QualityAlert)
@@ -167,14 +175,18 @@ def resolve_quality_alert(
 
 @router.get("/product/{product_id}/history", response_model=list[shared_schemas.QualityCheckWithProduct])
 def get_product_quality_history(
+        response: Response,
         product_id: int = Path(..., title="The ID of the product to get quality history for"),
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
     filter_params = shared_schemas.QualityCheckFilter(product_id=product_id)
-    return crud.quality_check.get_multi_with_filter(db, skip=skip, limit=limit, filter_params=filter_params)
+    page = crud.quality_check.get_multi_with_filter(db, skip=skip, limit=limit, cursor=cursor,
+                                                    filter_params=filter_params)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/checks/summary", response_model=dict[str, int])
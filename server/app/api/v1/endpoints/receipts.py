@@ -1,6 +1,6 @@
 # /server/app/api/v1/endpoints/receipts.py
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Body
+from fastapi import APIRouter, Depends, HTTPException, Path, Body, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models
@@ -21,13 +21,16 @@ def create_receipt(
 
 @router.get("/", response_model=list[shared_schemas.Receipt])
 def read_receipts(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         filter_params: shared_schemas.ReceiptFilter = Depends(),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.receipt.get_multi_with_filter(db, skip=skip, limit=limit, filter_params=filter_params)
+    page = crud.receipt.get_multi_with_filter(db, skip=skip, limit=limit, cursor=cursor, filter_params=filter_params)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/expected_today", response_model=list[shared_schemas.Receipt])
@@ -1,7 +1,7 @@
 # /server/app/api/v1/endpoints/reports.py
 
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
 
 from app import crud, models
@@ -33,10 +33,13 @@ def get_order_summary(
 def get_warehouse_performance(
         start_date: int = Query(...),
         end_date: int = Query(...),
+        breakdown: shared_schemas.ReportBreakdown | None = Query(None),
         db: Session = Depends(deps.get_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.reports.get_warehouse_performance(db, start_date, end_date)
+    if breakdown == shared_schemas.ReportBreakdown.ZONE:
+        raise HTTPException(status_code=400, detail="Warehouse performance can only be broken down by day")
+    return crud.reports.get_warehouse_performance(db, start_date, end_date, breakdown=breakdown)
 
 
 @router.get("/kpi_dashboard", response_model=shared_schemas.KPIDashboard)
@@ -1,6 +1,6 @@
 # /server/app/api/v1/endpoints/roles.py
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models
@@ -12,13 +12,15 @@ router = APIRouter()
 
 @router.get("/", response_model=list[shared_schemas.Role])
 def read_roles(
+        response: Response,
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         db: Session = Depends(deps.get_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    roles = crud.role.get_multi(db, skip=skip, limit=limit)
-    return [shared_schemas.Role.model_validate(role) for role in roles]
+    roles = crud.role.get_multi(db, skip=skip, limit=limit, cursor=cursor)
+    return deps.set_next_cursor(response, roles.map(shared_schemas.Role.model_validate))
 
 
 @router.post("/", response_model=shared_schemas.Role)
@@ -18,13 +18,15 @@ def search_products(
         min_quantity: int | None = Query(None),
         sort_by: str | None = Query(None),
         sort_order: str | None = Query("asc"),
+        skip: int = Query(0, ge=0),
+        limit: int = Query(100, ge=1, le=100),
         db: Session = Depends(deps.get_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
     return crud.product.advanced_search(
         db, q=q, category_id=category_id, min_price=min_price,
         max_price=max_price, in_stock=in_stock, min_quantity=min_quantity,
-        sort_by=sort_by, sort_order=sort_order
+        sort_by=sort_by, sort_order=sort_order, skip=skip, limit=limit
     )
 
 
@@ -39,6 +41,8 @@ def search_orders(
         customer_id: str | None = Query(None),
         sort_by: str | None = Query(None),
         sort_order: str | None = Query("asc"),
+        skip: int = Query(0, ge=0),
+        limit: int = Query(100, ge=1, le=100),
         db: Session = Depends(deps.get_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
@@ -46,5 +50,5 @@ def search_orders(
         db, q=q, status=status, min_total=min_total,
         max_total=max_total, start_date=start_date,
         end_date=end_date, customer_id=customer_id,
-        sort_by=sort_by, sort_order=sort_order
+        sort_by=sort_by, sort_order=sort_order, skip=skip, limit=limit
     )
@@ -1,6 +1,6 @@
 # /server/app/api/v1/endpoints/shipments.py
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Body, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Body, Query, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models
@@ -22,13 +22,16 @@ def create_shipment(
 
 @router.get("/", response_model=list[shared_schemas.Shipment])
 def read_shipments(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         filter_params: shared_schemas.ShipmentFilter = Depends(),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.shipment.get_multi_with_filter(db, skip=skip, limit=limit, filter_params=filter_params)
+    page = crud.shipment.get_multi_with_filter(db, skip=skip, limit=limit, cursor=cursor, filter_params=filter_params)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/carrier_rates", response_model=list[shared_schemas.CarrierRate])
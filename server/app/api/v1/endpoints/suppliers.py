@@ -1,6 +1,6 @@
 # /server/app/api/v1/endpoints/suppliers.py
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models
@@ -21,13 +21,16 @@ def create_supplier(
 
 @router.get("/", response_model=list[shared_schemas.Supplier])
 def read_suppliers(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         supplier_filter: shared_schemas.SupplierFilter = Depends(),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.supplier.get_multi_with_filter(db, skip=skip, limit=limit, filter_params=supplier_filter)
+    page = crud.supplier.get_multi_with_filter(db, skip=skip, limit=limit, cursor=cursor, filter_params=supplier_filter)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/{supplier_id}", response_model=shared_schemas.Supplier)
@@ -69,11 +72,15 @@ def delete_supplier(
 
 @router.get("/{supplier_id}/purchase_orders", response_model=list[shared_schemas.PurchaseOrder])
 def read_supplier_purchase_orders(
+        response: Response,
         supplier_id: int,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
     filter_params = shared_schemas.PurchaseOrderFilter(supplier_id=supplier_id)
-    return crud.purchase_order.get_multi_with_details(db, skip=skip, limit=limit, filter_params=filter_params)
+    page = crud.purchase_order.get_multi_with_details(db, skip=skip, limit=limit, cursor=cursor,
+                                                      filter_params=filter_params)
+    return deps.set_next_cursor(response, page)
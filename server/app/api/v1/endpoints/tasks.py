@@ -1,9 +1,11 @@
 # /server/app/api/v1/endpoints/tasks.py
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Body
+from fastapi import APIRouter, Depends, HTTPException, Path, Body, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import crud, models
+from app.crud.task import TASK_DETAIL_OPTIONS
 from app.api import deps
 from public_api import shared_schemas
 
@@ -11,23 +13,26 @@ router = APIRouter()
 
 
 @router.post("/", response_model=shared_schemas.Task)
-def create_task(
+async def create_task(
         task: shared_schemas.TaskCreate,
-        db: Session = Depends(deps.get_db),
+        db: AsyncSession = Depends(deps.get_async_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.task.create(db=db, obj_in=task)
+    return await crud.task_async.create(db=db, obj_in=task)
 
 
 @router.get("/", response_model=list[shared_schemas.TaskWithAssignee])
 def read_tasks(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         filter_params: shared_schemas.TaskFilter = Depends(),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.task.get_multi_with_filter(db, skip=skip, limit=limit, filter_params=filter_params)
+    page = crud.task.get_multi_with_filter(db, skip=skip, limit=limit, cursor=cursor, filter_params=filter_params)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/statistics", response_model=shared_schemas.TaskStatistics)
@@ -67,50 +72,53 @@ def create_batch_tasks(
 
 @router.get("/my_tasks", response_model=list[shared_schemas.Task])
 def get_my_tasks(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
     filter_params = shared_schemas.TaskFilter(assigned_to=current_user.id)
-    return crud.task.get_multi_with_filter(db, skip=skip, limit=limit, filter_params=filter_params)
+    page = crud.task.get_multi_with_filter(db, skip=skip, limit=limit, cursor=cursor, filter_params=filter_params)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/{task_id}", response_model=shared_schemas.TaskWithAssignee)
-def read_task(
+async def read_task(
         task_id: int = Path(..., title="The ID of the task to get"),
-        db: Session = Depends(deps.get_db),
+        db: AsyncSession = Depends(deps.get_async_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    task = crud.task.get(db, id=task_id)
+    task = await crud.task_async.get(db, id=task_id, options=list(TASK_DETAIL_OPTIONS))
     if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
     return task
 
 
 @router.put("/{task_id}", response_model=shared_schemas.Task)
-def update_task(
+async def update_task(
         task_id: int = Path(..., title="The ID of the task to update"),
         task_in: shared_schemas.TaskUpdate = Body(..., title="Task update data"),
-        db: Session = Depends(deps.get_db),
+        db: AsyncSession = Depends(deps.get_async_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    task = crud.task.get(db, id=task_id)
+    task = await crud.task_async.get(db, id=task_id)
     if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
-    return crud.task.update(db, db_obj=task, obj_in=task_in)
+    return await crud.task_async.update(db, db_obj=task, obj_in=task_in)
 
 
 @router.delete("/{task_id}", status_code=204)
-def delete_task(
+async def delete_task(
         task_id: int = Path(..., title="The ID of the task to delete"),
-        db: Session = Depends(deps.get_db),
+        db: AsyncSession = Depends(deps.get_async_db),
         current_user: models.User = Depends(deps.get_current_admin)
 ):
-    task = crud.task.get(db, id=task_id)
+    task = await crud.task_async.get(db, id=task_id)
     if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
-    crud.task.remove(db, id=task_id)
+    await crud.task_async.remove(db, id=task_id)
 
 
 @router.post("/{task_id}/complete", response_model=shared_schemas.Task)
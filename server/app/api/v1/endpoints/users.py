@@ -2,7 +2,7 @@
 from datetime import datetime
 
 import pyotp
-from fastapi import APIRouter, Depends, HTTPException, Body, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Body, Query, status, Response
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
@@ -180,9 +180,11 @@ def get_all_roles(
 
 @router.get("/", response_model=list[user_schemas.UserSanitized])
 def read_users(
+        response: Response,
         filter_params: user_schemas.UserFilter = Depends(),
         skip: int = Query(0),
         limit: int = Query(100),
+        cursor: str | None = Query(None),
         db: Session = Depends(deps.get_db),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
@@ -190,9 +192,10 @@ def read_users(
         db,
         filter_params=filter_params,
         skip=skip,
-        limit=limit
+        limit=limit,
+        cursor=cursor
     )
-    return users
+    return deps.set_next_cursor(response, users)
 
 
 @router.post("/", response_model=user_schemas.UserSanitized)
@@ -1,6 +1,6 @@
 # /server/app/api/v1/endpoints/yard.py
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models
@@ -22,13 +22,17 @@ def create_yard_location(
 
 @router.get("/locations", response_model=list[shared_schemas.YardLocation])
 def read_yard_locations(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         filter_params: shared_schemas.YardLocationFilter = Depends(),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.yard_location.get_multi_with_filter(db, skip=skip, limit=limit, filter_params=filter_params)
+    page = crud.yard_location.get_multi_with_filter(db, skip=skip, limit=limit, cursor=cursor,
+                                                    filter_params=filter_params)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/locations/{location_id}", response_model=shared_schemas.YardLocationWithAppointments)
@@ -84,13 +88,17 @@ def create_dock_appointment(
 
 @router.get("/appointments", response_model=list[shared_schemas.DockAppointment])
 def read_dock_appointments(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         filter_params: shared_schemas.DockAppointmentFilter = Depends(),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.dock_appointment.get_multi_with_filter(db, skip=skip, limit=limit, filter_params=filter_params)
+    page = crud.dock_appointment.get_multi_with_filter(db, skip=skip, limit=limit, cursor=cursor,
+                                                       filter_params=filter_params)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/appointments/{appointment_id}", response_model=shared_schemas.DockAppointment)
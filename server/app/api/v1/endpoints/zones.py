@@ -1,6 +1,6 @@
 # /server/app/api/v1/endpoints/zones.py
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models
@@ -21,13 +21,16 @@ def create_zone(
 
 @router.get("/", response_model=list[shared_schemas.ZoneWithLocations])
 def read_zones(
+        response: Response,
         db: Session = Depends(deps.get_db),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
         zone_filter: shared_schemas.ZoneFilter = Depends(),
         current_user: models.User = Depends(deps.get_current_active_user)
 ):
-    return crud.zone.get_multi_with_locations(db, skip=skip, limit=limit, filter_params=zone_filter)
+    page = crud.zone.get_multi_with_locations(db, skip=skip, limit=limit, cursor=cursor, filter_params=zone_filter)
+    return deps.set_next_cursor(response, page)
 
 
 @router.get("/{zone_id}", response_model=shared_schemas.ZoneWithLocations)
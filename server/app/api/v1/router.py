@@ -5,7 +5,8 @@ from app.api.v1.endpoints import (users, inventory, orders, warehouse, yard, ass
                                   search, \
                                   products, customers, purchase_orders, suppliers, po_items, locations, zones,
                                   product_categories, chat,
-                                  roles, permissions, pick_lists, receipts, shipments, carriers, notifications)
+                                  roles, permissions, pick_lists, receipts, shipments, carriers, notifications,
+                                  health)
 
 api_router = APIRouter()
 
@@ -48,3 +49,5 @@ api_router.include_router(product_categories.router, prefix="/product_categories
 api_router.include_router(notifications.router, prefix="/notifications", tags=["notifications"])
 
 api_router.include_router(chat.router, prefix="/chat", tags=["chat"])
+
+api_router.include_router(health.router, prefix="/health", tags=["health"])
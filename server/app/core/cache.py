@@ -0,0 +1,161 @@
+# /server/app/core/cache.py
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Callable, Hashable
+
+from app.core.config import settings
+from public_api.permissions import PermissionManager
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe in-process LRU cache whose entries also expire after `ttl` seconds (ttl <= 0 disables caching)."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING or entry[0] < time.monotonic():
+                if entry is not _MISSING:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> Any:
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return value
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        with self._lock:
+            stale = [key for key, (_, value) in self._data.items() if predicate(key, value)]
+            for key in stale:
+                del self._data[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TableDependentCache(TTLCache):
+    """
+    TTLCache of values computed from `tables`; it is cleared whenever a transaction that wrote to one of them
+    commits (see `app.db.database.track_table_writes`), so the TTL only bounds writes made by other processes.
+    """
+    instances: list["TableDependentCache"] = []
+
+    def __init__(self, maxsize: int, ttl: float, tables: set[str]):
+        super().__init__(maxsize, ttl)
+        self.tables = frozenset(tables)
+        TableDependentCache.instances.append(self)
+
+
+def invalidate_tables(tables: set[str]) -> None:
+    for cache in TableDependentCache.instances:
+        if cache.tables & tables:
+            cache.clear()
+
+
+@dataclass(frozen=True)
+class CachedPrincipal:
+    """Plain-data snapshot of an authenticated user, safe to share between requests and threads."""
+    user_id: int
+    role_id: int | None
+    user: dict
+    role: dict | None
+    role_permissions: tuple[tuple[dict, dict], ...] = ()  # (role_permission columns, permission columns)
+    permission_manager: PermissionManager = field(default_factory=lambda: PermissionManager([]))
+
+
+class PrincipalCache:
+    """
+    Maps access tokens to the principal they authenticate.
+
+    Invalidation is process-local; the TTL bounds how long other workers can serve a revoked token
+    or outdated permissions.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._entries = TTLCache(maxsize, ttl)
+
+    def get(self, token: str) -> CachedPrincipal | None:
+        return self._entries.get(token)
+
+    def set(self, token: str, principal: CachedPrincipal) -> CachedPrincipal:
+        return self._entries.set(token, principal)
+
+    def invalidate_token(self, token: str) -> None:
+        self._entries.pop(token)
+
+    def invalidate_user(self, user_id: int) -> None:
+        self._entries.discard_where(lambda _, principal: principal.user_id == user_id)
+
+    def invalidate_role(self, role_id: int) -> None:
+        self._entries.discard_where(lambda _, principal: principal.role_id == role_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @property
+    def ttl(self) -> float:
+        return self._entries.ttl
+
+    @ttl.setter
+    def ttl(self, value: float) -> None:
+        self._entries.ttl = value
+        self._entries.clear()
+
+    @property
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "hits": self._entries.hits, "misses": self._entries.misses}
+
+
+# (table, filters) -> row count, for list totals requested with count_mode=cached
+count_cache = TTLCache(maxsize=1024, ttl=settings.LIST_COUNT_CACHE_TTL_SECONDS)
+# Dashboard aggregates over stock, products and categories
+inventory_summary_cache = TableDependentCache(maxsize=16, ttl=settings.INVENTORY_SUMMARY_CACHE_TTL_SECONDS,
+                                              tables={"inventory", "products", "product_categories"})
+# Days whose inventory snapshot still matches live stock and prices
+inventory_snapshot_cache = TableDependentCache(maxsize=4, ttl=settings.INVENTORY_SNAPSHOT_TTL_SECONDS,
+                                               tables={"inventory", "products"})
+# Time of the last KPI refresh, while no order/inventory/product write has been committed since
+kpi_cache = TableDependentCache(maxsize=1, ttl=settings.KPI_MAX_STALENESS_SECONDS,
+                                tables={"orders", "inventory", "products"})
+# Time of the last ABC-XYZ classification, while no stock, product or movement write has been committed since
+classification_cache = TableDependentCache(maxsize=1, ttl=settings.ABC_XYZ_TTL_SECONDS,
+                                           tables={"inventory", "products", "inventory_movements"})
+# Warehouse layout (aisle/bay coordinates of every location) for pick routing, until a location or zone write
+layout_cache = TableDependentCache(maxsize=1, ttl=settings.LAYOUT_CACHE_TTL_SECONDS, tables={"locations", "zones"})
+# Set while the product lookup's barcode/SKU index is current, until a product write
+product_code_cache = TableDependentCache(maxsize=1, ttl=settings.PRODUCT_LOOKUP_TTL_SECONDS, tables={"products"})
+# Product id -> lookup summary (product fields and stock per location), until a stock, product or location write
+product_stock_cache = TableDependentCache(maxsize=settings.PRODUCT_LOOKUP_MAX_CACHED_PRODUCTS,
+                                          ttl=settings.PRODUCT_LOOKUP_TTL_SECONDS,
+                                          tables={"inventory", "products", "locations"})
+principal_cache = PrincipalCache(maxsize=settings.AUTH_CACHE_MAX_ENTRIES, ttl=settings.AUTH_CACHE_TTL_SECONDS)
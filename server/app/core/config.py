@@ -10,7 +10,90 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Authenticated principal cache (token -> user, permissions); 0 TTL disables it.
+    # Invalidation is per process, so the TTL is also the worst-case staleness across workers.
+    AUTH_CACHE_TTL_SECONDS: int = 60
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+    # How long "cached" list totals (count_mode=cached/estimate) are reused
+    LIST_COUNT_CACHE_TTL_SECONDS: int = 30
+    # Inventory summary (dashboard); dropped on every committed inventory/product/category write of this process
+    INVENTORY_SUMMARY_CACHE_TTL_SECONDS: int = 300
+    # Rows looked up / written per statement batch by bulk inventory operations (imports, batch updates, counts)
+    BULK_CHUNK_SIZE: int = 1000
+    # Per-row errors kept in a bulk import result
+    BULK_IMPORT_MAX_ERRORS: int = 1000
+    # Probability of not running out of stock during the lead time that reorder suggestions size safety stock for
+    REORDER_SERVICE_LEVEL: float = 0.95
+
+    # The periodic jobs below (*_INTERVAL_SECONDS) run in every worker process. The forecast, snapshot, KPI and
+    # classification jobs write shared tables, so with several workers set them to 0 in all but one of them; the
+    # product lookup job only warms the in-memory index of its own worker
+
+    # Demand forecasting: models are trained per product in batches on a process pool (0 workers trains in-process)
+    # and retrained only when the product's movement history changed
+    FORECAST_HORIZON_DAYS: int = 30
+    FORECAST_WORKERS: int = 2
+    FORECAST_BATCH_SIZE: int = 200
+    FORECAST_REFRESH_INTERVAL_SECONDS: int = 0  # periodic background refresh of all products, 0 disables
+    FORECAST_MODEL_DIR: str = "./forecast_models"  # where fitted models are kept; empty keeps only forecasts
+
+    # Daily inventory snapshots behind trend and turnover analytics: today's snapshot is recaptured by the periodic
+    # job, and on the next analytics read once a committed inventory/product write (or the TTL) marked it stale
+    INVENTORY_SNAPSHOT_INTERVAL_SECONDS: int = 3600  # 0 disables the periodic capture
+    INVENTORY_SNAPSHOT_TTL_SECONDS: int = 300
+
+    # Materialized KPI dashboard: committed order/inventory/product writes mark it dirty, the periodic job refreshes
+    # it when dirty, and a read never serves figures older than the staleness bound
+    KPI_MAX_STALENESS_SECONDS: int = 60
+    KPI_REFRESH_INTERVAL_SECONDS: int = 60  # 0 disables the periodic refresh
+
+    # ABC-XYZ product classification: XYZ uses the weekly demand of this many past weeks. The periodic job
+    # reclassifies after committed inventory/product/movement writes, or once the TTL has passed
+    ABC_XYZ_DEMAND_WEEKS: int = 12
+    ABC_XYZ_REFRESH_INTERVAL_SECONDS: int = 300  # 0 disables the periodic refresh
+    ABC_XYZ_TTL_SECONDS: int = 3600
+    # Pick lines of this many past days make up the velocity the slotting optimizer moves stock by
+    SLOTTING_VELOCITY_DAYS: int = 90
+    # Location coordinates used for pick routing are rebuilt after location/zone writes, or once the TTL has passed
+    LAYOUT_CACHE_TTL_SECONDS: int = 3600
+    # A query of a single term only matches it as a word prefix from this many characters on (a whole word below),
+    # so search-as-you-type never ranks most of the index for its first letter
+    SEARCH_MIN_PREFIX_LENGTH: int = 2
+    # Barcode/SKU lookups resolve codes through an in-memory index, rebuilt after committed product writes (or once
+    # the TTL has passed) by the periodic job, which also warms it at startup. On-hand summaries of the products
+    # looked up are cached until the next committed inventory write
+    PRODUCT_LOOKUP_REFRESH_INTERVAL_SECONDS: int = 300  # 0 disables the periodic refresh
+    PRODUCT_LOOKUP_TTL_SECONDS: int = 3600
+    PRODUCT_LOOKUP_MAX_CACHED_PRODUCTS: int = 100_000
+    # Wave planning: orders (put-wall slots) and order lines per batch pick list, and the picker model used to
+    # estimate picks per hour (walking speed, time per location visited, time per line sorted into the put wall)
+    WAVE_PUT_WALL_SLOTS: int = 24
+    WAVE_MAX_LINES_PER_BATCH: int = 200
+    PICKER_SPEED_METRES_PER_SECOND: float = 1.0
+    PICK_SECONDS_PER_LOCATION: float = 10.0
+    PUT_SECONDS_PER_LINE: float = 4.0
+    # Events (chat messages, notifications) a push subscriber may fall behind by before it is dropped and has to
+    # resynchronise over REST
+    PUBSUB_QUEUE_SIZE: int = 256
+    # Comment lines sent on an idle notification stream, so proxies don't time it out and dead clients are noticed
+    NOTIFICATION_STREAM_KEEPALIVE_SECONDS: int = 15
     DATABASE_URL: str = "sqlite:///./nexusware.db"
+    # Derived from DATABASE_URL (e.g. sqlite -> sqlite+aiosqlite) when left empty. requirements.txt only ships the
+    # SQLite drivers: PostgreSQL needs a sync driver plus asyncpg, MySQL one plus aiomysql, installed separately
+    ASYNC_DATABASE_URL: str = ""
+
+    # Connection pool / engine tuning (pool settings are ignored for in-memory SQLite)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds, -1 disables recycling
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # 0 disables; applied per connection where the dialect supports it
+
+    # SQLite pragmas applied on every new connection
+    SQLITE_WAL: bool = True
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
 
     # SMTP Configuration
     SMTP_SERVER: str = "smtp.example.com"
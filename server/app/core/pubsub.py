@@ -0,0 +1,99 @@
+# /server/app/core/pubsub.py
+import asyncio
+from threading import Lock
+from typing import Any
+
+from app.core.config import settings
+
+# Queued instead of an event once a subscriber fell `maxsize` events behind; it has to resynchronise over REST
+LAGGED = None
+
+
+class Subscription:
+    """Events published to some channels, queued on the event loop that subscribed."""
+
+    def __init__(self, broker: "InProcessBroker", channels: tuple[str, ...], maxsize: int):
+        self.broker = broker
+        self.channels = channels
+        self.loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.closed = False
+
+    def _deliver(self, event: Any) -> None:
+        if self.closed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Dropping events silently would leave the subscriber with gaps; tell it to reload what it missed
+            self.close()
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(LAGGED)
+
+    async def get(self) -> Any:
+        """The next event, or LAGGED after which the subscription is closed."""
+        return await self._queue.get()
+
+    def close(self) -> None:
+        self.closed = True
+        self.broker.unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class InProcessBroker:
+    """
+    Fan-out of published events to the subscriptions of a channel within this process. Publishing is thread-safe
+    (sync endpoints publish from the threadpool), delivery happens on each subscriber's event loop. Deployments with
+    several workers need a broker shared between them (e.g. Redis pub/sub) behind the same publish/subscribe API.
+    """
+
+    def __init__(self, maxsize: int = settings.PUBSUB_QUEUE_SIZE):
+        self.maxsize = maxsize
+        self._subscriptions: dict[str, set[Subscription]] = {}
+        self._lock = Lock()
+
+    def subscribe(self, *channels: str) -> Subscription:
+        """Subscribe the running event loop to `channels`; close the subscription when done with it."""
+        subscription = Subscription(self, channels, self.maxsize)
+        with self._lock:
+            for channel in channels:
+                self._subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            for channel in subscription.channels:
+                subscribers = self._subscriptions.get(channel)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscriptions[channel]
+
+    def publish(self, channel: str, event: Any) -> int:
+        """Queue `event` for every subscription of `channel`; returns how many there were."""
+        with self._lock:
+            subscribers = list(self._subscriptions.get(channel, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._deliver, event)
+            except RuntimeError:
+                # Its event loop is gone (shutdown); nobody is waiting for the event anymore
+                subscription.close()
+        return len(subscribers)
+
+
+def user_channel(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def notification_channel(user_id: int) -> str:
+    return f"notifications:{user_id}"
+
+
+broker = InProcessBroker()
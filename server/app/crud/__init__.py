@@ -3,16 +3,21 @@ from .asset import asset
 from .asset_maintenance import asset_maintenance
 from .audit import audit_log
 from .chat import chat
+from .classification import classification
 from .customer import customer
 from .dock_appointment import dock_appointment
-from .inventory import inventory
+from .forecast import forecast
+from .inventory import inventory, inventory_async
+from .inventory_snapshot import inventory_snapshot
+from .kpi import kpi
 from .location import location
 from .notification import notification
-from .order import order, order_item
+from .order import order, order_item, order_async
 from .permission import permission
-from .pick_list import pick_list, pick_list_item
+from .pick_list import pick_list, pick_list_item, pick_list_async
 from .product import product
 from .product_category import product_category
+from .product_lookup import product_lookup
 from .purchase_order import purchase_order, po_item
 from .quality import quality_check, quality_standard, quality_alert
 from .receipt import receipt, receipt_item
@@ -20,10 +25,11 @@ from .reports import reports
 from .role import role
 from .shipment import shipment, carrier
 from .supplier import supplier
-from .task import task
+from .task import task, task_async
 from .token import token
 from .user import user
 from .warehouse import whole_warehouse
+from .wave import wave
 from .yard import yard
 from .yard_location import yard_location
 from .zone import zone
@@ -10,7 +10,8 @@ from public_api.shared_schemas import (
     AssetWithMaintenance as AssetWithMaintenanceSchema,
     AssetCreate,
     AssetUpdate,
-    AssetFilter
+    AssetFilter,
+    CountMode
 )
 
 
@@ -49,7 +50,15 @@ class CRUDAsset(CRUDBase[Asset, AssetCreate, AssetUpdate]):
         return AssetWithMaintenanceSchema.model_validate(asset) if asset else None
 
     def get_multi_with_filter(self, db: Session, *,
-                              skip: int = 0, limit: int = 100, filter_params: AssetFilter) -> list[AssetSchema]:
+                              skip: int = 0, limit: int = 100, cursor: str | None = None,
+                              filter_params: AssetFilter) -> list[AssetSchema]:
+        query = self._filtered_query(db, filter_params)
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).map(AssetSchema.model_validate)
+
+    def count_with_filter(self, db: Session, *, filter_params: AssetFilter, mode: CountMode = CountMode.EXACT) -> int:
+        return self.count(db, self._filtered_query(db, filter_params), mode=mode, filter_params=filter_params)
+
+    def _filtered_query(self, db: Session, filter_params: AssetFilter):
         query = db.query(self.model)
         if filter_params.asset_type:
             query = query.filter(self.model.asset_type == filter_params.asset_type)
@@ -61,9 +70,7 @@ class CRUDAsset(CRUDBase[Asset, AssetCreate, AssetUpdate]):
             query = query.filter(self.model.purchase_date <= filter_params.purchase_date_to)
         if filter_params.location_id:
             query = query.filter(self.model.location_id == filter_params.location_id)
-
-        assets = query.offset(skip).limit(limit).all()
-        return [AssetSchema.model_validate(asset) for asset in assets]
+        return query
 
     def get_all_types(self, db: Session) -> list[str]:
         return [asset_type for (asset_type,) in db.query(self.model.asset_type).distinct().all()]
@@ -14,7 +14,7 @@ from public_api.shared_schemas import (
 
 class CRUDAssetMaintenance(CRUDBase[AssetMaintenance, AssetMaintenanceCreate, AssetMaintenanceUpdate]):
     def get_multi_with_filter(self, db: Session, *,
-                              skip: int = 0, limit: int = 100,
+                              skip: int = 0, limit: int = 100, cursor: str | None = None,
                               filter_params: AssetMaintenanceFilter) -> list[AssetMaintenanceSchema]:
         query = db.query(self.model)
         if filter_params.asset_id:
@@ -32,8 +32,7 @@ class CRUDAssetMaintenance(CRUDBase[AssetMaintenance, AssetMaintenanceCreate, As
         if filter_params.performed_by:
             query = query.filter(self.model.performed_by == filter_params.performed_by)
 
-        maintenance_records = query.offset(skip).limit(limit).all()
-        return [AssetMaintenanceSchema.model_validate(record) for record in maintenance_records]
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).map(AssetMaintenanceSchema.model_validate)
 
     def get_all_types(self, db: Session) -> list[str]:
         return [maintenance_type for (maintenance_type,) in db.query(self.model.maintenance_type).distinct().all()]
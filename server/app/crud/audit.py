@@ -9,7 +9,8 @@ from public_api.shared_schemas import AuditLog as AuditLogSchema, AuditLogCreate
 
 class CRUDAuditLog(CRUDBase[AuditLog, AuditLogCreate, AuditLogCreate]):
     def get_multi_with_filter(self, db: Session, *,
-                              skip: int = 0, limit: int = 100, filter_params: AuditLogFilter) -> list[AuditLogSchema]:
+                              skip: int = 0, limit: int = 100, cursor: str | None = None,
+                              filter_params: AuditLogFilter) -> list[AuditLogSchema]:
         query = db.query(self.model).join(User)
 
         if filter_params.user_id:
@@ -25,8 +26,8 @@ class CRUDAuditLog(CRUDBase[AuditLog, AuditLogCreate, AuditLogCreate]):
         if filter_params.date_to:
             query = query.filter(AuditLog.timestamp <= filter_params.date_to)
 
-        audit_logs = query.order_by(desc(AuditLog.timestamp)).offset(skip).limit(limit).all()
-        return [AuditLogSchema.model_validate(audit_log) for audit_log in audit_logs]
+        query = query.order_by(desc(AuditLog.timestamp))
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).map(AuditLogSchema.model_validate)
 
     def get_summary(self, db: Session, date_from: int | None, date_to: int | None) -> AuditSummary:
         query = db.query(self.model)
@@ -68,4 +69,4 @@ class CRUDAuditLog(CRUDBase[AuditLog, AuditLogCreate, AuditLogCreate]):
         return [table for (table,) in db.query(AuditLog.table_name).distinct().all()]
 
 
-audit_log = CRUDAuditLog(AuditLog)
+audit_log = CRUDAuditLog(AuditLog, cursor_key=[(AuditLog.timestamp, True), (AuditLog.id, True)])
@@ -1,10 +1,18 @@
-from typing import Generic, Type, TypeVar
+import base64
+import binascii
+import json
+from typing import Callable, Generic, Sequence, Type, TypeVar
 
+from fastapi import HTTPException
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import func, inspect, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.cache import count_cache
 from app.db.database import Base
+from public_api.shared_schemas import CountMode
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -12,9 +20,123 @@ UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 GetSchemaType = TypeVar("GetSchemaType", bound=BaseModel)
 
 
+# Keyset ordering: (column, descending) pairs, the last column(s) unique so the order is total
+CursorKey = Sequence[tuple[any, bool]]
+
+
+class Page(list):
+    """Results of one page; `next_cursor` is set in cursor mode while more rows follow."""
+
+    def __init__(self, items=(), next_cursor: str | None = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+    def map(self, fn: Callable) -> "Page":
+        return Page((fn(item) for item in self), self.next_cursor)
+
+
+def encode_cursor(values: Sequence) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(values), separators=(",", ":")).encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        values = None
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def paginate(query, *, skip: int = 0, limit: int = 100, cursor: str | None = None, key: CursorKey) -> Page:
+    """
+    Offset pagination when `cursor` is None (the query keeps its own ordering), keyset pagination otherwise.
+    In keyset mode the query is ordered by `key` and continues after the row the cursor was taken from;
+    an empty cursor starts at the first page.
+    """
+    if cursor is None:
+        return Page(query.offset(skip).limit(limit).all())
+
+    columns = [column for column, _ in key]
+    descending = key[0][1]
+    if any(desc != descending for _, desc in key):
+        raise ValueError("Cursor key columns must all sort in the same direction")
+
+    if cursor:
+        values = decode_cursor(cursor, len(columns))
+        left, right = (columns[0], values[0]) if len(columns) == 1 else (tuple_(*columns), tuple_(*values))
+        query = query.filter(left < right if descending else left > right)
+
+    ordering = [column.desc() if descending else column.asc() for column in columns]
+    rows = query.order_by(None).order_by(*ordering).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return Page(rows)
+    rows = rows[:limit]
+    return Page(rows, encode_cursor([getattr(rows[-1], column.key) for column in columns]))
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
-    def __init__(self, model: Type[ModelType]):
+    def __init__(self, model: Type[ModelType], *, cursor_key: CursorKey | None = None):
         self.model = model
+        # Defaults to the primary key, ascending
+        self.cursor_key = cursor_key or [(getattr(model, column.key), False) for column in inspect(model).primary_key]
+
+    def paginate(self, query, *, skip: int = 0, limit: int = 100, cursor: str | None = None,
+                 key: CursorKey | None = None) -> Page:
+        return paginate(query, skip=skip, limit=limit, cursor=cursor, key=key or self.cursor_key)
+
+    def count(
+            self,
+            db: Session,
+            query,
+            *,
+            mode: CountMode = CountMode.EXACT,
+            filter_params: BaseModel | None = None
+    ) -> int:
+        """
+        Number of rows matched by `query`, which should carry the list's filters but no eager-load options.
+        `filter_params` identifies the filter combination for the cached and estimated modes.
+        """
+        filters = filter_params.model_dump(mode="json", exclude_none=True) if filter_params else {}
+        if mode == CountMode.ESTIMATE and not filters:
+            estimate = self.estimate_count(db)
+            if estimate is not None:
+                return estimate
+
+        key = (self.model.__tablename__, tuple(sorted(filters.items())))
+        total = count_cache.get(key) if mode != CountMode.EXACT else None
+        if total is None:
+            # Exact counts refresh the cache too, so cached readers see them
+            total = count_cache.set(key, self._exact_count(query))
+        return total
+
+    def _exact_count(self, query) -> int:
+        primary_key = inspect(self.model).primary_key[0]
+        return query.order_by(None).with_entities(func.count(primary_key)).scalar()
+
+    def estimate_count(self, db: Session) -> int | None:
+        """Row count of the whole table from the planner's statistics, or None where none are available."""
+        table = self.model.__tablename__
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            estimate = db.execute(text("SELECT reltuples FROM pg_class WHERE relname = :table"),
+                                  {"table": table}).scalar()
+        elif dialect == "mysql":
+            estimate = db.execute(text("SELECT table_rows FROM information_schema.tables "
+                                       "WHERE table_schema = DATABASE() AND table_name = :table"),
+                                  {"table": table}).scalar()
+        elif dialect == "sqlite":
+            # sqlite_stat1 only exists once ANALYZE has run; the first number of `stat` is the table's row count
+            if not db.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")).scalar():
+                return None
+            stat = db.execute(text("SELECT stat FROM sqlite_stat1 WHERE tbl = :table LIMIT 1"),
+                              {"table": table}).scalar()
+            estimate = stat.split()[0] if stat else None
+        else:
+            return None
+        # Postgres reports -1 for tables that were never analyzed
+        return int(float(estimate)) if estimate is not None and float(estimate) >= 0 else None
 
     def get(
             self,
@@ -38,11 +160,12 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             *,
             skip: int = 0,
             limit: int = 100,
+            cursor: str | None = None,
             return_schema: Type[GetSchemaType] | None = None
     ) -> list[ModelType] | list[GetSchemaType]:
-        db_objs = db.query(self.model).offset(skip).limit(limit).all()
+        db_objs = self.paginate(db.query(self.model), skip=skip, limit=limit, cursor=cursor)
         if return_schema:
-            return [return_schema.model_validate(obj) for obj in db_objs]
+            return db_objs.map(return_schema.model_validate)
         return db_objs
 
     def create(
@@ -94,3 +217,96 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         if return_schema:
             return return_schema.model_validate(obj)
         return obj
+
+
+class AsyncCRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    def __init__(self, model: Type[ModelType]):
+        self.model = model
+
+    @staticmethod
+    def _column_keys(db_obj: ModelType) -> list[str]:
+        # Relationships are never touched here: reading or refreshing them would need an implicit (sync) lazy load,
+        # so callers eager-load whatever they need through `options`.
+        return [attr.key for attr in inspect(db_obj).mapper.column_attrs]
+
+    async def get(
+            self,
+            db: AsyncSession,
+            id: any,
+            *,
+            options: list | None = None,
+            return_schema: Type[GetSchemaType] | None = None
+    ) -> ModelType | GetSchemaType | None:
+        query = select(self.model).filter(self.model.id == id)
+        if options:
+            query = query.options(*options)
+        db_obj = (await db.execute(query)).scalars().first()
+        if return_schema and db_obj:
+            return return_schema.model_validate(db_obj)
+        return db_obj
+
+    async def get_multi(
+            self,
+            db: AsyncSession,
+            *,
+            skip: int = 0,
+            limit: int = 100,
+            options: list | None = None,
+            return_schema: Type[GetSchemaType] | None = None
+    ) -> list[ModelType] | list[GetSchemaType]:
+        query = select(self.model).offset(skip).limit(limit)
+        if options:
+            query = query.options(*options)
+        db_objs = (await db.execute(query)).scalars().all()
+        if return_schema:
+            return [return_schema.model_validate(obj) for obj in db_objs]
+        return list(db_objs)
+
+    async def create(
+            self,
+            db: AsyncSession,
+            *,
+            obj_in: CreateSchemaType,
+            return_schema: Type[GetSchemaType] | None = None
+    ) -> ModelType | GetSchemaType:
+        obj_in_data = obj_in.model_dump()
+        db_obj = self.model(**obj_in_data)
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj, attribute_names=self._column_keys(db_obj))
+        if return_schema:
+            return return_schema.model_validate(db_obj)
+        return db_obj
+
+    async def update(
+            self,
+            db: AsyncSession,
+            *,
+            db_obj: ModelType,
+            obj_in: UpdateSchemaType | dict[str, any],
+            return_schema: Type[GetSchemaType] | None = None
+    ) -> ModelType | GetSchemaType:
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+        for field in self._column_keys(db_obj):
+            if field in update_data:
+                setattr(db_obj, field, update_data[field])
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj, attribute_names=self._column_keys(db_obj))
+        if return_schema:
+            return return_schema.model_validate(db_obj)
+        return db_obj
+
+    async def remove(
+            self,
+            db: AsyncSession,
+            *,
+            id: int,
+            return_schema: Type[GetSchemaType] | None = None
+    ) -> ModelType | GetSchemaType:
+        obj = await db.get(self.model, id)
+        await db.delete(obj)
+        await db.commit()
+        if return_schema:
+            return return_schema.model_validate(obj)
+        return obj
@@ -1,13 +1,20 @@
 from typing import List
 
-from sqlalchemy import or_, and_
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, and_, case, update
+from sqlalchemy.orm import Session, joinedload
 
+from app.core.pubsub import broker, user_channel
 from app.models.chat import Chat, Message
-from public_api.shared_schemas import MessageCreate
+from public_api.shared_schemas import MessageCreate, MessageResponse
 
 
 class CRUDChat:
+    @staticmethod
+    def _publish(chat: Chat, event: dict) -> None:
+        # After committing, so a subscriber fetching what it missed (`after_id`) already sees the message
+        for user_id in {chat.user1_id, chat.user2_id}:
+            broker.publish(user_channel(user_id), event)
+
     def create_chat(self, db: Session, user1_id: int, user2_id: int) -> Chat:
         chat = Chat(user1_id=user1_id, user2_id=user2_id)
         db.add(chat)
@@ -16,9 +23,10 @@ class CRUDChat:
         return chat
 
     def get_user_chats(self, db: Session, user_id: int) -> List[Chat]:
-        return db.query(Chat).filter(
+        """The user's chats, most recently active first; their last message comes from the chat summary."""
+        return db.query(Chat).options(joinedload(Chat.user1), joinedload(Chat.user2)).filter(
             or_(Chat.user1_id == user_id, Chat.user2_id == user_id)
-        ).all()
+        ).order_by(Chat.last_message_at.desc().nulls_last(), Chat.id.desc()).all()
 
     def get_chat(self, db: Session, chat_id: int, user_id: int) -> Chat | None:
         return db.query(Chat).filter(
@@ -30,21 +38,57 @@ class CRUDChat:
         if chat:
             db.delete(chat)
             db.commit()
+            self._publish(chat, {"type": "chat_deleted", "chat_id": chat_id})
             return True
         return False
 
     def create_message(self, db: Session, chat_id: int, sender_id: int, message: MessageCreate) -> Message:
         db_message = Message(chat_id=chat_id, sender_id=sender_id, content=message.content)
         db.add(db_message)
+        db.flush()
+        # The summary moves along in the same transaction; counters are incremented in SQL so concurrent
+        # senders don't lose updates
+        db.execute(update(Chat).where(Chat.id == chat_id).values(
+            last_message_id=db_message.id, last_message_sender_id=sender_id,
+            last_message_content=db_message.content, last_message_at=db_message.created_at,
+            user1_unread_count=Chat.user1_unread_count + case((Chat.user1_id != sender_id, 1), else_=0),
+            user2_unread_count=Chat.user2_unread_count + case((Chat.user2_id != sender_id, 1), else_=0)
+        ).execution_options(synchronize_session=False))
         db.commit()
         db.refresh(db_message)
+        self._publish(db.get(Chat, chat_id), {
+            "type": "chat_message", "chat_id": chat_id,
+            "message": MessageResponse.model_validate(db_message).model_dump(mode="json")
+        })
         return db_message
 
-    def get_chat_messages(self, db: Session, chat_id: int, user_id: int) -> List[Message]:
+    def mark_read(self, db: Session, chat_id: int, user_id: int) -> Chat | None:
+        """Reset the user's unread count of the chat."""
         chat = self.get_chat(db, chat_id, user_id)
         if chat:
-            return db.query(Message).filter(Message.chat_id == chat_id).order_by(Message.created_at).all()
-        return []
+            unread = Chat.user1_unread_count if chat.user1_id == user_id else Chat.user2_unread_count
+            db.execute(update(Chat).where(Chat.id == chat_id).values({unread: 0})
+                       .execution_options(synchronize_session=False))
+            db.commit()
+        return chat
+
+    def get_chat_messages(self, db: Session, chat_id: int, user_id: int, before_id: int | None = None,
+                          after_id: int | None = None, limit: int = 50) -> tuple[List[Message], bool]:
+        """
+        A window of at most `limit` messages of the chat, oldest first, and whether more lie beyond it: the ones
+        right after message `after_id` (catching up), else the ones right before `before_id` (scrolling back),
+        else the latest ones.
+        """
+        if not self.get_chat(db, chat_id, user_id):
+            return [], False
+        query = db.query(Message).filter(Message.chat_id == chat_id)
+        if after_id is not None:
+            messages = query.filter(Message.id > after_id).order_by(Message.id).limit(limit + 1).all()
+            return messages[:limit], len(messages) > limit
+        if before_id is not None:
+            query = query.filter(Message.id < before_id)
+        messages = query.order_by(Message.id.desc()).limit(limit + 1).all()
+        return messages[:limit][::-1], len(messages) > limit
 
 
 chat = CRUDChat()
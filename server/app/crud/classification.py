@@ -0,0 +1,133 @@
+# /server/app/crud/classification.py
+import time
+from dataclasses import dataclass
+from threading import Lock
+
+import numpy as np
+from sqlalchemy import func, case, update
+from sqlalchemy.orm import Session
+
+from app.core.cache import classification_cache
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models import Product, Inventory, InventoryMovement
+
+# Cumulative share of the stock value reached before a product, below which it is class A / B (C above)
+ABC_THRESHOLDS = (0.8, 0.95)
+# Coefficient of variation of weekly demand up to which a product is class X / Y (Z above, or without demand)
+XYZ_THRESHOLDS = (0.5, 1.0)
+WEEK_SECONDS = 7 * 86400
+_FRESH = "fresh"
+
+
+@dataclass
+class Classification:
+    product_ids: np.ndarray
+    values: np.ndarray
+    abc: np.ndarray
+    xyz: np.ndarray
+    classified_at: int
+
+
+def abc_classes(values: np.ndarray) -> np.ndarray:
+    """A/B/C per value, from one descending sort and one cumulative sum."""
+    classes = np.full(len(values), "C")
+    total = values.sum()
+    if total <= 0:
+        return classes
+    order = np.argsort(-values, kind="stable")
+    share_before = (np.cumsum(values[order]) - values[order]) / total
+    classes[order] = np.select([share_before < ABC_THRESHOLDS[0], share_before < ABC_THRESHOLDS[1]], ["A", "B"], "C")
+    return classes
+
+
+def xyz_classes(mean_demand: np.ndarray, demand_std: np.ndarray) -> np.ndarray:
+    """X/Y/Z per product from the coefficient of variation of its demand; no demand at all is Z."""
+    cv = np.divide(demand_std, mean_demand, out=np.full(len(mean_demand), np.inf), where=mean_demand > 0)
+    return np.select([cv <= XYZ_THRESHOLDS[0], cv <= XYZ_THRESHOLDS[1]], ["X", "Y"], "Z")
+
+
+class CRUDClassification:
+    """
+    ABC (share of stock value) and XYZ (variability of weekly demand) class of every product, persisted on the
+    product so lists can filter by it. A refresh recomputes all classes in one NumPy pass over two grouped queries
+    and writes only the products whose class changed; the periodic job refreshes after committed writes.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+
+    def refresh(self, db: Session) -> Classification:
+        with self._lock:
+            now = int(time.time())
+            # Marked before classifying, so a write committed meanwhile clears it again. Writing changed classes
+            # to `products` clears it too: the next refresh then finds nothing to change and the marker stays
+            classification_cache.set(_FRESH, now)
+            try:
+                classification = self._classify(db, now)
+
+                stored = {product_id: (abc, xyz) for product_id, abc, xyz in
+                          db.query(Product.id, Product.abc_class, Product.xyz_class)}
+                changed = [
+                    {"id": int(product_id), "abc_class": str(abc), "xyz_class": str(xyz), "classified_at": now}
+                    for product_id, abc, xyz in zip(classification.product_ids, classification.abc,
+                                                    classification.xyz)
+                    if stored.get(product_id) != (abc, xyz)
+                ]
+                if changed:
+                    db.execute(update(Product), changed)
+                db.commit()
+            except Exception:
+                classification_cache.pop(_FRESH)
+                raise
+            return classification
+
+    def _classify(self, db: Session, now: int) -> Classification:
+        values = db.query(
+            Product.id, func.coalesce(func.sum(Inventory.quantity * Product.price), 0)
+        ).outerjoin(Inventory, Inventory.product_id == Product.id).group_by(Product.id).order_by(Product.id).all()
+        if not values:
+            empty = np.array([])
+            return Classification(empty.astype(int), empty, empty.astype(str), empty.astype(str), now)
+        product_ids, product_values = (np.array(column) for column in zip(*values))
+        product_values = product_values.astype(float)
+
+        # Outgoing quantity per product and week over the window; weeks without movements count as zero demand
+        weeks = settings.ABC_XYZ_DEMAND_WEEKS
+        since = now - weeks * WEEK_SECONDS
+        week = (InventoryMovement.timestamp - since) // WEEK_SECONDS
+        weekly = db.query(
+            InventoryMovement.product_id.label("product_id"),
+            func.sum(case((InventoryMovement.quantity < 0, -InventoryMovement.quantity), else_=0)).label("demand")
+        ).filter(InventoryMovement.timestamp >= since).group_by(InventoryMovement.product_id, week).subquery()
+        demand = db.query(
+            weekly.c.product_id, func.sum(weekly.c.demand), func.sum(weekly.c.demand * weekly.c.demand)
+        ).group_by(weekly.c.product_id).all()
+
+        total_demand = np.zeros(len(product_ids))
+        total_demand_squared = np.zeros(len(product_ids))
+        if demand:
+            demand_ids, sums, squares = (np.array(column, dtype=float) for column in zip(*demand))
+            positions = np.minimum(np.searchsorted(product_ids, demand_ids), len(product_ids) - 1)
+            known = product_ids[positions] == demand_ids
+            total_demand[positions[known]] = sums[known]
+            total_demand_squared[positions[known]] = squares[known]
+        mean_demand = total_demand / weeks
+        demand_std = np.sqrt(np.maximum(total_demand_squared / weeks - mean_demand ** 2, 0))
+
+        return Classification(product_ids, product_values, abc_classes(product_values),
+                              xyz_classes(mean_demand, demand_std), now)
+
+    def refresh_if_dirty(self, db: Session) -> bool:
+        if classification_cache.get(_FRESH) is not None:
+            return False
+        self.refresh(db)
+        return True
+
+    def refresh_in_background(self) -> None:
+        """`refresh_if_dirty` with its own session, for the periodic refresh."""
+        with SessionLocal() as db:
+            self.refresh_if_dirty(db)
+
+
+classification = CRUDClassification()
@@ -13,15 +13,14 @@ from public_api.shared_schemas import (
 
 class CRUDCustomer(CRUDBase[Customer, CustomerCreate, CustomerUpdate]):
     def get_multi_with_filter(self, db: Session, *,
-                              skip: int = 0, limit: int = 100,
+                              skip: int = 0, limit: int = 100, cursor: str | None = None,
                               filter_params: CustomerFilter) -> list[CustomerSchema]:
         query = db.query(self.model)
         if filter_params.name:
             query = query.filter(Customer.name.ilike(f"%{filter_params.name}%"))
         if filter_params.email:
             query = query.filter(Customer.email == filter_params.email)
-        customers = query.offset(skip).limit(limit).all()
-        return [CustomerSchema.model_validate(x) for x in customers]
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).map(CustomerSchema.model_validate)
 
 
 customer = CRUDCustomer(Customer)
@@ -13,7 +13,7 @@ from public_api.shared_schemas import (
 
 
 class CRUDDockAppointment(CRUDBase[DockAppointment, DockAppointmentCreate, DockAppointmentUpdate]):
-    def get_multi_with_filter(self, db: Session, *, skip: int = 0, limit: int = 100,
+    def get_multi_with_filter(self, db: Session, *, skip: int = 0, limit: int = 100, cursor: str | None = None,
                               filter_params: DockAppointmentFilter) -> list[DockAppointmentSchema]:
         query = db.query(self.model)
         if filter_params.yard_location_id:
@@ -28,8 +28,7 @@ class CRUDDockAppointment(CRUDBase[DockAppointment, DockAppointmentCreate, DockA
             query = query.filter(DockAppointment.appointment_time >= filter_params.date_from)
         if filter_params.date_to:
             query = query.filter(DockAppointment.appointment_time <= filter_params.date_to)
-        appointments = query.offset(skip).limit(limit).all()
-        return [DockAppointmentSchema.model_validate(appointment) for appointment in appointments]
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).map(DockAppointmentSchema.model_validate)
 
     def check_conflicts(self, db: Session,
                         appointment: DockAppointmentCreate,
@@ -0,0 +1,100 @@
+# /server/app/crud/forecast.py
+import json
+import time
+from collections import defaultdict
+from itertools import islice
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models import DemandForecast, InventoryMovement
+from app.utils.forecasting import train_forecast, get_executor
+
+
+class CRUDForecast:
+    """
+    Demand forecasts per product, served from the `demand_forecasts` table and retrained only when the product's
+    movement history changed since the stored forecast.
+    """
+
+    def get_forecast(self, db: Session, product_id: int) -> dict:
+        data_version = self.data_versions(db, [product_id]).get(product_id)
+        if data_version is None:
+            return {"forecast": []}
+
+        stored = db.get(DemandForecast, product_id)
+        if stored is None or stored.data_version != data_version:
+            # Not trained yet, or new movements since: train this one product right away
+            try:
+                self.refresh(db, product_ids=[product_id], use_pool=False)
+            except IntegrityError:
+                db.rollback()  # a concurrent request stored it first
+            stored = db.get(DemandForecast, product_id, populate_existing=True)
+        return {"forecast": json.loads(stored.forecast)}
+
+    def data_versions(self, db: Session, product_ids: list[int] | None = None) -> dict[int, str]:
+        """Fingerprint of each product's movement history: new, removed or edited movements change it."""
+        query = db.query(
+            InventoryMovement.product_id, func.count(), func.max(InventoryMovement.movement_id),
+            func.sum(InventoryMovement.quantity), func.max(InventoryMovement.timestamp)
+        ).group_by(InventoryMovement.product_id)
+        if product_ids is not None:
+            query = query.filter(InventoryMovement.product_id.in_(product_ids))
+        return {product_id: ":".join(map(str, fingerprint)) for product_id, *fingerprint in query}
+
+    def refresh(self, db: Session, *, product_ids: list[int] | None = None, batch_size: int | None = None,
+                use_pool: bool = True) -> int:
+        """
+        Retrain the stale forecasts of `product_ids` (all products with movements by default), `batch_size`
+        products at a time: one history query per batch, models fitted in parallel on the process pool, one
+        commit per batch. Returns the number of products retrained.
+        """
+        versions = self.data_versions(db, product_ids)
+        stored_query = db.query(DemandForecast.product_id, DemandForecast.data_version)
+        if product_ids is not None:
+            stored_query = stored_query.filter(DemandForecast.product_id.in_(product_ids))
+        stored = dict(stored_query.all())
+        stale = iter([product_id for product_id, version in versions.items() if stored.get(product_id) != version])
+
+        executor = get_executor() if use_pool else None
+        trained = 0
+        while batch := list(islice(stale, batch_size or settings.FORECAST_BATCH_SIZE)):
+            histories = defaultdict(lambda: ([], []))
+            for product_id, timestamp, quantity in db.query(
+                    InventoryMovement.product_id, InventoryMovement.timestamp, InventoryMovement.quantity
+            ).filter(InventoryMovement.product_id.in_(batch)).order_by(InventoryMovement.product_id,
+                                                                       InventoryMovement.timestamp):
+                histories[product_id][0].append(timestamp)
+                histories[product_id][1].append(quantity)
+
+            jobs = [(product_id, versions[product_id], timestamps, quantities, settings.FORECAST_HORIZON_DAYS,
+                     settings.FORECAST_MODEL_DIR) for product_id, (timestamps, quantities) in histories.items()]
+            if not jobs:
+                continue
+            # Workers only import app.utils.forecasting, never the database layer
+            results = (executor.map if executor else map)(train_forecast, *zip(*jobs))
+
+            existing = {forecast.product_id: forecast
+                        for forecast in db.query(DemandForecast).filter(DemandForecast.product_id.in_(batch))}
+            now = int(time.time())
+            for product_id, data_version, points, model_path in results:
+                row = existing.get(product_id) or DemandForecast(product_id=product_id)
+                row.data_version = data_version
+                row.forecast = json.dumps(points)
+                row.model_path = model_path
+                row.trained_at = now
+                db.add(row)
+            db.commit()
+            trained += len(jobs)
+        return trained
+
+    def refresh_in_background(self, product_ids: list[int] | None = None, batch_size: int | None = None) -> int:
+        """`refresh` with its own session, for background tasks and the periodic refresh."""
+        with SessionLocal() as db:
+            return self.refresh(db, product_ids=product_ids, batch_size=batch_size)
+
+
+forecast = CRUDForecast()
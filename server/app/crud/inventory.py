@@ -1,20 +1,34 @@
+import json
 import time
 from collections import defaultdict
 from datetime import timedelta, datetime
+from itertools import islice
+from statistics import NormalDist
+from typing import Iterable
 
 import numpy as np
 from fastapi import HTTPException
-from sklearn.ensemble import RandomForestRegressor
 from sklearn.linear_model import LinearRegression
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
-from sqlalchemy import func, or_
-from sqlalchemy.orm import Session, joinedload
-
-from app.crud.base import CRUDBase
+from sqlalchemy import func, or_, tuple_, insert, update, select, case
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, joinedload, aliased
+
+from app.core.cache import inventory_summary_cache
+from app.core.config import settings
+from app.crud.base import CRUDBase, AsyncCRUDBase
+from app.crud.classification import classification
+from app.crud.search import search_backend, search_terms
+from app.crud.inventory_snapshot import inventory_snapshot
 from app.models import (
-    Product, Inventory, Location, Zone, ProductCategory, InventoryMovement, InventoryAdjustment
+    Product, Inventory, Location, Zone, ProductCategory, InventoryMovement, InventoryAdjustment, AuditLog,
+    POItem, PurchaseOrder, PickList, PickListItem
 )
+from app.utils.inventory_import import ImportLine
+from app.utils.slotting import FreeCapacityIndex, travel_costs, unit_cube
+from app.utils.time import day_start, DAY_SECONDS
 from public_api.shared_schemas import (
     Product as ProductSchema,
     ProductWithInventory as ProductWithInventorySchema,
@@ -25,9 +39,21 @@ from public_api.shared_schemas import (
     InventoryReport, LocationWithInventory as LocationWithInventorySchema, InventoryMovement as InventoryMovementSchema,
     StocktakeCreate, StocktakeResult, ABCAnalysisResult, InventoryLocationSuggestion,
     StocktakeDiscrepancy, ABCCategory, StorageUtilization,
-    BulkImportData, BulkImportResult, InventoryFilter, InventoryWithDetails, InventorySummary, InventoryTrendItem
+    BulkImportData, BulkImportResult, InventoryImportRow, InventoryFilter, InventoryWithDetails, InventorySummary,
+    InventoryTrendItem, CountMode, ABCXYZCell, ABCClass, XYZClass
 )
 
+# Inventory row as loaded by `_load_stock`, and the part of it bulk stock changes write back
+_STOCK_COLUMNS = (Inventory.id, Inventory.product_id, Inventory.location_id, Inventory.quantity,
+                  Inventory.expiration_date, Inventory.last_updated)
+_WRITABLE_STOCK_KEYS = ("id", "quantity", "expiration_date", "last_updated")
+# Supplier lead time assumed for products without purchase orders carrying an expected delivery date
+DEFAULT_LEAD_TIME_DAYS = 7
+
+
+def _changed_keys(old: dict, new: dict) -> list[str]:
+    return [key for key in _WRITABLE_STOCK_KEYS[1:] if new[key] != old[key]]
+
 
 class CRUDInventory(CRUDBase[Inventory, InventoryCreate, InventoryUpdate]):
 
@@ -37,46 +63,45 @@ class CRUDInventory(CRUDBase[Inventory, InventoryCreate, InventoryUpdate]):
             *,
             skip: int = 0,
             limit: int = 100,
+            cursor: str | None = None,
             filter_params: InventoryFilter
     ) -> list[InventoryWithDetails]:
-        query = db.query(Inventory).options(
+        query = self._filtered_query(db, filter_params).options(
             joinedload(Inventory.product),
             joinedload(Inventory.location)
         )
-        if filter_params.product_id:
-            query = query.filter(Inventory.product_id == filter_params.product_id)
-        if filter_params.location_id:
-            query = query.filter(Inventory.location_id == filter_params.location_id)
-        if filter_params.sku:
-            query = query.join(Product).filter(Product.sku.ilike(f"%{filter_params.sku}%"))
-        if filter_params.name:
-            query = query.join(Product).filter(Product.name.ilike(f"%{filter_params.name}%"))
-        if filter_params.quantity_min is not None:
-            query = query.filter(Inventory.quantity >= filter_params.quantity_min)
-        if filter_params.quantity_max is not None:
-            query = query.filter(Inventory.quantity <= filter_params.quantity_max)
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).map(InventoryWithDetails.model_validate)
 
-        items = query.offset(skip).limit(limit).all()
+    def get_multi_with_filter(self, db: Session, *, skip: int = 0, limit: int = 100, cursor: str | None = None,
+                              filter_params: InventoryFilter) -> list[Inventory]:
+        query = self._filtered_query(db, filter_params)
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).map(InventorySchema.model_validate)
 
-        return [InventoryWithDetails.model_validate(item) for item in items]
+    def count_with_filter(self, db: Session, *, filter_params: InventoryFilter,
+                          mode: CountMode = CountMode.EXACT) -> int:
+        return self.count(db, self._filtered_query(db, filter_params), mode=mode, filter_params=filter_params)
 
-    def get_multi_with_filter(self, db: Session, *, skip: int = 0, limit: int = 100,
-                              filter_params: InventoryFilter) -> list[Inventory]:
+    def _filtered_query(self, db: Session, filter_params: InventoryFilter):
         query = db.query(Inventory)
         if filter_params.product_id:
             query = query.filter(Inventory.product_id == filter_params.product_id)
         if filter_params.location_id:
             query = query.filter(Inventory.location_id == filter_params.location_id)
+        if filter_params.sku or filter_params.name or filter_params.abc_class or filter_params.xyz_class:
+            query = query.join(Product)
         if filter_params.sku:
-            query = query.join(Product).filter(Product.sku.ilike(f"%{filter_params.sku}%"))
+            query = query.filter(Product.sku.ilike(f"%{filter_params.sku}%"))
         if filter_params.name:
-            query = query.join(Product).filter(Product.name.ilike(f"%{filter_params.name}%"))
+            query = query.filter(Product.name.ilike(f"%{filter_params.name}%"))
         if filter_params.quantity_min is not None:
             query = query.filter(Inventory.quantity >= filter_params.quantity_min)
         if filter_params.quantity_max is not None:
             query = query.filter(Inventory.quantity <= filter_params.quantity_max)
-
-        return [InventorySchema.model_validate(x) for x in query.offset(skip).limit(limit).all()]
+        if filter_params.abc_class:
+            query = query.filter(Product.abc_class == filter_params.abc_class.value)
+        if filter_params.xyz_class:
+            query = query.filter(Product.xyz_class == filter_params.xyz_class.value)
+        return query
 
     def adjust_quantity(self, db: Session, inventory_id: int, adjustment: InventoryAdjustmentSchema) -> InventorySchema:
         current_inventory = self.get(db, id=inventory_id)
@@ -142,21 +167,15 @@ class CRUDInventory(CRUDBase[Inventory, InventoryCreate, InventoryUpdate]):
             out_of_stock_items=out_of_stock_items
         )
 
-    def perform_cycle_count(self, db: Session,
-                            location_id: int, counted_items: list[InventoryUpdate]) -> list[InventorySchema]:
-        updated_items = []
-        for item in counted_items:
-            current_inventory = db.query(Inventory).filter(
-                Inventory.product_id == item.product_id,
-                Inventory.location_id == location_id
-            ).first()
-            if current_inventory:
-                current_inventory.quantity = item.quantity
-                current_inventory.last_updated = int(datetime.utcnow().timestamp())
-                db.add(current_inventory)
-                updated_items.append(current_inventory)
-        db.commit()
-        return [InventorySchema.model_validate(x) for x in updated_items]
+    def perform_cycle_count(self, db: Session, location_id: int, counted_items: list[InventoryUpdate],
+                            user_id: int | None = None) -> list[InventorySchema]:
+        counted = {item.product_id: item.quantity for item in counted_items
+                   if item.product_id is not None and item.quantity is not None}
+        stock = self._load_stock(db, [(product_id, location_id) for product_id in counted])
+        changes = [(row, {**row, "quantity": counted[product_id]})
+                   for (product_id, _), row in stock.items()]
+        updated = self._apply_stock_changes(db, changes, reason="Cycle count", user_id=user_id)
+        return [InventorySchema.model_validate(row) for row in updated]
 
     def get_low_stock_items(self, db: Session, threshold: int) -> list[ProductWithInventorySchema]:
         products = db.query(Product).join(Inventory).filter(Inventory.quantity <= threshold).all()
@@ -175,81 +194,154 @@ class CRUDInventory(CRUDBase[Inventory, InventoryCreate, InventoryUpdate]):
         locations = db.query(Location).join(Inventory).filter(Inventory.product_id == product_id).all()
         return [LocationWithInventorySchema.model_validate(location) for location in locations]
 
-    def batch_update(self, db: Session, updates: list[InventoryUpdate]) -> list[InventorySchema]:
-        updated_items = []
-        for update in updates:
-            current_inventory = db.query(Inventory).filter(
-                Inventory.product_id == update.product_id,
-                Inventory.location_id == update.location_id
-            ).first()
-            if current_inventory:
-                for key, value in update.model_dump(exclude_unset=True).items():
-                    setattr(current_inventory, key, value)
-                current_inventory.last_updated = int(datetime.utcnow().timestamp())
-                db.add(current_inventory)
-                updated_items.append(current_inventory)
+    def batch_update(self, db: Session, updates: list[InventoryUpdate],
+                     user_id: int | None = None) -> list[InventorySchema]:
+        """
+        Set the quantity and expiration date of existing stock rows. product_id and location_id select the row
+        rather than move it, so both are required; updates of rows that don't exist are skipped.
+        """
+        unaddressed = [index for index, item in enumerate(updates)
+                       if item.product_id is None or item.location_id is None]
+        if unaddressed:
+            raise HTTPException(status_code=400, detail=(
+                "product_id and location_id select the inventory row to update and can't be changed by a batch "
+                f"update; both are required (missing in updates {', '.join(map(str, unaddressed))})"))
+        stock = self._load_stock(db, [(item.product_id, item.location_id) for item in updates])
+        new_values = {}
+        for item in updates:
+            key = (item.product_id, item.location_id)
+            if key in stock:
+                values = item.model_dump(exclude_unset=True)
+                if values.get("quantity", 0) is None:
+                    # Like in a cycle count, no quantity leaves it as it is (it can't be NULL)
+                    del values["quantity"]
+                # Later updates of the same row apply on top of earlier ones
+                new_values[key] = {**new_values.get(key, stock[key]), **values}
+        updated = self._apply_stock_changes(db, [(stock[key], values) for key, values in new_values.items()],
+                                            reason="Batch update", user_id=user_id)
+        return [InventorySchema.model_validate(row) for row in updated]
+
+    def _load_stock(self, db: Session, keys: list[tuple[int, int]]) -> dict[tuple[int, int], dict]:
+        """Current inventory rows of (product_id, location_id) pairs as dicts, with one keyed query per chunk."""
+        keys = list(dict.fromkeys(keys))
+        stock = {}
+        for start in range(0, len(keys), settings.BULK_CHUNK_SIZE):
+            chunk = keys[start:start + settings.BULK_CHUNK_SIZE]
+            rows = db.query(*_STOCK_COLUMNS).filter(tuple_(Inventory.product_id, Inventory.location_id).in_(chunk))
+            stock.update({(row.product_id, row.location_id): row._asdict() for row in rows})
+        return stock
+
+    def _apply_stock_changes(self, db: Session, changes: list[tuple[dict, dict]], *, reason: str,
+                             user_id: int | None) -> list[dict]:
+        """
+        Persist (old row, new row) pairs from `_load_stock` in one transaction: a bulk UPDATE by primary key of the
+        rows that changed, plus bulk inserts of an adjustment per quantity change and an audit entry per changed row.
+        Returns the resulting rows.
+        """
+        now = int(time.time())
+        rows, changed_rows, adjustments, audit_entries = [], [], [], []
+        for old, new in changes:
+            changed = _changed_keys(old, new)
+            if not changed:
+                rows.append(old)
+                continue
+            row = {**new, "last_updated": now}
+            rows.append(row)
+            changed_rows.append({key: row[key] for key in _WRITABLE_STOCK_KEYS})
+            if new["quantity"] != old["quantity"]:
+                adjustments.append({"product_id": old["product_id"], "location_id": old["location_id"],
+                                    "quantity_change": new["quantity"] - old["quantity"], "reason": reason,
+                                    "timestamp": now})
+            audit_entries.append({"user_id": user_id, "action_type": "Update", "table_name": Inventory.__tablename__,
+                                  "record_id": old["id"], "timestamp": now,
+                                  "old_value": json.dumps({key: old[key] for key in changed}),
+                                  "new_value": json.dumps({key: new[key] for key in changed})})
+
+        if changed_rows:
+            db.execute(update(Inventory), changed_rows)
+        if adjustments:
+            db.execute(insert(InventoryAdjustment), adjustments)
+        if audit_entries:
+            db.execute(insert(AuditLog), audit_entries)
         db.commit()
-        return [InventorySchema.model_validate(inventory) for inventory in updated_items]
+        return rows
 
     def get_movement_history(self, db: Session, product_id: int, start_date: int | None,
-                             end_date: int | None) -> list[InventoryMovementSchema]:
+                             end_date: int | None, limit: int | None = None,
+                             cursor: str | None = None) -> list[InventoryMovementSchema]:
         query = db.query(InventoryMovement).filter(InventoryMovement.product_id == product_id)
         if start_date:
             query = query.filter(InventoryMovement.timestamp >= start_date)
         if end_date:
             query = query.filter(InventoryMovement.timestamp <= end_date)
 
-        result = query.order_by(InventoryMovement.timestamp.desc()).all()
-        return [InventoryMovementSchema.model_validate(movement) for movement in result]
+        query = query.order_by(InventoryMovement.timestamp.desc())
+        if limit is None:
+            return [InventoryMovementSchema.model_validate(movement) for movement in query.all()]
+        key = [(InventoryMovement.timestamp, True), (InventoryMovement.movement_id, True)]
+        return self.paginate(query, limit=limit, cursor=cursor, key=key).map(InventoryMovementSchema.model_validate)
 
     def get_inventory_summary(self, db: Session) -> InventorySummary:
-        categories = db.query(ProductCategory).all()
-        summary = {}
-        total_items = 0
-        for category in categories:
-            quantity = db.query(func.sum(Inventory.quantity)) \
-                           .join(Product) \
-                           .filter(Product.category_id == category.id) \
-                           .scalar() or 0
-            summary[category.name] = quantity
-            total_items += quantity
+        summary = inventory_summary_cache.get("summary")
+        if summary is None:
+            summary = inventory_summary_cache.set("summary", self._compute_inventory_summary(db))
+        return summary
+
+    def _compute_inventory_summary(self, db: Session) -> InventorySummary:
+        """Stock per top-level category, subcategories rolled up into their root, in a single aggregate query."""
+        # (category, root category) for every category reachable from a root
+        category_roots = select(
+            ProductCategory.id.label("category_id"), ProductCategory.id.label("root_id")
+        ).where(ProductCategory.parent_category_id.is_(None)).cte("category_roots", recursive=True)
+        subcategory = aliased(ProductCategory)
+        category_roots = category_roots.union_all(
+            select(subcategory.id, category_roots.c.root_id)
+            .where(subcategory.parent_category_id == category_roots.c.category_id)
+        )
+        total_categories = select(func.count(ProductCategory.id)).scalar_subquery()
 
+        rows = db.query(
+            ProductCategory.name, func.coalesce(func.sum(Inventory.quantity), 0), total_categories
+        ).join(category_roots, category_roots.c.root_id == ProductCategory.id) \
+            .outerjoin(Product, Product.category_id == category_roots.c.category_id) \
+            .outerjoin(Inventory, Inventory.product_id == Product.id) \
+            .group_by(ProductCategory.id, ProductCategory.name).all()
+
+        summary = {name: int(quantity) for name, quantity, _ in rows}
         return InventorySummary(
             category_quantities=summary,
-            total_items=total_items,
-            total_categories=len(categories)
+            total_items=sum(summary.values()),
+            total_categories=rows[0][2] if rows else 0
         )
 
-    def perform_stocktake(self, db: Session, stocktake: StocktakeCreate) -> StocktakeResult:
+    def perform_stocktake(self, db: Session, stocktake: StocktakeCreate,
+                          user_id: int | None = None) -> StocktakeResult:
         discrepancies = []
         total_items = len(stocktake.items)
         accurate_items = 0
 
+        stock = self._load_stock(db, [(item.product_id, stocktake.location_id) for item in stocktake.items])
+        changes = {}
         for item in stocktake.items:
-            current_inventory = db.query(Inventory).filter(
-                Inventory.product_id == item.product_id,
-                Inventory.location_id == stocktake.location_id
-            ).first()
-
-            if current_inventory:
-                expected_quantity = current_inventory.quantity
-                discrepancy = item.counted_quantity - expected_quantity
-
-                if discrepancy != 0:
-                    discrepancies.append(StocktakeDiscrepancy(
-                        product_id=item.product_id,
-                        expected_quantity=expected_quantity,
-                        counted_quantity=item.counted_quantity,
-                        discrepancy=discrepancy
-                    ))
-                else:
-                    accurate_items += 1
+            current = stock.get((item.product_id, stocktake.location_id))
+            if current is None:
+                continue
+            expected_quantity = current["quantity"]
+            discrepancy = item.counted_quantity - expected_quantity
+
+            if discrepancy != 0:
+                discrepancies.append(StocktakeDiscrepancy(
+                    product_id=item.product_id,
+                    expected_quantity=expected_quantity,
+                    counted_quantity=item.counted_quantity,
+                    discrepancy=discrepancy
+                ))
+            else:
+                accurate_items += 1
 
-                current_inventory.quantity = item.counted_quantity
-                current_inventory.last_updated = int(datetime.utcnow().timestamp())
-                db.add(current_inventory)
+            changes[item.product_id] = (current, {**current, "quantity": item.counted_quantity})
 
-        db.commit()
+        self._apply_stock_changes(db, list(changes.values()), reason="Stocktake", user_id=user_id)
 
         accuracy_percentage = (accurate_items / total_items) * 100 if total_items > 0 else 100
 
@@ -261,82 +353,101 @@ class CRUDInventory(CRUDBase[Inventory, InventoryCreate, InventoryUpdate]):
         )
 
     def perform_abc_analysis(self, db: Session) -> ABCAnalysisResult:
-        product_values = db.query(
-            Product.id,
-            Product.name,
-            func.sum(Inventory.quantity * Product.price).label('total_value')
-        ).join(Inventory).group_by(Product.id).all()
-
-        sorted_products = sorted(product_values, key=lambda x: x.total_value, reverse=True)
-
-        total_value = sum(x.total_value for x in sorted_products)
-        cumulative_value = 0
-        categories = defaultdict(list)
-
-        for current_product in sorted_products:
-            cumulative_value += current_product.total_value
-            percentage = cumulative_value / total_value
-
-            if percentage <= 0.8:
-                category = 'A'
-            elif percentage <= 0.95:
-                category = 'B'
-            else:
-                category = 'C'
-
-            categories[category].append(current_product)
-
-        result = []
-        for category, products in categories.items():
-            category_value = sum(p.total_value for p in products)
-            result.append(ABCCategory(
-                category=category,
-                products=[ProductSchema.model_validate(p) for p in products],
-                value_percentage=category_value / total_value * 100,
-                item_percentage=len(products) / len(sorted_products) * 100
-            ))
-
-        return ABCAnalysisResult(categories=result)
-
-    def optimize_locations(self, db: Session) -> list[InventoryLocationSuggestion]:
-        product_locations = db.query(
-            Product.id,
-            Inventory.location_id,
-            func.sum(Inventory.quantity).label('total_quantity')
-        ).join(Inventory).group_by(Product.id, Inventory.location_id).all()
-
-        locations = db.query(Location).all()
-        zones = db.query(Zone).all()
-
-        zone_locations = defaultdict(list)
-        for current_location in locations:
-            zone_locations[current_location.id].append(current_location)
-
-        suggestions = []
-
-        for product_location in product_locations:
-            current_location = next(loc for loc in locations if loc.id == product_location.id)
-            current_zone = next(zone for zone in zones if zone.id == current_location.zone_id)
-
-            if product_location.total_quantity > 1000:
-                optimal_zone = next((z for z in zones if z.name == 'High Volume'), None)
-            elif product_location.total_quantity > 100:
-                optimal_zone = next((z for z in zones if z.name == 'Medium Volume'), None)
-            else:
-                optimal_zone = next((z for z in zones if z.name == 'Low Volume'), None)
-
-            if optimal_zone and optimal_zone.id != current_zone.id:
-                optimal_location = min(zone_locations[optimal_zone.id],
-                                       key=lambda loc: (loc.aisle, loc.rack, loc.shelf, loc.bin))
-
-                suggestions.append(InventoryLocationSuggestion(
-                    product_id=product_location.product_id,
-                    current_location_id=current_location.id,
-                    suggested_location_id=optimal_location.id,
-                    reason=f"Move from {current_zone.name} to {optimal_zone.name} zone for better inventory management"
+        """ABC classes by stock value and the ABC-XYZ matrix, reclassifying (and persisting) every product first."""
+        result = classification.refresh(db)
+        total_value = result.values.sum()
+
+        def value_share(mask: np.ndarray) -> float:
+            return float(result.values[mask].sum() / total_value * 100) if total_value > 0 else 0.0
+
+        products = {product.id: product for product in db.query(Product)}
+
+        categories = []
+        for category in ABCClass:
+            mask = result.abc == category.value
+            if mask.any():
+                categories.append(ABCCategory(
+                    category=category.value,
+                    products=[ProductSchema.model_validate(products[product_id])
+                              for product_id in result.product_ids[mask].tolist()],
+                    value_percentage=value_share(mask),
+                    item_percentage=mask.sum() / len(result.product_ids) * 100
                 ))
 
-        return suggestions
+        matrix = [
+            ABCXYZCell(abc_class=abc_class, xyz_class=xyz_class, product_count=int(mask.sum()),
+                       value_percentage=value_share(mask))
+            for abc_class in ABCClass for xyz_class in XYZClass
+            if (mask := (result.abc == abc_class.value) & (result.xyz == xyz_class.value)).any()
+        ]
+        return ABCAnalysisResult(categories=categories, matrix=matrix, classified_at=result.classified_at)
+
+    def optimize_locations(self, db: Session, max_moves: int | None = None) -> list[InventoryLocationSuggestion]:
+        """
+        Slotting move plan. Picked stock rows are taken by cube-per-order index (small, often picked first) and
+        moved to the closest bin of their zone with enough free capacity when that shortens the walk from the dock.
+        Bins are indexed once per zone (ordered by travel cost in a free-capacity segment tree), so each row costs
+        O(log n). The saving of a move is the round trip saved over its pick lines of the last
+        SLOTTING_VELOCITY_DAYS days, in layout distance units.
+        """
+        locations = db.query(Location.id, Location.zone_id, Location.aisle, Location.rack, Location.shelf,
+                             Location.capacity).all()
+        if not locations:
+            return []
+        location_ids, zone_ids, aisles, racks, shelves, capacities = zip(*locations)
+        costs = travel_costs(aisles, racks, shelves)
+        occupied = dict(db.query(Inventory.location_id, func.sum(Inventory.quantity)).group_by(Inventory.location_id))
+
+        # Per zone: its locations ordered by travel cost, and each location's position in that order
+        zone_bins = defaultdict(list)
+        for i in np.lexsort((costs, [-1 if zone_id is None else zone_id for zone_id in zone_ids])).tolist():
+            zone_bins[zone_ids[i]].append(i)
+        slots = {location_ids[i]: (zone_id, position)
+                 for zone_id, bins in zone_bins.items() for position, i in enumerate(bins)}
+        free_capacity = {
+            zone_id: FreeCapacityIndex([(capacities[i] or 0) - (occupied.get(location_ids[i]) or 0) for i in bins])
+            for zone_id, bins in zone_bins.items()
+        }
+
+        since = int(time.time()) - settings.SLOTTING_VELOCITY_DAYS * 86400
+        picks = {(product_id, location_id): count for product_id, location_id, count in db.query(
+            PickListItem.product_id, PickListItem.location_id, func.count()
+        ).join(PickList, PickList.id == PickListItem.pick_list_id).filter(
+            PickList.created_at >= since
+        ).group_by(PickListItem.product_id, PickListItem.location_id)}
+        stock = [
+            (product_id, location_id, quantity, picks[product_id, location_id], unit_cube(dimensions))
+            for product_id, location_id, quantity, dimensions in db.query(
+                Inventory.product_id, Inventory.location_id, Inventory.quantity, Product.dimensions
+            ).join(Product, Product.id == Inventory.product_id).filter(Inventory.quantity > 0)
+            if (product_id, location_id) in picks and location_id in slots
+        ]
+        stock.sort(key=lambda row: row[2] * row[4] / row[3])
+
+        moves = []
+        for product_id, location_id, quantity, pick_count, _ in stock:
+            zone_id, position = slots[location_id]
+            index, bins = free_capacity[zone_id], zone_bins[zone_id]
+            index.add(position, quantity)  # its own space is free while looking for a better bin
+            target = index.closest_fitting(quantity)
+            current_cost = costs[bins[position]]
+            if target is None or costs[bins[target]] >= current_cost:
+                index.add(position, -quantity)
+                continue
+            index.add(target, -quantity)
+            saving = 2 * (current_cost - costs[bins[target]]) * pick_count
+            moves.append(InventoryLocationSuggestion(
+                product_id=product_id,
+                current_location_id=location_id,
+                suggested_location_id=location_ids[bins[target]],
+                quantity=quantity,
+                travel_saving=round(float(saving), 2),
+                reason=f"Picked {pick_count} times in {settings.SLOTTING_VELOCITY_DAYS} days; a closer bin in the "
+                       f"same zone saves {saving:.0f} units of travel"
+            ))
+
+        moves.sort(key=lambda move: move.travel_saving, reverse=True)
+        return moves[:max_moves] if max_moves else moves
 
     def get_expiring_soon(self, db: Session, days: int) -> list[ProductWithInventorySchema]:
         expiration_date = int((datetime.utcnow() + timedelta(days=days)).timestamp())
@@ -344,41 +455,104 @@ class CRUDInventory(CRUDBase[Inventory, InventoryCreate, InventoryUpdate]):
         return [ProductWithInventorySchema.model_validate(product) for product in products]
 
     def bulk_import(self, db: Session, import_data: BulkImportData) -> BulkImportResult:
-        successful_imports = []
-        failed_imports = []
-
-        for item in import_data.items:
-            try:
-                product = db.query(Product).filter(Product.sku == item.sku).first()
-                if not product:
-                    product = Product(sku=item.sku, name=item.name, category_id=item.category_id)
-                    db.add(product)
-                    db.flush()
-
-                inventory = db.query(Inventory).filter(
-                    Inventory.product_id == product.id,
-                    Inventory.location_id == item.location_id
-                ).first()
-
-                if inventory:
-                    inventory.quantity += item.quantity
+        rows = (InventoryImportRow(**item.model_dump()) for item in import_data.items)
+        return self.import_rows(db, rows=enumerate(rows, start=1))
+
+    def import_rows(self, db: Session, *, rows: Iterable[ImportLine]) -> BulkImportResult:
+        """
+        Add imported quantities to stock, chunk by chunk: a chunk costs a few IN lookups and one executemany
+        upsert whatever its size, and is committed on its own. `rows` is consumed lazily, so it may stream
+        from an upload; rows that fail to parse or reference unknown products/locations are reported, not raised.
+        """
+        started = time.perf_counter()
+        result = BulkImportResult(success_count=0, failure_count=0, errors=[])
+
+        def fail(line_num: int, message: str):
+            result.failure_count += 1
+            if len(result.errors) < settings.BULK_IMPORT_MAX_ERRORS:
+                result.errors.append(f"Row {line_num}: {message}")
+
+        rows = iter(rows)
+        while chunk := list(islice(rows, settings.BULK_CHUNK_SIZE)):
+            valid = []
+            for line_num, row in chunk:
+                if isinstance(row, str):
+                    fail(line_num, row)
+                elif row.product_id is None and not row.sku:
+                    fail(line_num, "either product_id or sku is required")
                 else:
-                    inventory = Inventory(
-                        product_id=product.id,
-                        location_id=item.location_id,
-                        quantity=item.quantity
-                    )
-                    db.add(inventory)
-
-                successful_imports.append(item)
-            except Exception as e:
-                failed_imports.append((item, str(e)))
-
-        db.commit()
-        return BulkImportResult(
-            successful_imports=successful_imports,
-            failed_imports=failed_imports
-        )
+                    valid.append((line_num, row))
+
+            skus = {row.sku for _, row in valid if row.product_id is None}
+            product_ids = {row.product_id for _, row in valid if row.product_id is not None}
+            location_ids = {row.location_id for _, row in valid}
+            ids_by_sku = dict(db.query(Product.sku, Product.id).filter(Product.sku.in_(skus)).all()) if skus else {}
+            known_products = {id for (id,) in db.query(Product.id).filter(Product.id.in_(product_ids))} \
+                if product_ids else set()
+            known_locations = {id for (id,) in db.query(Location.id).filter(Location.id.in_(location_ids))} \
+                if location_ids else set()
+
+            # Rows for the same (product, location) are folded into one upsert
+            now = int(time.time())
+            stock = {}
+            imported_lines = []
+            for line_num, row in valid:
+                product_id = row.product_id if row.product_id is not None else ids_by_sku.get(row.sku)
+                if product_id is None:
+                    fail(line_num, f"unknown SKU {row.sku!r}")
+                elif row.product_id is not None and product_id not in known_products:
+                    fail(line_num, f"unknown product_id {product_id}")
+                elif row.location_id not in known_locations:
+                    fail(line_num, f"unknown location_id {row.location_id}")
+                else:
+                    values = stock.setdefault((product_id, row.location_id), {
+                        "product_id": product_id, "location_id": row.location_id, "quantity": 0,
+                        "expiration_date": None, "last_updated": now
+                    })
+                    values["quantity"] += row.quantity
+                    if row.expiration_date is not None:
+                        values["expiration_date"] = row.expiration_date
+                    imported_lines.append(line_num)
+
+            if not stock:
+                continue
+            try:
+                self._upsert_stock(db, list(stock.values()))
+                db.commit()
+                result.success_count += len(imported_lines)
+            except SQLAlchemyError as e:
+                db.rollback()
+                for line_num in imported_lines:
+                    fail(line_num, f"database error: {getattr(e, 'orig', None) or e}")
+
+        result.elapsed_seconds = round(time.perf_counter() - started, 3)
+        processed = result.success_count + result.failure_count
+        result.rows_per_second = round(processed / result.elapsed_seconds, 1) if result.elapsed_seconds else 0.0
+        return result
+
+    def _upsert_stock(self, db: Session, values: list[dict]) -> None:
+        """Insert (product, location) rows, adding the quantity to the row that already exists for a pair."""
+        dialect = db.get_bind().dialect.name
+        if dialect in ("sqlite", "postgresql"):
+            stmt = (sqlite_insert if dialect == "sqlite" else postgresql_insert)(Inventory)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Inventory.product_id, Inventory.location_id],
+                set_={
+                    "quantity": Inventory.quantity + stmt.excluded.quantity,
+                    "expiration_date": func.coalesce(stmt.excluded.expiration_date, Inventory.expiration_date),
+                    "last_updated": stmt.excluded.last_updated
+                }
+            )
+        else:  # mysql
+            stmt = mysql_insert(Inventory)
+            stmt = stmt.on_duplicate_key_update(
+                quantity=Inventory.quantity + stmt.inserted.quantity,
+                expiration_date=func.coalesce(stmt.inserted.expiration_date, Inventory.expiration_date),
+                last_updated=stmt.inserted.last_updated
+            )
+        # Core executemany on the session's connection: a missing expiration_date stays NULL instead of getting
+        # the ORM default, so it never overwrites the date of an existing row
+        db.connection().execute(stmt, values)
 
     def get_storage_utilization(self, db: Session) -> StorageUtilization:
         total_capacity = db.query(func.sum(Location.capacity)).scalar() or 0
@@ -420,15 +594,11 @@ class CRUDInventory(CRUDBase[Inventory, InventoryCreate, InventoryUpdate]):
     ) -> list[ProductSchema]:
         query = db.query(Product)
 
-        # Apply search filters
-        if q:
-            query = query.filter(
-                or_(
-                    Product.name.ilike(f"%{q}%"),
-                    Product.sku.ilike(f"%{q}%"),
-                    Product.description.ilike(f"%{q}%")
-                )
-            )
+        # Apply search filters, ranked by the search index unless another order is asked for
+        matches = None
+        if q and search_terms(q):
+            matches = search_backend(db).products(q).subquery()
+            query = query.join(matches, matches.c.id == Product.id)
 
         if category_id:
             query = query.filter(Product.id == category_id)
@@ -448,117 +618,86 @@ class CRUDInventory(CRUDBase[Inventory, InventoryCreate, InventoryUpdate]):
                 )
 
         # Apply sorting
-        if sort_by:
-            sort_column = getattr(Product, sort_by, None)
-            if sort_column is not None:
-                if sort_order.lower() == "desc":
-                    sort_column = sort_column.desc()
-                query = query.order_by(sort_column)
+        sort_column = getattr(Product, sort_by, None) if sort_by else None
+        if sort_column is not None:
+            if sort_order.lower() == "desc":
+                sort_column = sort_column.desc()
+            query = query.order_by(sort_column)
+        elif matches is not None:
+            query = query.order_by(matches.c.rank, Product.id)
 
         # Execute query and return results
         products = query.all()
         return [ProductSchema.model_validate(product) for product in products]
 
-    def get_forecast_for_product_id(self, db: Session, product_id: int) -> dict:
-        history = db.query(InventoryMovement).filter(InventoryMovement.product_id == product_id).order_by(
-            InventoryMovement.timestamp).all()
-
-        if not history:
-            return {"forecast": []}
-
-        timestamps = np.array([h.timestamp for h in history]).reshape(-1, 1)
-        quantities = np.array([h.quantity for h in history])
-
-        X_train, X_test, y_train, y_test = train_test_split(timestamps, quantities, test_size=0.2, random_state=42)
-
-        scaler = StandardScaler()
-        X_train_scaled = scaler.fit_transform(X_train)
-
-        model = RandomForestRegressor(n_estimators=100, max_depth=10, random_state=42)
-        model.fit(X_train_scaled, y_train)
-
-        forecast = []
-        last_timestamp = timestamps[-1][0]
-        for i in range(30):
-            forecast_timestamp = last_timestamp + (i + 1) * 86400  # Add one day in seconds
-            forecast_input = scaler.transform([[forecast_timestamp]])
-            forecast_quantity = model.predict(forecast_input)[0]
-            forecast.append({
-                "date": int(forecast_timestamp),
-                "quantity": max(0, round(forecast_quantity, 2))
-            })
-
-        return {"forecast": forecast}
-
-    def get_reorder_suggestions(self, db: Session) -> list[dict]:
-        products = db.query(Product).options(joinedload(Product.inventory_items)).all()
-        suggestions = []
-        for product in products:
-            current_stock = sum(inv.quantity for inv in product.inventory_items)
-
-            # Calculate average daily demand
-            movements = db.query(InventoryMovement).filter(InventoryMovement.product_id == product.id).order_by(
-                InventoryMovement.timestamp).all()
-            if len(movements) < 2:
-                continue  # Not enough data for this product
-
-            total_demand = sum(m.quantity for m in movements if m.quantity < 0)  # Only outgoing movements
-            days = (movements[-1].timestamp - movements[0].timestamp) / 86400
-            avg_daily_demand = abs(total_demand) / days if days > 0 else 0
-
-            # Calculate lead time (assume 7 days if no data)
-            lead_time = 7
-            if product.po_items:
-                lead_times = [(po.purchase_order.expected_delivery_date - po.purchase_order.order_date).days
-                              for po in product.po_items if po.purchase_order.expected_delivery_date]
-                if lead_times:
-                    lead_time = sum(lead_times) / len(lead_times)
-
-            # Calculate reorder point
-            safety_stock = avg_daily_demand * 3  # 3 days of safety stock
-            reorder_point = (avg_daily_demand * lead_time) + safety_stock
-
-            if current_stock <= reorder_point:
-                suggestions.append({
-                    "sku": product.sku,
-                    "name": product.name,
-                    "current_stock": current_stock,
-                    "reorder_point": round(reorder_point),
-                    "suggested_reorder": round(reorder_point - current_stock)
-                })
-
-        return suggestions
+    def get_reorder_suggestions(self, db: Session, service_level: float | None = None) -> list[dict]:
+        """
+        Products whose stock is at or below their reorder point, computed for the whole catalogue at once from three
+        grouped queries fed into NumPy arrays:
+            reorder point = mean daily demand * lead time + z(service_level) * daily demand std * sqrt(lead time)
+        """
+        service_level = settings.REORDER_SERVICE_LEVEL if service_level is None else service_level
+
+        # Outgoing quantity per product and day; the outer query folds the days into per-product statistics
+        day = InventoryMovement.timestamp // 86400
+        daily = db.query(
+            InventoryMovement.product_id.label("product_id"),
+            day.label("day"),
+            func.count().label("movements"),
+            func.sum(case((InventoryMovement.quantity < 0, -InventoryMovement.quantity), else_=0)).label("demand")
+        ).group_by(InventoryMovement.product_id, day).subquery()
+        demand_rows = db.query(
+            Product.id, Product.sku, Product.name, func.min(daily.c.day), func.max(daily.c.day),
+            func.sum(daily.c.demand), func.sum(daily.c.demand * daily.c.demand)
+        ).join(daily, daily.c.product_id == Product.id) \
+            .group_by(Product.id, Product.sku, Product.name) \
+            .having(func.sum(daily.c.movements) >= 2).all()  # products with enough history only
+        if not demand_rows:
+            return []
+
+        product_ids, skus, names, *statistics = zip(*demand_rows)
+        first_day, last_day, total_demand, total_demand_squared = (np.array(column, dtype=float)
+                                                                   for column in statistics)
+        days = last_day - first_day + 1
+        mean_demand = total_demand / days
+        demand_std = np.sqrt(np.maximum(total_demand_squared / days - mean_demand ** 2, 0))
+
+        stock = dict(db.query(Inventory.product_id, func.sum(Inventory.quantity))
+                     .group_by(Inventory.product_id).all())
+        lead_times = dict(db.query(POItem.product_id,
+                                   func.avg(PurchaseOrder.expected_delivery_date - PurchaseOrder.order_date) / 86400)
+                          .join(PurchaseOrder, POItem.po_id == PurchaseOrder.id)
+                          .filter(PurchaseOrder.expected_delivery_date.isnot(None))
+                          .group_by(POItem.product_id).all())
+        current_stock = np.array([stock.get(product_id) or 0 for product_id in product_ids], dtype=float)
+        lead_time = np.array([lead_times.get(product_id, DEFAULT_LEAD_TIME_DAYS) for product_id in product_ids],
+                             dtype=float)
+
+        safety_stock = NormalDist().inv_cdf(service_level) * demand_std * np.sqrt(lead_time)
+        reorder_point = mean_demand * lead_time + safety_stock
+        return [
+            {
+                "sku": skus[i],
+                "name": names[i],
+                "current_stock": int(current_stock[i]),
+                "reorder_point": round(reorder_point[i]),
+                "safety_stock": round(safety_stock[i]),
+                "suggested_reorder": round(reorder_point[i] - current_stock[i])
+            }
+            for i in np.flatnonzero(current_stock <= reorder_point)
+        ]
 
     def get_inventory_trend_with_prediction(self, db: Session, days_past: int = 5, days_future: int = 5) \
             -> (list[InventoryTrendItem], list[InventoryTrendItem]):
-        end_timestamp = int(time.time())
-        start_timestamp = end_timestamp - (days_past * 86400)
-
-        # Get historical data
-        historical_data = db.query(
-            func.date(func.datetime(Inventory.last_updated, 'unixepoch')).label('date'),
-            func.sum(Inventory.quantity).label('total_quantity')
-        ).filter(
-            Inventory.last_updated >= start_timestamp,
-            Inventory.last_updated <= end_timestamp
-        ).group_by(
-            func.date(func.datetime(Inventory.last_updated, 'unixepoch'))
-        ).order_by(
-            func.date(func.datetime(Inventory.last_updated, 'unixepoch'))
-        ).all()
-
-        # Prepare data for historical records
-        timestamps = list(range(start_timestamp, end_timestamp + 86400, 86400))
-        quantities = [0] * (days_past + 1)
-
-        for record in historical_data:
-            record_date = datetime.strptime(record.date, "%Y-%m-%d").date()
-            index = (record_date - datetime.fromtimestamp(start_timestamp).date()).days
-            quantities[index] = record.total_quantity
+        # Historical totals come from the daily snapshots: one pre-aggregated row per day
+        today = day_start(int(time.time()))
+        daily_totals = inventory_snapshot.daily_totals(db, today - days_past * DAY_SECONDS, today)
+        timestamps = [day for day, _, _ in daily_totals]
+        quantities = [quantity for _, quantity, _ in daily_totals]
 
         historical_items = [
-            InventoryTrendItem(timestamp=timestamp, quantity=quantities[i])
-            for i, timestamp in enumerate(timestamps)
+            InventoryTrendItem(timestamp=timestamp, quantity=quantity)
+            for timestamp, quantity in zip(timestamps, quantities)
         ]
 
         # Perform linear regression
@@ -568,7 +707,7 @@ class CRUDInventory(CRUDBase[Inventory, InventoryCreate, InventoryUpdate]):
         model.fit(X, y)
 
         # Generate predictions
-        future_timestamps = [end_timestamp + (i * 86400) for i in range(1, days_future + 1)]
+        future_timestamps = [today + (i * DAY_SECONDS) for i in range(1, days_future + 1)]
         future_X = np.array(future_timestamps).reshape(-1, 1)
         predictions = model.predict(future_X)
 
@@ -581,3 +720,4 @@ class CRUDInventory(CRUDBase[Inventory, InventoryCreate, InventoryUpdate]):
 
 
 inventory = CRUDInventory(Inventory)
+inventory_async = AsyncCRUDBase[Inventory, InventoryCreate, InventoryUpdate](Inventory)
@@ -0,0 +1,104 @@
+# /server/app/crud/inventory_snapshot.py
+import time
+
+from sqlalchemy import select, insert, delete, func, literal, Integer
+from sqlalchemy.orm import Session
+
+from app.core.cache import inventory_snapshot_cache
+from app.db.database import SessionLocal
+from app.models import Inventory, Product, InventorySnapshot, InventoryDailyTotal
+from app.utils.time import day_start, DAY_SECONDS
+
+
+class CRUDInventorySnapshot:
+    """
+    Per product/location/day stock and value, plus one warehouse-wide total per day. Past days are never rewritten;
+    the periodic capture refreshes today's rows until the day is over, so analytics read pre-aggregated rows instead
+    of live stock.
+    """
+
+    def capture(self, db: Session, snapshot_date: int | None = None) -> int:
+        """
+        Replace the snapshot of the day containing `snapshot_date` (today by default) with the live stock, in two
+        INSERT ... SELECT statements. Returns the number of product/location rows captured.
+        """
+        snapshot_date = day_start(int(time.time()) if snapshot_date is None else snapshot_date)
+        db.execute(delete(InventorySnapshot).where(InventorySnapshot.snapshot_date == snapshot_date))
+        db.execute(delete(InventoryDailyTotal).where(InventoryDailyTotal.snapshot_date == snapshot_date))
+
+        captured = db.execute(insert(InventorySnapshot).from_select(
+            ["snapshot_date", "product_id", "location_id", "quantity", "value"],
+            select(literal(snapshot_date, Integer), Inventory.product_id, Inventory.location_id, Inventory.quantity,
+                   Inventory.quantity * Product.price)
+            .join(Product, Product.id == Inventory.product_id)
+            .where(Inventory.location_id.is_not(None), Inventory.quantity.is_not(None))
+        )).rowcount
+        db.execute(insert(InventoryDailyTotal).from_select(
+            ["snapshot_date", "quantity", "value", "captured_at"],
+            select(literal(snapshot_date, Integer), func.coalesce(func.sum(InventorySnapshot.quantity), 0),
+                   func.coalesce(func.sum(InventorySnapshot.value), 0), literal(int(time.time()), Integer))
+            .where(InventorySnapshot.snapshot_date == snapshot_date)
+        ))
+        db.commit()
+        return captured
+
+    def ensure_current(self, db: Session) -> None:
+        """Recapture today's snapshot if an inventory or product write (or the TTL) made it stale."""
+        today = day_start(int(time.time()))
+        if inventory_snapshot_cache.get(today) is not None:
+            return
+        # Marked before capturing, so a write committed while capturing clears it again
+        inventory_snapshot_cache.set(today, True)
+        try:
+            self.capture(db, today)
+        except Exception:
+            inventory_snapshot_cache.pop(today)
+            raise
+
+    def ensure_captured(self, db: Session) -> None:
+        """
+        Capture today's snapshot if there is none yet. A stale one is left for the periodic capture to refresh, so
+        reads never recapture after every inventory write.
+        """
+        today = day_start(int(time.time()))
+        if inventory_snapshot_cache.get(today) is None and db.query(InventoryDailyTotal.snapshot_date).filter(
+                InventoryDailyTotal.snapshot_date == today).first() is None:
+            self.ensure_current(db)
+
+    def capture_in_background(self) -> None:
+        """`ensure_current` with its own session, for the periodic capture."""
+        with SessionLocal() as db:
+            self.ensure_current(db)
+
+    def daily_totals(self, db: Session, start_date: int, end_date: int) -> list[tuple[int, int, float]]:
+        """
+        (day, quantity, value) for every day from `start_date` up to `end_date` (at most today). A day without a
+        snapshot carries the previous snapshot's totals forward; days before the first snapshot are left out, as
+        nothing is known about them.
+        """
+        today = day_start(int(time.time()))
+        first_day, last_day = day_start(start_date), min(day_start(end_date), today)
+        if first_day > last_day:
+            return []
+        if last_day == today:
+            self.ensure_captured(db)
+
+        totals = {
+            row.snapshot_date: (row.quantity, float(row.value))
+            for row in db.query(InventoryDailyTotal).filter(
+                InventoryDailyTotal.snapshot_date.between(first_day, last_day))
+        }
+        previous = db.query(InventoryDailyTotal).filter(
+            InventoryDailyTotal.snapshot_date < first_day
+        ).order_by(InventoryDailyTotal.snapshot_date.desc()).first()
+        current = (previous.quantity, float(previous.value)) if previous else None
+
+        result = []
+        for day in range(first_day, last_day + 1, DAY_SECONDS):
+            current = totals.get(day, current)
+            if current is not None:
+                result.append((day, *current))
+        return result
+
+
+inventory_snapshot = CRUDInventorySnapshot()
@@ -0,0 +1,97 @@
+# /server/app/crud/kpi.py
+import time
+from threading import Lock
+
+from sqlalchemy import select, insert, delete, func
+from sqlalchemy.orm import Session
+
+from app.core.cache import kpi_cache
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models import Order, Inventory, Product, OrderDailyStats, KPICounter
+from app.utils.time import day_start, DAY_SECONDS
+
+# The dashboard compares the orders of the last 7 days with the 7 before
+RECENT_DAYS = 14
+INVENTORY_VALUE = "inventory_value"
+PENDING_ORDERS = "pending_orders"
+_FRESH = "fresh"
+
+
+class CRUDKPI:
+    """
+    Materialized KPI figures: per-day order counts and revenue, plus current counters. Reads only touch the
+    recent buckets and the counters; a refresh recomputes the recent buckets (all of them once a day) and the
+    counters, and runs from the periodic job after committed writes or from a read past the staleness bound.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._rebuilt_on: int | None = None  # day of this process' last full rebuild of the order buckets
+
+    def refresh(self, db: Session, *, full: bool | None = None) -> None:
+        with self._lock:
+            now = int(time.time())
+            today = day_start(now)
+            full = self._rebuilt_on != today if full is None else full
+            # Marked before refreshing, so a write committed meanwhile marks the figures dirty again
+            kpi_cache.set(_FRESH, now)
+            try:
+                self._refresh(db, now, None if full else today - (RECENT_DAYS - 1) * DAY_SECONDS)
+            except Exception:
+                kpi_cache.pop(_FRESH)
+                raise
+            if full:
+                self._rebuilt_on = today
+
+    def _refresh(self, db: Session, now: int, since: int | None) -> None:
+        day = Order.order_date - Order.order_date % DAY_SECONDS
+        stale_buckets = delete(OrderDailyStats)
+        buckets = select(day, func.count(Order.id), func.coalesce(func.sum(Order.total_amount), 0)).where(
+            Order.order_date.is_not(None)).group_by(day)
+        if since is not None:
+            stale_buckets = stale_buckets.where(OrderDailyStats.day >= since)
+            buckets = buckets.where(Order.order_date >= since)
+        db.execute(stale_buckets)
+        db.execute(insert(OrderDailyStats).from_select(["day", "order_count", "revenue"], buckets))
+
+        counters = {
+            INVENTORY_VALUE: db.query(func.sum(Inventory.quantity * Product.price)).join(Product).scalar() or 0,
+            PENDING_ORDERS: db.query(func.count(Order.id)).filter(Order.status == "pending").scalar(),
+        }
+        for name, value in counters.items():
+            db.merge(KPICounter(name=name, value=value, updated_at=now))
+        db.commit()
+
+    def refresh_if_dirty(self, db: Session) -> bool:
+        if kpi_cache.get(_FRESH) is not None:
+            return False
+        self.refresh(db)
+        return True
+
+    def refresh_in_background(self) -> None:
+        """`refresh_if_dirty` with its own session, for the periodic refresh."""
+        with SessionLocal() as db:
+            self.refresh_if_dirty(db)
+
+    def get_figures(self, db: Session) -> tuple[dict[int, tuple[int, float]], dict[str, float], int]:
+        """
+        ({day: (orders, revenue)} for the recent days, {counter: value}, refreshed_at), refreshed first when older
+        than KPI_MAX_STALENESS_SECONDS.
+        """
+        counters = db.query(KPICounter).all()
+        refreshed_at = min((counter.updated_at for counter in counters), default=0)
+        if len(counters) < 2 or refreshed_at < int(time.time()) - settings.KPI_MAX_STALENESS_SECONDS:
+            self.refresh(db)
+            counters = db.query(KPICounter).all()
+            refreshed_at = min(counter.updated_at for counter in counters)
+
+        since = day_start(int(time.time())) - (RECENT_DAYS - 1) * DAY_SECONDS
+        daily = {
+            row.day: (row.order_count, float(row.revenue))
+            for row in db.query(OrderDailyStats).filter(OrderDailyStats.day >= since)
+        }
+        return daily, {counter.name: float(counter.value) for counter in counters}, refreshed_at
+
+
+kpi = CRUDKPI()
@@ -13,7 +13,7 @@ from public_api.shared_schemas import (
 class CRUDLocation(CRUDBase[Location, LocationCreate, LocationUpdate]):
     def get_multi_with_inventory(
             self, db: Session, *,
-            skip: int = 0, limit: int = 100,
+            skip: int = 0, limit: int = 100, cursor: str | None = None,
             filter_params: LocationFilter) -> list[LocationWithInventorySchema]:
         query = db.query(Location).options(joinedload(Location.inventory_items))
 
@@ -30,8 +30,8 @@ class CRUDLocation(CRUDBase[Location, LocationCreate, LocationUpdate]):
         if filter_params.bin:
             query = query.filter(Location.bin == filter_params.bin)
 
-        locations = query.offset(skip).limit(limit).all()
-        return [LocationWithInventorySchema.model_validate(location) for location in locations]
+        page = self.paginate(query, skip=skip, limit=limit, cursor=cursor)
+        return page.map(LocationWithInventorySchema.model_validate)
 
     def get_with_inventory(self, db: Session, id: int) -> LocationWithInventorySchema | None:
         location = db.query(Location).filter(Location.id == id).options(
@@ -1,46 +1,125 @@
+from sqlalchemy import false, select, true, update
 from sqlalchemy.orm import Session
 
+from app.core.pubsub import broker, notification_channel
 from app.crud.base import CRUDBase
-from app.models import Notification
+from app.models import Notification, User
 from public_api.shared_schemas import (
     NotificationCreate, NotificationUpdate, Notification as NotificationSchema
 )
 
 
 class CRUDNotification(CRUDBase[Notification, NotificationCreate, NotificationUpdate]):
+    """
+    Notifications and each user's unread counter (`User.unread_notification_count`), which every write here moves
+    along in its own transaction, only by the rows whose read state it actually changed. New notifications and
+    counter changes are published to the user's notification channel once committed.
+    """
+
+    @staticmethod
+    def _change_unread(db: Session, user_id: int, change: int) -> int:
+        """Move the user's unread counter by `change` in SQL (concurrent writes don't lose updates); the new count."""
+        count = db.execute(
+            update(User).where(User.id == user_id)
+            .values(unread_notification_count=User.unread_notification_count + change)
+            .returning(User.unread_notification_count)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+        return count or 0
+
+    @staticmethod
+    def _publish(user_id: int, event: dict) -> None:
+        broker.publish(notification_channel(user_id), event)
+
+    def get_unread_count(self, db: Session, user_id: int) -> int:
+        return db.execute(select(User.unread_notification_count).where(User.id == user_id)).scalar() or 0
+
+    def create(self, db: Session, *, obj_in: NotificationCreate, return_schema=None):
+        db_obj = Notification(**obj_in.model_dump())
+        db.add(db_obj)
+        db.flush()
+        unread = self._change_unread(db, db_obj.user_id, 0 if db_obj.is_read else 1)
+        db.commit()
+        db.refresh(db_obj)
+        created = NotificationSchema.model_validate(db_obj)
+        self._publish(db_obj.user_id, {"type": "notification", "notification": created.model_dump(mode="json"),
+                                       "unread_count": unread})
+        return created if return_schema else db_obj
+
+    def update(self, db: Session, *, db_obj: Notification, obj_in: NotificationUpdate | dict, return_schema=None):
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+        is_read = update_data.get("is_read")
+        updated = db_obj
+        if is_read is not None and bool(is_read) != db_obj.is_read:
+            updated = self._set_read(db, db_obj.id, db_obj.user_id, bool(is_read)) or db_obj
+        return return_schema.model_validate(updated) if return_schema else updated
+
+    def _set_read(self, db: Session, notification_id: int, user_id: int, is_read: bool) -> Notification | None:
+        """Mark one of the user's notifications (un)read with a guarded UPDATE; None when it isn't the user's."""
+        changed = db.execute(
+            update(Notification)
+            .where(Notification.id == notification_id, Notification.user_id == user_id,
+                   Notification.is_read == (false() if is_read else true()))
+            .values(is_read=is_read)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if changed:
+            unread = self._change_unread(db, user_id, -1 if is_read else 1)
+        db.commit()
+        if changed:
+            self._publish(user_id, {"type": "unread_count", "unread_count": unread})
+        return db.query(Notification).filter(Notification.id == notification_id,
+                                             Notification.user_id == user_id).first()
+
+    def remove(self, db: Session, *, id: int, return_schema=None):
+        notification = db.get(Notification, id)
+        unread = None
+        if notification is not None and not notification.is_read:
+            unread = self._change_unread(db, notification.user_id, -1)
+        removed = super().remove(db, id=id, return_schema=return_schema)
+        if unread is not None:
+            self._publish(notification.user_id, {"type": "unread_count", "unread_count": unread})
+        return removed
 
     def get_user_notifications(self, db: Session,
                                user_id: int, skip: int = 0, limit: int = 100) -> list[NotificationSchema]:
-        notifications = db.query(Notification).filter(Notification.user_id == user_id).offset(skip).limit(limit).all()
+        notifications = (db.query(Notification).filter(Notification.user_id == user_id)
+                         .order_by(Notification.id.desc())
+                         .offset(skip)
+                         .limit(limit)
+                         .all())
         return [NotificationSchema.model_validate(notification) for notification in notifications]
 
     def get_user_unread_notifications(self, db: Session,
                                       user_id: int, skip: int = 0, limit: int = 100) -> list[NotificationSchema]:
+        # An equality on is_read (not IS false) lets ix_notifications_user_id_is_read serve filter and order
         notifications = (db.query(Notification).filter(Notification.user_id == user_id,
-                                                       Notification.is_read.isnot(True))
+                                                       Notification.is_read == false())
+                         .order_by(Notification.id.desc())
                          .offset(skip)
                          .limit(limit)
                          .all())
         return [NotificationSchema.model_validate(notification) for notification in notifications]
 
     def mark_notification_as_read(self, db: Session, notification_id: int, user_id: int) -> NotificationSchema | None:
-        notification = db.query(Notification).filter(Notification.id == notification_id,
-                                                     Notification.user_id == user_id).first()
-        if notification:
-            notification.is_read = True
-            db.commit()
-            return NotificationSchema.model_validate(notification)
-        return None
+        notification = self._set_read(db, notification_id, user_id, True)
+        return NotificationSchema.model_validate(notification) if notification else None
 
     def mark_all_as_read(self, db: Session, user_id: int) -> list[NotificationSchema]:
-        notifications = db.query(self.model).filter(self.model.user_id == user_id,
-                                                    self.model.is_read.isnot(True)).all()
-        for notification in notifications:
-            notification.is_read = True
+        """One UPDATE ... RETURNING of the user's unread notifications."""
+        notifications = db.execute(
+            update(Notification).where(Notification.user_id == user_id, Notification.is_read == false())
+            .values(is_read=True)
+            .returning(Notification.id, Notification.user_id, Notification.message, Notification.timestamp,
+                       Notification.is_read)
+        ).all()
+        marked = [NotificationSchema.model_validate(row._mapping) for row in notifications]
+        if marked:
+            unread = self._change_unread(db, user_id, -len(marked))
         db.commit()
-        for notification in notifications:
-            db.refresh(notification)
-        return [NotificationSchema.model_validate(notification) for notification in notifications]
+        if marked:
+            self._publish(user_id, {"type": "unread_count", "unread_count": unread})
+        return marked
 
 
 notification = CRUDNotification(Notification)
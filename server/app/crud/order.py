@@ -1,11 +1,11 @@
-from datetime import datetime
-
 from fastapi import HTTPException
-from sqlalchemy import func, or_, String
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, or_, case, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 
-from app.crud.base import CRUDBase
-from app.models import Order, OrderItem, Customer
+from app.crud.base import CRUDBase, AsyncCRUDBase
+from app.crud.search import search_backend, search_terms
+from app.models import Order, OrderItem
 from public_api.shared_schemas import (
     Order as OrderSchema,
     OrderWithDetails as OrderWithDetailsSchema,
@@ -14,6 +14,12 @@ from public_api.shared_schemas import (
     BulkOrderImportResult, OrderProcessingTimes, OrderStatus, OrderWithDetails
 )
 
+# Everything OrderWithDetails serializes; async sessions can't lazy-load, so it has to be fetched up front
+ORDER_DETAIL_OPTIONS = (
+    selectinload(Order.customer),
+    selectinload(Order.order_items).selectinload(OrderItem.product),
+)
+
 
 class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
     def create(self, db: Session, *, obj_in: OrderCreate) -> OrderSchema:
@@ -28,7 +34,7 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
         return OrderSchema.model_validate(db_obj)
 
     def get_multi_with_details(self, db: Session, *,
-                               skip: int = 0, limit: int = 100,
+                               skip: int = 0, limit: int = 100, cursor: str | None = None,
                                filter_params: OrderFilter) -> list[OrderWithDetailsSchema]:
         query = db.query(self.model).options(
             joinedload(Order.customer),
@@ -47,8 +53,7 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
         if filter_params.ship_date_to:
             query = query.filter(Order.ship_date <= filter_params.ship_date_to)
 
-        orders = query.offset(skip).limit(limit).all()
-        return [OrderWithDetailsSchema.model_validate(x) for x in orders]
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).map(OrderWithDetailsSchema.model_validate)
 
     def advanced_search(
             self,
@@ -71,15 +76,19 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
             joinedload(Order.order_items).joinedload(OrderItem.product)
         )
 
-        # Apply filters
-        if q:
-            query = query.filter(
-                or_(
-                    Order.id.cast(String).ilike(f"%{q}%"),
-                    Order.customer.has(Customer.name.ilike(f"%{q}%")),
-                    Order.customer.has(Customer.email.ilike(f"%{q}%"))
-                )
-            )
+        # Apply filters: the order number, or the customer's name / email through the search index. An order
+        # found by its number comes first, then the best customer matches, unless another order is asked for
+        rank = []
+        if q and search_terms(q):
+            matches = search_backend(db).customers(q).subquery()
+            if q.strip().isdigit():
+                number = int(q.strip())
+                query = query.outerjoin(matches, matches.c.id == Order.customer_id).filter(
+                    or_(Order.id == number, Order.customer_id.in_(select(matches.c.id))))
+                rank.append(case((Order.id == number, 0), else_=1))
+            else:
+                query = query.join(matches, matches.c.id == Order.customer_id)
+            rank += [matches.c.rank, Order.id.desc()]
 
         if status:
             query = query.filter(Order.status == status)
@@ -91,20 +100,21 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, OrderUpdate]):
             query = query.filter(Order.total_amount <= max_total)
 
         if start_date is not None:
-            query = query.filter(Order.order_date >= datetime.fromtimestamp(start_date))
+            query = query.filter(Order.order_date >= start_date)
 
         if end_date is not None:
-            query = query.filter(Order.order_date <= datetime.fromtimestamp(end_date))
+            query = query.filter(Order.order_date <= end_date)
 
         if customer_id:
             query = query.filter(Order.customer_id == customer_id)
 
-        if sort_by:
-            sort_column = getattr(Order, sort_by, None)
-            if sort_column is not None:
-                if sort_order and sort_order.lower() == "desc":
-                    sort_column = sort_column.desc()
-                query = query.order_by(sort_column)
+        sort_column = getattr(Order, sort_by, None) if sort_by else None
+        if sort_column is not None:
+            if sort_order and sort_order.lower() == "desc":
+                sort_column = sort_column.desc()
+            query = query.order_by(sort_column)
+        elif rank:
+            query = query.order_by(*rank)
 
         # Apply pagination
         orders = query.offset(skip).limit(limit).all()
@@ -249,5 +259,20 @@ class CRUDOrderItem(CRUDBase[OrderItem, OrderItemCreate, OrderItemUpdate]):
     pass
 
 
+class AsyncCRUDOrder(AsyncCRUDBase[Order, OrderCreate, OrderUpdate]):
+    async def create(self, db: AsyncSession, *, obj_in: OrderCreate) -> OrderSchema:
+        obj_in_data = obj_in.model_dump()
+        items = obj_in_data.pop("items")
+        db_obj = self.model(**obj_in_data)
+        db_obj.order_items = [OrderItem(**item) for item in items]
+        db.add(db_obj)
+        await db.commit()
+        order_id = db_obj.id
+        db.expire(db_obj)
+        db_obj = await self.get(db, id=order_id, options=list(ORDER_DETAIL_OPTIONS))
+        return OrderSchema.model_validate(db_obj)
+
+
 order = CRUDOrder(Order)
 order_item = CRUDOrderItem(OrderItem)
+order_async = AsyncCRUDOrder(Order)
@@ -2,6 +2,7 @@
 
 from sqlalchemy.orm import Session
 
+from app.core.cache import principal_cache
 from app.crud.base import CRUDBase
 from app.models import Permission
 from public_api.shared_schemas import PermissionCreate, PermissionUpdate, \
@@ -13,5 +14,16 @@ class CRUDPermission(CRUDBase[Permission, PermissionCreate, PermissionUpdate]):
         permission = db.query(Permission).filter(Permission.name == name).first()
         return PermissionSchema.model_validate(permission) if permission else None
 
+    def update(self, db: Session, *, db_obj: Permission, obj_in: PermissionUpdate) -> Permission:
+        updated_permission = super().update(db, db_obj=db_obj, obj_in=obj_in)
+        # Permission names are embedded in every cached principal
+        principal_cache.clear()
+        return updated_permission
+
+    def remove(self, db: Session, *, id: int) -> Permission:
+        removed_permission = super().remove(db, id=id)
+        principal_cache.clear()
+        return removed_permission
+
 
 permission = CRUDPermission(Permission)
@@ -1,14 +1,20 @@
-from sqlalchemy import func
+import numpy as np
+from sqlalchemy import func, case
 from sqlalchemy.orm import Session
 
-from app.crud.base import CRUDBase
-from app.models import PickList, PickListItem
+from app.core.cache import layout_cache
+from app.crud.base import CRUDBase, AsyncCRUDBase
+from app.models import PickList, PickListItem, Location
+from app.utils.routing import Layout, build_layout, optimize_pick_path
+from app.utils.time import DAY_SECONDS
 from public_api.shared_schemas import (
     PickList as PickListSchema, PickListCreate, PickListUpdate,
     PickListItem as PickListItemSchema, PickListItemCreate, PickListItemUpdate,
-    PickListFilter, PickingPerformance, OptimizedPickingRoute
+    PickListFilter, PickingPerformance, PickingPerformanceGroup, OptimizedPickingRoute, ReportBreakdown
 )
 
+_LAYOUT = "layout"
+
 
 class CRUDPickList(CRUDBase[PickList, PickListCreate, PickListUpdate]):
     def create_with_items(self, db: Session, *, obj_in: PickListCreate) -> PickListSchema:
@@ -38,58 +44,116 @@ class CRUDPickList(CRUDBase[PickList, PickListCreate, PickListUpdate]):
         return PickListSchema.model_validate(updated_pick_list)
 
     def get_multi_with_filter(self, db: Session, *,
-                              skip: int = 0, limit: int = 100,
+                              skip: int = 0, limit: int = 100, cursor: str | None = None,
                               filter_params: PickListFilter) -> list[PickListSchema]:
         query = db.query(self.model)
         if filter_params.status:
             query = query.filter(PickList.status == filter_params.status)
         if filter_params.order_id:
             query = query.filter(PickList.order_id == filter_params.order_id)
+        if filter_params.wave_id:
+            query = query.filter(PickList.wave_id == filter_params.wave_id)
         if filter_params.date_from:
             query = query.filter(PickList.created_at >= filter_params.date_from)
         if filter_params.date_to:
             query = query.filter(PickList.created_at <= filter_params.date_to)
-        pick_lists = query.offset(skip).limit(limit).all()
-        return [PickListSchema.model_validate(pl) for pl in pick_lists]
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).map(PickListSchema.model_validate)
+
+    def get_performance(self, db: Session, start_date: int, end_date: int,
+                        breakdown: ReportBreakdown | None = None) -> PickingPerformance:
+        """
+        Picking time, throughput and line accuracy of the pick lists completed between the dates, aggregated in
+        SQL: totals in one statement, plus one more for a per-day (completion day) or per-zone breakdown. A pick
+        list spanning several zones counts towards each of them with its whole duration.
+        """
+        totals = self._performance_groups(db, start_date, end_date, None)
+        performance = totals[0] if totals else PickingPerformanceGroup(
+            key=None, pick_lists=0, average_picking_time=0, items_picked_per_hour=0, accuracy_rate=1)
+        return PickingPerformance(
+            average_picking_time=performance.average_picking_time,
+            items_picked_per_hour=performance.items_picked_per_hour,
+            accuracy_rate=performance.accuracy_rate,
+            breakdown=self._performance_groups(db, start_date, end_date, breakdown) if breakdown else None
+        )
 
-    def get_performance(self, db: Session, start_date: int, end_date: int) -> PickingPerformance:
-        completed_pick_lists = db.query(PickList).filter(
+    def _performance_groups(self, db: Session, start_date: int, end_date: int,
+                            breakdown: ReportBreakdown | None) -> list[PickingPerformanceGroup]:
+        if breakdown == ReportBreakdown.ZONE:
+            key = Location.zone_id
+        elif breakdown == ReportBreakdown.DAY:
+            key = PickList.completed_at - PickList.completed_at % DAY_SECONDS
+        else:
+            key = None
+        group_keys = [key] if key is not None else []
+
+        # One row per pick list (and zone): its duration, units picked, and accurate / total lines
+        per_list = db.query(
+            *[group_key.label("key") for group_key in group_keys],
+            (PickList.completed_at - PickList.created_at).label("duration"),
+            func.coalesce(func.sum(PickListItem.picked_quantity), 0).label("picked_items"),
+            func.count(PickListItem.pick_list_item_id).label("lines"),
+            func.count(case((PickListItem.quantity == PickListItem.picked_quantity, 1))).label("accurate_lines")
+        ).select_from(PickList).outerjoin(PickListItem, PickListItem.pick_list_id == PickList.id)
+        if breakdown == ReportBreakdown.ZONE:
+            per_list = per_list.outerjoin(Location, Location.id == PickListItem.location_id)
+        per_list = per_list.filter(
             PickList.status == "completed",
             PickList.completed_at.between(start_date, end_date)
-        ).all()
-
-        total_time = sum((pl.completed_at - pl.created_at) for pl in completed_pick_lists)
-        total_items = sum(sum(item.picked_quantity for item in pl.pick_list_items) for pl in completed_pick_lists)
-
-        if len(completed_pick_lists) > 0:
-            average_picking_time = total_time / len(completed_pick_lists) / 60  # in minutes
-            items_picked_per_hour = (total_items / (total_time / 3600)) if total_time > 0 else 0
-            accuracy_rate = sum(1 for pl in completed_pick_lists for item in pl.pick_list_items if
-                                item.quantity == item.picked_quantity) / total_items if total_items > 0 else 1
-        else:
-            average_picking_time = 0
-            items_picked_per_hour = 0
-            accuracy_rate = 1
-
-        return PickingPerformance(
-            average_picking_time=average_picking_time,
-            items_picked_per_hour=items_picked_per_hour,
-            accuracy_rate=accuracy_rate
-        )
+        ).group_by(PickList.id, PickList.completed_at, PickList.created_at, *group_keys).subquery()
+
+        grouped_keys = [per_list.c.key] if group_keys else []
+        rows = db.query(
+            *grouped_keys,
+            func.count().label("pick_lists"),
+            func.coalesce(func.sum(per_list.c.duration), 0).label("duration"),
+            func.sum(per_list.c.picked_items).label("picked_items"),
+            func.sum(per_list.c.lines).label("lines"),
+            func.sum(per_list.c.accurate_lines).label("accurate_lines")
+        ).group_by(*grouped_keys).order_by(*grouped_keys).all()
+
+        return [
+            PickingPerformanceGroup(
+                key=row.key if group_keys else None,
+                pick_lists=row.pick_lists,
+                average_picking_time=row.duration / row.pick_lists / 60,  # in minutes
+                items_picked_per_hour=row.picked_items / (row.duration / 3600) if row.duration > 0 else 0,
+                accuracy_rate=row.accurate_lines / row.lines if row.lines > 0 else 1
+            )
+            for row in rows if row.pick_lists
+        ]
 
     def optimize_route(self, db: Session, pick_list_id: int) -> OptimizedPickingRoute:
         pick_list = db.query(PickList).filter(PickList.id == pick_list_id).first()
         if not pick_list:
             raise ValueError("Pick list not found")
 
-        optimized_items = sorted(pick_list.pick_list_items, key=lambda x: (
-            x.location.id, x.location.aisle, x.location.rack, x.location.shelf, x.location.bin))
+        layout = self.layout(db)
+        items = (db.query(PickListItem).filter(PickListItem.pick_list_id == pick_list_id)
+                 .order_by(PickListItem.pick_list_item_id).all())
+        routed = [item for item in items if item.location_id in layout.positions]
+        unrouted = [item for item in items if item.location_id not in layout.positions]
+
+        points = np.array([(0, 0), *(layout.positions[item.location_id] for item in routed)], dtype=float)
+        order, distance, strategy = optimize_pick_path(points, layout.bays)
+        # Lines whose location no longer exists are left for last, in their original order
+        optimized_items = [routed[index - 1] for index in order] + unrouted
 
         return OptimizedPickingRoute(
             pick_list_id=pick_list_id,
-            optimized_route=[PickListItemSchema.model_validate(item) for item in optimized_items]
+            optimized_route=[PickListItemSchema.model_validate(item) for item in optimized_items],
+            total_distance=round(distance, 2),
+            strategy=strategy if routed else None
         )
 
+    @staticmethod
+    def layout(db: Session) -> Layout:
+        """Coordinates of every location, rebuilt only after a committed location or zone write."""
+        layout = layout_cache.get(_LAYOUT)
+        if layout is None:
+            layout = layout_cache.set(_LAYOUT, build_layout(
+                db.query(Location.id, Location.zone_id, Location.aisle, Location.rack).all()))
+        return layout
+
     def start(self, db: Session, *, pick_list_id: int, user_id: int) -> PickListSchema:
         current_pick_list = db.query(PickList).filter(PickList.id == pick_list_id).first()
         current_pick_list.status = "in_progress"
@@ -112,3 +176,4 @@ class CRUDPickListItem(CRUDBase[PickListItem, PickListItemCreate, PickListItemUp
 
 pick_list = CRUDPickList(PickList)
 pick_list_item = CRUDPickListItem(PickListItem)
+pick_list_async = AsyncCRUDBase[PickList, PickListCreate, PickListUpdate](PickList)
@@ -1,9 +1,10 @@
 # /server/app/crud/product.py
 
-from sqlalchemy import func, or_
+from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 
 from app.crud.base import CRUDBase
+from app.crud.search import search_backend, search_terms
 from app.models import Product, Inventory
 from public_api.shared_schemas import (
     ProductCreate, ProductUpdate,
@@ -15,7 +16,7 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
 
     def get_multi_with_category_and_inventory(
             self, db: Session, *,
-            skip: int = 0, limit: int = 100,
+            skip: int = 0, limit: int = 100, cursor: str | None = None,
             filter_params: ProductFilter) -> list[ProductWithCategoryAndInventory]:
         query = db.query(Product).options(
             joinedload(Product.category),
@@ -29,9 +30,13 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
             query = query.filter(Product.sku == filter_params.sku)
         if filter_params.barcode:
             query = query.filter(Product.barcode == filter_params.barcode)
+        if filter_params.abc_class:
+            query = query.filter(Product.abc_class == filter_params.abc_class.value)
+        if filter_params.xyz_class:
+            query = query.filter(Product.xyz_class == filter_params.xyz_class.value)
 
-        products = query.offset(skip).limit(limit).all()
-        return [ProductWithCategoryAndInventory.model_validate(product) for product in products]
+        page = self.paginate(query, skip=skip, limit=limit, cursor=cursor)
+        return page.map(ProductWithCategoryAndInventory.model_validate)
 
     def get_max_id(self, db: Session) -> int:
         max_id = db.query(func.max(Product.id)).scalar()
@@ -57,15 +62,12 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
             joinedload(Product.inventory_items)
         )
 
-        # Apply filters
-        if q:
-            query = query.filter(
-                or_(
-                    Product.name.ilike(f"%{q}%"),
-                    Product.description.ilike(f"%{q}%"),
-                    Product.sku.ilike(f"%{q}%")
-                )
-            )
+        # Apply filters; the search index ranks the matches, best first unless another order is asked for
+        matches, group_by = None, [Product.id]
+        if q and search_terms(q):
+            matches = search_backend(db).products(q).subquery()
+            query = query.join(matches, matches.c.id == Product.id)
+            group_by.append(matches.c.rank)
 
         if category_id is not None:
             query = query.filter(Product.category_id == category_id)
@@ -80,17 +82,18 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
             if in_stock:
                 query = query.join(Inventory).filter(Inventory.quantity > 0)
             else:
-                query = query.outerjoin(Inventory).group_by(Product.id).having(func.sum(Inventory.quantity) == 0)
+                query = query.outerjoin(Inventory).group_by(*group_by).having(func.sum(Inventory.quantity) == 0)
 
         if min_quantity is not None:
-            query = query.join(Inventory).group_by(Product.id).having(func.sum(Inventory.quantity) >= min_quantity)
-
-        if sort_by:
-            sort_column = getattr(Product, sort_by, None)
-            if sort_column is not None:
-                if sort_order and sort_order.lower() == "desc":
-                    sort_column = sort_column.desc()
-                query = query.order_by(sort_column)
+            query = query.join(Inventory).group_by(*group_by).having(func.sum(Inventory.quantity) >= min_quantity)
+
+        sort_column = getattr(Product, sort_by, None) if sort_by else None
+        if sort_column is not None:
+            if sort_order and sort_order.lower() == "desc":
+                sort_column = sort_column.desc()
+            query = query.order_by(sort_column)
+        elif matches is not None:
+            query = query.order_by(matches.c.rank, Product.id)
 
         # Apply pagination
         products = query.offset(skip).limit(limit).all()
@@ -0,0 +1,111 @@
+# /server/app/crud/product_lookup.py
+# Scanner fast path: exact barcode/SKU lookups resolved from memory. Codes map to product ids through one index of
+# the whole catalogue (rebuilt after product writes); the product fields and stock per location returned with them
+# are cached per product until the next stock write, and loaded in one query for all products a call misses.
+from threading import Lock
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.cache import product_code_cache, product_stock_cache
+from app.db.database import SessionLocal
+from app.models import Product, Inventory, Location
+from public_api.shared_schemas import ProductLookup, ProductLocationStock, ProductLookupResult
+
+_FRESH = "fresh"
+
+
+class CRUDProductLookup:
+
+    def __init__(self):
+        self._lock = Lock()
+        self._index: dict[str, int] | None = None
+
+    def codes(self, db: Session) -> dict[str, int]:
+        """The code index: barcode or SKU -> product id. A barcode wins over another product's identical SKU."""
+        if product_code_cache.get(_FRESH) is not None and (index := self._index) is not None:
+            return index
+        # One rebuild at a time; concurrent lookups wait for it rather than scanning the catalogue too
+        with self._lock:
+            if product_code_cache.get(_FRESH) is None or self._index is None:
+                # Marked before building, so a product write committed while building clears it again and the next
+                # lookup rebuilds; lookups wait for the new index rather than take the old one
+                self._index = None
+                product_code_cache.set(_FRESH, True)
+                try:
+                    self._index = self._build(db)
+                except Exception:
+                    product_code_cache.pop(_FRESH)
+                    raise
+            return self._index
+
+    @staticmethod
+    def _build(db: Session) -> dict[str, int]:
+        rows = db.execute(select(Product.id, Product.sku, Product.barcode)).all()
+        index = {sku: product_id for product_id, sku, _ in rows}
+        index.update((barcode, product_id) for product_id, _, barcode in rows if barcode)
+        return index
+
+    def lookup(self, db: Session, code: str) -> ProductLookup | None:
+        result = self.lookup_many(db, [code])
+        return result.products[0] if result.products else None
+
+    def lookup_many(self, db: Session, codes: list[str]) -> ProductLookupResult:
+        """Resolve scanned codes, in order; unknown ones come back in `missing`."""
+        index = self.codes(db)
+        resolved = [(code, index.get(code.strip())) for code in codes]
+        summaries = self._summaries(db, {product_id for _, product_id in resolved if product_id is not None})
+        return ProductLookupResult(
+            products=[ProductLookup(code=code, **summaries[product_id]) for code, product_id in resolved
+                      if product_id in summaries],
+            missing=[code for code, product_id in resolved if product_id not in summaries]
+        )
+
+    @staticmethod
+    def _summaries(db: Session, product_ids: set[int]) -> dict[int, dict]:
+        summaries = {}
+        for product_id in product_ids:
+            summary = product_stock_cache.get(product_id)
+            if summary is not None:
+                summaries[product_id] = summary
+        missed = product_ids - summaries.keys()
+        if not missed:
+            return summaries
+
+        rows = db.execute(
+            select(Product.id, Product.sku, Product.name, Product.barcode, Product.unit_of_measure, Product.price,
+                   Inventory.location_id, Location.name, Inventory.quantity)
+            .outerjoin(Inventory, Inventory.product_id == Product.id)
+            .outerjoin(Location, Location.id == Inventory.location_id)
+            .where(Product.id.in_(missed))
+            .order_by(Product.id, Inventory.location_id)
+        ).all()
+        loaded = {}
+        for product_id, sku, name, barcode, unit_of_measure, price, location_id, location_name, quantity in rows:
+            summary = loaded.get(product_id)
+            if summary is None:
+                summary = loaded[product_id] = {
+                    "product_id": product_id, "sku": sku, "name": name, "barcode": barcode,
+                    "unit_of_measure": unit_of_measure, "price": float(price), "on_hand": 0, "stock": []
+                }
+            if location_id is not None:
+                summary["on_hand"] += quantity
+                summary["stock"].append(ProductLocationStock(location_id=location_id,
+                                                             location_name=location_name or "", quantity=quantity))
+        for product_id, summary in loaded.items():
+            summaries[product_id] = product_stock_cache.set(product_id, summary)
+        return summaries
+
+    def refresh_if_dirty(self, db: Session) -> bool:
+        if product_code_cache.get(_FRESH) is not None and self._index is not None:
+            return False
+        self.codes(db)
+        return True
+
+    def refresh_in_background(self) -> None:
+        """`refresh_if_dirty` with its own session, for the periodic job that warms the index."""
+        with SessionLocal() as db:
+            self.refresh_if_dirty(db)
+
+
+product_lookup = CRUDProductLookup()
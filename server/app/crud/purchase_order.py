@@ -25,7 +25,7 @@ class CRUDPurchaseOrder(CRUDBase[PurchaseOrder, PurchaseOrderCreate, PurchaseOrd
         db.refresh(db_obj)
         return PurchaseOrderSchema.model_validate(db_obj)
 
-    def get_multi_with_details(self, db: Session, *, skip: int = 0, limit: int = 100,
+    def get_multi_with_details(self, db: Session, *, skip: int = 0, limit: int = 100, cursor: str | None = None,
                                filter_params: PurchaseOrderFilter) -> list[PurchaseOrderWithDetailsSchema]:
         query = db.query(self.model).join(Supplier)
         if filter_params.supplier_id:
@@ -37,8 +37,8 @@ class CRUDPurchaseOrder(CRUDBase[PurchaseOrder, PurchaseOrderCreate, PurchaseOrd
         if filter_params.date_to:
             query = query.filter(PurchaseOrder.order_date <= filter_params.date_to)
 
-        purchase_orders = query.offset(skip).limit(limit).all()
-        return [PurchaseOrderWithDetailsSchema.model_validate(po) for po in purchase_orders]
+        page = self.paginate(query, skip=skip, limit=limit, cursor=cursor)
+        return page.map(PurchaseOrderWithDetailsSchema.model_validate)
 
     def receive(self, db: Session, *, db_obj: PurchaseOrder,
                 received_items: list[POItemReceive]) -> PurchaseOrderSchema:
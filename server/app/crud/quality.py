@@ -16,7 +16,7 @@ from public_api.shared_schemas import (
 
 
 class CRUDQualityCheck(CRUDBase[QualityCheck, QualityCheckCreate, QualityCheckUpdate]):
-    def get_multi_with_filter(self, db: Session, *, skip: int = 0, limit: int = 100,
+    def get_multi_with_filter(self, db: Session, *, skip: int = 0, limit: int = 100, cursor: str | None = None,
                               filter_params: QualityCheckFilter) -> list[QualityCheckSchema]:
         query = db.query(self.model).join(Product)
         if filter_params.product_id:
@@ -30,8 +30,7 @@ class CRUDQualityCheck(CRUDBase[QualityCheck, QualityCheckCreate, QualityCheckUp
         if filter_params.date_to:
             query = query.filter(QualityCheck.check_date <= filter_params.date_to)
 
-        quality_checks = query.offset(skip).limit(limit).all()
-        return [QualityCheckSchema.model_validate(check) for check in quality_checks]
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).map(QualityCheckSchema.model_validate)
 
     def get_metrics(self, db: Session, date_from: int | None, date_to: int | None) -> QualityMetrics:
         query = db.query(
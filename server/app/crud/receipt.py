@@ -40,7 +40,8 @@ class CRUDReceipt(CRUDBase[Receipt, ReceiptCreate, ReceiptUpdate]):
         return ReceiptSchema.model_validate(updated_receipt)
 
     def get_multi_with_filter(self, db: Session, *,
-                              skip: int = 0, limit: int = 100, filter_params: ReceiptFilter) -> list[ReceiptSchema]:
+                              skip: int = 0, limit: int = 100, cursor: str | None = None,
+                              filter_params: ReceiptFilter) -> list[ReceiptSchema]:
         query = db.query(self.model)
         if filter_params.status:
             query = query.filter(Receipt.status == filter_params.status)
@@ -50,8 +51,7 @@ class CRUDReceipt(CRUDBase[Receipt, ReceiptCreate, ReceiptUpdate]):
             query = query.filter(Receipt.received_date >= filter_params.date_from)
         if filter_params.date_to:
             query = query.filter(Receipt.received_date <= filter_params.date_to)
-        receipts = query.offset(skip).limit(limit).all()
-        return [ReceiptSchema.model_validate(receipt) for receipt in receipts]
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).map(ReceiptSchema.model_validate)
 
     def report_discrepancy(self, db: Session, *, receipt_id: int, item_id: int, discrepancy: int) -> ReceiptItemSchema:
         item = db.query(ReceiptItem).filter(ReceiptItem.receipt_id == receipt_id,
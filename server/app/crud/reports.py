@@ -1,10 +1,14 @@
-from datetime import timedelta, datetime
-from sqlalchemy import func
+import time
+from sqlalchemy import func, select, case, union_all, literal_column
 from sqlalchemy.orm import Session
+from app.crud.inventory_snapshot import inventory_snapshot
+from app.crud.kpi import kpi, INVENTORY_VALUE, PENDING_ORDERS
 from app.models import Product, Inventory, Order, OrderItem, Task
+from app.utils.time import day_start, DAY_SECONDS
 from public_api.shared_schemas import (
     InventorySummaryReport, InventoryItem, OrderSummaryReport, OrderSummary,
-    WarehousePerformanceReport, WarehousePerformanceMetric, KPIDashboard, KPIMetric
+    WarehousePerformanceReport, WarehousePerformanceMetric, WarehousePerformancePeriod, KPIDashboard, KPIMetric,
+    ReportBreakdown
 )
 
 
@@ -59,40 +63,76 @@ class ReportsCRUD:
             summary=summary.model_dump()
         )
 
-    def get_warehouse_performance(self, db: Session, start_date: int, end_date: int) -> WarehousePerformanceReport:
-        # Order fulfillment rate
-        total_orders = db.query(func.count(Order.id)).filter(
-            Order.order_date.between(start_date, end_date)).scalar()
-        fulfilled_orders = db.query(func.count(Order.id)).filter(
-            Order.order_date.between(start_date, end_date),
-            Order.status == "completed"
-        ).scalar()
-        fulfillment_rate = (fulfilled_orders / total_orders) * 100 if total_orders > 0 else 0
-
-        # Average task completion time
-        avg_task_completion_time = db.query(func.avg(Task.due_date - Task.created_at)).filter(
+    def get_warehouse_performance(self, db: Session, start_date: int, end_date: int,
+                                  breakdown: ReportBreakdown | None = None) -> WarehousePerformanceReport:
+        """
+        Fulfillment, picking task time and inventory turnover between the dates: orders, cost of goods sold and
+        tasks are aggregated together in one statement, grouped per day when a daily breakdown is asked for.
+        """
+        # Inventory turnover rate: cost of goods sold over the average daily inventory value (from the snapshots)
+        daily_totals = inventory_snapshot.daily_totals(db, start_date, end_date)
+        avg_inventory = sum(value for _, _, value in daily_totals) / len(daily_totals) if daily_totals else 0
+
+        totals = self._warehouse_performance_figures(db, start_date, end_date, by_day=False)[0]
+        report = WarehousePerformanceReport(
+            start_date=start_date,
+            end_date=end_date,
+            metrics=self._warehouse_performance_metrics(totals, avg_inventory)
+        )
+
+        if breakdown == ReportBreakdown.DAY:
+            inventory_values = {day: value for day, _, value in daily_totals}
+            report.breakdown = [
+                WarehousePerformancePeriod(day=row.day, metrics=self._warehouse_performance_metrics(
+                    row, inventory_values.get(row.day, 0)))
+                for row in self._warehouse_performance_figures(db, start_date, end_date, by_day=True)
+            ]
+        return report
+
+    def _warehouse_performance_figures(self, db: Session, start_date: int, end_date: int, *, by_day: bool):
+        def day(column):
+            return [(column - column % DAY_SECONDS).label("day")] if by_day else []
+
+        zero = literal_column("0")
+        orders = select(
+            *day(Order.order_date),
+            func.count(Order.id).label("orders"),
+            func.count(case((Order.status == "completed", 1))).label("fulfilled_orders"),
+            zero.label("cogs"), zero.label("task_seconds"), zero.label("tasks")
+        ).where(Order.order_date.between(start_date, end_date))
+        cogs = select(
+            *day(Order.order_date), zero, zero, func.sum(OrderItem.quantity * Product.price), zero, zero
+        ).select_from(OrderItem).join(Order, Order.id == OrderItem.order_id).join(
+            Product, Product.id == OrderItem.product_id
+        ).where(Order.order_date.between(start_date, end_date))
+        tasks = select(
+            *day(Task.created_at), zero, zero, zero, func.sum(Task.due_date - Task.created_at), func.count(Task.id)
+        ).where(
             Task.task_type == "picking",
             Task.created_at.between(start_date, end_date),
             Task.status == "completed"
-        ).scalar()
-
-        # Convert avg_task_completion_time to minutes
-        avg_picking_time = avg_task_completion_time.total_seconds() / 60 if avg_task_completion_time else 0
-
-        # Inventory turnover rate
-        start_inventory = db.query(func.sum(Inventory.quantity)).filter(
-            Inventory.last_updated <= start_date).scalar() or 0
-        end_inventory = db.query(func.sum(Inventory.quantity)).filter(Inventory.last_updated <= end_date).scalar() or 0
-        avg_inventory = (start_inventory + end_inventory) / 2
+        )
+        if by_day:
+            orders, cogs, tasks = (part.group_by(part.selected_columns[0]) for part in (orders, cogs, tasks))
+
+        figures = union_all(orders, cogs, tasks).subquery()
+        keys = [figures.c.day] if by_day else []
+        return db.execute(select(
+            *keys,
+            *(func.coalesce(func.sum(figures.c[name]), 0).label(name)
+              for name in ("orders", "fulfilled_orders", "cogs", "task_seconds", "tasks"))
+        ).group_by(*keys).order_by(*keys)).all()
+
+    def _warehouse_performance_metrics(self, figures, avg_inventory: float) -> list[WarehousePerformanceMetric]:
+        # Order fulfillment rate
+        fulfillment_rate = (figures.fulfilled_orders / figures.orders) * 100 if figures.orders > 0 else 0
 
-        cogs = db.query(func.sum(OrderItem.quantity * Product.price)).join(Product).filter(
-            OrderItem.order_id == Order.id,
-            Order.order_date.between(start_date, end_date)
-        ).scalar() or 0
+        # Average task completion time, in minutes
+        avg_picking_time = figures.task_seconds / figures.tasks / 60 if figures.tasks > 0 else 0
 
-        inventory_turnover = float(cogs) / float(avg_inventory) if avg_inventory > 0 else 0
+        inventory_turnover = float(figures.cogs) / float(avg_inventory) if avg_inventory > 0 else 0
 
-        metrics = [
+        return [
             WarehousePerformanceMetric.model_validate({
                 "name": "Order Fulfillment Rate",
                 "value": fulfillment_rate,
@@ -110,38 +150,32 @@ class ReportsCRUD:
             })
         ]
 
-        return WarehousePerformanceReport(
-            start_date=start_date,
-            end_date=end_date,
-            metrics=metrics
-        )
-
     def get_kpi_dashboard(self, db: Session) -> KPIDashboard:
-        today = int(datetime.utcnow().timestamp())
-        yesterday = today - timedelta(days=1).total_seconds()
-        last_week = today - timedelta(days=7).total_seconds()
+        # Materialized figures: a handful of pre-aggregated rows however long the order history is
+        daily, counters, _ = kpi.get_figures(db)
+        today = day_start(int(time.time()))
+
+        def orders_and_revenue(first_day: int, last_day: int) -> tuple[int, float]:
+            days = [daily.get(day, (0, 0.0)) for day in range(first_day, last_day + 1, DAY_SECONDS)]
+            return sum(count for count, _ in days), sum(revenue for _, revenue in days)
 
         # Daily revenue
-        today_revenue = db.query(func.sum(Order.total_amount)).filter(
-            func.date(Order.order_date) == today).scalar() or 0
-        yesterday_revenue = db.query(func.sum(Order.total_amount)).filter(
-            func.date(Order.order_date) == yesterday).scalar() or 0
+        _, today_revenue = orders_and_revenue(today, today)
+        _, yesterday_revenue = orders_and_revenue(today - DAY_SECONDS, today - DAY_SECONDS)
         revenue_trend = "up" if today_revenue > yesterday_revenue else "down" \
             if today_revenue < yesterday_revenue else "stable"
 
         # Weekly order count
-        weekly_orders = db.query(func.count(Order.id)).filter(Order.order_date >= last_week).scalar()
-        prev_week_orders = db.query(func.count(Order.id)).filter(
-            Order.order_date.between(last_week - timedelta(days=7).total_seconds(), last_week)
-        ).scalar()
+        weekly_orders, _ = orders_and_revenue(today - 6 * DAY_SECONDS, today)
+        prev_week_orders, _ = orders_and_revenue(today - 13 * DAY_SECONDS, today - 7 * DAY_SECONDS)
         order_trend = "up" if weekly_orders > prev_week_orders else "down" \
             if weekly_orders < prev_week_orders else "stable"
 
         # Current inventory value
-        inventory_value = db.query(func.sum(Inventory.quantity * Product.price)).join(Product).scalar() or 0
+        inventory_value = counters[INVENTORY_VALUE]
 
         # Pending shipments
-        pending_shipments = db.query(func.count(Order.id)).filter(Order.status == "pending").scalar()
+        pending_shipments = counters[PENDING_ORDERS]
 
         metrics = [
             KPIMetric.model_validate({
@@ -167,7 +201,7 @@ class ReportsCRUD:
         ]
 
         return KPIDashboard(
-            date=today,
+            date=int(time.time()),
             metrics=metrics
         )
 
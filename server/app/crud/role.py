@@ -1,7 +1,9 @@
 from sqlalchemy.orm import Session
 
+from app.core.cache import principal_cache
 from app.crud.base import CRUDBase
 from app.models.user import Role as RoleModel, RolePermission as RolePermissionModel
+from public_api.permissions import PermissionManager
 from public_api.shared_schemas import RoleCreate, RoleUpdate
 
 
@@ -52,6 +54,7 @@ class CRUDRole(CRUDBase[RoleModel, RoleCreate, RoleUpdate]):
 
         db.commit()
         db.refresh(db_obj)
+        principal_cache.invalidate_role(db_obj.id)
         return db_obj
 
     def get(self, db: Session, id: int) -> RoleModel | None:
@@ -60,8 +63,9 @@ class CRUDRole(CRUDBase[RoleModel, RoleCreate, RoleUpdate]):
     def get_by_name(self, db: Session, *, name: str) -> RoleModel | None:
         return db.query(RoleModel).filter(RoleModel.name == name).first()
 
-    def get_multi(self, db: Session, *, skip: int = 0, limit: int = 100) -> list[RoleModel]:
-        return db.query(RoleModel).offset(skip).limit(limit).all()
+    def get_multi(self, db: Session, *, skip: int = 0, limit: int = 100,
+                  cursor: str | None = None) -> list[RoleModel]:
+        return self.paginate(db.query(RoleModel), skip=skip, limit=limit, cursor=cursor)
 
     def remove(self, db: Session, *, id: int) -> RoleModel | None:
         obj = db.query(RoleModel).get(id)
@@ -70,6 +74,8 @@ class CRUDRole(CRUDBase[RoleModel, RoleCreate, RoleUpdate]):
             db.query(RolePermissionModel).filter(RolePermissionModel.role_id == id).delete(synchronize_session=False)
             db.delete(obj)
             db.commit()
+            principal_cache.invalidate_role(id)
+            PermissionManager.forget_role(id)
         return obj
 
 
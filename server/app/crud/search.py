@@ -0,0 +1,100 @@
+# /server/app/crud/search.py
+# Ranked, prefix-matching lookups against the full-text indexes of app.models.search. Each backend turns a query
+# string with at least one search term into a SELECT of (id, rank) rows, lower rank first, that the list queries
+# join and order by.
+import re
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import Select, and_, column, func, inspect, literal, literal_column, or_, select, table
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models import Product, Customer, PRODUCT_DOCUMENT, CUSTOMER_DOCUMENT
+
+_TERM = re.compile(r"\w+")
+
+
+def search_terms(q: str) -> list[str]:
+    """
+    Lower-cased word terms of a query. Every one has to match a word; the last one, as typed so far, a word prefix
+    (exact words are far cheaper to intersect than prefixes).
+    """
+    return _TERM.findall(q.lower())
+
+
+def _prefix(terms: list[str], operator: str) -> str:
+    """`operator` making the last term a prefix, unless it is a lone term too short to be expanded cheaply."""
+    return operator if len(terms) > 1 or len(terms[0]) >= settings.SEARCH_MIN_PREFIX_LENGTH else ""
+
+
+class LikeSearch:
+    """Fallback without a search index: every term as a substring of any column, unranked (full scan)."""
+
+    @staticmethod
+    def _matches(model, columns: list, q: str) -> Select:
+        return select(model.id.label("id"), literal(0).label("rank")).where(
+            and_(*(or_(*(column.ilike(f"%{term}%") for column in columns)) for term in search_terms(q)))
+        )
+
+    def products(self, q: str) -> Select:
+        return self._matches(Product, [Product.name, Product.sku, Product.description], q)
+
+    def customers(self, q: str) -> Select:
+        return self._matches(Customer, [Customer.name, Customer.email], q)
+
+
+class SQLiteSearch:
+    """FTS5 MATCH of all terms, ranked by BM25 with name above SKU above description."""
+
+    @staticmethod
+    def _matches(name: str, weights: str, q: str) -> Select:
+        fts = table(name, column("rowid"), column(name))
+        terms = search_terms(q)
+        return select(fts.c.rowid.label("id"), literal_column(f"bm25({name}, {weights})").label("rank")).where(
+            fts.c[name].op("MATCH")(" ".join(f'"{term}"' for term in terms) + _prefix(terms, "*"))
+        )
+
+    def products(self, q: str) -> Select:
+        return self._matches("products_fts", "10.0, 5.0, 1.0", q)
+
+    def customers(self, q: str) -> Select:
+        return self._matches("customers_fts", "10.0, 5.0", q)
+
+
+class PostgreSQLSearch:
+    """tsvector match of all terms ranked by ts_rank, or a trigram substring match of SKU / email."""
+
+    @staticmethod
+    def _matches(model, document: str, substring_column, q: str) -> Select:
+        vector = literal_column(f"to_tsvector('simple', {document})")
+        terms = search_terms(q)
+        query = func.to_tsquery("simple", " & ".join(terms) + _prefix(terms, ":*"))
+        return select(model.id.label("id"), (-func.ts_rank(vector, query)).label("rank")).where(
+            or_(vector.op("@@")(query), substring_column.ilike(f"%{q.strip()}%"))
+        )
+
+    def products(self, q: str) -> Select:
+        return self._matches(Product, PRODUCT_DOCUMENT, Product.sku, q)
+
+    def customers(self, q: str) -> Select:
+        return self._matches(Customer, CUSTOMER_DOCUMENT, Customer.email, q)
+
+
+_backends: "WeakKeyDictionary[Engine, object]" = WeakKeyDictionary()
+
+
+def search_backend(db: Session) -> LikeSearch | SQLiteSearch | PostgreSQLSearch:
+    """The backend for the session's database; LIKE when its search index hasn't been created (migrated) yet."""
+    engine = db.get_bind()
+    engine = getattr(engine, "engine", engine)
+    backend = _backends.get(engine)
+    if backend is None:
+        if engine.dialect.name == "sqlite" and inspect(engine).has_table("products_fts"):
+            backend = SQLiteSearch()
+        elif engine.dialect.name == "postgresql":
+            backend = PostgreSQLSearch()
+        else:
+            backend = LikeSearch()
+        _backends[engine] = backend
+    return backend
@@ -11,7 +11,8 @@ from public_api.shared_schemas import (Shipment as ShipmentSchema, ShipmentCreat
 
 class CRUDShipment(CRUDBase[Shipment, ShipmentCreate, ShipmentUpdate]):
     def get_multi_with_filter(self, db: Session, *,
-                              skip: int = 0, limit: int = 100, filter_params: ShipmentFilter) -> list[ShipmentSchema]:
+                              skip: int = 0, limit: int = 100, cursor: str | None = None,
+                              filter_params: ShipmentFilter) -> list[ShipmentSchema]:
         query = db.query(self.model)
         if filter_params.status:
             query = query.filter(Shipment.status == filter_params.status)
@@ -23,8 +24,7 @@ class CRUDShipment(CRUDBase[Shipment, ShipmentCreate, ShipmentUpdate]):
             query = query.filter(Shipment.ship_date >= filter_params.date_from)
         if filter_params.date_to:
             query = query.filter(Shipment.ship_date <= filter_params.date_to)
-        shipments = query.offset(skip).limit(limit).all()
-        return [ShipmentSchema.model_validate(shipment) for shipment in shipments]
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).map(ShipmentSchema.model_validate)
 
     def get_carrier_rates(self, db: Session, weight: float, dimensions: str, destination_zip: str) -> list[CarrierRate]:
         try:
@@ -13,15 +13,14 @@ from public_api.shared_schemas import (
 
 class CRUDSupplier(CRUDBase[Supplier, SupplierCreate, SupplierUpdate]):
     def get_multi_with_filter(self, db: Session, *,
-                              skip: int = 0, limit: int = 100,
+                              skip: int = 0, limit: int = 100, cursor: str | None = None,
                               filter_params: SupplierFilter) -> list[SupplierSchema]:
         query = db.query(self.model)
         if filter_params.name:
             query = query.filter(Supplier.name.ilike(f"%{filter_params.name}%"))
         if filter_params.contact_person:
             query = query.filter(Supplier.contact_person.ilike(f"%{filter_params.contact_person}%"))
-        suppliers = query.offset(skip).limit(limit).all()
-        return [SupplierSchema.model_validate(supplier) for supplier in suppliers]
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).map(SupplierSchema.model_validate)
 
 
 supplier = CRUDSupplier(Supplier)
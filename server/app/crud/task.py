@@ -1,16 +1,23 @@
 from sqlalchemy import func, case
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
-from app.crud.base import CRUDBase
-from app.models import Task, User, TaskComment
+from app.crud.base import CRUDBase, AsyncCRUDBase
+from app.models import Task, User, TaskComment, Role, RolePermission
 from public_api.shared_schemas import TaskCreate, TaskUpdate, TaskFilter, TaskCommentCreate, TaskStatistics, \
     UserTaskSummary, \
     Task as TaskSchema, TaskComment as TaskCommentSchema, TaskStatus, TaskPriority
 
+# Everything TaskWithAssignee serializes; async sessions can't lazy-load, so it has to be fetched up front
+TASK_DETAIL_OPTIONS = (
+    selectinload(Task.assigned_user).selectinload(User.role)
+    .selectinload(Role.role_permissions).selectinload(RolePermission.permission),
+)
+
 
 class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
     def get_multi_with_filter(self, db: Session, *,
-                              skip: int = 0, limit: int = 100, filter_params: TaskFilter) -> list[TaskSchema]:
+                              skip: int = 0, limit: int = 100, cursor: str | None = None,
+                              filter_params: TaskFilter) -> list[TaskSchema]:
         query = db.query(self.model).join(User)
         if filter_params.task_type:
             query = query.filter(Task.task_type == filter_params.task_type)
@@ -25,8 +32,7 @@ class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
         if filter_params.due_date_to:
             query = query.filter(Task.due_date <= filter_params.due_date_to)
 
-        tasks = query.offset(skip).limit(limit).all()
-        return [TaskSchema.model_validate(x) for x in tasks]
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).map(TaskSchema.model_validate)
 
     def complete(self, db: Session, *, db_obj: Task) -> TaskSchema:
         db_obj.status = "completed"
@@ -110,3 +116,4 @@ class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
 
 
 task = CRUDTask(Task)
+task_async = AsyncCRUDBase[Task, TaskCreate, TaskUpdate](Task)
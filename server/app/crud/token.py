@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 
 from sqlalchemy.orm import Session
 
+from app.core.cache import principal_cache
 from app.core.config import settings
 from app.core.security import create_access_token, create_refresh_token
 from app.models import Token
@@ -35,11 +36,13 @@ class CRUDToken:
     def revoke_all_user_tokens(self, db: Session, user_id: int) -> None:
         db.query(Token).filter(Token.user_id == user_id).update({"is_active": False})
         db.commit()
+        principal_cache.invalidate_user(user_id)
 
     def revoke_token(self, db: Session, token: Token) -> None:
         token.is_active = False
         db.add(token)
         db.commit()
+        principal_cache.invalidate_token(token.access_token)
 
 
 token = CRUDToken()
@@ -2,14 +2,22 @@
 import time
 from datetime import timedelta, datetime
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, joinedload, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.core.cache import CachedPrincipal, principal_cache
 from app.core.config import settings
 from app.core.security import get_password_hash, verify_password, create_access_token, create_refresh_token
 from app.crud.base import CRUDBase
 from app.models import User, Permission, Role, RolePermission, Token
+from public_api.permissions import PermissionManager
 from public_api.shared_schemas import user as user_schemas
 
+# Changed without invalidating the principal cache (every notification, every login); left out of the cached
+# snapshot, so a rebuilt user loads them when they are read
+_VOLATILE_USER_COLUMNS = ("unread_notification_count", "last_login")
+
 
 class CRUDUser(CRUDBase[User, user_schemas.UserCreate, user_schemas.UserUpdate]):
     def get_by_email(self, db: Session, email: str) -> user_schemas.UserSanitized | None:
@@ -21,7 +29,8 @@ class CRUDUser(CRUDBase[User, user_schemas.UserCreate, user_schemas.UserUpdate])
             db: Session,
             filter_params: user_schemas.UserFilter,
             skip: int = 0,
-            limit: int = 100
+            limit: int = 100,
+            cursor: str | None = None
     ) -> list[user_schemas.UserSanitized]:
         query = db.query(User)
 
@@ -34,20 +43,27 @@ class CRUDUser(CRUDBase[User, user_schemas.UserCreate, user_schemas.UserUpdate])
         if filter_params.is_active is not None:
             query = query.filter(User.is_active == filter_params.is_active)
 
-        users = query.offset(skip).limit(limit).all()
-        return [user_schemas.UserSanitized.model_validate(user) for user in users]
+        page = self.paginate(query, skip=skip, limit=limit, cursor=cursor)
+        return page.map(user_schemas.UserSanitized.model_validate)
 
     def get_by_username(self, db: Session, username: str) -> user_schemas.UserSanitized | None:
         user = db.query(User).filter(User.username == username).first()
         return user_schemas.UserSanitized.model_validate(user) if user else None
 
     def update(self, db: Session, *, db_obj: User, obj_in: user_schemas.UserUpdate) -> user_schemas.UserSanitized:
-        update_data = obj_in.model_dump(exclude_unset=True)
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
         if "password" in update_data:
             hashed_password = get_password_hash(update_data["password"])
             del update_data["password"]
             update_data["password"] = hashed_password
-        return super().update(db, db_obj=db_obj, obj_in=update_data)
+        updated_user = super().update(db, db_obj=db_obj, obj_in=update_data)
+        principal_cache.invalidate_user(db_obj.id)
+        return updated_user
+
+    def remove(self, db: Session, *, id: int) -> User:
+        removed_user = super().remove(db, id=id)
+        principal_cache.invalidate_user(id)
+        return removed_user
 
     def authenticate(self, db: Session, *, email: str, password: str) -> user_schemas.UserSanitized | None:
         user = db.query(User).options(
@@ -76,6 +92,7 @@ class CRUDUser(CRUDBase[User, user_schemas.UserCreate, user_schemas.UserUpdate])
             user.role_id = new_role_id
             db.commit()
             db.refresh(user)
+            principal_cache.invalidate_user(user_id)
         return user_schemas.UserSanitized.model_validate(user) if user else None
 
     def set_reset_password_token(self, db: Session, *, user: User, token: str) -> user_schemas.UserSanitized:
@@ -86,15 +103,13 @@ class CRUDUser(CRUDBase[User, user_schemas.UserCreate, user_schemas.UserUpdate])
         db.refresh(user)
         return user_schemas.UserSanitized.model_validate(user)
 
-    def get_user_with_permissions(self, db: Session, user_id: int) -> user_schemas.UserWithPermissions | None:
-        user = db.query(User).options(
+    def get_with_role(self, db: Session, user_id: int) -> User | None:
+        return db.query(User).options(
             joinedload(User.role).joinedload(Role.role_permissions).joinedload(RolePermission.permission)
         ).filter(User.id == user_id).first()
 
-        if not user:
-            return None
-
-        user_permissions = [
+    def build_user_permissions(self, user: User) -> list[user_schemas.UserPermission]:
+        return [
             user_schemas.UserPermission(
                 id=role_permission.permission.id,
                 name=role_permission.permission.name,
@@ -104,13 +119,66 @@ class CRUDUser(CRUDBase[User, user_schemas.UserCreate, user_schemas.UserUpdate])
                 can_delete=role_permission.can_delete
             )
             for role_permission in user.role.role_permissions
-        ]
+        ] if user.role else []
+
+    def get_permission_manager(self, user: User) -> PermissionManager:
+        """Compiled permissions of a user loaded with its role graph, shared by every user of the same role."""
+        role = user.role
+        if role is None:
+            return PermissionManager([])
+        # Role permissions as they are now; any grant, revoke or rename yields a new version
+        version = tuple(
+            (rp.permission.name, rp.can_read, rp.can_write, rp.can_edit, rp.can_delete)
+            for rp in role.role_permissions
+        )
+        return PermissionManager.for_role(role.id, version, lambda: self.build_user_permissions(user))
+
+    def get_user_with_permissions(self, db: Session, user_id: int) -> user_schemas.UserWithPermissions | None:
+        user = self.get_with_role(db, user_id)
+
+        if not user:
+            return None
 
         return user_schemas.UserWithPermissions(
             **user_schemas.UserSanitized.model_validate(user).model_dump(),
-            permissions=user_permissions
+            permissions=self.build_user_permissions(user)
+        )
+
+    def to_principal(self, user: User) -> CachedPrincipal:
+        """Snapshot a user loaded through `get_with_role` into plain data for the principal cache."""
+        role = user.role
+        return CachedPrincipal(
+            user_id=user.id,
+            role_id=user.role_id,
+            user={key: value for key, value in _column_values(user).items() if key not in _VOLATILE_USER_COLUMNS},
+            role=_column_values(role) if role else None,
+            role_permissions=tuple(
+                (_column_values(rp), _column_values(rp.permission)) for rp in role.role_permissions
+            ) if role else (),
+            permission_manager=self.get_permission_manager(user)
         )
 
+    def from_principal(self, db: Session, principal: CachedPrincipal) -> User:
+        """
+        Rebuild the user, role and permission graph from a cached snapshot and attach it to `db` without
+        querying. Every request gets its own instances, so nothing mutable is shared between sessions.
+        """
+        user = _detached(User, principal.user)
+        role = None
+        if principal.role is not None:
+            role = _detached(Role, principal.role)
+            role_permissions = []
+            for rp_values, permission_values in principal.role_permissions:
+                role_permission = _detached(RolePermission, rp_values)
+                permission = _detached(Permission, permission_values)
+                set_committed_value(role_permission, "permission", permission)
+                set_committed_value(role_permission, "role", role)
+                role_permissions.append(role_permission)
+            set_committed_value(role, "role_permissions", role_permissions)
+        set_committed_value(user, "role", role)
+        db.add(user)
+        return user
+
     def update_user_permissions(
             self,
             db: Session,
@@ -141,6 +209,7 @@ class CRUDUser(CRUDBase[User, user_schemas.UserCreate, user_schemas.UserUpdate])
 
         db.commit()
         db.refresh(user)
+        principal_cache.invalidate_role(user.role_id)
         return self.get_user_with_permissions(db, user_id)
 
     def get_user_permissions(self, db: Session, user_id: int) -> list[Permission]:
@@ -189,6 +258,7 @@ class CRUDUser(CRUDBase[User, user_schemas.UserCreate, user_schemas.UserUpdate])
     def revoke_user_tokens(self, db: Session, user_id: int):
         db.query(Token).filter(Token.user_id == user_id, Token.is_active.is_(True)).update({"is_active": False})
         db.commit()
+        principal_cache.invalidate_user(user_id)
 
     def get_user_by_token(self, db: Session, access_token: str) -> User | None:
         token = db.query(Token).filter(Token.access_token == access_token, Token.is_active.is_(True)).first()
@@ -204,6 +274,7 @@ class CRUDUser(CRUDBase[User, user_schemas.UserCreate, user_schemas.UserUpdate])
         # Revoke the old token
         token.is_active = False
         db.add(token)
+        principal_cache.invalidate_token(token.access_token)
 
         # Create new tokens
         new_token = self.create_user_tokens(db, token.user_id)
@@ -220,4 +291,15 @@ class CRUDUser(CRUDBase[User, user_schemas.UserCreate, user_schemas.UserUpdate])
         ).offset(skip).limit(limit).all()
         return [user_schemas.UserSearchResult(id=user.id, email=user.email) for user in users]
 
+
+def _column_values(obj) -> dict:
+    return {attr.key: getattr(obj, attr.key) for attr in inspect(obj).mapper.column_attrs}
+
+
+def _detached(model, values: dict):
+    obj = model(**values)
+    make_transient_to_detached(obj)
+    return obj
+
+
 user = CRUDUser(User)
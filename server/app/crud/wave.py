@@ -0,0 +1,265 @@
+# /server/app/crud/wave.py
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+
+import numpy as np
+from sqlalchemy import func, insert, select, or_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.pick_list import pick_list
+from app.models import Order, OrderItem, Inventory, Location, PickList, PickListItem, Shipment, Wave
+from app.utils.routing import AISLE_SPACING_METRES, BAY_WIDTH_METRES, Layout, optimize_pick_path
+from app.utils.time import day_start
+from public_api.shared_schemas import OrderStatus, WavePlanRequest, WavePlan, WaveBatch, PutWallSlot
+
+OPEN_ORDER_STATUSES = (OrderStatus.PENDING, OrderStatus.PROCESSING)
+# Pick lists whose unpicked quantity no longer holds stock
+CLOSED_PICK_LIST_STATUSES = ("completed", "cancelled")
+# A batch grows with the most similar of the next put_wall_slots * SIMILARITY_WINDOW orders of its group
+SIMILARITY_WINDOW = 4
+
+
+@dataclass
+class _PlannedOrder:
+    id: int
+    carrier_id: int | None
+    cutoff: int | None
+    allocations: list[tuple[int, int, int]] = field(default_factory=list)  # (product_id, location_id, quantity)
+    zone_id: int | None = None
+    aisles: frozenset = frozenset()
+
+    @property
+    def group(self) -> tuple:
+        return self.cutoff is None, self.cutoff or 0, self.carrier_id or 0, self.zone_id or 0
+
+
+def similarity(a: frozenset, b: frozenset) -> float:
+    """Jaccard similarity of two aisle sets: batches of orders sharing aisles walk fewer of them."""
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def batch_orders(orders: list[_PlannedOrder], slots: int, max_lines: int) -> list[list[_PlannedOrder]]:
+    """
+    Split one group's orders into batches of at most `slots` orders and `max_lines` lines. Orders are swept by the
+    aisles they span; each batch starts from the first order left and adds the most similar one among the next
+    few, so the work stays linear in the number of orders.
+    """
+    pending = sorted(orders, key=lambda order: (min(order.aisles, default=0), max(order.aisles, default=0)))
+    batches = []
+    while pending:
+        batch = [pending.pop(0)]
+        aisles = set(batch[0].aisles)
+        lines = len(batch[0].allocations)
+        while len(batch) < slots and pending:
+            window, current = pending[:slots * SIMILARITY_WINDOW], frozenset(aisles)
+            best = max(range(len(window)), key=lambda i: (similarity(window[i].aisles, current), -i))
+            if lines + len(window[best].allocations) > max_lines:
+                break
+            order = pending.pop(best)
+            batch.append(order)
+            aisles |= order.aisles
+            lines += len(order.allocations)
+        batches.append(batch)
+    return batches
+
+
+class CRUDWave:
+    """
+    Wave planning: allocates stock to open orders, groups them by requested ship day (the carrier cutoff), carrier
+    and zone, and batches similar orders into consolidated pick lists whose lines are sorted to a put wall per
+    order. Everything is loaded in a few set-based queries, so thousands of orders plan in seconds.
+    """
+
+    def plan(self, db: Session, request: WavePlanRequest) -> WavePlan:
+        slots = request.put_wall_slots or settings.WAVE_PUT_WALL_SLOTS
+        max_lines = request.max_lines_per_batch or settings.WAVE_MAX_LINES_PER_BATCH
+        layout = pick_list.layout(db)
+
+        orders, lines = self._open_orders(db, request.order_ids)
+        stock, zones = self._available_stock(db, layout, sorted({product_id for _, product_id, _ in lines}))
+        planned, unallocated = self._allocate(orders, lines, stock)
+        for order in planned:
+            zone_units = Counter()
+            for _, location_id, quantity in order.allocations:
+                zone_units[zones.get(location_id)] += quantity
+            order.zone_id = zone_units.most_common(1)[0][0]
+            order.aisles = frozenset(layout.positions[location_id][0] for _, location_id, _ in order.allocations
+                                     if location_id in layout.positions)
+
+        groups = defaultdict(list)
+        for order in planned:
+            groups[order.group].append(order)
+        batches = [(group, batch) for group in sorted(groups)
+                   for batch in batch_orders(groups[group], slots, max_lines)]
+
+        results = [self._estimate(layout, batch) for _, batch in batches]
+        wave_ids = [] if request.simulate else self._release(db, batches, results)
+
+        total_lines = sum(result.lines for result in results)
+        batch_seconds = sum(result.estimated_seconds for result in results)
+        single_seconds = sum(self._single_order_seconds(layout, order) for order in planned)
+        return WavePlan(
+            wave_ids=wave_ids,
+            simulated=request.simulate,
+            batches=results,
+            orders_planned=len(planned),
+            unallocated_order_ids=unallocated,
+            picks_per_hour=round(total_lines * 3600 / batch_seconds, 2) if batch_seconds else 0.0,
+            single_order_picks_per_hour=round(total_lines * 3600 / single_seconds, 2) if single_seconds else 0.0
+        )
+
+    @staticmethod
+    def _open_orders(db: Session, order_ids: list[int] | None) -> tuple[dict[int, _PlannedOrder], list[tuple]]:
+        """Open orders not on any pick list yet, by ship date, with their carrier and (order, product, qty) lines."""
+        open_orders = select(Order.id).where(
+            Order.status.in_(OPEN_ORDER_STATUSES),
+            ~select(PickList.id).where(PickList.order_id == Order.id).exists(),
+            ~select(PickListItem.pick_list_item_id).where(PickListItem.order_id == Order.id).exists()
+        )
+        if order_ids is not None:
+            open_orders = open_orders.where(Order.id.in_(order_ids))
+
+        latest_shipment = (select(func.max(Shipment.id)).where(Shipment.order_id.in_(open_orders))
+                           .group_by(Shipment.order_id))
+        carriers = dict(db.execute(select(Shipment.order_id, Shipment.carrier_id)
+                                   .where(Shipment.id.in_(latest_shipment))).all())
+        orders = {
+            order_id: _PlannedOrder(order_id, carriers.get(order_id), day_start(ship_date) if ship_date else None)
+            for order_id, ship_date in db.execute(
+                select(Order.id, Order.ship_date).where(Order.id.in_(open_orders))
+                .order_by(Order.ship_date.is_(None), Order.ship_date, Order.order_date, Order.id)
+            )
+        }
+        lines = db.execute(
+            select(OrderItem.order_id, OrderItem.product_id, func.sum(OrderItem.quantity))
+            .where(OrderItem.order_id.in_(open_orders), OrderItem.quantity > 0)
+            .group_by(OrderItem.order_id, OrderItem.product_id)
+        ).all()
+        return orders, lines
+
+    @staticmethod
+    def _available_stock(db: Session, layout: Layout,
+                         product_ids: list[int]) -> tuple[dict[int, list[list[int]]], dict[int, int | None]]:
+        """
+        Per product, [location_id, available] pairs nearest the depot first, net of the unpicked quantity of open
+        pick lists; and the zone of every location holding it.
+        """
+        reserved = dict(((product_id, location_id), quantity) for product_id, location_id, quantity in db.execute(
+            select(PickListItem.product_id, PickListItem.location_id,
+                   func.sum(PickListItem.quantity - func.coalesce(PickListItem.picked_quantity, 0)))
+            .join(PickList, PickList.id == PickListItem.pick_list_id)
+            .where(or_(PickList.status.is_(None), PickList.status.notin_(CLOSED_PICK_LIST_STATUSES)),
+                   PickListItem.product_id.in_(product_ids))
+            .group_by(PickListItem.product_id, PickListItem.location_id)
+        ))
+        rows = db.execute(
+            select(Inventory.product_id, Inventory.location_id, Inventory.quantity, Location.zone_id)
+            .join(Location, Location.id == Inventory.location_id)
+            .where(Inventory.product_id.in_(product_ids), Inventory.quantity > 0)
+        ).all()
+
+        def cost(location_id: int) -> float:
+            aisle, bay = layout.positions.get(location_id, (np.inf, np.inf))
+            return aisle * AISLE_SPACING_METRES + bay * BAY_WIDTH_METRES
+
+        stock, zones = defaultdict(list), {}
+        for product_id, location_id, quantity, zone_id in sorted(rows, key=lambda row: (cost(row[1]), row[1])):
+            available = quantity - reserved.get((product_id, location_id), 0)
+            if available > 0:
+                stock[product_id].append([location_id, available])
+                zones[location_id] = zone_id
+        return stock, zones
+
+    @staticmethod
+    def _allocate(orders: dict[int, _PlannedOrder], lines: list[tuple],
+                  stock: dict[int, list[list[int]]]) -> tuple[list[_PlannedOrder], list[int]]:
+        """
+        Allocate orders in ship date order, all lines or none: an order short of any product is left unallocated
+        and its stock stays with later orders. Each product's stock is consumed nearest location first.
+        """
+        order_lines = defaultdict(list)
+        for order_id, product_id, quantity in lines:
+            order_lines[order_id].append((product_id, int(quantity)))
+        remaining = {product_id: sum(available for _, available in entries) for product_id, entries in stock.items()}
+        cursor = dict.fromkeys(stock, 0)
+
+        planned, unallocated = [], []
+        for order_id, order in orders.items():
+            wanted = order_lines.get(order_id)
+            if not wanted:
+                continue
+            if any(remaining.get(product_id, 0) < quantity for product_id, quantity in wanted):
+                unallocated.append(order_id)
+                continue
+            for product_id, quantity in wanted:
+                remaining[product_id] -= quantity
+                entries = stock[product_id]
+                while quantity:
+                    entry = entries[cursor[product_id]]
+                    taken = min(quantity, entry[1])
+                    order.allocations.append((product_id, entry[0], taken))
+                    entry[1] -= taken
+                    quantity -= taken
+                    if not entry[1]:
+                        cursor[product_id] += 1
+            planned.append(order)
+        return planned, unallocated
+
+    @staticmethod
+    def _route(layout: Layout, location_ids: set[int]) -> tuple[float, int]:
+        """Walking distance of the optimized route through the locations, and the number of stops."""
+        points = [layout.positions[location_id] for location_id in location_ids if location_id in layout.positions]
+        _, distance, _ = optimize_pick_path(np.array([(0, 0), *points], dtype=float), layout.bays)
+        return distance, len(location_ids)
+
+    def _estimate(self, layout: Layout, orders: list[_PlannedOrder]) -> WaveBatch:
+        distance, stops = self._route(layout, {location_id for order in orders
+                                               for _, location_id, _ in order.allocations})
+        lines = sum(len(order.allocations) for order in orders)
+        return WaveBatch(
+            zone_id=orders[0].zone_id,
+            carrier_id=orders[0].carrier_id,
+            cutoff=orders[0].cutoff,
+            slots=[PutWallSlot(slot=slot, order_id=order.id) for slot, order in enumerate(orders, start=1)],
+            lines=lines,
+            units=sum(quantity for order in orders for *_, quantity in order.allocations),
+            locations=stops,
+            travel_distance=round(distance, 2),
+            estimated_seconds=round(distance / settings.PICKER_SPEED_METRES_PER_SECOND
+                                    + stops * settings.PICK_SECONDS_PER_LOCATION
+                                    + lines * settings.PUT_SECONDS_PER_LINE, 2)
+        )
+
+    def _single_order_seconds(self, layout: Layout, order: _PlannedOrder) -> float:
+        distance, stops = self._route(layout, {location_id for _, location_id, _ in order.allocations})
+        return distance / settings.PICKER_SPEED_METRES_PER_SECOND + stops * settings.PICK_SECONDS_PER_LOCATION
+
+    @staticmethod
+    def _release(db: Session, batches: list[tuple[tuple, list[_PlannedOrder]]], results: list[WaveBatch]) -> list[int]:
+        """Create a wave per carrier and cutoff and a pick list per batch, then insert all lines in one statement."""
+        waves, pick_lists = {}, []
+        for (group, orders), result in zip(batches, results):
+            wave_key = group[:3]
+            if wave_key not in waves:
+                waves[wave_key] = Wave(status="released", carrier_id=result.carrier_id, cutoff=result.cutoff)
+            pick_lists.append(PickList(status="pending", wave=waves[wave_key], zone_id=result.zone_id,
+                                       order_id=orders[0].id if len(orders) == 1 else None))
+        db.add_all(pick_lists)
+        db.flush()
+
+        items = []
+        for (_, orders), result, batch in zip(batches, results, pick_lists):
+            result.pick_list_id = batch.id
+            items.extend({"pick_list_id": batch.id, "order_id": order.id, "put_wall_slot": slot.slot,
+                          "product_id": product_id, "location_id": location_id, "quantity": quantity,
+                          "picked_quantity": 0}
+                         for slot, order in zip(result.slots, orders)
+                         for product_id, location_id, quantity in order.allocations)
+        if items:
+            db.execute(insert(PickListItem), items)
+        db.commit()
+        return [wave.id for wave in waves.values()]
+
+
+wave = CRUDWave()
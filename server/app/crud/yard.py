@@ -1,6 +1,7 @@
+import time
 from typing import List
 
-from sqlalchemy import func
+from sqlalchemy import func, case, and_, select
 from sqlalchemy.orm import Session
 
 from public_api.shared_schemas import (
@@ -8,6 +9,7 @@ from public_api.shared_schemas import (
     CarrierPerformance, YardLocationCapacity
 )
 from app.models import YardLocation, DockAppointment, Carrier
+from app.utils.time import day_start, DAY_SECONDS
 
 
 class CRUDYard:
@@ -17,7 +19,7 @@ class CRUDYard:
             YardLocation.status == "occupied").scalar()
         total_appointments = db.query(func.count(DockAppointment.id)).scalar()
         upcoming_appointments = db.query(func.count(DockAppointment.id)).filter(
-            DockAppointment.appointment_time > func.now(),
+            DockAppointment.appointment_time > int(time.time()),
             DockAppointment.status == "scheduled"
         ).scalar()
 
@@ -28,28 +30,29 @@ class CRUDYard:
             upcoming_appointments=upcoming_appointments
         )
 
-    def get_utilization_report(self, db: Session, date: int) -> YardUtilizationReport:
-        locations = db.query(YardLocation).all()
-        total_capacity = sum(location.capacity for location in locations)
-        total_utilization = db.query(func.count(DockAppointment.id)).filter(
-            func.date(DockAppointment.appointment_time) == func.to_timestamp(date)
-        ).scalar()
-
-        location_breakdown = []
-        for location in locations:
-            occupancy = db.query(func.count(DockAppointment.id)).filter(
-                DockAppointment.yard_location_id == location.yard_location_id,
-                func.date(DockAppointment.appointment_time) == func.to_timestamp(date)
-            ).scalar()
-            location_breakdown.append(YardLocationCapacity(
-                yard_location_id=location.yard_location_id,
-                name=location.name,
-                capacity=location.capacity,
-                current_occupancy=occupancy
-            ))
+    def get_utilization_report(self, db: Session, date: int | None = None) -> YardUtilizationReport:
+        """Appointments per yard location on the (UTC) day of `date`, today by default, in one grouped query."""
+        day = day_start(date if date is not None else int(time.time()))
+        occupancy = (
+            select(DockAppointment.yard_location_id, func.count(DockAppointment.id).label("occupancy"))
+            .where(DockAppointment.appointment_time >= day, DockAppointment.appointment_time < day + DAY_SECONDS)
+            .group_by(DockAppointment.yard_location_id)
+            .subquery()
+        )
+        rows = db.query(
+            YardLocation.id, YardLocation.name, YardLocation.capacity, func.coalesce(occupancy.c.occupancy, 0)
+        ).outerjoin(occupancy, occupancy.c.yard_location_id == YardLocation.id).order_by(YardLocation.id).all()
+
+        location_breakdown = [
+            YardLocationCapacity(yard_location_id=location_id, name=name, capacity=capacity or 0,
+                                 current_occupancy=occupancy)
+            for location_id, name, capacity, occupancy in rows
+        ]
+        total_capacity = sum(location.capacity for location in location_breakdown)
+        total_utilization = sum(location.current_occupancy for location in location_breakdown)
 
         return YardUtilizationReport(
-            date=date,
+            date=date if date is not None else day,
             total_capacity=total_capacity,
             total_utilization=total_utilization,
             utilization_percentage=(total_utilization / total_capacity) * 100 if total_capacity > 0 else 0,
@@ -58,40 +61,41 @@ class CRUDYard:
 
     def get_carrier_performance(self, db: Session,
                                 start_date: int, end_date: int) -> List[CarrierPerformance]:
-        carriers = db.query(Carrier).all()
-        performance_data = []
-
-        for carrier in carriers:
-            appointments = db.query(DockAppointment).filter(
-                DockAppointment.carrier_id == carrier.id,
-                DockAppointment.appointment_time.between(func.to_timestamp(start_date), func.to_timestamp(end_date))
-            ).all()
-
-            total_appointments = len(appointments)
-            on_time_appointments = sum(
-                1 for a in appointments if a.status == "completed" and a.actual_arrival_time <= a.appointment_time)
-            late_appointments = sum(
-                1 for a in appointments if a.status == "completed" and a.actual_arrival_time > a.appointment_time)
-            missed_appointments = sum(1 for a in appointments if a.status == "missed")
-
-            dwell_times = [
-                (a.actual_departure_time - a.actual_arrival_time).total_seconds() / 60
-                for a in appointments
-                if a.status == "completed" and a.actual_arrival_time and a.actual_departure_time
-            ]
-            average_dwell_time = sum(dwell_times) / len(dwell_times) if dwell_times else 0
-
-            performance_data.append(CarrierPerformance(
-                carrier_id=carrier.id,
-                carrier_name=carrier.name,
-                total_appointments=total_appointments,
-                on_time_appointments=on_time_appointments,
-                late_appointments=late_appointments,
-                missed_appointments=missed_appointments,
-                average_dwell_time=average_dwell_time
-            ))
-
-        return performance_data
+        """
+        Appointment outcomes and average dwell time (minutes) of every carrier between the dates, as conditional
+        aggregates of one grouped query; carriers without appointments report zeros.
+        """
+        completed = DockAppointment.status == "completed"
+        dwell = case((and_(completed, DockAppointment.actual_arrival_time.isnot(None),
+                           DockAppointment.actual_departure_time.isnot(None)),
+                      DockAppointment.actual_departure_time - DockAppointment.actual_arrival_time))
+        rows = db.query(
+            Carrier.id,
+            Carrier.name,
+            func.count(DockAppointment.id),
+            func.count(case((and_(completed, DockAppointment.actual_arrival_time <= DockAppointment.appointment_time),
+                             1))),
+            func.count(case((and_(completed, DockAppointment.actual_arrival_time > DockAppointment.appointment_time),
+                             1))),
+            func.count(case((DockAppointment.status == "missed", 1))),
+            func.avg(dwell)
+        ).outerjoin(DockAppointment, and_(
+            DockAppointment.carrier_id == Carrier.id,
+            DockAppointment.appointment_time.between(start_date, end_date)
+        )).group_by(Carrier.id, Carrier.name).order_by(Carrier.id).all()
+
+        return [
+            CarrierPerformance(
+                carrier_id=carrier_id,
+                carrier_name=name,
+                total_appointments=total,
+                on_time_appointments=on_time,
+                late_appointments=late,
+                missed_appointments=missed,
+                average_dwell_time=float(average_dwell) / 60 if average_dwell is not None else 0
+            )
+            for carrier_id, name, total, on_time, late, missed, average_dwell in rows
+        ]
 
 
 yard = CRUDYard()
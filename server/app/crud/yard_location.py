@@ -10,7 +10,7 @@ from public_api.shared_schemas import (
 
 
 class CRUDYardLocation(CRUDBase[YardLocation, YardLocationCreate, YardLocationUpdate]):
-    def get_multi_with_filter(self, db: Session, *, skip: int = 0, limit: int = 100,
+    def get_multi_with_filter(self, db: Session, *, skip: int = 0, limit: int = 100, cursor: str | None = None,
                               filter_params: YardLocationFilter) -> list[YardLocationSchema]:
         query = db.query(self.model)
         if filter_params.name:
@@ -19,8 +19,7 @@ class CRUDYardLocation(CRUDBase[YardLocation, YardLocationCreate, YardLocationUp
             query = query.filter(YardLocation.type == filter_params.type)
         if filter_params.status:
             query = query.filter(YardLocation.status == filter_params.status)
-        locations = query.offset(skip).limit(limit).all()
-        return [YardLocationSchema.model_validate(location) for location in locations]
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).map(YardLocationSchema.model_validate)
 
     def get_with_appointments(self, db: Session, id: int) -> YardLocationWithAppointments | None:
         location = (db.query(self.model)
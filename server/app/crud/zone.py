@@ -27,7 +27,7 @@ class CRUDZone(CRUDBase[Zone, ZoneCreate, ZoneUpdate]):
 
     def get_multi_with_locations(
             self, db: Session,
-            skip: int = 0, limit: int = 100,
+            skip: int = 0, limit: int = 100, cursor: str | None = None,
             filter_params: LocationFilter | None = None) -> list[ZoneWithLocations]:
         query = db.query(Zone).options(joinedload(Zone.locations))
 
@@ -35,8 +35,7 @@ class CRUDZone(CRUDBase[Zone, ZoneCreate, ZoneUpdate]):
             if filter_params.name:
                 query = query.filter(Zone.name.ilike(f"%{filter_params.name}%"))
 
-        zones = query.offset(skip).limit(limit).all()
-        return [ZoneWithLocations.model_validate(zone) for zone in zones]
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).map(ZoneWithLocations.model_validate)
 
     def get_with_locations(self, db: Session, id: int) -> ZoneWithLocations | None:
         zone = db.query(Zone).filter(Zone.id == id).options(joinedload(Zone.locations)).first()
@@ -1,12 +1,122 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
+from app.core.cache import invalidate_tables
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+
+def get_async_database_url(url: str) -> str:
+    scheme, _, rest = url.partition("://")
+    dialect = scheme.split("+", 1)[0]
+    if dialect not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database dialect '{dialect}'")
+    return f"{ASYNC_DRIVERS[dialect]}://{rest}"
+
+
+def get_engine_options(url: str, *, is_async: bool = False) -> dict:
+    url_obj = make_url(url)
+    backend = url_obj.get_backend_name()
+    options = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+
+    # In-memory SQLite must stay on a single shared connection, so the dialect's default pool is kept
+    if backend == "sqlite" and url_obj.database in (None, "", ":memory:"):
+        return options
+
+    options.update(
+        poolclass=AsyncAdaptedQueuePool if is_async else QueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+
+    timeout_ms = settings.DB_STATEMENT_TIMEOUT_MS
+    if timeout_ms > 0:
+        if backend == "postgresql":
+            options["connect_args"] = (
+                {"server_settings": {"statement_timeout": str(timeout_ms)}} if url_obj.get_driver_name() == "asyncpg"
+                else {"options": f"-c statement_timeout={timeout_ms}"}
+            )
+        elif backend == "mysql":
+            options["connect_args"] = {"init_command": f"SET SESSION max_execution_time={timeout_ms}"}
+    return options
+
+
+def configure_sqlite(engine: Engine) -> None:
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if settings.SQLITE_WAL:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.close()
+
+
+# Connection.info key of the tables written by the current transaction
+_WRITTEN_TABLES = "written_tables"
+
+
+def track_table_writes(engine: Engine) -> None:
+    """
+    Record the tables each connection's transaction inserts into, updates or deletes from (ORM flushes, bulk
+    statements and Core alike) and invalidate the caches depending on them when that transaction commits.
+    """
+    @event.listens_for(engine, "after_execute")
+    def record_written_table(conn, clauseelement, multiparams, params, execution_options, result):
+        if getattr(clauseelement, "is_dml", False):
+            conn.info.setdefault(_WRITTEN_TABLES, set()).add(clauseelement.table.name)
+
+    @event.listens_for(engine, "commit")
+    def invalidate_written_tables(conn):
+        tables = conn.info.pop(_WRITTEN_TABLES, None)
+        if tables:
+            invalidate_tables(tables)
+
+    @event.listens_for(engine, "rollback")
+    def forget_written_tables(conn):
+        conn.info.pop(_WRITTEN_TABLES, None)
+
+
+def get_pool_status(engine: Engine) -> dict:
+    pool = engine.pool
+    status = {"pool_class": type(pool).__name__}
+    # Only queue-style pools track these counters; singleton/static/null pools report just their class
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        counter = getattr(pool, name, None)
+        if callable(counter):
+            status[name] = counter()
+    if "size" in status:
+        # QueuePool counts overflow from -pool_size upwards; only connections beyond pool_size are interesting
+        status["overflow"] = max(status["overflow"], 0)
+        status["max_overflow"] = getattr(pool, "_max_overflow", None)
+    return status
+
+
+engine = create_engine(settings.DATABASE_URL, **get_engine_options(settings.DATABASE_URL))
+configure_sqlite(engine)
+track_table_writes(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_database_url = settings.ASYNC_DATABASE_URL or get_async_database_url(settings.DATABASE_URL)
+async_engine = create_async_engine(async_database_url, **get_engine_options(async_database_url, is_async=True))
+configure_sqlite(async_engine.sync_engine)
+track_table_writes(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 
@@ -16,3 +126,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
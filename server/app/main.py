@@ -1,11 +1,53 @@
 # /server/app/main.py
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from app import crud
 from app.api.v1.router import api_router
 from app.core.config import settings
-from app.db.database import engine, Base
+from app.db.database import engine, async_engine, Base
+from app.utils.forecasting import shutdown_executor
+
+logger = logging.getLogger(__name__)
+
+
+async def run_periodically(job, interval_seconds: int, description: str):
+    while True:
+        try:
+            await asyncio.to_thread(job)
+        except Exception:
+            logger.exception("Error %s", description)
+        await asyncio.sleep(interval_seconds)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    periodic_jobs = [
+        (crud.forecast.refresh_in_background, settings.FORECAST_REFRESH_INTERVAL_SECONDS,
+         "refreshing demand forecasts"),
+        (crud.inventory_snapshot.capture_in_background, settings.INVENTORY_SNAPSHOT_INTERVAL_SECONDS,
+         "capturing the inventory snapshot"),
+        (crud.kpi.refresh_in_background, settings.KPI_REFRESH_INTERVAL_SECONDS, "refreshing the KPI dashboard"),
+        (crud.classification.refresh_in_background, settings.ABC_XYZ_REFRESH_INTERVAL_SECONDS,
+         "classifying products"),
+        (crud.product_lookup.refresh_in_background, settings.PRODUCT_LOOKUP_REFRESH_INTERVAL_SECONDS,
+         "building the product lookup index"),
+    ]
+    tasks = [asyncio.create_task(run_periodically(job, interval, description))
+             for job, interval, description in periodic_jobs if interval > 0]
+    yield
+    for task in tasks:
+        task.cancel()
+    shutdown_executor()
+    # Close pooled connections so workers shut down cleanly
+    await async_engine.dispose()
+    engine.dispose()
+
 
-app = FastAPI(title=settings.PROJECT_NAME, version=settings.PROJECT_VERSION)
+app = FastAPI(title=settings.PROJECT_NAME, version=settings.PROJECT_VERSION, lifespan=lifespan)
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
@@ -5,14 +5,18 @@ from .base import Base
 from .carrier import Carrier
 from .customer import Customer
 from .dock_appointment import DockAppointment
-from .inventory import Inventory, LocationInventory, InventoryMovement, InventoryAdjustment
+from .forecast import DemandForecast
+from .inventory import (Inventory, LocationInventory, InventoryMovement, InventoryAdjustment, InventorySnapshot,
+                        InventoryDailyTotal)
+from .kpi import OrderDailyStats, KPICounter
 from .location import Location
 from .notification import Notification
 from .order import Order, OrderItem, PurchaseOrder, POItem
-from .pick_list import PickList, PickListItem
+from .pick_list import Wave, PickList, PickListItem
 from .product import Product, ProductCategory
 from .quality import QualityCheck, QualityAlert, QualityStandard
 from .receipt import Receipt, ReceiptItem
+from .search import PRODUCT_DOCUMENT, CUSTOMER_DOCUMENT
 from .shipment import Shipment
 from .supplier import Supplier
 from .task import Task, TaskComment
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Text, Index
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -10,17 +10,37 @@ class Chat(Base):
     __tablename__ = "chats"
 
     id = Column(Integer, primary_key=True, index=True)
-    user1_id = Column(Integer, ForeignKey("users.id"))
-    user2_id = Column(Integer, ForeignKey("users.id"))
+    user1_id = Column(Integer, ForeignKey("users.id"), index=True)
+    user2_id = Column(Integer, ForeignKey("users.id"), index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Summary maintained by app.crud.chat on every message write and read, so chat lists never touch messages
+    last_message_id = Column(Integer)
+    last_message_sender_id = Column(Integer)
+    last_message_content = Column(Text)
+    last_message_at = Column(DateTime)
+    # Messages of the other participant each participant hasn't read yet
+    user1_unread_count = Column(Integer, nullable=False, default=0, server_default="0")
+    user2_unread_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     user1 = relationship("User", foreign_keys=[user1_id])
     user2 = relationship("User", foreign_keys=[user2_id])
     messages = relationship("Message", back_populates="chat", cascade="all, delete-orphan")
 
+    @property
+    def last_message(self) -> dict | None:
+        if self.last_message_id is None:
+            return None
+        return {"id": self.last_message_id, "sender_id": self.last_message_sender_id,
+                "content": self.last_message_content, "created_at": self.last_message_at}
+
+    def unread_count_for(self, user_id: int) -> int:
+        return self.user1_unread_count if user_id == self.user1_id else self.user2_unread_count
+
 
 class Message(Base):
     __tablename__ = "messages"
+    # History is paged by id (keyset) within a chat
+    __table_args__ = (Index("ix_messages_chat_id_id", "chat_id", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     chat_id = Column(Integer, ForeignKey("chats.id"))
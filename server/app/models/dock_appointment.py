@@ -1,5 +1,5 @@
 # /server/app/models/dock_appointment.py
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -7,6 +7,9 @@ from app.models.base import Base
 
 class DockAppointment(Base):
     __tablename__ = "dock_appointments"
+    __table_args__ = (
+        Index("ix_dock_appointments_yard_location_id_appointment_time", "yard_location_id", "appointment_time"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     yard_location_id = Column(Integer, ForeignKey("yard_locations.id"))
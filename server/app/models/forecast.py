@@ -0,0 +1,20 @@
+# /server/app/models/forecast.py
+import time
+
+from sqlalchemy import Column, Integer, String, ForeignKey, Text
+from sqlalchemy.orm import relationship
+
+from app.models.base import Base
+
+
+class DemandForecast(Base):
+    __tablename__ = "demand_forecasts"
+
+    product_id = Column(Integer, ForeignKey("products.id"), primary_key=True)
+    # Fingerprint of the product's movement history the forecast was trained on
+    data_version = Column(String(64), nullable=False)
+    forecast = Column(Text, nullable=False)  # JSON list of {"date", "quantity"}
+    model_path = Column(String(255))
+    trained_at = Column(Integer, default=lambda: int(time.time()))
+
+    product = relationship("Product")
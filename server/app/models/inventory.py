@@ -1,8 +1,8 @@
 # /server/app/models/inventory.py
 import time
 
-from sqlalchemy import (Column, Integer, String,
-                        ForeignKey)
+from sqlalchemy import (Column, Integer, String, Index, UniqueConstraint,
+                        ForeignKey, Numeric)
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -10,6 +10,7 @@ from app.models.base import Base
 
 class Inventory(Base):
     __tablename__ = "inventory"
+    __table_args__ = (UniqueConstraint("product_id", "location_id", name="uq_inventory_product_location"),)
 
     id = Column(Integer, primary_key=True, index=True)
     product_id = Column(Integer, ForeignKey("products.id"))
@@ -35,6 +36,7 @@ class LocationInventory(Base):
 
 class InventoryMovement(Base):
     __tablename__ = "inventory_movements"
+    __table_args__ = (Index("ix_inventory_movements_product_id_timestamp", "product_id", "timestamp"),)
 
     movement_id = Column(Integer, primary_key=True, index=True)
     product_id = Column(Integer, ForeignKey("products.id"))
@@ -61,3 +63,27 @@ class InventoryAdjustment(Base):
 
     product = relationship("Product")
     location = relationship("Location")
+
+
+class InventorySnapshot(Base):
+    """Stock of one product at one location at the end of a UTC day, kept for trend and turnover analytics."""
+    __tablename__ = "inventory_snapshots"
+
+    snapshot_date = Column(Integer, primary_key=True)  # start of the day, unix timestamp (UTC)
+    product_id = Column(Integer, ForeignKey("products.id"), primary_key=True)
+    location_id = Column(Integer, ForeignKey("locations.id"), primary_key=True)
+    quantity = Column(Integer, nullable=False)
+    value = Column(Numeric(14, 2), nullable=False)
+
+    product = relationship("Product")
+    location = relationship("Location")
+
+
+class InventoryDailyTotal(Base):
+    """Warehouse-wide sum of the day's `InventorySnapshot` rows, so trends read one row per day."""
+    __tablename__ = "inventory_daily_totals"
+
+    snapshot_date = Column(Integer, primary_key=True)
+    quantity = Column(Integer, nullable=False)
+    value = Column(Numeric(16, 2), nullable=False)
+    captured_at = Column(Integer, default=lambda: int(time.time()))
@@ -0,0 +1,24 @@
+# /server/app/models/kpi.py
+import time
+
+from sqlalchemy import Column, Integer, String, Numeric
+
+from app.models.base import Base
+
+
+class OrderDailyStats(Base):
+    """Orders and revenue bucketed per UTC day of `Order.order_date`, read by the KPI dashboard."""
+    __tablename__ = "order_daily_stats"
+
+    day = Column(Integer, primary_key=True)  # start of the day, unix timestamp (UTC)
+    order_count = Column(Integer, nullable=False)
+    revenue = Column(Numeric(16, 2), nullable=False)
+
+
+class KPICounter(Base):
+    """Current-state KPI figures (inventory value, pending orders) kept by the KPI refresh."""
+    __tablename__ = "kpi_counters"
+
+    name = Column(String(50), primary_key=True)
+    value = Column(Numeric(16, 2), nullable=False)
+    updated_at = Column(Integer, default=lambda: int(time.time()))
@@ -1,5 +1,5 @@
 # /server/app/models/notification.py
-from sqlalchemy import Column, Integer, String, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, Boolean, Index, false
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -7,11 +7,12 @@ from app.models.base import Base
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (Index("ix_notifications_user_id_is_read", "user_id", "is_read"),)
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
     message = Column(String(255), nullable=False)
     timestamp = Column(Integer, nullable=False)
-    is_read = Column(Boolean, default=False)
+    is_read = Column(Boolean, nullable=False, default=False, server_default=false())
 
     user = relationship("User", back_populates="notifications")
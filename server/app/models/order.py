@@ -1,5 +1,5 @@
 # /server/app/models/order.py
-from sqlalchemy import (Column, Integer, String, ForeignKey,
+from sqlalchemy import (Column, Integer, String, ForeignKey, Index,
                         Numeric)
 from sqlalchemy.orm import relationship
 import time
@@ -9,9 +9,10 @@ from app.models.base import Base
 
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (Index("ix_orders_status_order_date", "status", "order_date"),)
 
     id = Column(Integer, primary_key=True, index=True)
-    customer_id = Column(Integer, ForeignKey("customers.id"))
+    customer_id = Column(Integer, ForeignKey("customers.id"), index=True)
     order_date = Column(Integer, default=lambda: int(time.time()))
     ship_date = Column(Integer)
     status = Column(String(20))
@@ -7,16 +7,33 @@ from sqlalchemy.orm import relationship
 from app.models.base import Base
 
 
+class Wave(Base):
+    """A released set of orders, picked as consolidated (batch) pick lists and sorted to a put wall per order."""
+    __tablename__ = "waves"
+
+    id = Column(Integer, primary_key=True, index=True)
+    status = Column(String(20))
+    carrier_id = Column(Integer, ForeignKey("carriers.id"))
+    cutoff = Column(Integer)  # start of the requested ship day (UTC) shared by the wave's orders
+    created_at = Column(Integer, default=lambda: int(time.time()))
+
+    carrier = relationship("Carrier")
+    pick_lists = relationship("PickList", back_populates="wave")
+
+
 class PickList(Base):
     __tablename__ = "pick_lists"
 
     id = Column(Integer, primary_key=True, index=True)
-    order_id = Column(Integer, ForeignKey("orders.id"))
+    order_id = Column(Integer, ForeignKey("orders.id"))  # None for a batch pick list of several orders
+    wave_id = Column(Integer, ForeignKey("waves.id"), index=True)
+    zone_id = Column(Integer, ForeignKey("zones.id"))
     status = Column(String(20))
     created_at = Column(Integer, default=lambda: int(time.time()))
     completed_at = Column(Integer)
 
     order = relationship("Order")
+    wave = relationship("Wave", back_populates="pick_lists")
     pick_list_items = relationship("PickListItem", back_populates="pick_list")
 
 
@@ -29,6 +46,9 @@ class PickListItem(Base):
     location_id = Column(Integer, ForeignKey("locations.id"))
     quantity = Column(Integer)
     picked_quantity = Column(Integer, default=0)
+    # Order a batch pick line is for, and the put-wall slot its units are sorted into
+    order_id = Column(Integer, ForeignKey("orders.id"), index=True)
+    put_wall_slot = Column(Integer)
 
     pick_list = relationship("PickList", back_populates="pick_list_items")
     product = relationship("Product")
@@ -1,5 +1,5 @@
 # /server/app/models/product.py
-from sqlalchemy import Column, Integer, String, Numeric, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Numeric, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -7,6 +7,7 @@ from app.models.base import Base
 
 class Product(Base):
     __tablename__ = "products"
+    __table_args__ = (Index("ix_products_abc_class_xyz_class", "abc_class", "xyz_class"),)
 
     id = Column(Integer, primary_key=True, index=True)
     sku = Column(String(50), unique=True, nullable=False)
@@ -18,6 +19,10 @@ class Product(Base):
     dimensions = Column(String(50))
     barcode = Column(String(50))
     price = Column(Numeric(10, 2), nullable=False)
+    # ABC-XYZ class, maintained by app.crud.classification
+    abc_class = Column(String(1))
+    xyz_class = Column(String(1))
+    classified_at = Column(Integer)
 
     category = relationship("ProductCategory", back_populates="products")
     inventory_items = relationship("Inventory", back_populates="product")
@@ -0,0 +1,57 @@
+# /server/app/models/search.py
+# Full-text search indexes, created along with their tables. On SQLite, products and customers get an FTS5 table
+# kept in sync by triggers; on PostgreSQL, GIN expression indexes over the same text (tsvector), plus trigram
+# indexes for substring matches. Both stay in sync on every write, ORM and bulk Core statements alike.
+from sqlalchemy import DDL, event
+
+from app.models.customer import Customer
+from app.models.product import Product
+
+# Text indexed per table; PostgreSQL only uses its expression index when a query repeats it verbatim
+PRODUCT_DOCUMENT = "coalesce(name, '') || ' ' || coalesce(sku, '') || ' ' || coalesce(description, '')"
+CUSTOMER_DOCUMENT = "coalesce(name, '') || ' ' || coalesce(email, '')"
+
+
+def _fts5_statements(table: str, columns: list[str]) -> list[str]:
+    """External-content FTS5 table over `columns` of `table` and the triggers mirroring its writes."""
+    names = ", ".join(columns)
+    new = ", ".join(f"new.{column}" for column in columns)
+    old = ", ".join(f"old.{column}" for column in columns)
+    remove = f"INSERT INTO {table}_fts({table}_fts, rowid, {names}) VALUES ('delete', old.id, {old});"
+    add = f"INSERT INTO {table}_fts(rowid, {names}) VALUES (new.id, {new});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts USING fts5({names}, content='{table}', content_rowid='id', "
+        f"prefix='2 3', tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER {table}_fts_insert AFTER INSERT ON {table} BEGIN {add} END",
+        f"CREATE TRIGGER {table}_fts_delete AFTER DELETE ON {table} BEGIN {remove} END",
+        f"CREATE TRIGGER {table}_fts_update AFTER UPDATE OF {names} ON {table} BEGIN {remove} {add} END",
+    ]
+
+
+SQLITE_STATEMENTS = {
+    Product.__table__: _fts5_statements("products", ["name", "sku", "description"]),
+    Customer.__table__: _fts5_statements("customers", ["name", "email"]),
+}
+POSTGRESQL_STATEMENTS = {
+    Product.__table__: [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        f"CREATE INDEX IF NOT EXISTS ix_products_search ON products USING gin "
+        f"(to_tsvector('simple', {PRODUCT_DOCUMENT}))",
+        "CREATE INDEX IF NOT EXISTS ix_products_sku_trgm ON products USING gin (sku gin_trgm_ops)",
+    ],
+    Customer.__table__: [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        f"CREATE INDEX IF NOT EXISTS ix_customers_search ON customers USING gin "
+        f"(to_tsvector('simple', {CUSTOMER_DOCUMENT}))",
+        "CREATE INDEX IF NOT EXISTS ix_customers_email_trgm ON customers USING gin (email gin_trgm_ops)",
+    ],
+}
+
+for _table, _statements in SQLITE_STATEMENTS.items():
+    for _statement in _statements:
+        event.listen(_table, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+    # The FTS5 table outlives a dropped content table otherwise; the triggers go with it
+    event.listen(_table, "after_drop", DDL(f"DROP TABLE IF EXISTS {_table.name}_fts").execute_if(dialect="sqlite"))
+for _table, _statements in POSTGRESQL_STATEMENTS.items():
+    for _statement in _statements:
+        event.listen(_table, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
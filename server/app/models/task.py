@@ -1,7 +1,7 @@
 # /server/app/models/task.py
 import time
 
-from sqlalchemy import Column, Integer, String, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -9,6 +9,7 @@ from app.models.base import Base
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (Index("ix_tasks_assigned_to_status_due_date", "assigned_to", "status", "due_date"),)
 
     id = Column(Integer, primary_key=True, index=True)
     task_type = Column(String(50))
@@ -22,6 +22,8 @@ class User(Base):
     password_reset_expiration = Column(Integer)
     two_factor_auth_enabled = Column(Boolean, default=False)
     two_factor_auth_secret = Column(String(32))
+    # Maintained by app.crud.notification on every notification write, so badges never count notification rows
+    unread_notification_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     role = relationship("Role", back_populates="users")
     assigned_tasks = relationship("Task", back_populates="assigned_user")
@@ -115,8 +115,7 @@ def add_sample_data():
     db.commit()
     # Inventory
     for product in products:
-        for _ in range(3):  # Multiple inventory entries per product
-            location = random.choice(locations)
+        for location in random.sample(locations, 3):  # Multiple inventory entries per product, one per location
             inventory = Inventory(
                 product_id=product.id,
                 location_id=location.id,
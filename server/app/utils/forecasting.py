@@ -0,0 +1,61 @@
+# /server/app/utils/forecasting.py
+# Demand model training; nothing here touches the database, so it can run in worker processes
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from threading import Lock
+
+import joblib
+import numpy as np
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.preprocessing import StandardScaler
+
+from app.core.config import settings
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = Lock()
+
+
+def train_forecast(product_id: int, data_version: str, timestamps: list[int], quantities: list[int],
+                   horizon_days: int, model_dir: str) -> tuple[int, str, list[dict], str | None]:
+    """
+    Fit the demand model of one product on its movement history and predict the next `horizon_days` days in
+    one call. Returns (product_id, data_version, forecast, path of the saved model or None).
+    """
+    x = np.asarray(timestamps, dtype=float).reshape(-1, 1)
+    scaler = StandardScaler()
+    model = RandomForestRegressor(n_estimators=100, max_depth=10, random_state=42, n_jobs=1)
+    model.fit(scaler.fit_transform(x), np.asarray(quantities, dtype=float))
+
+    forecast_timestamps = timestamps[-1] + np.arange(1, horizon_days + 1) * 86400
+    predictions = model.predict(scaler.transform(forecast_timestamps.reshape(-1, 1).astype(float)))
+    forecast = [{"date": int(timestamp), "quantity": max(0, round(float(quantity), 2))}
+                for timestamp, quantity in zip(forecast_timestamps, predictions)]
+
+    model_path = None
+    if model_dir:
+        os.makedirs(model_dir, exist_ok=True)
+        model_path = os.path.join(model_dir, f"{product_id}.joblib")
+        joblib.dump({"data_version": data_version, "scaler": scaler, "model": model}, model_path, compress=3)
+    return product_id, data_version, forecast, model_path
+
+
+def get_executor() -> Executor | None:
+    """The shared training pool, or None when FORECAST_WORKERS is 0 and models are trained in-process."""
+    global _executor
+    if settings.FORECAST_WORKERS <= 0:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            # "spawn" keeps workers free of the server's threads and open connections
+            _executor = ProcessPoolExecutor(max_workers=settings.FORECAST_WORKERS,
+                                            mp_context=multiprocessing.get_context("spawn"))
+        return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(cancel_futures=True)
+            _executor = None
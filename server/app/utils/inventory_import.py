@@ -0,0 +1,96 @@
+# /server/app/utils/inventory_import.py
+# Lazy parsing of inventory import uploads (CSV with a header line, or NDJSON: one JSON object per line)
+import codecs
+import csv
+import json
+from typing import BinaryIO, Iterator
+
+from pydantic import ValidationError
+
+from public_api.shared_schemas import InventoryImportRow
+
+CSV = "csv"
+NDJSON = "ndjson"
+
+_FORMATS_BY_EXTENSION = {".csv": CSV, ".ndjson": NDJSON, ".jsonl": NDJSON}
+_FORMATS_BY_CONTENT_TYPE = {"text/csv": CSV, "application/x-ndjson": NDJSON, "application/jsonl": NDJSON}
+
+# (line number, parsed row or error message)
+ImportLine = tuple[int, InventoryImportRow | str]
+
+_UNDECODABLE = "not valid UTF-8 text"
+
+
+def detect_import_format(filename: str | None, content_type: str | None) -> str | None:
+    for extension, import_format in _FORMATS_BY_EXTENSION.items():
+        if filename and filename.lower().endswith(extension):
+            return import_format
+    return _FORMATS_BY_CONTENT_TYPE.get((content_type or "").split(";")[0].strip().lower())
+
+
+def iter_import_rows(file: BinaryIO, import_format: str) -> Iterator[ImportLine]:
+    """Yield the rows of an upload one at a time, so the file is never loaded whole."""
+    lines = _iter_text_lines(file)
+    if import_format == CSV:
+        yield from _iter_csv(lines)
+    else:
+        yield from _iter_ndjson(lines)
+
+
+def _iter_text_lines(file: BinaryIO) -> Iterator[str | None]:
+    """The upload's lines decoded as UTF-8 (a leading BOM dropped), None for a line that isn't valid UTF-8."""
+    for line_num, line in enumerate(file, start=1):
+        if line_num == 1:
+            line = line.removeprefix(codecs.BOM_UTF8)
+        try:
+            yield line.decode("utf-8")
+        except UnicodeDecodeError:
+            yield None
+
+
+def _iter_csv(lines: Iterator[str | None]) -> Iterator[ImportLine]:
+    undecodable = []
+
+    def decoded_lines() -> Iterator[str]:
+        for line_num, line in enumerate(lines, start=1):
+            if line is None:
+                # Read as a blank line, which the reader skips, so its line numbers stay those of the file
+                undecodable.append(line_num)
+                line = "\n"
+            yield line
+
+    reader = csv.DictReader(decoded_lines())
+    for record in reader:
+        yield from _undecodable_errors(undecodable)
+        # Empty cells mean "not given", so optional columns can be left blank
+        values = {key.strip(): value.strip() for key, value in record.items()
+                  if key is not None and value not in (None, "")}
+        yield reader.line_num, _validate(values)
+    yield from _undecodable_errors(undecodable)
+
+
+def _undecodable_errors(line_nums: list[int]) -> Iterator[ImportLine]:
+    yield from ((line_num, _UNDECODABLE) for line_num in line_nums)
+    line_nums.clear()
+
+
+def _iter_ndjson(lines: Iterator[str | None]) -> Iterator[ImportLine]:
+    for line_num, line in enumerate(lines, start=1):
+        if line is None:
+            yield line_num, _UNDECODABLE
+            continue
+        if not line.strip():
+            continue
+        try:
+            values = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_num, f"invalid JSON ({e.msg})"
+            continue
+        yield line_num, _validate(values) if isinstance(values, dict) else "expected a JSON object"
+
+
+def _validate(values: dict) -> InventoryImportRow | str:
+    try:
+        return InventoryImportRow.model_validate(values)
+    except ValidationError as e:
+        return "; ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors())
@@ -0,0 +1,120 @@
+# /server/app/utils/routing.py
+# Pick path routing over a parallel-aisle layout with a front and a back cross aisle. The depot (pick list start
+# and end) is at the front of the first aisle.
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.utils.slotting import natural_key
+
+AISLE_SPACING_METRES = 3.0  # between the centre lines of neighbouring aisles
+BAY_WIDTH_METRES = 1.2  # along an aisle, per rack position
+
+
+@dataclass(frozen=True)
+class Layout:
+    # location id -> (aisle index, bay index); bay 0 is the front cross aisle, bays + 1 the back one
+    positions: dict[int, tuple[int, int]]
+    bays: int
+
+
+def build_layout(locations: list[tuple[int, int | None, str | None, str | None]]) -> Layout:
+    """Layout of (id, zone_id, aisle, rack) locations: aisles ordered by zone then aisle label, bays by rack label."""
+    aisle_keys = {(zone_id, aisle) for _, zone_id, aisle, _ in locations}
+    aisles = {key: index for index, key in enumerate(
+        sorted(aisle_keys, key=lambda key: (key[0] is not None, key[0] or 0, natural_key(key[1]))))}
+    racks = {rack: index + 1 for index, rack in enumerate(sorted({rack for *_, rack in locations}, key=natural_key))}
+    positions = {location_id: (aisles[zone_id, aisle], racks[rack]) for location_id, zone_id, aisle, rack in locations}
+    return Layout(positions=positions, bays=len(racks))
+
+
+def distance_matrix(points: np.ndarray, bays: int) -> np.ndarray:
+    """Walking distance in metres between every pair of (aisle, bay) points, changing aisles via either cross aisle."""
+    aisle, bay = points[:, 0][:, None], points[:, 1][:, None]
+    same_aisle = aisle == aisle.T
+    along = np.where(same_aisle, np.abs(bay - bay.T), np.minimum(bay + bay.T, 2 * (bays + 1) - bay - bay.T))
+    return along * BAY_WIDTH_METRES + np.abs(aisle - aisle.T) * AISLE_SPACING_METRES
+
+
+def route_distance(route: list[int], matrix: np.ndarray) -> float:
+    """Length of depot -> route -> depot, the depot being point 0."""
+    stops = [0, *route, 0]
+    return float(matrix[stops[:-1], stops[1:]].sum())
+
+
+def _picks_by_aisle(points: np.ndarray) -> dict[int, list[int]]:
+    """Point indices (without the depot) per aisle, aisles ascending and picks ordered front to back."""
+    aisles = {}
+    for index in sorted(range(1, len(points)), key=lambda i: (points[i, 0], points[i, 1])):
+        aisles.setdefault(int(points[index, 0]), []).append(index)
+    return aisles
+
+
+def s_shape(points: np.ndarray, bays: int) -> list[int]:
+    """Traverse every aisle holding picks completely, alternating front-to-back and back-to-front."""
+    route = []
+    for number, picks in enumerate(_picks_by_aisle(points).values()):
+        route.extend(picks if number % 2 == 0 else reversed(picks))
+    return route
+
+
+def largest_gap(points: np.ndarray, bays: int) -> list[int]:
+    """
+    Traverse the first and last aisles completely; enter every aisle in between from the back and from the front
+    only up to its largest gap between neighbouring picks (or the cross aisles), so that gap is never walked.
+    """
+    aisles = list(_picks_by_aisle(points).values())
+    if len(aisles) == 1:
+        return aisles[0]
+
+    from_back, from_front = [], []
+    for picks in aisles[1:-1]:
+        bay_stops = [0, *(int(points[i, 1]) for i in picks), bays + 1]
+        gap = int(np.argmax(np.diff(bay_stops)))  # picks before the gap are reached from the front
+        from_front.append(picks[:gap])
+        from_back.append(picks[gap:])
+
+    route = list(aisles[0])
+    for picks in from_back:
+        route.extend(reversed(picks))
+    route.extend(reversed(aisles[-1]))
+    for picks in reversed(from_front):
+        route.extend(picks)
+    return route
+
+
+def two_opt(route: list[int], matrix: np.ndarray, max_passes: int = 50) -> list[int]:
+    """Reverse route segments while that shortens the tour; each candidate set is evaluated with NumPy at once."""
+    stops = np.array([0, *route, 0])
+    for _ in range(max_passes):
+        improved = False
+        for i in range(1, len(stops) - 2):
+            a, b = stops[i - 1], stops[i]
+            c, d = stops[i + 1:-1], stops[i + 2:]
+            delta = matrix[a, c] + matrix[b, d] - matrix[a, b] - matrix[c, d]
+            best = int(np.argmin(delta))
+            if delta[best] < -1e-9:
+                j = i + 1 + best
+                stops[i:j + 1] = stops[i:j + 1][::-1].copy()
+                improved = True
+        if not improved:
+            break
+    return stops[1:-1].tolist()
+
+
+def optimize_pick_path(points: np.ndarray, bays: int) -> tuple[list[int], float, str]:
+    """
+    Best pick order for `points` (row 0 is the depot): the shorter of the S-shape and largest-gap routes, improved
+    by 2-opt. Returns the order of point indices, its distance in metres and the strategy that produced it.
+    """
+    if len(points) <= 1:
+        return [], 0.0, "empty"
+    matrix = distance_matrix(points, bays)
+    strategy, route = min(
+        (("s_shape", s_shape(points, bays)), ("largest_gap", largest_gap(points, bays))),
+        key=lambda candidate: route_distance(candidate[1], matrix)
+    )
+    improved = two_opt(route, matrix)
+    if route_distance(improved, matrix) < route_distance(route, matrix) - 1e-9:
+        route, strategy = improved, f"{strategy}+2opt"
+    return route, route_distance(route, matrix), strategy
@@ -0,0 +1,69 @@
+# /server/app/utils/slotting.py
+# Warehouse layout distances and the free-capacity index used to slot products into bins
+import re
+
+import numpy as np
+
+# Layout distance units: one rack bay along an aisle is 1; moving to the next aisle and reaching up a shelf cost more
+AISLE_DISTANCE = 10.0
+RACK_DISTANCE = 1.0
+SHELF_DISTANCE = 0.5
+
+_DIMENSIONS = re.compile(r"\d+(?:\.\d+)?")
+
+
+def natural_key(value: str | None) -> tuple:
+    """Sort key ordering "2" before "10", and missing labels first (nearest the dock)."""
+    if value is None or value == "":
+        return 0, 0, ""
+    return (1, int(value), "") if value.isdigit() else (2, 0, value)
+
+
+def label_ranks(labels: list[str | None]) -> np.ndarray:
+    """Position of each label among the distinct labels in natural order."""
+    ordered = {label: rank for rank, label in enumerate(sorted(set(labels), key=natural_key))}
+    return np.fromiter((ordered[label] for label in labels), dtype=float, count=len(labels))
+
+
+def travel_costs(aisles: list[str | None], racks: list[str | None], shelves: list[str | None]) -> np.ndarray:
+    """One-way walking distance from the dock (aisle 0, rack 0, floor shelf) to each location."""
+    return (label_ranks(aisles) * AISLE_DISTANCE + label_ranks(racks) * RACK_DISTANCE
+            + label_ranks(shelves) * SHELF_DISTANCE)
+
+
+def unit_cube(dimensions: str | None) -> float:
+    """Volume of one unit from a "L x W x H" dimensions string; 1 when it can't be read."""
+    sizes = [float(size) for size in _DIMENSIONS.findall(dimensions or "")]
+    return float(np.prod(sizes[:3])) if len(sizes) >= 3 and all(sizes[:3]) else 1.0
+
+
+class FreeCapacityIndex:
+    """
+    Max-segment tree over the free capacity of bins ordered by travel cost: finds the closest bin with room for a
+    quantity and updates a bin's free capacity, both in O(log n).
+    """
+
+    def __init__(self, free_capacity: list[int]):
+        self.size = 1
+        while self.size < len(free_capacity):
+            self.size *= 2
+        self.tree = [-1] * (2 * self.size)
+        self.tree[self.size:self.size + len(free_capacity)] = free_capacity
+        for node in range(self.size - 1, 0, -1):
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def closest_fitting(self, quantity: int) -> int | None:
+        if self.tree[1] < quantity:
+            return None
+        node = 1
+        while node < self.size:
+            node = 2 * node if self.tree[2 * node] >= quantity else 2 * node + 1
+        return node - self.size
+
+    def add(self, position: int, quantity: int) -> None:
+        node = position + self.size
+        self.tree[node] += quantity
+        node //= 2
+        while node:
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+            node //= 2
@@ -0,0 +1,9 @@
+# /server/app/utils/time.py
+# Day arithmetic on the integer (epoch seconds, UTC) timestamps the models store
+
+DAY_SECONDS = 86400
+
+
+def day_start(timestamp: int) -> int:
+    """Start of the UTC day containing `timestamp`, the key daily rollups are stored under."""
+    return timestamp - timestamp % DAY_SECONDS
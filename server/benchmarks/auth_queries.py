@@ -0,0 +1,75 @@
+# /server/benchmarks/auth_queries.py
+"""
+Queries and latency per authenticated GET with the principal cache disabled (the previous behaviour:
+user + token + permission lookups on every request) and with a warm cache.
+"""
+import time
+
+from benchmarks.common import SessionLocal, QueryCounter, create_schema, print_table
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.cache import principal_cache  # noqa: E402
+from app.core.security import get_password_hash  # noqa: E402
+from app import crud  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import User, Role, Permission, RolePermission  # noqa: E402
+
+REQUESTS = 200
+ENDPOINTS = {
+    "GET /users/me": "/api/v1/users/me",
+    "GET /assets/types (permission check)": "/api/v1/assets/types",
+}
+
+
+def seed() -> str:
+    db = SessionLocal()
+    role = Role(name="Manager")
+    db.add(role)
+    db.flush()
+    for name in ("Asset", "Inventory", "Orders"):
+        permission = Permission(name=name)
+        db.add(permission)
+        db.flush()
+        db.add(RolePermission(role_id=role.id, permission_id=permission.id, can_read=True, can_write=True))
+    user = User(username="bench", email="bench@example.com", password=get_password_hash("benchmark"),
+                role_id=role.id)
+    db.add(user)
+    db.commit()
+    token = crud.token.create_user_tokens(db, user.id).access_token
+    db.close()
+    return token
+
+
+def measure(client: TestClient, url: str, headers: dict) -> tuple[float, float]:
+    client.get(url, headers=headers).raise_for_status()  # warm-up (fills the cache when enabled)
+    with QueryCounter() as counter:
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            client.get(url, headers=headers).raise_for_status()
+        elapsed = time.perf_counter() - start
+    return counter.count / REQUESTS, elapsed / REQUESTS * 1000
+
+
+def main():
+    create_schema()
+    token = seed()
+    headers = {"Authorization": f"Bearer {token}"}
+    client = TestClient(app)
+    configured_ttl = principal_cache.ttl or 60
+
+    rows = []
+    for label, url in ENDPOINTS.items():
+        principal_cache.ttl = 0
+        queries_before, ms_before = measure(client, url, headers)
+        principal_cache.ttl = configured_ttl
+        queries_after, ms_after = measure(client, url, headers)
+        rows.append([label, f"{queries_before:.1f}", f"{queries_after:.1f}", f"{ms_before:.2f}", f"{ms_after:.2f}"])
+
+    print(f"{REQUESTS} requests per endpoint\n")
+    print_table(["endpoint", "queries/req (no cache)", "queries/req (cached)", "ms/req (no cache)",
+                 "ms/req (cached)"], rows)
+
+
+if __name__ == "__main__":
+    main()
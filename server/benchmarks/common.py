@@ -0,0 +1,63 @@
+# /server/benchmarks/common.py
+"""
+Shared setup for the benchmark scripts.
+
+Run them from the repository root, e.g.:
+    PYTHONPATH=server:. python -m benchmarks.auth_queries
+
+Each script works against a throw-away SQLite database unless BENCH_DATABASE_URL is set.
+"""
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+_tmp_dir = tempfile.mkdtemp(prefix="nexusware-bench-")
+os.environ["DATABASE_URL"] = os.environ.get("BENCH_DATABASE_URL", f"sqlite:///{_tmp_dir}/bench.db")
+
+from sqlalchemy import event  # noqa: E402
+
+from app.db.database import engine, SessionLocal  # noqa: E402
+from app.models import Base  # noqa: E402
+
+
+def create_schema() -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+class QueryCounter:
+    """Counts SQL statements executed through the sync engine while active."""
+
+    def __init__(self):
+        self.count = 0
+        self.statements: list[str] = []
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+
+
+@contextmanager
+def timer(label: str, results: dict):
+    start = time.perf_counter()
+    yield
+    results[label] = time.perf_counter() - start
+
+
+def print_table(headers: list[str], rows: list[list]) -> None:
+    widths = [max(len(str(cell)) for cell in column) for column in zip(headers, *rows)]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(str(cell).ljust(w) for cell, w in zip(row, widths)))
+
+
+__all__ = ["engine", "SessionLocal", "create_schema", "QueryCounter", "timer", "print_table"]
@@ -0,0 +1,84 @@
+# /server/benchmarks/inventory_bulk.py
+"""
+Queries and wall time of batch_update, cycle count and stocktake for 1k/10k/100k items, next to the previous
+row-by-row cycle count (one SELECT per item) for the sizes where it finishes in reasonable time.
+
+    PYTHONPATH=server:. python -m benchmarks.inventory_bulk [sizes...]
+"""
+import sys
+import time
+
+from benchmarks.common import SessionLocal, QueryCounter, create_schema, print_table
+
+from app import crud  # noqa: E402
+from app.models import Product, Location, Inventory  # noqa: E402
+from public_api.shared_schemas import InventoryUpdate, StocktakeCreate, StocktakeItem  # noqa: E402
+
+SIZES = [1_000, 10_000, 100_000]
+LEGACY_MAX_SIZE = 10_000
+
+
+def seed(size: int) -> int:
+    create_schema()
+    db = SessionLocal()
+    location = Location(name="Bench")
+    db.add(location)
+    db.flush()
+    location_id = location.id
+    db.add_all([Product(sku=f"SKU-{i}", name=f"Product {i}", price=1) for i in range(size)])
+    db.flush()
+    db.add_all([Inventory(product_id=product_id, location_id=location_id, quantity=100)
+                for product_id in range(1, size + 1)])
+    db.commit()
+    db.close()
+    return location_id
+
+
+def legacy_cycle_count(db, location_id: int, counted_items: list[InventoryUpdate]) -> None:
+    for item in counted_items:
+        current_inventory = db.query(Inventory).filter(
+            Inventory.product_id == item.product_id,
+            Inventory.location_id == location_id
+        ).first()
+        if current_inventory:
+            current_inventory.quantity = item.quantity
+            db.add(current_inventory)
+    db.commit()
+
+
+def measure(operation) -> tuple[int, float]:
+    db = SessionLocal()
+    with QueryCounter() as counter:
+        start = time.perf_counter()
+        operation(db)
+        elapsed = time.perf_counter() - start
+    db.close()
+    return counter.count, elapsed
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or SIZES
+    rows = []
+    for size in sizes:
+        location_id = seed(size)
+        counted = [InventoryUpdate(product_id=i, location_id=location_id, quantity=i % 7 + 95)
+                   for i in range(1, size + 1)]
+        stocktake = StocktakeCreate(location_id=location_id, items=[
+            StocktakeItem(product_id=i, counted_quantity=i % 5 + 95) for i in range(1, size + 1)
+        ])
+        operations = {
+            "batch_update": lambda db: crud.inventory.batch_update(db, updates=counted),
+            "cycle count": lambda db: crud.inventory.perform_cycle_count(db, location_id, counted),
+            "stocktake": lambda db: crud.inventory.perform_stocktake(db, stocktake),
+        }
+        if size <= LEGACY_MAX_SIZE:
+            operations["cycle count (row by row)"] = lambda db: legacy_cycle_count(db, location_id, counted)
+        for label, operation in operations.items():
+            queries, elapsed = measure(operation)
+            rows.append([f"{size:,}", label, queries, f"{elapsed:.2f}", f"{size / elapsed:,.0f}"])
+
+    print_table(["items", "operation", "queries", "seconds", "items/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# /server/benchmarks/product_lookup.py
+"""
+Latency of scanner lookups against a catalogue of 100k products (or the given sizes), each stocked in two locations:
+the filtered product list the scanner used (`get_multi_with_category_and_inventory` with `barcode=`), the lookup
+index cold (built by the first call) and warm, and a batch of 500 codes.
+
+    PYTHONPATH=server:. python -m benchmarks.product_lookup [sizes...]
+"""
+import random
+import statistics
+import sys
+import time
+
+from benchmarks.common import SessionLocal, create_schema, print_table, engine
+
+from app import crud  # noqa: E402
+from app.core.cache import product_code_cache, product_stock_cache  # noqa: E402
+from app.models import Product, ProductCategory, Location, Inventory  # noqa: E402
+from public_api.shared_schemas import ProductFilter  # noqa: E402
+
+SIZES = [100_000]
+LOCATIONS = 1_000
+BATCH_CODES = 500
+REPEATS = 50
+BATCH = 50_000
+
+
+def seed(size: int) -> None:
+    create_schema()
+    rng = random.Random(42)
+    with engine.begin() as connection:
+        connection.execute(ProductCategory.__table__.insert(), [{"id": 1, "name": "General"}])
+        connection.execute(Location.__table__.insert(), [{"id": i, "name": f"L{i}"} for i in range(1, LOCATIONS + 1)])
+        for start in range(1, size + 1, BATCH):
+            ids = range(start, min(start + BATCH, size + 1))
+            connection.execute(Product.__table__.insert(), [
+                {"id": i, "sku": f"SKU-{i}", "barcode": f"{400000000000 + i}", "name": f"Product {i}",
+                 "category_id": 1, "price": 1} for i in ids
+            ])
+            connection.execute(Inventory.__table__.insert(), [
+                {"product_id": i, "location_id": location_id, "quantity": rng.randint(1, 100)}
+                for i in ids for location_id in rng.sample(range(1, LOCATIONS + 1), 2)
+            ])
+
+
+def median_ms(call, codes: list[str]) -> float:
+    timings = []
+    for code in codes:
+        start = time.perf_counter()
+        call(code)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or SIZES
+    rows = []
+    for size in sizes:
+        seed(size)
+        product_code_cache.clear()
+        product_stock_cache.clear()
+        rng = random.Random(7)
+        codes = [f"{400000000000 + rng.randint(1, size)}" for _ in range(REPEATS)]
+        db = SessionLocal()
+
+        listed = median_ms(lambda code: crud.product.get_multi_with_category_and_inventory(
+            db, limit=1, filter_params=ProductFilter(barcode=code)), codes)
+        rows.append([f"{size:,}", "filtered product list", f"{listed:.2f}"])
+        start = time.perf_counter()
+        crud.product_lookup.lookup(db, codes[0])
+        rows.append([f"{size:,}", "lookup, building the index", f"{(time.perf_counter() - start) * 1000:.2f}"])
+        product_stock_cache.clear()
+        rows.append([f"{size:,}", "lookup, stock not cached",
+                     f"{median_ms(lambda code: crud.product_lookup.lookup(db, code), codes):.2f}"])
+        rows.append([f"{size:,}", "lookup, warm",
+                     f"{median_ms(lambda code: crud.product_lookup.lookup(db, code), codes):.2f}"])
+        batch = [f"SKU-{rng.randint(1, size)}" for _ in range(BATCH_CODES)]
+        start = time.perf_counter()
+        crud.product_lookup.lookup_many(db, batch)
+        rows.append([f"{size:,}", f"batch of {BATCH_CODES}, stock not cached",
+                     f"{(time.perf_counter() - start) * 1000:.2f}"])
+        db.close()
+
+    print_table(["products", "path", "ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
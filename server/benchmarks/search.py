@@ -0,0 +1,60 @@
+# /server/benchmarks/search.py
+"""
+Latency of /search/products (`crud.product.advanced_search`, first page of 20) against catalogues of 100k and 1M
+products, for a few typical queries: a rare word, a word prefix, two words and a SKU fragment.
+
+    PYTHONPATH=server:. python -m benchmarks.search [sizes...]
+"""
+import random
+import statistics
+import sys
+import time
+
+from benchmarks.common import SessionLocal, create_schema, print_table, engine
+
+from app import crud  # noqa: E402
+from app.models import Product, ProductCategory  # noqa: E402
+
+SIZES = [100_000, 1_000_000]
+QUERIES = ["walnut", "ergo", "steel shelf", "SKU-4242"]
+REPEATS = 20
+ADJECTIVES = ["steel", "oak", "walnut", "ergonomic", "compact", "folding", "industrial", "classic", "modern", "heavy"]
+NOUNS = ["shelf", "chair", "desk", "lamp", "cabinet", "trolley", "bin", "rack", "pallet", "crate", "ladder", "hook"]
+BATCH = 50_000
+
+
+def seed(size: int) -> None:
+    create_schema()
+    rng = random.Random(42)
+    with engine.begin() as connection:
+        connection.execute(ProductCategory.__table__.insert(), [{"id": 1, "name": "General"}])
+        for start in range(1, size + 1, BATCH):
+            connection.execute(Product.__table__.insert(), [
+                {"id": i, "sku": f"SKU-{i}", "category_id": 1, "price": 1,
+                 "name": f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {i % 997}",
+                 "description": " ".join(rng.choices(ADJECTIVES + NOUNS, k=6))}
+                for i in range(start, min(start + BATCH, size + 1))
+            ])
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or SIZES
+    rows = []
+    for size in sizes:
+        seed(size)
+        db = SessionLocal()
+        for q in QUERIES:
+            timings = []
+            for _ in range(REPEATS):
+                start = time.perf_counter()
+                results = crud.product.advanced_search(db, q=q, limit=20)
+                timings.append(time.perf_counter() - start)
+            rows.append([f"{size:,}", q, len(results), f"{statistics.median(timings) * 1000:.1f}",
+                         f"{max(timings) * 1000:.1f}"])
+        db.close()
+
+    print_table(["products", "query", "results", "median ms", "max ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
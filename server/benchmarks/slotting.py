@@ -0,0 +1,67 @@
+# /server/benchmarks/slotting.py
+"""
+Wall time and queries of the slotting optimizer (`optimize_locations`) for 1k/10k/100k locations, each holding one
+stock row with pick history.
+
+    PYTHONPATH=server:. python -m benchmarks.slotting [sizes...]
+"""
+import random
+import sys
+import time
+
+from benchmarks.common import SessionLocal, QueryCounter, create_schema, print_table, engine
+
+from app import crud  # noqa: E402
+from app.models import Product, Location, Zone, Inventory, PickList, PickListItem  # noqa: E402
+
+SIZES = [1_000, 10_000, 100_000]
+ZONES = 10
+PICK_LINES_PER_LOCATION = 3
+
+
+def seed(size: int) -> None:
+    create_schema()
+    rng = random.Random(42)
+    now = int(time.time())
+    with engine.begin() as connection:
+        connection.execute(Zone.__table__.insert(), [{"id": i, "name": f"Zone {i}"} for i in range(1, ZONES + 1)])
+        connection.execute(Location.__table__.insert(), [
+            {"id": i, "name": f"L{i}", "zone_id": i % ZONES + 1, "aisle": str(i // 400), "rack": str(i // 8 % 50),
+             "shelf": str(i % 8), "bin": "1", "capacity": 100}
+            for i in range(1, size + 1)
+        ])
+        connection.execute(Product.__table__.insert(), [
+            {"id": i, "sku": f"SKU-{i}", "name": f"Product {i}", "price": 1, "dimensions": f"{rng.randint(1, 9)}x2x2"}
+            for i in range(1, size + 1)
+        ])
+        # Every other location is stocked, the rest is free capacity to move into
+        stocked = range(1, size + 1, 2)
+        connection.execute(Inventory.__table__.insert(), [
+            {"product_id": i, "location_id": i, "quantity": rng.randint(1, 60), "last_updated": now} for i in stocked
+        ])
+        connection.execute(PickList.__table__.insert(), [{"id": 1, "status": "completed", "created_at": now}])
+        connection.execute(PickListItem.__table__.insert(), [
+            {"pick_list_id": 1, "product_id": i, "location_id": i, "quantity": 1, "picked_quantity": 1}
+            for i in stocked for _ in range(rng.randint(1, PICK_LINES_PER_LOCATION))
+        ])
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or SIZES
+    rows = []
+    for size in sizes:
+        seed(size)
+        db = SessionLocal()
+        with QueryCounter() as counter:
+            start = time.perf_counter()
+            moves = crud.inventory.optimize_locations(db)
+            elapsed = time.perf_counter() - start
+        db.close()
+        saving = sum(move.travel_saving for move in moves)
+        rows.append([f"{size:,}", counter.count, len(moves), f"{saving:,.0f}", f"{elapsed:.2f}"])
+
+    print_table(["locations", "queries", "moves", "travel saved", "seconds"], rows)
+
+
+if __name__ == "__main__":
+    main()
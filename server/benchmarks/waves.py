@@ -0,0 +1,82 @@
+# /server/benchmarks/waves.py
+"""
+Wall time and queries of wave planning (`crud.wave.plan`) for 1k/5k/10k open orders of 1-5 lines over 20k stocked
+locations, simulated and released.
+
+    PYTHONPATH=server:. python -m benchmarks.waves [sizes...]
+"""
+import random
+import sys
+import time
+
+from benchmarks.common import SessionLocal, QueryCounter, create_schema, print_table, engine
+
+from app import crud  # noqa: E402
+from app.core.cache import layout_cache  # noqa: E402
+from app.models import Product, Location, Zone, Inventory, Order, OrderItem, Carrier, Shipment  # noqa: E402
+from public_api.shared_schemas import WavePlanRequest  # noqa: E402
+
+SIZES = [1_000, 5_000, 10_000]
+LOCATIONS = 20_000
+ZONES = 4
+CARRIERS = 3
+DAY = 86400
+
+
+def seed(size: int) -> None:
+    create_schema()
+    layout_cache.clear()
+    rng = random.Random(42)
+    now = int(time.time())
+    with engine.begin() as connection:
+        connection.execute(Zone.__table__.insert(), [{"id": i, "name": f"Zone {i}"} for i in range(1, ZONES + 1)])
+        connection.execute(Carrier.__table__.insert(), [{"id": i, "name": f"Carrier {i}"}
+                                                        for i in range(1, CARRIERS + 1)])
+        connection.execute(Location.__table__.insert(), [
+            {"id": i, "name": f"L{i}", "zone_id": i * ZONES // LOCATIONS + 1, "aisle": str(i // 500),
+             "rack": str(i // 10 % 50), "shelf": str(i % 10), "bin": "1", "capacity": 100}
+            for i in range(LOCATIONS)
+        ])
+        connection.execute(Product.__table__.insert(), [
+            {"id": i, "sku": f"SKU-{i}", "name": f"Product {i}", "price": 1} for i in range(LOCATIONS)
+        ])
+        connection.execute(Inventory.__table__.insert(), [
+            {"product_id": i, "location_id": i, "quantity": 50, "last_updated": now} for i in range(LOCATIONS)
+        ])
+        connection.execute(Order.__table__.insert(), [
+            {"id": i, "status": "Pending", "order_date": now, "ship_date": now + rng.randint(0, 2) * DAY}
+            for i in range(1, size + 1)
+        ])
+        connection.execute(Shipment.__table__.insert(), [
+            {"order_id": i, "carrier_id": rng.randint(1, CARRIERS), "status": "Pending"} for i in range(1, size + 1)
+        ])
+        # Orders mostly stay within one zone, so batches have something to consolidate
+        connection.execute(OrderItem.__table__.insert(), [
+            {"order_id": i, "product_id": zone_start + rng.randrange(LOCATIONS // ZONES), "quantity": rng.randint(1, 3),
+             "unit_price": 1}
+            for i in range(1, size + 1)
+            for zone_start in [rng.randrange(ZONES) * LOCATIONS // ZONES]
+            for _ in range(rng.randint(1, 5))
+        ])
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or SIZES
+    rows = []
+    for size in sizes:
+        seed(size)
+        for simulate in (True, False):
+            db = SessionLocal()
+            with QueryCounter() as counter:
+                start = time.perf_counter()
+                plan = crud.wave.plan(db, WavePlanRequest(simulate=simulate))
+                elapsed = time.perf_counter() - start
+            db.close()
+            rows.append([f"{size:,}", "simulate" if simulate else "release", counter.count, len(plan.batches),
+                         f"{plan.picks_per_hour:,.0f}", f"{plan.single_order_picks_per_hour:,.0f}", f"{elapsed:.2f}"])
+
+    print_table(["orders", "mode", "queries", "batches", "picks/h batched", "picks/h single", "seconds"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# /server/benchmarks/yard_reports.py
+"""
+Wall time and queries of the yard carrier performance and utilization reports over 10k dock appointments (or the
+given counts) spread across 50 carriers, 40 yard locations and 30 days.
+
+    PYTHONPATH=server:. python -m benchmarks.yard_reports [sizes...]
+"""
+import random
+import sys
+import time
+
+from benchmarks.common import SessionLocal, QueryCounter, create_schema, print_table, engine
+
+from app import crud  # noqa: E402
+from app.models import Carrier, DockAppointment, YardLocation  # noqa: E402
+
+SIZES = [10_000]
+CARRIERS = 50
+YARD_LOCATIONS = 40
+DAYS = 30
+DAY = 86400
+START = 1_700_000_000 // DAY * DAY
+
+
+def seed(size: int) -> None:
+    create_schema()
+    rng = random.Random(42)
+    with engine.begin() as connection:
+        connection.execute(Carrier.__table__.insert(), [{"id": i, "name": f"Carrier {i}"}
+                                                        for i in range(1, CARRIERS + 1)])
+        connection.execute(YardLocation.__table__.insert(), [
+            {"id": i, "name": f"Dock {i}", "type": "dock", "status": "available", "capacity": rng.randint(4, 12)}
+            for i in range(1, YARD_LOCATIONS + 1)
+        ])
+        appointments = []
+        for _ in range(size):
+            appointment_time = START + rng.randrange(DAYS * DAY)
+            status = rng.choices(["completed", "missed", "scheduled"], [8, 1, 1])[0]
+            arrival = appointment_time + rng.randint(-1800, 3600) if status == "completed" else None
+            appointments.append({
+                "yard_location_id": rng.randint(1, YARD_LOCATIONS), "carrier_id": rng.randint(1, CARRIERS),
+                "appointment_time": appointment_time, "type": "inbound", "status": status,
+                "actual_arrival_time": arrival,
+                "actual_departure_time": arrival + rng.randint(900, 14400) if arrival else None
+            })
+        connection.execute(DockAppointment.__table__.insert(), appointments)
+
+
+def timed(report) -> tuple[int, float]:
+    db = SessionLocal()
+    with QueryCounter() as counter:
+        start = time.perf_counter()
+        report(db)
+        elapsed = time.perf_counter() - start
+    db.close()
+    return counter.count, elapsed
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or SIZES
+    rows = []
+    for size in sizes:
+        seed(size)
+        for name, report in [
+            ("carrier_performance", lambda db: crud.yard.get_carrier_performance(db, START, START + DAYS * DAY)),
+            ("utilization", lambda db: crud.yard.get_utilization_report(db, START + DAYS // 2 * DAY)),
+        ]:
+            queries, elapsed = timed(report)
+            rows.append([f"{size:,}", name, queries, f"{elapsed * 1000:.1f}"])
+
+    print_table(["appointments", "report", "queries", "ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
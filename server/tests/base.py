@@ -0,0 +1,65 @@
+# /server/tests/base.py
+import unittest
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.api import deps
+from app.core.cache import TableDependentCache
+from app.db.database import track_table_writes
+from app.main import app
+from app.models import Base, User
+
+
+class DatabaseTestCase(unittest.TestCase):
+    """
+    A fresh in-memory database per test with every table (and its search index), `self.db` on it, and commits
+    invalidating the table-dependent caches as on the app's engine. Those caches start out empty.
+    """
+
+    def setUp(self):
+        self.clear_caches()
+        self.addCleanup(self.clear_caches)
+        # One connection shared by every thread, so endpoints running in the threadpool see the same database
+        self.engine = create_engine(self.database_url(), poolclass=StaticPool,
+                                    connect_args={"check_same_thread": False})
+        track_table_writes(self.engine)
+        Base.metadata.create_all(self.engine)
+        self.addCleanup(self.engine.dispose)
+        self.db = Session(self.engine)
+        self.addCleanup(self.db.close)
+
+    def database_url(self) -> str:
+        """In memory by default; tests that also open other connections to the database use a file."""
+        return "sqlite://"
+
+    @staticmethod
+    def clear_caches() -> None:
+        for cache in TableDependentCache.instances:
+            cache.clear()
+
+    def add_users(self, *user_ids: int, role_id: int | None = None) -> None:
+        self.db.add_all([User(id=user_id, username=f"user{user_id}", email=f"user{user_id}@example.com",
+                              password="x", role_id=role_id) for user_id in user_ids])
+        self.db.commit()
+
+    def client_as(self, user_id: int) -> TestClient:
+        """A client of the app on this database, authenticated as user `user_id`."""
+        app.dependency_overrides[deps.get_db] = lambda: self.db
+        for dependency in (deps.get_current_user, deps.get_current_active_user):
+            app.dependency_overrides[dependency] = lambda: self.db.get(User, user_id)
+        self.addCleanup(app.dependency_overrides.clear)
+        return TestClient(app)
+
+    def record_statements(self) -> list[str]:
+        """SQL statements executed from now on, in order."""
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", record)
+        self.addCleanup(event.remove, self.engine, "before_cursor_execute", record)
+        return statements
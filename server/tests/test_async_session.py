@@ -0,0 +1,123 @@
+# /server/tests/test_async_session.py
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.cache import TableDependentCache
+from app.crud.task import TASK_DETAIL_OPTIONS, task_async
+from app.db import database
+from app.db.database import get_async_database_url, track_table_writes
+from app.models import Customer, Product, ProductCategory, Role, Task
+from public_api.shared_schemas import TaskCreate, TaskUpdate
+from tests.base import DatabaseTestCase
+
+
+class TestAsyncDatabaseUrl(unittest.TestCase):
+
+    def test_async_driver_per_dialect(self):
+        self.assertEqual(get_async_database_url("sqlite:///./nexusware.db"), "sqlite+aiosqlite:///./nexusware.db")
+        self.assertEqual(get_async_database_url("postgresql+psycopg2://u:p@db/wms"), "postgresql+asyncpg://u:p@db/wms")
+        self.assertEqual(get_async_database_url("mysql://u:p@db/wms"), "mysql+aiomysql://u:p@db/wms")
+        with self.assertRaises(ValueError):
+            get_async_database_url("oracle://u:p@db/wms")
+
+
+class TestAsyncSession(DatabaseTestCase):
+    """The async CRUD layer and endpoints, on an aiosqlite engine sharing a database file with `self.db`."""
+
+    def database_url(self) -> str:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        return f"sqlite:///{os.path.join(directory.name, 'async.db')}"
+
+    def setUp(self):
+        super().setUp()
+        # No pooling: the test client and asyncio.run each run their own event loop
+        async_engine = create_async_engine(get_async_database_url(str(self.engine.url)), poolclass=NullPool)
+        track_table_writes(async_engine.sync_engine)
+        self.addCleanup(asyncio.run, async_engine.dispose())
+        self.session_factory = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False,
+                                                  expire_on_commit=False)
+        # The real get_async_db dependency, handing out sessions of this engine
+        patcher = patch.object(database, "AsyncSessionLocal", self.session_factory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.db.add_all([Role(id=1, name="Admin"), Customer(id=1, name="Acme"), ProductCategory(id=1, name="Chairs"),
+                         Product(id=1, sku="CHR-100", name="Chair", price=10, category_id=1)])
+        self.add_users(1, role_id=1)
+        self.client = self.client_as(1)
+
+    def run_async(self, work):
+        async def in_session():
+            async with self.session_factory() as db:
+                return await work(db)
+        return asyncio.run(in_session())
+
+    def test_crud(self):
+        task_in = TaskCreate(task_type="Other", description="Count aisle 3", assigned_to=1, due_date=100,
+                             priority="High", status="Pending")
+        created = self.run_async(lambda db: task_async.create(db, obj_in=task_in))
+        self.assertEqual(self.db.get(Task, created.id).description, "Count aisle 3")
+
+        async def get_with_assignee(db):
+            found = await task_async.get(db, id=created.id, options=list(TASK_DETAIL_OPTIONS))
+            return found.assigned_user.role.name
+        self.assertEqual(self.run_async(get_with_assignee), "Admin")
+
+        async def update(db):
+            found = await task_async.get(db, id=created.id)
+            return await task_async.update(db, db_obj=found, obj_in=TaskUpdate(status="Completed"))
+        updated = self.run_async(update)
+        self.assertEqual((updated.status, updated.description), ("Completed", "Count aisle 3"))
+        self.assertEqual(len(self.run_async(lambda db: task_async.get_multi(db))), 1)
+
+        self.run_async(lambda db: task_async.remove(db, id=created.id))
+        self.assertIsNone(self.run_async(lambda db: task_async.get(db, id=created.id)))
+        self.db.expire_all()
+        self.assertIsNone(self.db.get(Task, created.id))
+
+    def test_commits_invalidate_caches(self):
+        cache = TableDependentCache(maxsize=1, ttl=60, tables={"tasks"})
+        self.addCleanup(TableDependentCache.instances.remove, cache)
+        cache.set("key", "value")
+        self.client.post("/api/v1/tasks/", json={"task_type": "Other", "description": "x", "assigned_to": 1,
+                                                 "due_date": 1, "priority": "Low", "status": "Pending"})
+        self.assertIsNone(cache.get("key"))
+
+    def test_task_endpoints(self):
+        response = self.client.post("/api/v1/tasks/", json={
+            "task_type": "Other", "description": "Count aisle 3", "assigned_to": 1, "due_date": 100,
+            "priority": "High", "status": "Pending"})
+        self.assertEqual(response.status_code, 200)
+        task_id = response.json()["id"]
+
+        response = self.client.get(f"/api/v1/tasks/{task_id}")
+        self.assertEqual((response.status_code, response.json()["assigned_user"]["username"]), (200, "user1"))
+        response = self.client.put(f"/api/v1/tasks/{task_id}", json={"status": "In Progress"})
+        self.assertEqual(response.json()["status"], "In Progress")
+        self.assertEqual(self.client.delete(f"/api/v1/tasks/{task_id}").status_code, 204)
+        self.assertEqual(self.client.get(f"/api/v1/tasks/{task_id}").status_code, 404)
+
+    def test_order_endpoints(self):
+        response = self.client.post("/api/v1/orders/", json={
+            "customer_id": 1, "status": "Pending", "order_date": 100, "total_amount": 20,
+            "items": [{"product_id": 1, "quantity": 2, "unit_price": 10}]})
+        self.assertEqual(response.status_code, 200)
+        order = response.json()
+        self.assertEqual([item["product"]["sku"] for item in order["order_items"]], ["CHR-100"])
+
+        response = self.client.get(f"/api/v1/orders/{order['id']}")
+        self.assertEqual((response.json()["customer"]["name"], len(response.json()["order_items"])), ("Acme", 1))
+        response = self.client.put(f"/api/v1/orders/{order['id']}", json={"total_amount": 25})
+        self.assertEqual((response.status_code, response.json()["total_amount"]), (200, 25))
+        self.assertEqual(self.client.get("/api/v1/orders/999").status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+# /server/tests/test_chat_history.py
+import unittest
+
+from app.crud.chat import chat
+from app.models import Role
+from public_api.shared_schemas import MessageCreate
+from tests.base import DatabaseTestCase
+
+
+class TestChatHistory(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.add_users(1, 2, 3)
+        self.chat = chat.create_chat(self.db, 1, 2)
+        self.other = chat.create_chat(self.db, 3, 1)
+
+    def send(self, sender_id: int, content: str, chat_id: int | None = None):
+        return chat.create_message(self.db, chat_id or self.chat.id, sender_id, MessageCreate(content=content))
+
+    def test_keyset_windows(self):
+        ids = [self.send(1, f"m{n}").id for n in range(7)]
+        latest, has_more = chat.get_chat_messages(self.db, self.chat.id, 1, limit=3)
+        self.assertEqual(([message.id for message in latest], has_more), (ids[4:], True))
+        older, has_more = chat.get_chat_messages(self.db, self.chat.id, 1, before_id=ids[4], limit=3)
+        self.assertEqual(([message.id for message in older], has_more), (ids[1:4], True))
+        oldest, has_more = chat.get_chat_messages(self.db, self.chat.id, 1, before_id=ids[1], limit=3)
+        self.assertEqual(([message.id for message in oldest], has_more), (ids[:1], False))
+        newer, has_more = chat.get_chat_messages(self.db, self.chat.id, 1, after_id=ids[2], limit=3)
+        self.assertEqual(([message.id for message in newer], has_more), (ids[3:6], True))
+
+    def test_summary_maintained_on_write_and_read(self):
+        self.send(1, "hi")
+        self.send(2, "hello")
+        last = self.send(2, "how are you?")
+        self.send(3, "ping", chat_id=self.other.id)
+
+        self.db.expire_all()
+        statements = self.record_statements()
+        chats = chat.get_user_chats(self.db, 1)
+        self.assertEqual(len(statements), 1)
+        self.assertNotIn("messages", statements[0])
+        self.assertEqual([found.id for found in chats], [self.other.id, self.chat.id])
+        self.assertEqual(chats[1].last_message["id"], last.id)
+        self.assertEqual(chats[1].last_message["content"], "how are you?")
+        self.assertEqual((chats[1].unread_count_for(1), chats[1].unread_count_for(2)), (2, 1))
+        self.assertEqual(chats[0].unread_count_for(1), 1)
+
+        chat.mark_read(self.db, self.chat.id, 1)
+        self.assertEqual((self.chat.unread_count_for(1), self.chat.unread_count_for(2)), (0, 1))
+
+
+class TestChatEndpoints(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db.add(Role(id=1, name="staff"))
+        self.add_users(1, 2, role_id=1)
+        self.client = self.client_as(1)
+
+    def test_chat_routes(self):
+        created = self.client.post("/api/v1/chat/", json={"user2_id": 2})
+        self.assertEqual(created.status_code, 200)
+        chat_id = created.json()["id"]
+        self.assertEqual((created.json()["user2"]["id"], created.json()["unread_count"]), (2, 0))
+        chat.create_message(self.db, chat_id, 2, MessageCreate(content="hi"))
+        chat.create_message(self.db, chat_id, 2, MessageCreate(content="there"))
+
+        listed = self.client.get("/api/v1/chat/")
+        self.assertEqual(listed.status_code, 200)
+        [summary] = listed.json()["chats"]
+        self.assertEqual((summary["id"], summary["unread_count"]), (chat_id, 2))
+        self.assertEqual(summary["last_message"]["content"], "there")
+
+        fetched = self.client.get(f"/api/v1/chat/{chat_id}")
+        self.assertEqual((fetched.status_code, fetched.json()["unread_count"]), (200, 2))
+        read = self.client.post(f"/api/v1/chat/{chat_id}/read")
+        self.assertEqual((read.status_code, read.json()["unread_count"]), (200, 0))
+        self.assertEqual(self.client.get("/api/v1/chat/999").status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+# /server/tests/test_chat_push.py
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.core.pubsub import InProcessBroker, broker, user_channel, LAGGED
+from app.crud.chat import chat
+from app.main import app
+from public_api.shared_schemas import MessageCreate
+from tests.base import DatabaseTestCase
+
+
+class TestInProcessBroker(unittest.TestCase):
+
+    def test_fan_out_to_channel_subscribers(self):
+        async def scenario():
+            local = InProcessBroker(maxsize=8)
+            with local.subscribe("user:1") as first, local.subscribe("user:1", "user:2") as second:
+                self.assertEqual(local.publish("user:1", {"n": 1}), 2)
+                self.assertEqual(local.publish("user:2", {"n": 2}), 1)
+                self.assertEqual(local.publish("user:3", {"n": 3}), 0)
+                await asyncio.sleep(0)
+                self.assertEqual(await first.get(), {"n": 1})
+                self.assertEqual([await second.get(), await second.get()], [{"n": 1}, {"n": 2}])
+            self.assertEqual(local.publish("user:1", {"n": 4}), 0)
+
+        asyncio.run(scenario())
+
+    def test_lagging_subscriber_is_dropped(self):
+        async def scenario():
+            local = InProcessBroker(maxsize=2)
+            subscription = local.subscribe("user:1")
+            for n in range(3):
+                local.publish("user:1", {"n": n})
+            await asyncio.sleep(0)
+            self.assertIs(await subscription.get(), LAGGED)
+            self.assertEqual(local.publish("user:1", {"n": 3}), 0)
+
+        asyncio.run(scenario())
+
+
+class TestChatPush(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.add_users(1, 2)
+        self.chat = chat.create_chat(self.db, 1, 2)
+
+    def test_messages_after_id(self):
+        sent = [chat.create_message(self.db, self.chat.id, 1, MessageCreate(content=f"m{n}")) for n in range(3)]
+        everything, _ = chat.get_chat_messages(self.db, self.chat.id, 2)
+        self.assertEqual([message.id for message in everything], [message.id for message in sent])
+        newer, _ = chat.get_chat_messages(self.db, self.chat.id, 2, after_id=sent[0].id)
+        self.assertEqual([message.content for message in newer], ["m1", "m2"])
+        self.assertEqual(chat.get_chat_messages(self.db, self.chat.id, 3, after_id=0), ([], False))
+
+    def test_new_messages_are_pushed_to_both_participants(self):
+        with patch("app.api.deps.get_stream_user_id", return_value=2):
+            client = TestClient(app)
+            with client.websocket_connect("/api/v1/chat/ws?token=t") as websocket:
+                chat.create_message(self.db, self.chat.id, 1, MessageCreate(content="hello"))
+                event = websocket.receive_json()
+        self.assertEqual((event["type"], event["chat_id"]), ("chat_message", self.chat.id))
+        self.assertEqual((event["message"]["sender_id"], event["message"]["content"]), (1, "hello"))
+        self.assertFalse(broker._subscriptions.get(user_channel(2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+# /server/tests/test_classification.py
+import time
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from app.crud.classification import classification, abc_classes, xyz_classes, WEEK_SECONDS
+from app.models import Product, Location, Inventory, InventoryMovement
+from tests.base import DatabaseTestCase
+
+
+class TestClassificationFunctions(unittest.TestCase):
+
+    def test_abc_by_cumulative_value_share(self):
+        values = np.array([5.0, 70.0, 0.0, 15.0, 10.0])
+        self.assertEqual(abc_classes(values).tolist(), ["C", "A", "C", "A", "B"])
+
+    def test_abc_top_product_is_always_a(self):
+        self.assertEqual(abc_classes(np.array([100.0])).tolist(), ["A"])
+        self.assertEqual(abc_classes(np.zeros(2)).tolist(), ["C", "C"])
+
+    def test_xyz_by_coefficient_of_variation(self):
+        classes = xyz_classes(np.array([10.0, 10.0, 10.0, 0.0]), np.array([2.0, 8.0, 20.0, 0.0]))
+        self.assertEqual(classes.tolist(), ["X", "Y", "Z", "Z"])
+
+
+class TestClassificationRefresh(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db.add(Location(id=1, name="A"))
+        self.db.add_all([Product(id=i, sku=f"P{i}", name=f"P{i}", price=1) for i in (1, 2, 3)])
+        self.db.add_all([Inventory(product_id=1, location_id=1, quantity=90),
+                         Inventory(product_id=2, location_id=1, quantity=10)])
+        now = int(time.time())
+        # Product 1 ships the same amount every week, product 2 once
+        self.db.add_all([InventoryMovement(product_id=1, quantity=-5, timestamp=now - week * WEEK_SECONDS - 60)
+                         for week in range(12)])
+        self.db.add(InventoryMovement(product_id=2, quantity=-30, timestamp=now - 60))
+        self.db.commit()
+
+    def classes(self) -> dict:
+        return {product.id: (product.abc_class, product.xyz_class)
+                for product in self.db.query(Product).populate_existing()}
+
+    def test_refresh_persists_classes(self):
+        classification.refresh(self.db)
+        self.assertEqual(self.classes(), {1: ("A", "X"), 2: ("B", "Z"), 3: ("C", "Z")})
+
+    def test_only_changed_products_are_rewritten(self):
+        classification.refresh(self.db)
+        classified_at = {product.id: product.classified_at for product in self.db.query(Product)}
+        self.db.query(Product).filter_by(id=1).update({"classified_at": 1})
+        self.db.query(Inventory).filter_by(product_id=2).update({"quantity": 900})
+        self.db.commit()
+
+        self.assertTrue(classification.refresh_if_dirty(self.db))
+        products = {product.id: product for product in self.db.query(Product).populate_existing()}
+        self.assertEqual((products[2].abc_class, products[1].abc_class), ("A", "B"))
+        self.assertEqual(products[3].classified_at, classified_at[3])
+        # Writing the changed classes marked them stale once more; the check that follows changes nothing
+        statements = self.record_statements()
+        self.assertTrue(classification.refresh_if_dirty(self.db))
+        self.assertFalse(any(statement.startswith("UPDATE") for statement in statements))
+        self.assertFalse(classification.refresh_if_dirty(self.db))
+
+    def test_write_committed_while_classifying_is_not_lost(self):
+        classification.refresh(self.db)
+        classification.refresh(self.db)
+        self.assertFalse(classification.refresh_if_dirty(self.db))
+
+        classify = classification._classify
+
+        def classify_then_write(db, now):
+            result = classify(db, now)
+            # Another request moves stock after the figures were read
+            self.db.query(Inventory).filter_by(product_id=2).update({"quantity": 900})
+            self.db.commit()
+            return result
+
+        with patch.object(classification, "_classify", side_effect=classify_then_write):
+            classification.refresh(self.db)
+        self.assertEqual(self.classes()[2], ("B", "Z"))
+        self.assertTrue(classification.refresh_if_dirty(self.db))
+        self.assertEqual(self.classes()[2], ("A", "Z"))
+
+    def test_failed_refresh_stays_dirty(self):
+        with patch.object(classification, "_classify", side_effect=RuntimeError("database gone")):
+            with self.assertRaises(RuntimeError):
+                classification.refresh(self.db)
+        self.assertTrue(classification.refresh_if_dirty(self.db))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+# /server/tests/test_forecast.py
+import json
+import os
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import joblib
+
+from app.core.config import settings
+from app.crud.forecast import forecast
+from app.models import DemandForecast, InventoryMovement, Location, Product
+from tests.base import DatabaseTestCase
+
+DAY = 86400
+# app.crud re-exports the `forecast` instance under the module's name
+forecast_module = sys.modules["app.crud.forecast"]
+
+
+class TestForecast(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        model_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(model_dir.cleanup)
+        self.model_dir = model_dir.name
+        for name, value in (("FORECAST_MODEL_DIR", self.model_dir), ("FORECAST_HORIZON_DAYS", 3)):
+            patcher = patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        # Counts the models fitted, whether in-process or on the pool
+        train = patch.object(forecast_module, "train_forecast", wraps=forecast_module.train_forecast)
+        self.train = train.start()
+        self.addCleanup(train.stop)
+
+        self.db.add(Location(id=1, name="A"))
+        self.db.add_all([Product(id=n, sku=f"P{n}", name=f"P{n}", price=1) for n in (1, 2, 3)])
+        for product_id in (1, 2):
+            self.add_movements(product_id, (5, 7, 6))
+        self.db.commit()
+
+    def add_movements(self, product_id: int, quantities: tuple[int, ...], first_day: int = 0) -> None:
+        self.db.add_all([InventoryMovement(product_id=product_id, from_location_id=1, quantity=quantity,
+                                           timestamp=(first_day + day) * DAY)
+                         for day, quantity in enumerate(quantities)])
+
+    def trained(self) -> list[int]:
+        products = sorted(call.args[0] for call in self.train.call_args_list)
+        self.train.reset_mock()
+        return products
+
+    def stored(self, product_id: int) -> DemandForecast:
+        return self.db.get(DemandForecast, product_id, populate_existing=True)
+
+    def test_forecast_is_trained_once_per_history(self):
+        first = forecast.get_forecast(self.db, 1)
+        self.assertEqual([point["date"] for point in first["forecast"]], [3 * DAY, 4 * DAY, 5 * DAY])
+        self.assertEqual(self.trained(), [1])
+        self.assertEqual(forecast.get_forecast(self.db, 1), first)
+        self.assertEqual(self.trained(), [])
+        self.assertEqual(json.loads(self.stored(1).forecast), first["forecast"])
+
+        self.add_movements(1, (9,), first_day=3)
+        self.db.commit()
+        second = forecast.get_forecast(self.db, 1)
+        self.assertEqual(self.trained(), [1])
+        self.assertEqual(second["forecast"][0]["date"], 4 * DAY)
+
+    def test_product_without_movements(self):
+        self.assertEqual(forecast.get_forecast(self.db, 3), {"forecast": []})
+        self.assertEqual(self.trained(), [])
+        self.assertIsNone(self.stored(3))
+
+    def test_model_is_saved_with_its_data_version(self):
+        forecast.get_forecast(self.db, 1)
+        stored = self.stored(1)
+        self.assertEqual(stored.data_version, forecast.data_versions(self.db, [1])[1])
+        self.assertEqual(stored.model_path, os.path.join(self.model_dir, "1.joblib"))
+        self.assertEqual(joblib.load(stored.model_path)["data_version"], stored.data_version)
+
+        # Editing a movement changes the fingerprint even though the number of movements stays the same
+        self.db.query(InventoryMovement).filter_by(product_id=1, timestamp=0).update({"quantity": 50})
+        self.db.commit()
+        self.assertNotEqual(forecast.data_versions(self.db, [1])[1], stored.data_version)
+        forecast.get_forecast(self.db, 1)
+        self.assertEqual(joblib.load(stored.model_path)["data_version"], self.stored(1).data_version)
+
+        with patch.object(settings, "FORECAST_MODEL_DIR", ""):
+            self.add_movements(1, (9,), first_day=3)
+            self.db.commit()
+            forecast.get_forecast(self.db, 1)
+        self.assertIsNone(self.stored(1).model_path)
+
+    def test_pool_refresh_retrains_stale_products_only(self):
+        with ThreadPoolExecutor(max_workers=2) as executor, \
+                patch.object(forecast_module, "get_executor", return_value=executor):
+            self.assertEqual(forecast.refresh(self.db, batch_size=1), 2)
+            self.assertEqual(self.trained(), [1, 2])
+            self.assertEqual(forecast.refresh(self.db), 0)
+            self.assertEqual(self.trained(), [])
+
+            self.add_movements(2, (3,), first_day=3)
+            self.add_movements(3, (1, 2))
+            self.db.commit()
+            self.assertEqual(forecast.refresh(self.db), 2)
+            self.assertEqual(self.trained(), [2, 3])
+            self.assertEqual(forecast.refresh(self.db, product_ids=[1, 2]), 0)
+        self.assertEqual({product_id: self.stored(product_id).data_version for product_id in (1, 2, 3)},
+                         forecast.data_versions(self.db))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+# /server/tests/test_inventory_batch.py
+import json
+import unittest
+
+from fastapi import HTTPException
+
+from app.crud.inventory import inventory
+from app.models import Product, Location, Inventory, InventoryAdjustment, AuditLog
+from public_api.shared_schemas import InventoryUpdate, StocktakeCreate, StocktakeItem
+from tests.base import DatabaseTestCase
+
+
+class TestStockChanges(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.add_users(1)
+        self.db.add_all([Location(id=1, name="A"), Location(id=2, name="B"),
+                         Product(id=1, sku="P1", name="P1", price=2), Product(id=2, sku="P2", name="P2", price=5)])
+        self.db.add_all([Inventory(id=1, product_id=1, location_id=1, quantity=10),
+                         Inventory(id=2, product_id=2, location_id=1, quantity=4),
+                         Inventory(id=3, product_id=1, location_id=2, quantity=5, expiration_date=100)])
+        self.db.commit()
+
+    def quantities(self) -> dict[int, int]:
+        self.db.expire_all()
+        return {row.id: row.quantity for row in self.db.query(Inventory)}
+
+    def adjustments(self) -> list[tuple]:
+        return [(row.product_id, row.location_id, row.quantity_change, row.reason)
+                for row in self.db.query(InventoryAdjustment).order_by(InventoryAdjustment.id)]
+
+    def audit_entries(self) -> list[tuple]:
+        return [(row.user_id, row.record_id, json.loads(row.old_value), json.loads(row.new_value))
+                for row in self.db.query(AuditLog).order_by(AuditLog.id)]
+
+    def test_batch_update(self):
+        updated = inventory.batch_update(self.db, [
+            InventoryUpdate(product_id=1, location_id=1, quantity=12),
+            InventoryUpdate(product_id=9, location_id=1, quantity=1),
+            InventoryUpdate(product_id=1, location_id=2, quantity=None, expiration_date=200),
+            InventoryUpdate(product_id=1, location_id=1, quantity=15),
+            InventoryUpdate(product_id=2, location_id=1, quantity=4),
+        ], user_id=1)
+        self.assertEqual([(row.id, row.quantity) for row in updated], [(1, 15), (3, 5), (2, 4)])
+        self.assertEqual(self.quantities(), {1: 15, 2: 4, 3: 5})
+        self.assertEqual(self.db.get(Inventory, 3).expiration_date, 200)
+        self.assertEqual(self.adjustments(), [(1, 1, 5, "Batch update")])
+        self.assertEqual(self.audit_entries(), [(1, 1, {"quantity": 10}, {"quantity": 15}),
+                                                (1, 3, {"expiration_date": 100}, {"expiration_date": 200})])
+
+    def test_batch_update_needs_the_row_ids(self):
+        with self.assertRaises(HTTPException) as raised:
+            inventory.batch_update(self.db, [InventoryUpdate(product_id=1, location_id=1, quantity=12),
+                                             InventoryUpdate(product_id=2, quantity=1),
+                                             InventoryUpdate(location_id=2, quantity=1)])
+        self.assertEqual(raised.exception.status_code, 400)
+        self.assertIn("missing in updates 1, 2", raised.exception.detail)
+        self.assertEqual(self.quantities(), {1: 10, 2: 4, 3: 5})
+
+    def test_cycle_count(self):
+        updated = inventory.perform_cycle_count(self.db, 1, [
+            InventoryUpdate(product_id=1, quantity=7),
+            InventoryUpdate(product_id=2, quantity=None),
+            InventoryUpdate(product_id=9, quantity=3),
+            InventoryUpdate(product_id=1, quantity=8),
+        ], user_id=1)
+        self.assertEqual([(row.id, row.quantity) for row in updated], [(1, 8)])
+        self.assertEqual(self.quantities(), {1: 8, 2: 4, 3: 5})
+        self.assertEqual(self.adjustments(), [(1, 1, -2, "Cycle count")])
+        self.assertEqual(self.audit_entries(), [(1, 1, {"quantity": 10}, {"quantity": 8})])
+
+    def test_stocktake(self):
+        result = inventory.perform_stocktake(self.db, StocktakeCreate(location_id=1, items=[
+            StocktakeItem(product_id=1, counted_quantity=9),
+            StocktakeItem(product_id=2, counted_quantity=4),
+            StocktakeItem(product_id=9, counted_quantity=1),
+        ]), user_id=1)
+        self.assertEqual([(found.product_id, found.expected_quantity, found.discrepancy)
+                          for found in result.discrepancies], [(1, 10, -1)])
+        self.assertEqual((result.total_items, round(result.accuracy_percentage, 2)), (3, 33.33))
+        self.assertEqual(self.quantities(), {1: 9, 2: 4, 3: 5})
+        self.assertEqual(self.adjustments(), [(1, 1, -1, "Stocktake")])
+        self.assertEqual(self.audit_entries(), [(1, 1, {"quantity": 10}, {"quantity": 9})])
+
+
+if __name__ == "__main__":
+    unittest.main()
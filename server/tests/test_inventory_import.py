@@ -0,0 +1,127 @@
+# /server/tests/test_inventory_import.py
+import io
+import unittest
+from unittest.mock import patch
+
+from app.core.config import settings
+from app.crud.inventory import inventory
+from app.models import Inventory, Location, Product, Role
+from app.utils.inventory_import import CSV, NDJSON, iter_import_rows
+from tests.base import DatabaseTestCase
+
+
+def upload(text: str) -> io.BytesIO:
+    return io.BytesIO(text.encode())
+
+
+class TestImportParsing(unittest.TestCase):
+
+    def test_csv_rows_and_errors(self):
+        rows = list(iter_import_rows(upload(
+            "\ufeffsku,location_id,quantity,expiration_date\n"
+            "CHR-100,1,5,\n"
+            "CHR-100,one,5,\n"
+            "LMP-300,2,,\n"
+        ), CSV))
+        self.assertEqual([line_num for line_num, _ in rows], [2, 3, 4])
+        self.assertEqual((rows[0][1].sku, rows[0][1].quantity, rows[0][1].expiration_date), ("CHR-100", 5, None))
+        self.assertTrue(rows[1][1].startswith("location_id: "))
+        self.assertEqual(rows[2][1], "quantity: Field required")
+
+    def test_ndjson_rows_and_errors(self):
+        rows = list(iter_import_rows(upload(
+            '{"product_id": 1, "location_id": 1, "quantity": 2}\n'
+            "\n"
+            '{"product_id": 1, "location_id": 1\n'
+            "[1, 2]\n"
+        ), NDJSON))
+        self.assertEqual([line_num for line_num, _ in rows], [1, 3, 4])
+        self.assertEqual(rows[0][1].product_id, 1)
+        self.assertTrue(rows[1][1].startswith("invalid JSON"))
+        self.assertEqual(rows[2][1], "expected a JSON object")
+
+    def test_lines_that_are_not_utf8(self):
+        rows = list(iter_import_rows(io.BytesIO(
+            "sku,location_id,quantity\n".encode() + "CHR-100,1,5,Caf\xe9\n".encode("latin-1") + b"LMP-300,2,1\n"
+        ), CSV))
+        self.assertEqual([(line_num, row if isinstance(row, str) else row.sku) for line_num, row in rows],
+                         [(2, "not valid UTF-8 text"), (3, "LMP-300")])
+        rows = list(iter_import_rows(io.BytesIO(
+            b'{"sku": "CHR-100", "location_id": 1, "quantity": 1}\n{"sku": "\xff"}\n'
+        ), NDJSON))
+        self.assertEqual([(line_num, isinstance(row, str)) for line_num, row in rows], [(1, False), (2, True)])
+        self.assertEqual(rows[1][1], "not valid UTF-8 text")
+
+
+class TestImportRows(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db.add_all([Location(id=1, name="A"), Location(id=2, name="B"),
+                         Product(id=1, sku="CHR-100", name="Chair", price=1),
+                         Product(id=2, sku="LMP-300", name="Lamp", price=1)])
+        self.db.add(Inventory(product_id=1, location_id=1, quantity=10, expiration_date=50))
+        self.db.commit()
+
+    def stock(self) -> dict[tuple[int, int], tuple[int, int | None]]:
+        self.db.expire_all()
+        return {(row.product_id, row.location_id): (row.quantity, row.expiration_date)
+                for row in self.db.query(Inventory)}
+
+    def test_valid_and_invalid_rows(self):
+        result = inventory.import_rows(self.db, rows=iter_import_rows(upload(
+            "product_id,sku,location_id,quantity\n"
+            ",LMP-300,2,4\n"
+            ",NOPE-1,1,1\n"
+            "9,,1,1\n"
+            "2,,7,1\n"
+            ",,1,1\n"
+            "2,,1,x\n"
+            "1,,2,3\n"
+        ), CSV))
+        self.assertEqual((result.success_count, result.failure_count), (2, 5))
+        self.assertEqual(result.errors, [
+            "Row 6: either product_id or sku is required",
+            "Row 7: quantity: Input should be a valid integer, unable to parse string as an integer",
+            "Row 3: unknown SKU 'NOPE-1'",
+            "Row 4: unknown product_id 9",
+            "Row 5: unknown location_id 7",
+        ])
+        self.assertEqual(self.stock(), {(1, 1): (10, 50), (2, 2): (4, None), (1, 2): (3, None)})
+
+    def test_duplicate_rows_add_up(self):
+        # Same (product, location) by id and by SKU, within a chunk and across chunks, on top of existing stock
+        lines = ['{"product_id": 1, "location_id": 1, "quantity": 2}',
+                 '{"sku": "CHR-100", "location_id": 1, "quantity": 3, "expiration_date": 90}',
+                 '{"product_id": 2, "location_id": 1, "quantity": 1}',
+                 '{"sku": "CHR-100", "location_id": 1, "quantity": 5}',
+                 '{"product_id": 2, "location_id": 1, "quantity": 1}']
+        with patch.object(settings, "BULK_CHUNK_SIZE", 3):
+            result = inventory.import_rows(self.db, rows=iter_import_rows(upload("\n".join(lines)), NDJSON))
+        self.assertEqual((result.success_count, result.failure_count, result.errors), (5, 0, []))
+        self.assertEqual(self.stock(), {(1, 1): (20, 90), (2, 1): (2, None)})
+
+    def test_errors_are_capped(self):
+        with patch.object(settings, "BULK_IMPORT_MAX_ERRORS", 2):
+            result = inventory.import_rows(self.db, rows=[(n, "bad row") for n in range(1, 6)])
+        self.assertEqual((result.failure_count, result.errors), (5, ["Row 1: bad row", "Row 2: bad row"]))
+
+    def test_file_endpoint(self):
+        self.db.add(Role(id=1, name="Admin"))
+        self.add_users(1, role_id=1)
+        client = self.client_as(1)
+        response = client.post("/api/v1/inventory/bulk_import/file",
+                               files={"file": ("stock.csv", b"sku,location_id,quantity\nLMP-300,1,6\nNOPE,1,1\n")})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.json()["success_count"], response.json()["errors"]),
+                         (1, ["Row 3: unknown SKU 'NOPE'"]))
+        response = client.post("/api/v1/inventory/bulk_import/file", files={
+            "file": ("stock.csv", "sku,location_id,quantity\nLMP-300,1,1,Lámpara\n".encode("cp1252"))})
+        self.assertEqual((response.status_code, response.json()["errors"]), (200, ["Row 2: not valid UTF-8 text"]))
+        response = client.post("/api/v1/inventory/bulk_import/file", files={"file": ("stock.xlsx", b"")})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.stock()[2, 1], (6, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
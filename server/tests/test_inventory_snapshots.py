@@ -0,0 +1,65 @@
+# /server/tests/test_inventory_snapshots.py
+import time
+import unittest
+
+from app.core.cache import inventory_snapshot_cache
+from app.crud.inventory_snapshot import inventory_snapshot
+from app.models import Product, Location, Inventory, InventorySnapshot
+from app.utils.time import day_start, DAY_SECONDS
+from tests.base import DatabaseTestCase
+
+DAY = day_start(1_700_000_000)
+
+
+class TestInventorySnapshots(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db.add_all([Location(id=1, name="A"), Location(id=2, name="B"),
+                         Product(id=1, sku="P1", name="P1", price=2), Product(id=2, sku="P2", name="P2", price=5)])
+        self.db.add_all([Inventory(product_id=1, location_id=1, quantity=10),
+                         Inventory(product_id=1, location_id=2, quantity=5),
+                         Inventory(product_id=2, location_id=1, quantity=4)])
+        self.db.commit()
+
+    def test_capture_stores_rows_and_daily_total(self):
+        self.assertEqual(inventory_snapshot.capture(self.db, DAY + 3600), 3)
+        self.assertEqual(self.db.query(InventorySnapshot).filter_by(snapshot_date=DAY).count(), 3)
+        self.assertEqual(inventory_snapshot.daily_totals(self.db, DAY, DAY), [(DAY, 19, 50.0)])
+
+    def test_recapture_replaces_the_day(self):
+        inventory_snapshot.capture(self.db, DAY)
+        self.db.query(Inventory).filter_by(product_id=2).delete()
+        self.db.commit()
+        self.assertEqual(inventory_snapshot.capture(self.db, DAY), 2)
+        self.assertEqual(inventory_snapshot.daily_totals(self.db, DAY, DAY), [(DAY, 15, 30.0)])
+
+    def test_missing_days_carry_the_previous_totals_forward(self):
+        inventory_snapshot.capture(self.db, DAY + DAY_SECONDS)
+        self.db.query(Inventory).filter_by(product_id=1, location_id=1).update({"quantity": 1})
+        self.db.commit()
+        inventory_snapshot.capture(self.db, DAY + 3 * DAY_SECONDS)
+
+        totals = inventory_snapshot.daily_totals(self.db, DAY, DAY + 4 * DAY_SECONDS)
+        self.assertEqual([quantity for _, quantity, _ in totals], [19, 19, 10, 10])
+        self.assertEqual([day for day, _, _ in totals], [DAY + i * DAY_SECONDS for i in range(1, 5)])
+        self.assertEqual(inventory_snapshot.daily_totals(self.db, 0, DAY), [])
+
+    def test_reads_capture_today_once(self):
+        today = day_start(int(time.time()))
+        self.assertEqual(inventory_snapshot.daily_totals(self.db, today, today), [(today, 19, 50.0)])
+        self.assertIsNotNone(inventory_snapshot_cache.get(today))
+
+        self.db.query(Inventory).filter_by(product_id=2).update({"quantity": 40})
+        self.db.commit()
+        self.assertIsNone(inventory_snapshot_cache.get(today))
+        statements = self.record_statements()
+        self.assertEqual(inventory_snapshot.daily_totals(self.db, today, today), [(today, 19, 50.0)])
+        self.assertFalse([statement for statement in statements if not statement.startswith("SELECT")])
+
+        inventory_snapshot.ensure_current(self.db)
+        self.assertEqual(inventory_snapshot.daily_totals(self.db, today, today), [(today, 55, 230.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+# /server/tests/test_inventory_summary.py
+import unittest
+
+from app.core.cache import inventory_summary_cache
+from app.crud.inventory import inventory
+from app.models import Inventory, Location, Product, ProductCategory
+from tests.base import DatabaseTestCase
+
+
+class TestInventorySummary(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        # Furniture > Chairs > Office chairs, and Lighting without any stock
+        self.db.add_all([ProductCategory(id=1, name="Furniture"),
+                         ProductCategory(id=2, name="Chairs", parent_category_id=1),
+                         ProductCategory(id=3, name="Office chairs", parent_category_id=2),
+                         ProductCategory(id=4, name="Lighting")])
+        self.db.add_all([Location(id=1, name="A"), Location(id=2, name="B"),
+                         Product(id=1, sku="P1", name="P1", price=1, category_id=3),
+                         Product(id=2, sku="P2", name="P2", price=1, category_id=2),
+                         Product(id=3, sku="P3", name="P3", price=1, category_id=1),
+                         Product(id=4, sku="P4", name="P4", price=1)])
+        self.db.add_all([Inventory(id=1, product_id=1, location_id=1, quantity=5),
+                         Inventory(id=2, product_id=1, location_id=2, quantity=2),
+                         Inventory(id=3, product_id=2, location_id=1, quantity=4),
+                         Inventory(id=4, product_id=3, location_id=1, quantity=1),
+                         Inventory(id=5, product_id=4, location_id=1, quantity=50)])
+        self.db.commit()
+
+    def test_subcategories_roll_up_into_their_root(self):
+        summary = inventory.get_inventory_summary(self.db)
+        self.assertEqual(summary.category_quantities, {"Furniture": 12, "Lighting": 0})
+        self.assertEqual((summary.total_items, summary.total_categories), (12, 4))
+
+    def test_cached_until_an_inventory_commit(self):
+        first = inventory.get_inventory_summary(self.db)
+        statements = self.record_statements()
+        self.assertIs(inventory.get_inventory_summary(self.db), first)
+        self.assertEqual(statements, [])
+
+        self.db.query(Inventory).filter_by(id=1).update({"quantity": 8})
+        self.db.rollback()
+        self.assertIs(inventory_summary_cache.get("summary"), first)
+
+        self.db.query(Inventory).filter_by(id=1).update({"quantity": 8})
+        self.db.commit()
+        self.assertIsNone(inventory_summary_cache.get("summary"))
+        self.assertEqual(inventory.get_inventory_summary(self.db).category_quantities, {"Furniture": 15, "Lighting": 0})
+
+        self.db.get(Product, 4).category_id = 4
+        self.db.commit()
+        self.assertEqual(inventory.get_inventory_summary(self.db).category_quantities,
+                         {"Furniture": 15, "Lighting": 50})
+
+
+if __name__ == "__main__":
+    unittest.main()
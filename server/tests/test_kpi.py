@@ -0,0 +1,68 @@
+# /server/tests/test_kpi.py
+import time
+import unittest
+
+from app.crud.kpi import kpi
+from app.crud.reports import reports
+from app.models import Product, Location, Inventory, Order, OrderDailyStats
+from app.utils.time import day_start, DAY_SECONDS
+from tests.base import DatabaseTestCase
+
+TODAY = day_start(int(time.time()))
+
+
+class TestKPIDashboard(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db.add_all([Location(id=1, name="A"), Product(id=1, sku="P1", name="P1", price=2)])
+        self.db.add(Inventory(product_id=1, location_id=1, quantity=10))
+        self.db.add_all([
+            Order(order_date=TODAY + 60, status="pending", total_amount=30),
+            Order(order_date=TODAY - DAY_SECONDS + 60, status="completed", total_amount=10),
+            Order(order_date=TODAY - 8 * DAY_SECONDS, status="completed", total_amount=5),
+            Order(order_date=TODAY - 400 * DAY_SECONDS, status="completed", total_amount=99),
+        ])
+        self.db.commit()
+        kpi._rebuilt_on = None
+
+    def metrics(self) -> dict:
+        return {metric.name: (metric.value, metric.trend) for metric in reports.get_kpi_dashboard(self.db).metrics}
+
+    def test_dashboard_from_materialized_figures(self):
+        self.assertEqual(self.metrics(), {
+            "Daily Revenue": (30.0, "up"),
+            "Weekly Orders": (2.0, "up"),
+            "Inventory Value": (20.0, "stable"),
+            "Pending Shipments": (1.0, "stable"),
+        })
+
+    def test_fresh_figures_are_read_without_aggregating_orders(self):
+        kpi.refresh(self.db)
+        statements = self.record_statements()
+        self.metrics()
+        self.assertEqual(len(statements), 2)
+        self.assertFalse(any("FROM orders" in statement for statement in statements))
+
+    def test_writes_mark_the_figures_dirty(self):
+        kpi.refresh(self.db)
+        self.assertFalse(kpi.refresh_if_dirty(self.db))
+
+        self.db.add(Order(order_date=TODAY + 120, status="pending", total_amount=5))
+        self.db.commit()
+        self.assertTrue(kpi.refresh_if_dirty(self.db))
+        self.assertEqual(self.metrics()["Pending Shipments"], (2.0, "stable"))
+
+    def test_incremental_refresh_keeps_old_buckets(self):
+        kpi.refresh(self.db, full=True)
+        self.db.query(Order).filter(Order.total_amount == 99).update({"total_amount": 1})
+        self.db.commit()
+        old_day = TODAY - 400 * DAY_SECONDS
+        kpi.refresh(self.db)
+        self.assertEqual(self.db.get(OrderDailyStats, old_day, populate_existing=True).revenue, 99)
+        kpi.refresh(self.db, full=True)
+        self.assertEqual(self.db.get(OrderDailyStats, old_day, populate_existing=True).revenue, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
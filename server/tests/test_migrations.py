@@ -0,0 +1,38 @@
+# /server/tests/test_migrations.py
+import os
+import tempfile
+import unittest
+
+import sqlalchemy as sa
+from alembic import command
+from alembic.config import Config
+
+ALEMBIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic")
+
+
+class TestMigrations(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.url = f"sqlite:///{os.path.join(directory.name, 'migrations.db')}"
+        # No config file, so running env.py leaves the logging configuration alone
+        self.config = Config()
+        self.config.set_main_option("script_location", ALEMBIC_DIR)
+        self.config.set_main_option("sqlalchemy.url", self.url)
+
+    def tables(self) -> set[str]:
+        engine = sa.create_engine(self.url)
+        self.addCleanup(engine.dispose)
+        return set(sa.inspect(engine).get_table_names())
+
+    def test_upgrade_and_downgrade_an_empty_database(self):
+        command.upgrade(self.config, "head")
+        self.assertTrue({"inventory", "users", "inventory_snapshots", "waves"} <= self.tables())
+        command.downgrade(self.config, "base")
+        self.assertEqual(self.tables(), {"alembic_version"})
+        command.upgrade(self.config, "head")
+
+
+if __name__ == "__main__":
+    unittest.main()
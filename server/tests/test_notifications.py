@@ -0,0 +1,69 @@
+# /server/tests/test_notifications.py
+import asyncio
+import unittest
+
+from app.core.pubsub import broker, notification_channel
+from app.crud.notification import notification
+from app.models import Notification
+from public_api.shared_schemas import NotificationCreate, NotificationUpdate
+from tests.base import DatabaseTestCase
+
+
+class TestNotificationCounters(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.add_users(1, 2)
+
+    def notify(self, user_id: int, message: str) -> Notification:
+        return notification.create(self.db, obj_in=NotificationCreate(user_id=user_id, message=message, timestamp=1))
+
+    def unread(self, user_id: int = 1) -> int:
+        return notification.get_unread_count(self.db, user_id)
+
+    def test_counter_follows_every_write(self):
+        first, second, third = (self.notify(1, message) for message in ("a", "b", "c"))
+        self.notify(2, "d")
+        self.assertEqual((self.unread(1), self.unread(2)), (3, 1))
+
+        notification.mark_notification_as_read(self.db, first.id, 1)
+        notification.mark_notification_as_read(self.db, first.id, 1)
+        self.assertIsNone(notification.mark_notification_as_read(self.db, first.id, 2))
+        self.assertEqual(self.unread(), 2)
+
+        unread_again = NotificationUpdate(is_read=False)
+        notification.update(self.db, db_obj=self.db.get(Notification, first.id), obj_in=unread_again)
+        self.assertEqual(self.unread(), 3)
+        notification.remove(self.db, id=second.id)
+        self.assertEqual(self.unread(), 2)
+        self.assertEqual([found.id for found in notification.get_user_unread_notifications(self.db, 1)],
+                         [third.id, first.id])
+
+    def test_mark_all_as_read_is_one_update(self):
+        for message in ("a", "b", "c"):
+            self.notify(1, message)
+        self.notify(2, "d")
+        statements = self.record_statements()
+        marked = notification.mark_all_as_read(self.db, 1)
+        self.assertEqual(len(marked), 3)
+        self.assertTrue(all(found.is_read for found in marked))
+        self.assertEqual([statement.split()[:2] for statement in statements],
+                         [["UPDATE", "notifications"], ["UPDATE", "users"]])
+        self.assertIn("notifications.is_read = 0", statements[0])
+        self.assertEqual((self.unread(1), self.unread(2)), (0, 1))
+
+    def test_writes_are_published(self):
+        async def scenario():
+            with broker.subscribe(notification_channel(1)) as subscription:
+                created = self.notify(1, "Dock 4 is free")
+                notification.mark_all_as_read(self.db, 1)
+                await asyncio.sleep(0)
+                return created, await subscription.get(), await subscription.get()
+
+        created, new, read = asyncio.run(scenario())
+        self.assertEqual((new["type"], new["notification"]["id"], new["unread_count"]), ("notification", created.id, 1))
+        self.assertEqual(read, {"type": "unread_count", "unread_count": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+# /server/tests/test_pagination.py
+import unittest
+
+from app.api.deps import NEXT_CURSOR_HEADER
+from app.crud.audit import audit_log
+from app.models import AuditLog, Inventory, Location, Product, ProductCategory, Role
+from public_api.shared_schemas import AuditLogFilter
+from tests.base import DatabaseTestCase
+
+
+class TestCursorPagination(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db.add(Role(id=1, name="staff"))
+        self.add_users(1, role_id=1)
+        self.client = self.client_as(1)
+
+    def walk(self, url: str, **params) -> list[list[int]]:
+        """Ids of every page of `url`, following the next-page cursors from the first page on."""
+        pages, cursor = [], ""
+        while cursor is not None:
+            response = self.client.get(url, params={**params, "cursor": cursor})
+            self.assertEqual(response.status_code, 200)
+            pages.append([item["id"] for item in response.json()["items"]])
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            self.assertEqual(response.json()["next_cursor"], cursor)
+        return pages
+
+    def walk_audit_logs(self, limit: int, **filters) -> list[list[int]]:
+        pages, cursor = [], ""
+        while cursor is not None:
+            page = audit_log.get_multi_with_filter(self.db, limit=limit, cursor=cursor,
+                                                   filter_params=AuditLogFilter(**filters))
+            pages.append([entry.id for entry in page])
+            cursor = page.next_cursor
+        return pages
+
+    def test_walk_across_ties_in_the_sort_key(self):
+        # Audit logs page by (timestamp, id) descending; most timestamps are shared by several entries
+        timestamps = [100, 80, 100, 90, 100, 80, 90, 70]
+        self.db.add_all([AuditLog(id=n + 1, user_id=1, action_type="Update" if n % 2 else "Create",
+                                  table_name="inventory", record_id=n, timestamp=timestamp)
+                         for n, timestamp in enumerate(timestamps)])
+        self.db.commit()
+        newest_first = [5, 3, 1, 7, 4, 6, 2, 8]
+
+        self.assertEqual(self.walk_audit_logs(3), [[5, 3, 1], [7, 4, 6], [2, 8]])
+        self.assertEqual(self.walk_audit_logs(2), [newest_first[i:i + 2] for i in range(0, 8, 2)])
+        self.assertEqual(self.walk_audit_logs(2, action_type="Update"), [[4, 6], [2, 8]])
+        self.assertEqual(self.walk_audit_logs(10), [newest_first])
+
+    def test_filtered_totals(self):
+        self.db.add_all([Location(id=1, name="A"), Location(id=2, name="B"), ProductCategory(id=1, name="C")])
+        self.db.add_all([Product(id=n, sku=f"CHR-{n}" if n % 2 else f"LMP-{n}", name=f"P{n}", price=1,
+                                 category_id=1) for n in range(1, 7)])
+        self.db.add_all([Inventory(id=n, product_id=n, location_id=1 + n % 2, quantity=n * 10)
+                         for n in range(1, 7)])
+        self.db.commit()
+
+        filters = {"location_id": 2, "quantity_min": 20}
+        self.assertEqual(self.walk("/api/v1/inventory/", limit=1, **filters), [[3], [5]])
+        for params in ({"cursor": ""}, {"skip": 1}):
+            body = self.client.get("/api/v1/inventory/", params={"limit": 1, **filters, **params}).json()
+            self.assertEqual((len(body["items"]), body["total"]), (1, 2))
+        self.assertEqual(self.client.get("/api/v1/inventory/", params={"limit": 2, "sku": "lmp"}).json()["total"], 3)
+        self.assertEqual(self.client.get("/api/v1/inventory/", params={"limit": 2}).json()["total"], 6)
+
+    def test_invalid_cursor(self):
+        self.assertEqual(self.client.get("/api/v1/inventory/", params={"cursor": "not-a-cursor"}).status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
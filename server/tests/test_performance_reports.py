@@ -0,0 +1,127 @@
+# /server/tests/test_performance_reports.py
+import unittest
+
+from app.crud.pick_list import pick_list
+from app.crud.reports import reports
+from app.models import (InventoryDailyTotal, Location, Order, OrderItem, PickList, PickListItem, Product, Role, Task,
+                        Zone)
+from app.utils.time import day_start, DAY_SECONDS
+from public_api.shared_schemas import ReportBreakdown
+from tests.base import DatabaseTestCase
+
+DAY = day_start(1_700_000_000)
+MINUTE = 60
+
+
+class TestPickingPerformance(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db.add_all([Zone(id=1, name="Z1"), Zone(id=2, name="Z2"), Product(id=1, sku="P1", name="P1", price=1),
+                         Location(id=1, name="A", zone_id=1), Location(id=2, name="B", zone_id=2),
+                         Location(id=3, name="Dock")])
+        # Day 1: 30 minutes, 8 units, 1 of 2 lines accurate. Day 2: 60 minutes, 12 units, both lines accurate
+        self.db.add_all([PickList(id=1, status="completed", created_at=DAY, completed_at=DAY + 30 * MINUTE),
+                         PickList(id=2, status="completed", created_at=DAY + DAY_SECONDS,
+                                  completed_at=DAY + DAY_SECONDS + 60 * MINUTE),
+                         PickList(id=3, status="pending", created_at=DAY),
+                         PickList(id=4, status="completed", created_at=DAY + 9 * DAY_SECONDS,
+                                  completed_at=DAY + 9 * DAY_SECONDS + MINUTE)])
+        self.db.add_all([PickListItem(pick_list_id=1, product_id=1, location_id=1, quantity=5, picked_quantity=5),
+                         PickListItem(pick_list_id=1, product_id=1, location_id=2, quantity=4, picked_quantity=3),
+                         PickListItem(pick_list_id=2, product_id=1, location_id=1, quantity=10, picked_quantity=10),
+                         PickListItem(pick_list_id=2, product_id=1, location_id=3, quantity=2, picked_quantity=2),
+                         PickListItem(pick_list_id=3, product_id=1, location_id=1, quantity=7, picked_quantity=0),
+                         PickListItem(pick_list_id=4, product_id=1, location_id=1, quantity=1, picked_quantity=0)])
+        self.db.commit()
+        self.end = DAY + 2 * DAY_SECONDS
+
+    @staticmethod
+    def figures(group) -> tuple:
+        return (group.average_picking_time, round(group.items_picked_per_hour, 2), group.accuracy_rate)
+
+    def test_totals(self):
+        performance = pick_list.get_performance(self.db, DAY, self.end)
+        self.assertEqual(self.figures(performance), (45, 13.33, 0.75))
+        self.assertIsNone(performance.breakdown)
+
+    def test_breakdown_per_completion_day(self):
+        breakdown = pick_list.get_performance(self.db, DAY, self.end, ReportBreakdown.DAY).breakdown
+        self.assertEqual([(group.key, group.pick_lists, *self.figures(group)) for group in breakdown],
+                         [(DAY, 1, 30, 16, 0.5), (DAY + DAY_SECONDS, 1, 60, 12, 1)])
+
+    def test_breakdown_per_zone(self):
+        # A pick list counts towards every zone it visits with its whole duration; key None is outside any zone
+        breakdown = pick_list.get_performance(self.db, DAY, self.end, ReportBreakdown.ZONE).breakdown
+        self.assertEqual([(group.key, group.pick_lists, *self.figures(group)) for group in breakdown],
+                         [(None, 1, 60, 2, 1), (1, 2, 45, 10, 1), (2, 1, 30, 6, 0)])
+
+    def test_empty_range(self):
+        start = DAY + 20 * DAY_SECONDS
+        performance = pick_list.get_performance(self.db, start, start + DAY_SECONDS, ReportBreakdown.DAY)
+        self.assertEqual((self.figures(performance), performance.breakdown), ((0, 0, 1), []))
+
+
+class TestWarehousePerformance(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db.add_all([Product(id=1, sku="P1", name="P1", price=10), Product(id=2, sku="P2", name="P2", price=5)])
+        # Day 1: 2 orders (1 completed) worth 30 at cost. Day 2: 1 completed order worth 15. Day 6 is out of range
+        self.db.add_all([Order(id=1, status="completed", order_date=DAY + 100),
+                         Order(id=2, status="pending", order_date=DAY + 200),
+                         Order(id=3, status="completed", order_date=DAY + DAY_SECONDS),
+                         Order(id=4, status="completed", order_date=DAY + 5 * DAY_SECONDS)])
+        self.db.add_all([OrderItem(order_id=1, product_id=1, quantity=2, unit_price=12),
+                         OrderItem(order_id=2, product_id=1, quantity=1, unit_price=12),
+                         OrderItem(order_id=3, product_id=2, quantity=3, unit_price=6),
+                         OrderItem(order_id=4, product_id=2, quantity=9, unit_price=6)])
+        # Completed picking tasks of 10 minutes on day 1 and 30 on day 2; the others don't count
+        self.db.add_all([Task(task_type="picking", status="completed", created_at=DAY, due_date=DAY + 10 * MINUTE),
+                         Task(task_type="picking", status="completed", created_at=DAY + DAY_SECONDS,
+                              due_date=DAY + DAY_SECONDS + 30 * MINUTE),
+                         Task(task_type="picking", status="pending", created_at=DAY, due_date=DAY + 99 * MINUTE),
+                         Task(task_type="counting", status="completed", created_at=DAY, due_date=DAY + 99 * MINUTE)])
+        # Inventory worth 40 carried into day 1 from the day before, 60 on day 2
+        self.db.add_all([InventoryDailyTotal(snapshot_date=DAY - DAY_SECONDS, quantity=4, value=40),
+                         InventoryDailyTotal(snapshot_date=DAY + DAY_SECONDS, quantity=6, value=60)])
+        self.db.commit()
+        self.end = DAY + DAY_SECONDS + 3600
+
+    @staticmethod
+    def metrics(metrics) -> dict[str, float]:
+        return {metric.name: round(metric.value, 2) for metric in metrics}
+
+    def test_totals(self):
+        report = reports.get_warehouse_performance(self.db, DAY, self.end)
+        self.assertEqual(self.metrics(report.metrics), {"Order Fulfillment Rate": 66.67,
+                                                        "Average Task Completion Time": 20,
+                                                        "Inventory Turnover Rate": 0.9})
+        self.assertIsNone(report.breakdown)
+
+    def test_breakdown_per_day(self):
+        report = reports.get_warehouse_performance(self.db, DAY, self.end, ReportBreakdown.DAY)
+        self.assertEqual([(period.day, self.metrics(period.metrics)) for period in report.breakdown], [
+            (DAY, {"Order Fulfillment Rate": 50, "Average Task Completion Time": 10, "Inventory Turnover Rate": 0.75}),
+            (DAY + DAY_SECONDS, {"Order Fulfillment Rate": 100, "Average Task Completion Time": 30,
+                                 "Inventory Turnover Rate": 0.25}),
+        ])
+        self.assertEqual(self.metrics(report.metrics), self.metrics(
+            reports.get_warehouse_performance(self.db, DAY, self.end).metrics))
+
+    def test_empty_range(self):
+        start = DAY + 20 * DAY_SECONDS
+        report = reports.get_warehouse_performance(self.db, start, start + DAY_SECONDS, ReportBreakdown.DAY)
+        self.assertEqual(set(self.metrics(report.metrics).values()), {0})
+        self.assertEqual(report.breakdown, [])
+
+    def test_zone_breakdown_is_rejected(self):
+        self.db.add(Role(id=1, name="staff"))
+        self.add_users(1, role_id=1)
+        response = self.client_as(1).get("/api/v1/reports/warehouse_performance",
+                                         params={"start_date": DAY, "end_date": self.end, "breakdown": "zone"})
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
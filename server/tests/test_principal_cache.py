@@ -0,0 +1,85 @@
+# /server/tests/test_principal_cache.py
+import unittest
+
+from fastapi import HTTPException
+
+from app import crud
+from app.api import deps
+from app.core.cache import principal_cache
+from app.models import Permission, Role, RolePermission, User
+from public_api.permissions import PermissionName, PermissionType
+from public_api.shared_schemas import RoleUpdate, RolePermissionCreate, UserUpdate
+from tests.base import DatabaseTestCase
+
+
+class TestPrincipalCache(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        principal_cache.clear()
+        self.addCleanup(principal_cache.clear)
+        self.db.add_all([Role(id=1, name="staff"), Permission(id=1, name=PermissionName.INVENTORY.value),
+                         RolePermission(role_id=1, permission_id=1, can_read=True)])
+        self.add_users(1, role_id=1)
+        self.token = crud.token.create_user_tokens(self.db, 1).access_token
+
+    def current_user(self) -> User:
+        # As in a request of its own: a cached principal is rebuilt into a session that hasn't loaded the user
+        self.db.expunge_all()
+        return deps.get_current_active_user(deps.get_current_user(self.db, self.token))
+
+    def can_write_inventory(self) -> bool:
+        return deps.get_permission_manager(self.token, self.current_user()).has_permission(
+            PermissionName.INVENTORY, PermissionType.WRITE)
+
+    def test_cached_user_is_rebuilt_without_queries(self):
+        self.current_user()
+        self.assertIsNotNone(principal_cache.get(self.token))
+        statements = self.record_statements()
+        user = self.current_user()
+        self.assertEqual((user.id, user.role.name, user.role.role_permissions[0].permission.name),
+                         (1, "staff", PermissionName.INVENTORY.value))
+        self.assertEqual(statements, [])
+
+    def test_volatile_counters_are_not_cached(self):
+        self.current_user()
+        self.assertNotIn("unread_notification_count", principal_cache.get(self.token).user)
+        self.db.query(User).filter_by(id=1).update({"unread_notification_count": 3, "last_login": 100})
+        self.db.commit()
+        user = self.current_user()
+        self.assertEqual((user.unread_notification_count, user.last_login), (3, 100))
+
+    def test_logout_invalidates(self):
+        self.current_user()
+        crud.token.revoke_all_user_tokens(self.db, 1)
+        self.assertIsNone(principal_cache.get(self.token))
+        with self.assertRaises(HTTPException) as raised:
+            self.current_user()
+        self.assertEqual(raised.exception.status_code, 401)
+
+    def test_deactivation_invalidates(self):
+        self.current_user()
+        crud.user.update(self.db, db_obj=self.db.get(User, 1), obj_in=UserUpdate(is_active=False))
+        self.assertIsNone(principal_cache.get(self.token))
+        with self.assertRaises(HTTPException) as raised:
+            self.current_user()
+        self.assertEqual(raised.exception.status_code, 400)
+
+    def test_role_and_permission_edits_invalidate(self):
+        self.assertFalse(self.can_write_inventory())
+        write = RolePermissionCreate(permission_id=1, can_read=True, can_write=True, can_edit=False, can_delete=False)
+        crud.role.update(self.db, db_obj=self.db.get(Role, 1), obj_in=RoleUpdate(permissions=[write]))
+        self.assertIsNone(principal_cache.get(self.token))
+        self.assertTrue(self.can_write_inventory())
+
+        crud.user.update_user_permissions(self.db, user_id=1, permissions=[RolePermissionCreate(permission_id=1)])
+        self.assertIsNone(principal_cache.get(self.token))
+        self.assertFalse(self.can_write_inventory())
+
+        self.current_user()
+        crud.permission.update(self.db, db_obj=self.db.get(Permission, 1), obj_in={"name": "Stock"})
+        self.assertIsNone(principal_cache.get(self.token))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+# /server/tests/test_product_lookup.py
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import update
+
+from app.crud.product_lookup import product_lookup
+from app.models import Product, Location, Inventory
+from tests.base import DatabaseTestCase
+
+
+class TestProductLookup(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db.add_all([Location(id=1, name="A-01"), Location(id=2, name="B-07")])
+        self.db.add_all([Product(id=1, sku="CHR-100", name="Chair", barcode="4006381333931", price=120),
+                         Product(id=2, sku="LMP-300", name="Lamp", price=30)])
+        self.db.add_all([Inventory(product_id=1, location_id=1, quantity=5),
+                         Inventory(product_id=1, location_id=2, quantity=7)])
+        self.db.commit()
+
+    def test_lookup_by_barcode_or_sku(self):
+        by_barcode = product_lookup.lookup(self.db, "4006381333931")
+        self.assertEqual((by_barcode.product_id, by_barcode.sku, by_barcode.on_hand), (1, "CHR-100", 12))
+        self.assertEqual([(stock.location_name, stock.quantity) for stock in by_barcode.stock],
+                         [("A-01", 5), ("B-07", 7)])
+        without_stock = product_lookup.lookup(self.db, " LMP-300 ")
+        self.assertEqual((without_stock.product_id, without_stock.on_hand, without_stock.stock), (2, 0, []))
+        self.assertIsNone(product_lookup.lookup(self.db, "chr-100"))
+
+    def test_batch_is_served_from_memory_once_warm(self):
+        self.assertTrue(product_lookup.refresh_if_dirty(self.db))
+        self.assertFalse(product_lookup.refresh_if_dirty(self.db))
+        codes = ["CHR-100", "NOPE", "LMP-300", "4006381333931"]
+        result = product_lookup.lookup_many(self.db, codes)
+        self.assertEqual([found.product_id for found in result.products], [1, 2, 1])
+        self.assertEqual(result.missing, ["NOPE"])
+        statements = self.record_statements()
+        product_lookup.lookup_many(self.db, codes)
+        self.assertEqual(statements, [])
+
+    def test_writes_invalidate(self):
+        self.assertEqual(product_lookup.lookup(self.db, "CHR-100").on_hand, 12)
+        self.db.execute(update(Inventory).where(Inventory.location_id == 1).values(quantity=1))
+        self.db.commit()
+        self.assertEqual(product_lookup.lookup(self.db, "CHR-100").on_hand, 8)
+
+        self.db.execute(update(Product).where(Product.id == 2).values(barcode="5012345678900"))
+        self.db.commit()
+        self.assertEqual(product_lookup.lookup(self.db, "5012345678900").product_id, 2)
+
+    def test_product_write_committed_while_building_is_not_lost(self):
+        build = product_lookup._build
+
+        def build_then_write(db):
+            index = build(db)
+            # Another request gives product 2 a barcode after the catalogue was read
+            self.db.execute(update(Product).where(Product.id == 2).values(barcode="5012345678900"))
+            self.db.commit()
+            return index
+
+        with patch.object(product_lookup, "_build", side_effect=build_then_write):
+            self.assertIsNone(product_lookup.lookup(self.db, "5012345678900"))
+        self.assertEqual(product_lookup.lookup(self.db, "5012345678900").product_id, 2)
+
+    def test_failed_build_is_retried(self):
+        with patch.object(product_lookup, "_build", side_effect=RuntimeError("database gone")):
+            with self.assertRaises(RuntimeError):
+                product_lookup.lookup(self.db, "CHR-100")
+        self.assertTrue(product_lookup.refresh_if_dirty(self.db))
+        self.assertEqual(product_lookup.lookup(self.db, "CHR-100").product_id, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
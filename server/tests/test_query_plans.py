@@ -0,0 +1,80 @@
+# /server/tests/test_query_plans.py
+import unittest
+
+from sqlalchemy import create_engine, false, text
+from sqlalchemy.orm import Session
+
+from app.models import (Base, Inventory, InventoryMovement, Order, Task, AuditLog, Notification,
+                        DockAppointment)
+from app.models.chat import Message
+
+
+class TestQueryPlans(unittest.TestCase):
+    """The hot list/lookup queries must be answered by an index, without a full scan or an extra sort."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_engine("sqlite://")
+        Base.metadata.create_all(cls.engine)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.dispose()
+
+    def setUp(self):
+        self.db = Session(self.engine)
+
+    def tearDown(self):
+        self.db.close()
+
+    def query_plan(self, query) -> str:
+        sql = query.statement.compile(dialect=self.engine.dialect, compile_kwargs={"literal_binds": True})
+        with self.engine.connect() as connection:
+            rows = connection.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+        return "\n".join(row[-1] for row in rows)
+
+    def assertUsesIndex(self, query, index_name: str):
+        plan = self.query_plan(query)
+        self.assertIn(f"USING INDEX {index_name}", plan)
+        self.assertNotIn("USE TEMP B-TREE", plan)
+
+    def test_inventory_by_product_and_location(self):
+        # SQLite backs the named unique constraint with an automatic index
+        query = self.db.query(Inventory).filter(Inventory.product_id == 1, Inventory.location_id == 2)
+        plan = self.query_plan(query)
+        self.assertIn("SEARCH inventory USING INDEX sqlite_autoindex_inventory", plan)
+        self.assertIn("product_id=? AND location_id=?", plan)
+
+    def test_movement_history(self):
+        query = self.db.query(InventoryMovement).filter(InventoryMovement.product_id == 1).order_by(
+            InventoryMovement.timestamp.desc())
+        self.assertUsesIndex(query, "ix_inventory_movements_product_id_timestamp")
+
+    def test_orders_by_status(self):
+        query = self.db.query(Order).filter(Order.status == "pending").order_by(Order.order_date.desc())
+        self.assertUsesIndex(query, "ix_orders_status_order_date")
+
+    def test_user_tasks_by_status(self):
+        query = self.db.query(Task).filter(Task.assigned_to == 1, Task.status == "pending").order_by(Task.due_date)
+        self.assertUsesIndex(query, "ix_tasks_assigned_to_status_due_date")
+
+    def test_latest_audit_logs(self):
+        query = self.db.query(AuditLog).order_by(AuditLog.timestamp.desc(), AuditLog.id.desc()).limit(100)
+        self.assertUsesIndex(query, "ix_audit_log_timestamp")
+
+    def test_unread_notifications(self):
+        query = self.db.query(Notification).filter(Notification.user_id == 1, Notification.is_read == false())
+        self.assertUsesIndex(query, "ix_notifications_user_id_is_read")
+
+    def test_dock_appointments_by_yard_location(self):
+        query = self.db.query(DockAppointment).filter(DockAppointment.yard_location_id == 1,
+                                                      DockAppointment.appointment_time >= 0)
+        self.assertUsesIndex(query, "ix_dock_appointments_yard_location_id_appointment_time")
+
+    def test_chat_messages(self):
+        query = self.db.query(Message).filter(Message.chat_id == 1, Message.id < 100).order_by(Message.id.desc())
+        self.assertUsesIndex(query.limit(50), "ix_messages_chat_id_id")
+
+
+if __name__ == "__main__":
+    unittest.main()
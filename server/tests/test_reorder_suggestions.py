@@ -0,0 +1,46 @@
+# /server/tests/test_reorder_suggestions.py
+import unittest
+
+from app.crud.inventory import inventory
+from app.models import Inventory, InventoryMovement, Location, POItem, Product, PurchaseOrder
+from tests.base import DatabaseTestCase
+
+DAY = 86400
+
+
+class TestReorderSuggestions(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db.add(Location(id=1, name="A"))
+        self.db.add_all([Product(id=n, sku=f"P{n}", name=f"P{n}", price=1) for n in (1, 2, 3)])
+        # Daily demand of 10, 20, 10, 20: mean 15, standard deviation 5
+        self.db.add_all([InventoryMovement(product_id=product_id, from_location_id=1, quantity=-quantity,
+                                           timestamp=day * DAY + 3600)
+                         for product_id in (1, 2, 3) for day, quantity in enumerate((10, 20, 10, 20))])
+        # Lead times: 4 days for P1, same-day delivery for P2, none known for P3 (the 7 day default)
+        self.db.add_all([PurchaseOrder(id=1, order_date=0, expected_delivery_date=4 * DAY),
+                         PurchaseOrder(id=2, order_date=DAY, expected_delivery_date=DAY),
+                         POItem(po_id=1, product_id=1, quantity=1), POItem(po_id=2, product_id=2, quantity=1)])
+        self.db.add_all([Inventory(product_id=1, location_id=1, quantity=50),
+                         Inventory(product_id=2, location_id=1, quantity=1),
+                         Inventory(product_id=3, location_id=1, quantity=100)])
+        self.db.commit()
+
+    def test_safety_stock_and_reorder_point(self):
+        # safety stock = z(0.95) * 5 * sqrt(lead time); reorder point = 15 * lead time + safety stock
+        suggestions = {suggestion["sku"]: suggestion for suggestion in inventory.get_reorder_suggestions(self.db)}
+        self.assertEqual(sorted(suggestions), ["P1", "P3"])
+        self.assertEqual(suggestions["P1"], {"sku": "P1", "name": "P1", "current_stock": 50, "safety_stock": 16,
+                                             "reorder_point": 76, "suggested_reorder": 26})
+        self.assertEqual(suggestions["P3"], {"sku": "P3", "name": "P3", "current_stock": 100, "safety_stock": 22,
+                                             "reorder_point": 127, "suggested_reorder": 27})
+
+    def test_service_level(self):
+        suggestions = inventory.get_reorder_suggestions(self.db, service_level=0.5)
+        self.assertEqual([(found["sku"], found["safety_stock"], found["reorder_point"]) for found in suggestions],
+                         [("P1", 0, 60), ("P3", 0, 105)])
+
+
+if __name__ == "__main__":
+    unittest.main()
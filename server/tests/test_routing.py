@@ -0,0 +1,74 @@
+# /server/tests/test_routing.py
+import unittest
+
+import numpy as np
+
+from app.crud.pick_list import pick_list
+from app.models import Product, Location, Zone, PickList, PickListItem
+from app.utils.routing import (
+    AISLE_SPACING_METRES, BAY_WIDTH_METRES, distance_matrix, largest_gap, optimize_pick_path, route_distance, s_shape
+)
+from tests.base import DatabaseTestCase
+
+
+class TestRoutingUtils(unittest.TestCase):
+
+    def test_distance_changes_aisles_through_the_nearer_cross_aisle(self):
+        # 10 bays, so the back cross aisle is bay 11
+        matrix = distance_matrix(np.array([(0, 0), (0, 4), (2, 9), (2, 2)]), bays=10)
+        self.assertEqual(matrix[1, 3], (4 + 2) * BAY_WIDTH_METRES + 2 * AISLE_SPACING_METRES)
+        self.assertEqual(matrix[1, 2], (7 + 2) * BAY_WIDTH_METRES + 2 * AISLE_SPACING_METRES)
+        self.assertEqual(matrix[2, 3], 7 * BAY_WIDTH_METRES)
+        np.testing.assert_array_equal(matrix, matrix.T)
+
+    def test_largest_gap_beats_s_shape_for_picks_near_the_cross_aisles(self):
+        points = np.array([(0, 0), (0, 1), (1, 1), (1, 10), (2, 1), (2, 10), (3, 1)])
+        matrix = distance_matrix(points, bays=10)
+        self.assertEqual(sorted(largest_gap(points, 10)), list(range(1, 7)))
+        self.assertLess(route_distance(largest_gap(points, 10), matrix), route_distance(s_shape(points, 10), matrix))
+
+    def test_optimized_path_is_never_longer_than_the_heuristics(self):
+        rng = np.random.default_rng(7)
+        points = np.vstack([[0, 0], np.column_stack([rng.integers(0, 8, 30), rng.integers(1, 21, 30)])])
+        matrix = distance_matrix(points, bays=20)
+        route, distance, _ = optimize_pick_path(points, bays=20)
+        self.assertEqual(sorted(route), list(range(1, 31)))
+        self.assertAlmostEqual(distance, route_distance(route, matrix))
+        self.assertLessEqual(distance, min(route_distance(s_shape(points, 20), matrix),
+                                           route_distance(largest_gap(points, 20), matrix)))
+
+
+class TestOptimizeRoute(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db.add(Zone(id=1, name="Z1"))
+        self.db.add_all([
+            Location(id=1, name="A2-R1", zone_id=1, aisle="2", rack="1"),
+            Location(id=2, name="A1-R9", zone_id=1, aisle="1", rack="9"),
+            Location(id=3, name="A10-R1", zone_id=1, aisle="10", rack="1"),
+            Location(id=4, name="A1-R1", zone_id=1, aisle="1", rack="1"),
+        ])
+        self.db.add(Product(id=1, sku="P1", name="P1", price=1))
+        self.db.add(PickList(id=1, status="pending"))
+        # Location 99 doesn't exist (any more), so its line can't be placed on the route
+        self.db.add_all([PickListItem(pick_list_item_id=index, pick_list_id=1, product_id=1, location_id=location_id,
+                                      quantity=1) for index, location_id in enumerate((1, 99, 2, 3, 4), start=1)])
+        self.db.commit()
+
+    def test_route_starts_in_the_nearest_aisle_and_ends_with_unknown_locations(self):
+        route = pick_list.optimize_route(self.db, pick_list_id=1)
+        locations = [item.location_id for item in route.optimized_route]
+        self.assertEqual(locations[:2], [4, 2])
+        self.assertEqual(locations[-1], 99)
+        # Two bays: out along aisle "1", over to aisle "10" via aisle "2" and back to the depot
+        self.assertAlmostEqual(route.total_distance, 8 * BAY_WIDTH_METRES + 4 * AISLE_SPACING_METRES)
+        self.assertIsNotNone(route.strategy)
+
+    def test_missing_pick_list(self):
+        with self.assertRaises(ValueError):
+            pick_list.optimize_route(self.db, pick_list_id=99)
+
+
+if __name__ == "__main__":
+    unittest.main()
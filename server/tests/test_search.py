@@ -0,0 +1,87 @@
+# /server/tests/test_search.py
+import unittest
+
+from sqlalchemy import update, delete
+
+from app.crud.order import order
+from app.crud.product import product
+from app.crud.search import LikeSearch, SQLiteSearch, search_backend
+from app.models import Product, ProductCategory, Customer, Order
+from tests.base import DatabaseTestCase
+
+
+class TestFullTextSearch(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db.add(ProductCategory(id=1, name="Furniture"))
+        self.db.add_all([
+            Product(id=1, sku="CHR-100", name="Office chair", description="Ergonomic mesh chair", price=120,
+                    category_id=1),
+            Product(id=2, sku="DSK-200", name="Standing desk", description="Pairs with any office chair", price=400,
+                    category_id=1),
+            Product(id=3, sku="LMP-300", name="Desk lamp", description="LED", price=30, category_id=1),
+        ])
+        self.db.add_all([Customer(id=1, name="Ada Lovelace", email="ada@analytical.example"),
+                         Customer(id=2, name="Charles Babbage", email="charles@engines.example")])
+        orders = [(7, 1, "Pending"), (8, 2, "Pending"), (9, 1, "Shipped")]
+        self.db.add_all([Order(id=order_id, customer_id=customer_id, status=status, total_amount=10)
+                         for order_id, customer_id, status in orders])
+        self.db.commit()
+
+    def search(self, q: str) -> list[int]:
+        return [found.id for found in product.advanced_search(self.db, q=q)]
+
+    def test_ranked_prefix_matches(self):
+        self.assertIsInstance(search_backend(self.db), SQLiteSearch)
+        # A name match outranks a description match; every term has to match as a prefix
+        self.assertEqual(self.search("chai"), [1, 2])
+        self.assertEqual(self.search("office ch"), [1, 2])
+        self.assertEqual(self.search("desk lamp"), [3])
+        self.assertEqual(self.search("dsk-2"), [2])
+        self.assertEqual(self.search("sofa"), [])
+
+    def test_index_follows_bulk_writes(self):
+        self.db.execute(update(Product).where(Product.id == 3).values(name="Floor lamp", description="Tall"))
+        self.db.execute(delete(Product).where(Product.id == 1))
+        self.db.execute(Product.__table__.insert(), [{"id": 4, "sku": "SOF-1", "name": "Sofa", "price": 900,
+                                                     "category_id": 1}])
+        self.db.commit()
+        self.assertEqual(self.search("desk"), [2])
+        self.assertEqual(self.search("floor"), [3])
+        self.assertEqual(self.search("sofa"), [4])
+        self.assertEqual(self.search("mesh"), [])
+
+    def test_pagination(self):
+        self.assertEqual([found.id for found in product.advanced_search(self.db, q="chair", skip=1, limit=1)], [2])
+
+    def test_orders_by_customer_or_number(self):
+        by_customer = order.advanced_search(self.db, q="lovelace")
+        self.assertEqual([found.id for found in by_customer], [9, 7])
+        self.assertEqual([found.id for found in order.advanced_search(self.db, q="engines.example")], [8])
+        self.assertEqual([found.id for found in order.advanced_search(self.db, q="8")], [8])
+        self.assertEqual([found.id for found in order.advanced_search(self.db, q="ada", status="Pending")], [7])
+
+    def test_best_and_filtered_matches_among_many(self):
+        self.db.add(ProductCategory(id=2, name="Outdoor"))
+        self.db.add_all([Product(id=100 + n, sku=f"ACC-{n}", name=f"Accessory {n}", description="Fits any chair",
+                                 price=5, category_id=1) for n in range(200)])
+        self.db.add_all([Product(id=400, sku="CHR-900", name="Garden chair", price=60, category_id=2),
+                         Product(id=401, sku="CHR-901", name="Chair cushion", price=700, category_id=1)])
+        self.db.commit()
+        self.assertEqual(self.search("chair")[:3], [400, 401, 1])
+        self.assertEqual([found.id for found in product.advanced_search(self.db, q="chair", category_id=2)], [400])
+        self.assertEqual([found.id for found in product.advanced_search(self.db, q="chair", min_price=500)], [401])
+
+    def test_lone_short_term_matches_whole_words(self):
+        self.assertEqual(self.search("d"), [])
+        self.assertEqual(sorted(self.search("de")), [2, 3])
+        self.assertEqual(self.search("office c"), [1, 2])
+
+    def test_like_fallback_matches_the_same_products(self):
+        matches = LikeSearch().products("office ch")
+        self.assertEqual(sorted(self.db.execute(matches).scalars()), [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
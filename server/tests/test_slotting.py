@@ -0,0 +1,65 @@
+# /server/tests/test_slotting.py
+import time
+import unittest
+
+from app.crud.inventory import inventory
+from app.models import Product, Location, Zone, Inventory, PickList, PickListItem
+from app.utils.slotting import FreeCapacityIndex, travel_costs, unit_cube
+from tests.base import DatabaseTestCase
+
+
+class TestSlottingUtils(unittest.TestCase):
+
+    def test_closest_fitting_bin(self):
+        index = FreeCapacityIndex([2, 0, 7, 5, 9])
+        self.assertEqual(index.closest_fitting(1), 0)
+        self.assertEqual(index.closest_fitting(5), 2)
+        self.assertIsNone(index.closest_fitting(10))
+        index.add(2, -7)
+        self.assertEqual(index.closest_fitting(5), 3)
+
+    def test_travel_costs_use_natural_order(self):
+        costs = travel_costs(["2", "10", "1"], ["1", "1", "3"], [None, None, None])
+        self.assertEqual(costs.argsort().tolist(), [2, 0, 1])
+
+    def test_unit_cube(self):
+        self.assertEqual(unit_cube("10 x 20 x 1.5 cm"), 300.0)
+        self.assertEqual(unit_cube(None), 1.0)
+
+
+class TestOptimizeLocations(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db.add_all([Zone(id=1, name="Z1"), Zone(id=2, name="Z2")])
+        self.db.add_all([
+            Location(id=1, name="near", zone_id=1, aisle="1", rack="1", capacity=10),
+            Location(id=2, name="far", zone_id=1, aisle="9", rack="1", capacity=50),
+            Location(id=3, name="other zone", zone_id=2, aisle="1", rack="1", capacity=100),
+            Location(id=4, name="middle", zone_id=1, aisle="5", rack="1", capacity=50),
+        ])
+        self.db.add_all([Product(id=i, sku=f"P{i}", name=f"P{i}", price=1) for i in (1, 2, 3)])
+        self.db.add_all([Inventory(product_id=1, location_id=2, quantity=8),
+                         Inventory(product_id=2, location_id=2, quantity=8),
+                         Inventory(product_id=3, location_id=2, quantity=8)])
+        self.db.add(PickList(id=1, status="completed", created_at=int(time.time())))
+        # Product 1 is the fastest mover, product 3 is never picked
+        self.db.add_all([PickListItem(pick_list_id=1, product_id=product_id, location_id=2, quantity=1,
+                                      picked_quantity=1) for product_id in (1, 1, 1, 2)])
+        self.db.commit()
+
+    def test_fast_movers_get_the_closest_free_bins_of_their_zone(self):
+        moves = {move.product_id: move for move in inventory.optimize_locations(self.db)}
+        self.assertEqual(set(moves), {1, 2})
+        self.assertEqual(moves[1].suggested_location_id, 1)
+        # The closest bin is full after product 1 moved in
+        self.assertEqual(moves[2].suggested_location_id, 4)
+        self.assertGreater(moves[1].travel_saving, moves[2].travel_saving)
+        self.assertEqual(moves[1].quantity, 8)
+
+    def test_max_moves(self):
+        self.assertEqual([move.product_id for move in inventory.optimize_locations(self.db, max_moves=1)], [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
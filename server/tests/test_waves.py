@@ -0,0 +1,89 @@
+# /server/tests/test_waves.py
+import unittest
+
+from app.crud.wave import wave, batch_orders, _PlannedOrder
+from app.models import (Product, Location, Zone, Inventory, Order, OrderItem, PickList, Carrier,
+                        Shipment, Wave)
+from public_api.shared_schemas import WavePlanRequest
+from tests.base import DatabaseTestCase
+
+DAY = 86400
+
+
+class TestBatchOrders(unittest.TestCase):
+
+    def test_similar_orders_share_a_batch(self):
+        orders = [_PlannedOrder(i, None, None, [(1, 1, 1)], aisles=frozenset(aisles))
+                  for i, aisles in enumerate([{1}, {1, 2}, {7}, {7, 8}, {1}])]
+        batches = batch_orders(orders, slots=3, max_lines=10)
+        self.assertEqual([[order.id for order in batch] for batch in batches], [[0, 4, 1], [2, 3]])
+
+    def test_line_limit(self):
+        orders = [_PlannedOrder(i, None, None, [(1, 1, 1)] * 3, aisles=frozenset({1})) for i in range(3)]
+        self.assertEqual([len(batch) for batch in batch_orders(orders, slots=10, max_lines=6)], [2, 1])
+
+
+class TestWavePlanning(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db.add_all([Zone(id=1, name="Z1"), Zone(id=2, name="Z2"), Carrier(id=1, name="C1")])
+        self.db.add_all([
+            Location(id=1, name="L1", zone_id=1, aisle="1", rack="1"),
+            Location(id=2, name="L2", zone_id=1, aisle="1", rack="5"),
+            Location(id=3, name="L3", zone_id=2, aisle="9", rack="1"),
+        ])
+        self.db.add_all([Product(id=i, sku=f"P{i}", name=f"P{i}", price=1) for i in (1, 2, 3)])
+        self.db.add_all([Inventory(product_id=1, location_id=1, quantity=5),
+                         Inventory(product_id=1, location_id=2, quantity=5),
+                         Inventory(product_id=2, location_id=2, quantity=10),
+                         Inventory(product_id=3, location_id=3, quantity=1)])
+        self.db.add_all([
+            Order(id=1, status="Pending", ship_date=DAY + 10),
+            Order(id=2, status="Pending", ship_date=DAY + 20),
+            Order(id=3, status="Processing", ship_date=DAY + 30),
+            Order(id=4, status="Pending", ship_date=DAY + 40),  # short: product 3 already taken by order 3
+            Order(id=5, status="Shipped", ship_date=DAY),
+        ])
+        self.db.add_all([
+            OrderItem(order_id=1, product_id=1, quantity=7), OrderItem(order_id=1, product_id=2, quantity=1),
+            OrderItem(order_id=2, product_id=2, quantity=2),
+            OrderItem(order_id=3, product_id=3, quantity=1),
+            OrderItem(order_id=4, product_id=3, quantity=1),
+            OrderItem(order_id=5, product_id=1, quantity=1),
+        ])
+        self.db.add(Shipment(order_id=3, carrier_id=1))
+        self.db.commit()
+
+    def test_simulation_groups_orders_without_writing(self):
+        plan = wave.plan(self.db, WavePlanRequest(simulate=True))
+        self.assertEqual(plan.orders_planned, 3)
+        self.assertEqual(plan.unallocated_order_ids, [4])
+        # Orders 1 and 2 share zone 1 and no carrier; order 3 goes with carrier 1 from zone 2
+        self.assertEqual([[slot.order_id for slot in batch.slots] for batch in plan.batches], [[1, 2], [3]])
+        self.assertEqual(plan.batches[0].units, 10)
+        self.assertEqual(plan.batches[0].locations, 2)
+        self.assertGreater(plan.picks_per_hour, 0)
+        self.assertEqual(self.db.query(PickList).count(), 0)
+
+    def test_release_creates_batch_pick_lists_with_put_wall_slots(self):
+        plan = wave.plan(self.db, WavePlanRequest())
+        self.assertEqual(len(plan.wave_ids), 2)
+        self.assertEqual(self.db.query(Wave).count(), 2)
+        batch = self.db.get(PickList, plan.batches[0].pick_list_id)
+        self.assertIsNone(batch.order_id)
+        lines = {(item.order_id, item.put_wall_slot, item.product_id, item.location_id): item.quantity
+                 for item in batch.pick_list_items}
+        # Product 1 is taken from the nearest location first
+        self.assertEqual(lines, {(1, 1, 1, 1): 5, (1, 1, 1, 2): 2, (1, 1, 2, 2): 1, (2, 2, 2, 2): 2})
+
+        # Released orders are not planned again, and their stock stays reserved
+        self.db.add(Order(id=6, status="Pending"))
+        self.db.add(OrderItem(order_id=6, product_id=2, quantity=8))
+        self.db.commit()
+        again = wave.plan(self.db, WavePlanRequest(simulate=True))
+        self.assertEqual(again.unallocated_order_ids, [4, 6])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+# /server/tests/test_yard_reports.py
+import unittest
+
+from app.crud.yard import yard
+from app.models import Carrier, DockAppointment, YardLocation
+from tests.base import DatabaseTestCase
+
+DAY = 86400
+
+
+class TestYardReports(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db.add_all([Carrier(id=1, name="Fast"), Carrier(id=2, name="Idle")])
+        self.db.add_all([YardLocation(id=1, name="Dock 1", capacity=4), YardLocation(id=2, name="Dock 2", capacity=6)])
+        self.db.add_all([
+            # On time, 30 minutes at the dock
+            DockAppointment(yard_location_id=1, carrier_id=1, appointment_time=DAY + 3600, status="completed",
+                            actual_arrival_time=DAY + 3500, actual_departure_time=DAY + 5300),
+            # Late, 90 minutes at the dock
+            DockAppointment(yard_location_id=1, carrier_id=1, appointment_time=DAY + 7200, status="completed",
+                            actual_arrival_time=DAY + 7800, actual_departure_time=DAY + 13200),
+            DockAppointment(yard_location_id=2, carrier_id=1, appointment_time=DAY + 9000, status="missed"),
+            # Next day, outside both reports
+            DockAppointment(yard_location_id=2, carrier_id=1, appointment_time=2 * DAY + 60, status="scheduled"),
+        ])
+        self.db.commit()
+
+    def test_carrier_performance(self):
+        fast, idle = yard.get_carrier_performance(self.db, start_date=DAY, end_date=2 * DAY - 1)
+        self.assertEqual((fast.total_appointments, fast.on_time_appointments, fast.late_appointments,
+                          fast.missed_appointments), (3, 1, 1, 1))
+        self.assertEqual(fast.average_dwell_time, 60)
+        self.assertEqual((idle.carrier_name, idle.total_appointments, idle.average_dwell_time), ("Idle", 0, 0))
+
+    def test_utilization_of_a_day(self):
+        report = yard.get_utilization_report(self.db, date=DAY + 4000)
+        self.assertEqual([location.current_occupancy for location in report.location_breakdown], [2, 1])
+        self.assertEqual((report.total_capacity, report.total_utilization), (10, 3))
+        self.assertEqual(report.utilization_percentage, 30)
+
+
+if __name__ == "__main__":
+    unittest.main()